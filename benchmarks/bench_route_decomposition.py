@@ -0,0 +1,104 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Sunday, October 18th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+"""Benchmark the network-level route decomposition methods on UTDF datasets.
+
+For each method, report the runtime, the number of routes, the share of UTDF turning
+counts covered by the routes, and the largest overuse of a counted movement (always 0).
+
+Usage:
+    python benchmarks/bench_route_decomposition.py
+    python benchmarks/bench_route_decomposition.py datasets/data_Tempe_network/UTDF.csv
+"""
+
+import argparse
+import contextlib
+import io
+import time
+from pathlib import Path
+
+import utdf2gmns as ug
+from utdf2gmns.func_lib.sumo import gmns2sumo
+
+
+def load_route_inputs(path_utdf: str) -> dict:
+    """Load a UTDF file and build the inputs of the route decomposition."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        net = ug.UTDF2GMNS(utdf_filename=path_utdf, verbose=False)
+
+        # coordinates do not affect the decomposition, anchor any intersection
+        int_id = str(net._utdf_dict["Nodes"]["INTID"].iloc[0])
+        net.geocode_utdf_intersections(
+            single_intersection_coord={"INTID": int_id, "x_coord": -111.9, "y_coord": 33.4})
+
+    utdf_dict = net._utdf_dict
+    edge_profiles = gmns2sumo._get_sumo_edge_profile_dict(utdf_dict, net.network_unit)
+    boundary_source_edge_ids, boundary_sink_edge_ids = gmns2sumo._build_physical_boundary_edge_ids(
+        edge_profiles, utdf_dict.get("network_nodes"))
+    return {
+        "movement_records": gmns2sumo._build_turn_movement_records(utdf_dict, net.network_unit),
+        "boundary_source_edge_ids": boundary_source_edge_ids,
+        "boundary_sink_edge_ids": boundary_sink_edge_ids,
+        "topology_transition_graph": gmns2sumo._build_topology_transition_graph(
+            edge_profiles, utdf_dict.get("network_nodes")),
+    }
+
+
+def evaluate_routes(movement_records: list, network_routes: list) -> tuple[float, float]:
+    """Return the covered share of the UTDF counts and the largest overuse of a counted movement."""
+    movement_counts = {}
+    for record in movement_records:
+        movement_key = (record["source_edge_id"], record["target_edge_id"])
+        movement_counts[movement_key] = movement_counts.get(movement_key, 0.0) + record["volume"]
+
+    movement_usage = dict.fromkeys(movement_counts, 0.0)
+    for network_route in network_routes:
+        edge_path = network_route["main_edge_path"]
+        for movement_key in zip(edge_path, edge_path[1:]):
+            if movement_key in movement_usage:
+                movement_usage[movement_key] += network_route["volume"]
+
+    covered_share = sum(movement_usage.values()) / max(sum(movement_counts.values()), 1e-9)
+    max_overuse = max((movement_usage[key] - movement_counts[key] for key in movement_counts), default=0.0)
+    return covered_share, max(max_overuse, 0.0)
+
+
+def run_benchmark(path_utdf: str, max_route_edges: int = 50, min_route_volume: float = 0.5) -> None:
+    """Run every decomposition method on one UTDF file and print a summary table."""
+    route_inputs = load_route_inputs(path_utdf)
+    print(f"\n{path_utdf}: {len(route_inputs['movement_records'])} counted movements")
+    print(f"  {'method':<15}{'time (s)':>10}{'routes':>8}{'covered':>10}{'overuse':>10}")
+
+    for method in gmns2sumo.ROUTE_DECOMPOSITION_METHODS:
+        start_time = time.perf_counter()
+        network_routes = gmns2sumo._decompose_turn_movements_to_routes(
+            route_inputs["movement_records"],
+            max_route_edges,
+            min_route_volume,
+            boundary_source_edge_ids=route_inputs["boundary_source_edge_ids"],
+            boundary_sink_edge_ids=route_inputs["boundary_sink_edge_ids"],
+            topology_transition_graph=route_inputs["topology_transition_graph"],
+            decomposition_method=method,
+        )
+        elapsed = time.perf_counter() - start_time
+
+        covered_share, max_overuse = evaluate_routes(route_inputs["movement_records"], network_routes)
+        print(f"  {method:<15}{elapsed:>10.2f}{len(network_routes):>8}{covered_share:>10.1%}{max_overuse:>10.3f}")
+
+
+if __name__ == "__main__":
+
+    dir_datasets = Path(__file__).resolve().parents[1] / "datasets"
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("utdf_files", nargs="*",
+                        default=[str(dir_datasets / "data_bullhead_seg4" / "UTDF.csv"),
+                                 str(dir_datasets / "data_Tempe_network" / "UTDF.csv")])
+    parser.add_argument("--max-route-edges", type=int, default=50)
+    parser.add_argument("--min-route-volume", type=float, default=0.5)
+    args = parser.parse_args()
+
+    for utdf_file in args.utdf_files:
+        run_benchmark(utdf_file, args.max_route_edges, args.min_route_volume)
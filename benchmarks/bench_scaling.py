@@ -0,0 +1,184 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Sunday, October 18th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+"""Benchmark how each conversion stage scales with the number of intersections.
+
+Synthetic grid and arterial UTDF networks are generated at each size and converted to GMNS
+and SUMO. The wall time of every stage is taken from the stage timing report: read_UTDF (parse),
+geocoding, create_signal_control, each GMNS/SUMO writer, netconvert and the network route
+decomposition. For each stage, the complexity exponent k of time ~ n^k is fitted on a log-log scale.
+
+With a baseline file, the run fails (exit code 1) when the exponent of a stage grows by more than
+--exponent-tolerance, or with --check-times, when a stage is slower than the baseline by more than
+--time-tolerance. Times depend on the machine, exponents much less so.
+
+Usage:
+    python benchmarks/bench_scaling.py
+    python benchmarks/bench_scaling.py --sizes 10 100 1000 10000 --layouts arterial
+    python benchmarks/bench_scaling.py --save-baseline
+    python benchmarks/bench_scaling.py --output scaling.json --check-times
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import sys
+import tempfile
+from pathlib import Path
+
+import utdf2gmns as ug
+from utdf2gmns.func_lib.utdf.synthetic_utdf import SYNTHETIC_LAYOUTS, generate_synthetic_utdf
+
+DEFAULT_SIZES = (10, 30, 100, 300)
+
+# stages faster than this are dominated by overheads and left out of the exponent fit and time check
+MIN_STAGE_TIME_S = 0.05
+
+
+def time_conversion_stages(num_intersections: int, layout: str, incl_sumo: bool = True) -> dict:
+    """Convert a synthetic network and return the total wall time of each stage, {stage name: seconds}."""
+    with tempfile.TemporaryDirectory() as dir_output, contextlib.redirect_stdout(io.StringIO()):
+        path_utdf = generate_synthetic_utdf(str(Path(dir_output) / "UTDF.csv"), num_intersections, layout=layout)
+        net = ug.UTDF2GMNS(utdf_filename=path_utdf, verbose=False)
+
+        # coordinates do not affect the conversion time, anchor the first intersection
+        net.geocode_utdf_intersections(
+            single_intersection_coord={"INTID": "1", "x_coord": -111.9, "y_coord": 33.4})
+        net.create_signal_control()
+        net.utdf_to_gmns(output_dir=str(Path(dir_output) / "gmns"), incl_utdf=False)
+        if incl_sumo:
+            net.utdf_to_sumo(output_dir=str(Path(dir_output) / "sumo"))
+
+    return {stage_name: total["wall_time_s"]
+            for stage_name, total in net.stage_recorder.to_dict()["totals"].items()}
+
+
+def fit_complexity_exponent(stage_times: dict) -> float | None:
+    """Fit k of time ~ n^k by least squares on log(n) and log(time), {n: seconds} -> k."""
+    points = [(math.log(size), math.log(seconds))
+              for size, seconds in stage_times.items() if seconds >= MIN_STAGE_TIME_S]
+    if len(points) < 2 or len({x for x, _ in points}) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    return (sum((x - mean_x) * (y - mean_y) for x, y in points)
+            / sum((x - mean_x) ** 2 for x, _ in points))
+
+
+def run_benchmark(sizes: list, layouts: list, repeat: int = 1, incl_sumo: bool = True) -> dict:
+    """Time every stage at each size and layout, print the complexity curves and return the results.
+
+    Returns:
+        dict: {layout: {"times": {stage name: {size: seconds}}, "exponents": {stage name: k}}}
+    """
+    results = {}
+    for layout in layouts:
+        stage_curves = {}
+        for size in sizes:
+            # the fastest of the repeats is the least disturbed by other processes
+            for _ in range(repeat):
+                for stage_name, seconds in time_conversion_stages(size, layout, incl_sumo).items():
+                    stage_sizes = stage_curves.setdefault(stage_name, {})
+                    stage_sizes[size] = min(seconds, stage_sizes.get(size, math.inf))
+            print(f"  :{layout} network of {size} intersections converted", file=sys.stderr)
+
+        results[layout] = {
+            "times": stage_curves,
+            "exponents": {stage_name: fit_complexity_exponent(curve) for stage_name, curve in stage_curves.items()},
+        }
+        print_complexity_curves(layout, sizes, results[layout])
+    return results
+
+
+def print_complexity_curves(layout: str, sizes: list, layout_results: dict) -> None:
+    """Print the stage times of one layout as a table of stages by sizes, with the fitted exponents."""
+    print(f"\n{layout}: wall time (s) by number of intersections")
+    print(f"  {'stage':<22}" + "".join(f"{size:>10}" for size in sizes) + f"{'exponent':>10}")
+    for stage_name, curve in layout_results["times"].items():
+        exponent = layout_results["exponents"][stage_name]
+        print(f"  {stage_name:<22}"
+              + "".join(f"{curve[size]:>10.3f}" if size in curve else f"{'-':>10}" for size in sizes)
+              + (f"{exponent:>10.2f}" if exponent is not None else f"{'-':>10}"))
+
+
+def find_regressions(results: dict, baseline: dict, exponent_tolerance: float,
+                     time_tolerance: float | None = None) -> list:
+    """Compare the results with a baseline and return the regression messages.
+
+    A stage regresses when its exponent exceeds the baseline exponent by more than exponent_tolerance,
+    or, if time_tolerance is given, when it is slower than (1 + time_tolerance) times the baseline at a size.
+    Stages and sizes missing from either side are not compared.
+    """
+    regressions = []
+    for layout, layout_results in results.items():
+        layout_baseline = baseline.get(layout, {})
+
+        for stage_name, exponent in layout_results["exponents"].items():
+            baseline_exponent = layout_baseline.get("exponents", {}).get(stage_name)
+            if exponent is not None and baseline_exponent is not None \
+                    and exponent > baseline_exponent + exponent_tolerance:
+                regressions.append(f"{layout} {stage_name}: complexity exponent {exponent:.2f}, "
+                                   f"baseline {baseline_exponent:.2f}")
+
+        if time_tolerance is None:
+            continue
+        for stage_name, curve in layout_results["times"].items():
+            # json keys are strings
+            baseline_curve = {int(size): seconds
+                              for size, seconds in layout_baseline.get("times", {}).get(stage_name, {}).items()}
+            for size, seconds in curve.items():
+                baseline_seconds = baseline_curve.get(int(size))
+                if baseline_seconds is not None and seconds >= MIN_STAGE_TIME_S \
+                        and seconds > baseline_seconds * (1 + time_tolerance):
+                    regressions.append(f"{layout} {stage_name} at {size} intersections: {seconds:.3f}s, "
+                                       f"baseline {baseline_seconds:.3f}s")
+    return regressions
+
+
+if __name__ == "__main__":
+
+    path_baseline_default = Path(__file__).resolve().parent / "baseline_scaling.json"
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="numbers of intersections, 10 to 10000")
+    parser.add_argument("--layouts", nargs="+", choices=SYNTHETIC_LAYOUTS, default=list(SYNTHETIC_LAYOUTS))
+    parser.add_argument("--repeat", type=int, default=1, help="runs per size, the fastest is kept")
+    parser.add_argument("--no-sumo", action="store_true", help="skip the SUMO conversion, e.g. without netconvert")
+    parser.add_argument("--baseline", default=str(path_baseline_default))
+    parser.add_argument("--save-baseline", action="store_true", help="save the results as the baseline")
+    parser.add_argument("--exponent-tolerance", type=float, default=0.5)
+    parser.add_argument("--check-times", action="store_true",
+                        help="also compare the stage times, for baselines saved on the same machine")
+    parser.add_argument("--time-tolerance", type=float, default=0.5)
+    parser.add_argument("--output", default="", help="JSON file to save the results")
+    args = parser.parse_args()
+
+    benchmark_results = run_benchmark(sorted(set(args.sizes)), args.layouts, args.repeat, not args.no_sumo)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(benchmark_results, indent=2), encoding="utf-8")
+
+    if args.save_baseline:
+        Path(args.baseline).write_text(json.dumps(benchmark_results, indent=2), encoding="utf-8")
+        print(f"\nSaved baseline to {args.baseline}")
+        sys.exit(0)
+
+    if not Path(args.baseline).is_file():
+        print(f"\nNo baseline at {args.baseline}, run with --save-baseline to create it")
+        sys.exit(0)
+
+    baseline_results = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    regression_messages = find_regressions(benchmark_results, baseline_results, args.exponent_tolerance,
+                                           args.time_tolerance if args.check_times else None)
+    if regression_messages:
+        print(f"\n{len(regression_messages)} regressions against {args.baseline}:")
+        for message in regression_messages:
+            print(f"  {message}")
+        sys.exit(1)
+    print(f"\nNo regressions against {args.baseline}")
@@ -80,9 +80,8 @@ class TestUTDF2GMNS:
         monkeypatch.setattr(utdf_module, "generate_sumo_edg_xml", lambda *args, **kwargs: True)
         monkeypatch.setattr(utdf_module, "generate_sumo_connection_xml", lambda *args, **kwargs: True)
         monkeypatch.setattr(utdf_module, "generate_sumo_loop_detector_add_xml", count_detector_generation)
-        monkeypatch.setattr(utdf_module, "update_sumo_signal_from_utdf", lambda *args, **kwargs: True)
         monkeypatch.setattr(utdf_module, "generate_sumo_flow_xml", lambda *args, **kwargs: True)
-        monkeypatch.setattr(utdf_module, "remove_sumo_U_turn", lambda *args, **kwargs: True)
+        monkeypatch.setattr(utdf_module, "post_process_sumo_net", lambda *args, **kwargs: True)
         monkeypatch.setattr(utdf_module.shutil, "which", lambda executable_name: executable_name)
         monkeypatch.setattr(utdf_module.subprocess, "run", lambda *args, **kwargs: completed_process)
 
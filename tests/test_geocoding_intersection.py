@@ -0,0 +1,112 @@
+"""Regression tests for the cached, concurrent intersection geocoding."""
+
+import threading
+import time
+
+import pandas as pd
+
+from utdf2gmns.func_lib.utdf.geocoding_cache import normalize_address
+from utdf2gmns.func_lib.utdf.geocoding_intersection import generate_intersection_coordinates
+
+
+# a local stand-in of the geocoding service, {normalized address: (lng, lat)}
+ADDRESS_COORDS = {
+    "main st&1st ave,tempe": (-111.94, 33.42),
+    "1st ave&main st,tempe": (-111.94, 33.42),
+    "main st&2nd ave,tempe": (-111.93, 33.42),
+    "2nd ave&main st,tempe": (-111.90, 33.40),
+}
+
+
+class FakeProvider:
+    """Count the geocoding requests of each address."""
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, address: str) -> tuple:
+        with self._lock:
+            self.calls.append(address)
+        return ADDRESS_COORDS.get(normalize_address(address), (0, 0))
+
+
+class SlowProvider(FakeProvider):
+    """Answer after a delay, and record the largest number of requests in flight at once."""
+
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def __call__(self, address: str) -> tuple:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return super().__call__(address)
+
+
+DF_INTERSECTION = pd.DataFrame({
+    "synchro_INTID": [1, 2, 3, 4],
+    "intersection_name": ["Main St & 1st Ave", "Main St & 2nd Ave", "Unknown Rd & Nowhere", "Main St  & 1st Ave"],
+    "city_name": ["Tempe"] * 4,
+})
+
+
+def test_repeat_geocoding_is_served_from_cache(tmp_path):
+    """Each address should be requested once, and a second run should only request failed addresses."""
+    cache_path = str(tmp_path / "geocoding.sqlite")
+    provider = FakeProvider()
+
+    df_coords = generate_intersection_coordinates(DF_INTERSECTION, provider=provider, cache_path=cache_path,
+                                                  max_requests_per_second=None)
+    # intersection 4 is a spelling variant of intersection 1
+    assert len(provider.calls) == 6
+    assert df_coords["x_coord"].tolist()[0::3] == [-111.94, -111.94]
+    # the two name orders of intersection 2 are too far apart
+    assert df_coords["x_coord"].isna().tolist()[:2] == [False, True]
+
+    provider_again = FakeProvider()
+    df_coords_again = generate_intersection_coordinates(DF_INTERSECTION, provider=provider_again,
+                                                        cache_path=cache_path, max_workers=1,
+                                                        max_requests_per_second=None)
+    # only the failed address is requested again
+    assert sorted(set(provider_again.calls)) == [" Nowhere & Unknown Rd , Tempe", "Unknown Rd & Nowhere, Tempe"]
+    pd.testing.assert_frame_equal(df_coords_again, df_coords)
+
+
+def test_geocode_one_returns_first_valid_intersection():
+    """geocode_one should stop at the first intersection whose two name orders agree."""
+    provider = FakeProvider()
+    df_intersection = DF_INTERSECTION.iloc[[2, 1, 0]].reset_index(drop=True)
+
+    single_intersection = generate_intersection_coordinates(df_intersection, geocode_one=True,
+                                                            provider=provider, max_workers=1,
+                                                            max_requests_per_second=None)
+    assert single_intersection == {"INTID": 1, "x_coord": -111.94, "y_coord": 33.42}
+
+    # a valid first intersection is geocoded alone, with its two name orders
+    provider = FakeProvider()
+    single_intersection = generate_intersection_coordinates(DF_INTERSECTION, geocode_one=True,
+                                                            provider=provider, max_requests_per_second=None)
+    assert single_intersection["INTID"] == 1
+    assert len(provider.calls) == 2
+
+
+def test_default_geocoding_sends_requests_concurrently():
+    """With the default workers and rate limit, slow requests should overlap instead of running one by one."""
+    provider = SlowProvider(delay=0.3)
+
+    start_time = time.perf_counter()
+    df_coords = generate_intersection_coordinates(DF_INTERSECTION, provider=provider)
+    elapsed = time.perf_counter() - start_time
+
+    assert len(provider.calls) == 6
+    assert provider.max_in_flight > 1
+    # six serial requests take 1.8 s
+    assert elapsed < 6 * provider.delay
+    assert df_coords["x_coord"].notna().sum() == 3
@@ -0,0 +1,52 @@
+"""Regression tests for batched node geocoding."""
+
+import numpy as np
+import pandas as pd
+
+from utdf2gmns.func_lib.gmns.geocoding_Nodes import (
+    GEODESIC_BATCH_TOLERANCE_DEGREES,
+    calculate_new_coordinates_from_offsets,
+    calculate_new_coordinates_from_offsets_array,
+    update_node_from_one_intersection,
+)
+
+
+BASE_LON, BASE_LAT = -111.94, 33.42
+X_OFFSETS = [0.0, 250.0, -1320.0, 0.0, 5280.0, -10.5]
+Y_OFFSETS = [0.0, 0.0, 660.0, -900.0, -5280.0, 33.3]
+
+
+def test_batched_offsets_match_single_point_geodesic():
+    """The batched geodesic should agree with the geopy single-point version."""
+    lons, lats = calculate_new_coordinates_from_offsets_array(
+        BASE_LON, BASE_LAT, X_OFFSETS, Y_OFFSETS, "feet")
+
+    for index, (x_offset, y_offset) in enumerate(zip(X_OFFSETS, Y_OFFSETS)):
+        lon, lat = calculate_new_coordinates_from_offsets(BASE_LON, BASE_LAT, x_offset, y_offset, "feet")
+        assert abs(lons[index] - lon) < GEODESIC_BATCH_TOLERANCE_DEGREES
+        assert abs(lats[index] - lat) < GEODESIC_BATCH_TOLERANCE_DEGREES
+
+    # zero offsets keep the base coordinates exactly
+    assert (lons[0], lats[0]) == (BASE_LON, BASE_LAT)
+
+
+def test_update_node_from_one_intersection_fills_all_columns():
+    """All nodes should be geocoded relative to the base intersection in one pass."""
+    df_node = pd.DataFrame({
+        "INTID": ["1", "2", "3"],
+        "TYPE": ["0", "1", "3"],
+        "X": ["1000", "1500", "1000"],
+        "Y": ["2000", "2000", "1200"],
+    })
+    single_int = {"INTID": 1, "x_coord": BASE_LON, "y_coord": BASE_LAT}
+
+    node_dict = update_node_from_one_intersection(single_int, df_node, "feet, mph")
+
+    assert list(node_dict) == ["1", "2", "3"]
+    assert [node["INTID_base"] for node in node_dict.values()] == [1, 0, 0]
+    assert [node["TYPE_DESC"] for node in node_dict.values()] == ["Signalized", "External Node", "Unsignalized"]
+    assert (node_dict["1"]["x_coord"], node_dict["1"]["y_coord"]) == (BASE_LON, BASE_LAT)
+
+    lon, lat = calculate_new_coordinates_from_offsets(BASE_LON, BASE_LAT, 0, -800, "feet")
+    assert np.isclose(node_dict["3"]["x_coord"], lon, rtol=0, atol=GEODESIC_BATCH_TOLERANCE_DEGREES)
+    assert np.isclose(node_dict["3"]["y_coord"], lat, rtol=0, atol=GEODESIC_BATCH_TOLERANCE_DEGREES)
@@ -0,0 +1,58 @@
+"""Regression tests for cached and batched UTM projection helpers."""
+
+import numpy as np
+import pytest
+
+from utdf2gmns.func_lib.gmns.geocoding_Links import (
+    _get_utm_transformer,
+    cvt_lonlat_array_to_utm,
+    cvt_lonlat_to_utm,
+    cvt_utm_array_to_lonlat,
+    cvt_utm_to_lonlat,
+)
+from utdf2gmns.func_lib.sumo.gmns2sumo import _shape_length_meters, _shape_points_to_utm
+
+
+LONGITUDES = [-111.94, -111.935, -111.93, -111.925]
+LATITUDES = [33.42, 33.425, 33.43, 33.44]
+
+
+def test_batch_projection_matches_single_point_projection():
+    """One batched transform should give the same coordinates as per-point calls."""
+    eastings, northings, zone_number, hemisphere = cvt_lonlat_array_to_utm(LONGITUDES, LATITUDES)
+
+    for index, (lon, lat) in enumerate(zip(LONGITUDES, LATITUDES)):
+        easting, northing, point_zone_number, point_hemisphere = cvt_lonlat_to_utm(lon, lat)
+        assert eastings[index] == easting
+        assert northings[index] == northing
+        assert (zone_number, hemisphere) == (point_zone_number, point_hemisphere)
+
+    lons, lats = cvt_utm_array_to_lonlat(eastings, northings, zone_number, hemisphere)
+    for index in range(len(LONGITUDES)):
+        assert (lons[index], lats[index]) == cvt_utm_to_lonlat(
+            eastings[index], northings[index], zone_number, hemisphere)
+    np.testing.assert_allclose(lons, LONGITUDES, atol=1e-9)
+    np.testing.assert_allclose(lats, LATITUDES, atol=1e-9)
+
+
+def test_transformers_are_reused_per_zone():
+    """Transformer construction should happen once per zone and direction."""
+    assert _get_utm_transformer(12, "north") is _get_utm_transformer(12, "north")
+    assert _get_utm_transformer(12, "north") is not _get_utm_transformer(12, "north", inverse=True)
+
+    with pytest.raises(ValueError):
+        cvt_utm_to_lonlat(400000.0, 3700000.0, 12, "east")
+
+
+def test_shape_projection_uses_one_zone_array():
+    """Shape helpers should project into one zone and measure the projected array."""
+    shape_points = list(zip(LONGITUDES, LATITUDES))
+    projected_points, zone_number, hemisphere = _shape_points_to_utm(shape_points)
+
+    assert projected_points.shape == (len(shape_points), 2)
+    assert (zone_number, hemisphere) == (12, "north")
+    expected_length = sum(
+        float(np.hypot(*(end - start)))
+        for start, end in zip(projected_points, projected_points[1:])
+    )
+    assert _shape_length_meters(shape_points) == pytest.approx(expected_length)
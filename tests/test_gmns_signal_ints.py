@@ -0,0 +1,39 @@
+"""Regression tests for the native signal intersection tables."""
+
+from pathlib import Path
+
+import pandas as pd
+
+from utdf2gmns.func_lib.gmns.generate_signal_intersection import (SIGNAL_INT_TABLE_COLUMNS,
+                                                                  generate_gmns_signal_ints)
+from utdf2gmns.func_lib.utdf.read_utdf import read_UTDF
+
+
+def test_signal_tables_follow_utdf_timings_and_worker_count(tmp_path):
+    """Signal tables should carry the UTDF timings, per node and for all nodes, with any worker count."""
+    utdf_dict = read_UTDF(str(Path(__file__).resolve().parents[1] / "datasets" / "data_bullhead_seg4" / "UTDF.csv"))
+
+    assert generate_gmns_signal_ints(utdf_dict, str(tmp_path / "serial"))
+    assert generate_gmns_signal_ints(utdf_dict, str(tmp_path / "pool"), max_workers=2)
+
+    node_dir = tmp_path / "serial" / "Node_39_SR 95_Camp Mohave South"
+    for table_name, columns in SIGNAL_INT_TABLE_COLUMNS.items():
+        df_table = pd.read_csv(tmp_path / "serial" / f"{table_name}.csv", dtype=str, keep_default_na=False)
+        assert list(df_table.columns) == columns
+        assert (node_dir / f"{table_name}.csv").read_bytes() == (
+            tmp_path / "pool" / node_dir.name / f"{table_name}.csv").read_bytes()
+        assert (tmp_path / "serial" / f"{table_name}.csv").read_bytes() == (
+            tmp_path / "pool" / f"{table_name}.csv").read_bytes()
+
+    timing_plan = pd.read_csv(node_dir / "signal_timing_plan.csv", dtype=str)
+    assert timing_plan.loc[0, ["cycle_length", "coord_phase", "offset"]].tolist() == ["73.2", "206", "54.5"]
+
+    concurrency = pd.read_csv(node_dir / "signal_phase_concurrency.csv", dtype=str)
+    assert concurrency.set_index("signal_phase_id").loc["4", ["ring", "barrier"]].tolist() == ["1", "2"]
+
+    signal_phase = pd.read_csv(node_dir / "signal_phase.csv", dtype=str).set_index("mvmt_text_id")
+    assert signal_phase.loc["NBT", ["phase_num", "protection"]].tolist() == ["2", "Protected"]
+    assert signal_phase.loc["NBR", ["mvmt_id", "protection"]].tolist() == ["21", "RTOR"]
+
+    sim_timing = pd.read_csv(node_dir / "sim_timing.csv", dtype=str).set_index("mvmt_text_id")
+    assert sim_timing.loc["NBT", ["time_window", "green_time", "stage_no"]].tolist() == ["000000_000020", "20", "1"]
@@ -7,6 +7,8 @@ from shapely import wkt
 
 from utdf2gmns import UTDF2GMNS
 from utdf2gmns.func_lib.gmns.generate_lane_movement import (
+    _build_polygon_geometries,
+    _build_polygon_geometry,
     generate_gmns_lane,
     generate_gmns_link,
     generate_gmns_movement,
@@ -213,3 +215,27 @@ def test_gmns_signal_control_uses_shared_controller_local_lanes(tmp_path):
     with open(signal_file, encoding="utf-8") as file:
         signal_control = json.load(file)
     assert all(isinstance(node_id, str) for node_id in signal_control)
+
+
+def test_batched_polygons_match_single_polygons():
+    """Polygons built in one batch should match polygons built one at a time."""
+    curved_shape = [(-111.9400, 33.4200), (-111.9390, 33.4205), (-111.93899, 33.42051), (-111.9380, 33.4215)]
+    straight_shape = [(151.2000, -33.8700), (151.2010, -33.8700)]
+    polygon_specs = [
+        (curved_shape, 3, 3.6576, None),
+        *[(curved_shape, 3, 3.6576, lane_index) for lane_index in range(3)],
+        (straight_shape, 2, 3.2, 1),
+        ([(-111.94, 33.42)], 1, 3.2, None),
+        (None, 1, 3.2, 0),
+    ]
+
+    polygon_geometries = _build_polygon_geometries(polygon_specs)
+
+    assert polygon_geometries == [_build_polygon_geometry(*polygon_spec) for polygon_spec in polygon_specs]
+    assert polygon_geometries[-2:] == ["", ""]
+
+    link_polygon = wkt.loads(polygon_geometries[0])
+    lane_polygons = [wkt.loads(geometry) for geometry in polygon_geometries[1:4]]
+    assert all(lane_polygon.is_valid for lane_polygon in lane_polygons)
+    assert abs(sum(lane_polygon.area for lane_polygon in lane_polygons) - link_polygon.area) < 1e-6 * link_polygon.area
+
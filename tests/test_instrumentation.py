@@ -0,0 +1,90 @@
+"""Regression tests for the stage timing and counters of the conversion."""
+
+import json
+import shutil
+import threading
+from pathlib import Path
+
+from utdf2gmns import UTDF2GMNS
+from utdf2gmns.util_lib.instrumentation import StageRecorder, count, record_stage
+
+
+PATH_UTDF = Path(__file__).resolve().parents[1] / "datasets" / "data_bullhead_seg4" / "UTDF.csv"
+SINGLE_COORD = {"INTID": "39", "x_coord": -114.59807666698381, "y_coord": 35.02605198650903}
+
+
+def test_nested_stages_record_counters_memory_and_callback():
+    """Counters go to the innermost open stage, peak memory covers nested stages, the callback sees each stage."""
+    finished = []
+    recorder = StageRecorder(trace_memory=True, on_stage_end=finished.append)
+
+    # no stage is open, nothing is recorded
+    count("projections", 5)
+    with record_stage("orphan") as counters:
+        assert counters is None
+
+    with recorder.stage("convert"):
+        count("projections", 2)
+        with record_stage("writer", file="link.csv"):
+            buffer = bytearray(4_000_000)
+            count("xml_elements_written", 3)
+            del buffer
+        count("projections")
+
+    assert [record["name"] for record in finished] == ["writer", "convert"]
+    writer, convert = recorder.records
+    assert writer["parent"] == "convert" and writer["info"] == {"file": "link.csv"}
+    assert writer["counters"] == {"xml_elements_written": 3}
+    assert convert["counters"] == {"projections": 3}
+    assert writer["peak_memory_bytes"] >= 4_000_000
+    assert convert["peak_memory_bytes"] >= 4_000_000
+    assert convert["wall_time_s"] >= writer["wall_time_s"]
+
+
+def test_recorders_in_threads_keep_their_own_stages():
+    """count() and record_stage() in one thread should not record into a stage open in another thread."""
+    barrier = threading.Barrier(2)
+    recorders = {}
+
+    def convert(name: str, value: int):
+        recorders[name] = recorder = StageRecorder()
+        with recorder.stage(name):
+            # both stages are open before either thread counts
+            barrier.wait()
+            with record_stage("writer"):
+                count("projections", value)
+                barrier.wait()
+            count("projections", value)
+
+    threads = [threading.Thread(target=convert, args=(name, value)) for name, value in [("a", 1), ("b", 10)]]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for name, value in [("a", 1), ("b", 10)]:
+        writer, stage = recorders[name].records
+        assert (writer["name"], writer["parent"], writer["counters"]) == ("writer", name, {"projections": value})
+        assert stage["counters"] == {"projections": value}
+
+
+def test_conversion_report_covers_each_stage(tmp_path):
+    """The UTDF2GMNS JSON report should hold the parse, geocode, profile and writer stages with counters."""
+    shutil.copy(PATH_UTDF, tmp_path / "UTDF.csv")
+    stage_names = []
+    net = UTDF2GMNS(tmp_path / "UTDF.csv", on_stage_end=lambda record: stage_names.append(record["name"]))
+    net.geocode_utdf_intersections(single_intersection_coord=SINGLE_COORD)
+    net.utdf_to_gmns(output_dir=str(tmp_path / "gmns"), incl_utdf=False)
+
+    report = json.loads(net.get_stage_report(path=str(tmp_path / "report.json")))
+    assert json.loads((tmp_path / "report.json").read_text()) == report
+    assert [record["name"] for record in report["stages"]] == stage_names
+    assert stage_names[:2] == ["parse", "geocode"]
+
+    totals = report["totals"]
+    assert totals["parse"]["counters"] == {"utdf_rows": 1191, "intersections": 22}
+    assert totals["geocode"]["counters"]["projections"] == 22
+    assert totals["profile_build"]["counters"]["edge_profiles"] == 42
+    assert totals["gmns.lane_csv"]["counters"]["projections"] > 0
+    assert {record["parent"] for record in report["stages"] if record["name"].startswith("gmns.")} == {"utdf_to_gmns"}
+    assert all(record["status"] == "ok" and record["peak_memory_bytes"] is None for record in report["stages"])
@@ -0,0 +1,59 @@
+"""Regression tests for the lazy imports of the package."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import utdf2gmns
+import utdf2gmns.func_lib as func_lib
+
+
+PATH_REPO = Path(__file__).resolve().parents[1]
+
+# upper bound of the cumulative import time of utdf2gmns, in microseconds
+COLD_IMPORT_BUDGET_US = 50_000
+
+# modules that must not be imported by "import utdf2gmns"
+HEAVY_MODULES = ("pandas", "numpy", "pyufunc", "sumolib", "utdf2gmns._utdf2gmns",
+                 "utdf2gmns.func_lib.sumo.gmns2sumo", "xml.dom.minidom")
+
+
+def _run_python(code: str, *args: str) -> subprocess.CompletedProcess:
+    """run python code in a fresh interpreter, so no module is imported beforehand"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(PATH_REPO), os.environ.get("PYTHONPATH")])))
+    return subprocess.run([sys.executable, *args, "-c", code], capture_output=True, text=True,
+                          cwd=PATH_REPO, env=env, check=True)
+
+
+def test_cold_import_is_within_budget():
+    """import utdf2gmns should not import heavy modules and should stay within the cold-start budget."""
+    result = _run_python(f"import sys, utdf2gmns; print([m for m in {HEAVY_MODULES!r} if m in sys.modules])",
+                         "-X", "importtime")
+    assert result.stdout.strip() == "[]"
+
+    # the last line of -X importtime is the top-level package: "import time: self | cumulative | utdf2gmns"
+    import_time_line = [line for line in result.stderr.splitlines() if line.endswith("| utdf2gmns")][-1]
+    assert int(import_time_line.split("|")[1]) < COLD_IMPORT_BUDGET_US
+
+
+def test_reading_utdf_does_not_import_writers():
+    """Using read_UTDF should only import the UTDF reader, not the GMNS or SUMO writers."""
+    result = _run_python("import sys, utdf2gmns as ug; ug.read_UTDF; "
+                         "print(sorted(m for m in sys.modules if m.startswith('utdf2gmns.func_lib.')))")
+    assert "utdf2gmns.func_lib.utdf.read_utdf" in result.stdout
+    assert "gmns" not in result.stdout.replace("utdf2gmns", "")
+    assert "sumo" not in result.stdout
+
+
+def test_lazy_names_resolve_to_their_functions():
+    """Every exported name should resolve, func_lib should list what its subpackages export."""
+    for module in (utdf2gmns, func_lib, func_lib.utdf, func_lib.gmns, func_lib.sumo, func_lib.sumo_geojson):
+        for name in module.__all__:
+            assert callable(getattr(module, name)), f"{module.__name__}.{name}"
+        assert set(module.__all__) <= set(dir(module))
+
+    assert func_lib.__all__ == (func_lib.utdf.__all__ + func_lib.gmns.__all__ + func_lib.sumo.__all__
+                                + func_lib.sumo_geojson.__all__ + ["plot_net_mpl", "plot_net_keplergl"])
+    assert utdf2gmns.update_sumo_signal_from_utdf is func_lib.sumo.update_sumo_signal_from_utdf
+    assert callable(func_lib.sumo.update_sumo_signal_from_utdf)
@@ -0,0 +1,76 @@
+"""Regression tests for the UTDF section reader."""
+
+import pandas as pd
+
+from utdf2gmns.func_lib.utdf.read_utdf import _scan_utdf_sections, read_UTDF
+
+
+UTDF_TEXT = """[Network],,,,
+Network Settings,,,,
+RECORDNAME,DATA,,,
+UTDFVERSION,8,,,
+Metric,0,,,
+,,,,
+[Nodes],,,,
+Node Data,,,,
+INTID,TYPE,X,Y,
+1,0,100,200,
+2,1,300,200,
+
+,,,,
+[Links],,,,
+Link Data,,,,
+RECORDNAME,INTID,NB,SB,
+Up ID,1,2,,
+Lanes,1,1
+,,,,
+[Lanes],,,,
+Lane Group Data,,,,
+RECORDNAME,INTID,NBT,SBT,PED
+Lanes,1,1,0,
+,,,,
+[Timeplans],,,,
+Timing Plan Settings,,,,
+RECORDNAME,INTID,DATA,,
+Cycle Length,1,90,,
+,,,,
+[Phases],,,,
+Phasing Data,,,,
+RECORDNAME,INTID,D1,D2,
+BRP,1,111,112,
+"""
+
+
+def test_scan_finds_sections_in_file_order():
+    """Each section should start after its column line and end before the next title line."""
+    section_list = _scan_utdf_sections(UTDF_TEXT)
+
+    assert [section[0] for section in section_list] == ["Network", "Nodes", "Links", "Lanes", "Timeplans", "Phases"]
+    assert section_list[0][1] == "RECORDNAME,DATA,,,"
+    assert section_list[0][2] == "UTDFVERSION,8,,,\nMetric,0,,,\n,,,,\n"
+
+
+def test_read_utdf_cleans_rows_and_columns(tmp_path):
+    """Invalid rows and unnamed padding columns should be removed from every table."""
+    path_utdf = tmp_path / "UTDF.csv"
+    path_utdf.write_text(UTDF_TEXT, encoding="utf-8")
+
+    utdf_dict = read_UTDF(str(path_utdf))
+
+    assert list(utdf_dict) == ["Network", "Nodes", "Links", "Lanes", "Timeplans", "Phases", "phase_timeplans"]
+    assert list(utdf_dict["Network"].columns) == ["RECORDNAME", "DATA"]
+    assert utdf_dict["Network"]["RECORDNAME"].tolist() == ["UTDFVERSION", "Metric", ""]
+
+    df_node = utdf_dict["Nodes"]
+    assert list(df_node.columns) == ["INTID", "TYPE", "X", "Y"]
+    assert df_node["INTID"].tolist() == ["1", "2"]
+    assert df_node.index.tolist() == [0, 1]
+
+    # short rows keep missing values instead of empty strings
+    df_link = utdf_dict["Links"]
+    assert df_link["SB"].tolist()[0] == ""
+    assert pd.isna(df_link["SB"].tolist()[1])
+
+    assert utdf_dict["Lanes"].loc[0, "PED"] == ""
+    assert list(utdf_dict["Timeplans"].columns) == ["RECORDNAME", "INTID", "DATA"]
+    assert utdf_dict["Phases"].loc[0, "D2"] == "112"
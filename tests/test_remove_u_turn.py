@@ -3,6 +3,8 @@
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
+from utdf2gmns.func_lib.sumo import post_process_net
+from utdf2gmns.func_lib.sumo.post_process_net import post_process_sumo_net
 from utdf2gmns.func_lib.sumo.remove_u_turn import remove_sumo_U_turn
 
 
@@ -124,3 +126,44 @@ def test_preserve_non_dead_end_u_turn_without_con_file(tmp_path):
     remove_sumo_U_turn(str(path_net), rebuild_net=False)
 
     assert _get_single_connection(path_net).get("dir") == "t"
+
+
+def test_post_process_parses_and_writes_net_once(tmp_path, monkeypatch):
+    """All post-processing steps should share one parse of the net file."""
+    path_net = tmp_path / "network.net.xml"
+    path_con = tmp_path / "network.con.xml"
+    explicit_connection = {"from": "3_2", "to": "2_3", "fromLane": "0", "toLane": "0", "dir": "t"}
+
+    _write_sumo_net(
+        path_net,
+        edges=[
+            {"id": "1_2", "from": "1", "to": "2"},
+            {"id": "2_1", "from": "2", "to": "1"},
+            {"id": "3_2", "from": "3", "to": "2"},
+            {"id": "2_3", "from": "2", "to": "3"},
+            {"id": "4_5", "from": "4", "to": "5"},
+            {"id": "5_4", "from": "5", "to": "4"},
+        ],
+        connections=[
+            {"from": "1_2", "to": "2_3", "fromLane": "0", "toLane": "0", "dir": "s"},
+            explicit_connection,
+            {"from": "4_5", "to": "5_4", "fromLane": "0", "toLane": "0", "dir": "t"},
+        ],
+    )
+    _write_sumo_connections(path_con, connections=[explicit_connection])
+
+    parsed_files = []
+    parse = ET.parse
+
+    def count_parse(source, *args, **kwargs):
+        parsed_files.append(Path(source).name)
+        return parse(source, *args, **kwargs)
+
+    monkeypatch.setattr(post_process_net.ET, "parse", count_parse)
+    assert post_process_sumo_net(str(path_net), None, str(path_con),
+                                 remove_end_route_connection=True,
+                                 rebuild_net=False)
+
+    assert parsed_files.count(path_net.name) == 1
+    assert [(connection.get("from"), connection.get("dir")) for connection in _get_connections(path_net)] == [
+        ("1_2", "s"), ("3_2", "invalid")]
@@ -0,0 +1,123 @@
+"""Regression tests for decomposing UTDF turning counts into network-level routes."""
+
+import copy
+import random
+
+import pytest
+
+from utdf2gmns.func_lib.sumo import gmns2sumo
+from utdf2gmns.func_lib.sumo.gmns2sumo import _decompose_turn_movements_to_routes
+
+
+def _movement_records(movement_counts: dict) -> list:
+    return [{"source_edge_id": source_edge_id, "target_edge_id": target_edge_id,
+             "volume": volume, "movement_name": f"{source_edge_id}_{target_edge_id}"}
+            for (source_edge_id, target_edge_id), volume in movement_counts.items()]
+
+
+def _movement_usage(network_routes: list) -> dict:
+    movement_usage = {}
+    for network_route in network_routes:
+        edge_path = network_route["main_edge_path"]
+        for movement_key in zip(edge_path, edge_path[1:]):
+            movement_usage[movement_key] = movement_usage.get(movement_key, 0.0) + network_route["volume"]
+    return movement_usage
+
+
+# a -> b splits to c and d, b <-> e is a counted loop, c -> f is an uncounted connector
+MOVEMENT_COUNTS = {("a", "b"): 10.0, ("b", "c"): 6.0, ("b", "d"): 8.0, ("b", "e"): 3.0, ("e", "b"): 3.0}
+TOPOLOGY_GRAPH = {"a": {"b"}, "b": {"c", "d", "e"}, "c": {"f"}, "d": set(), "e": {"b"}, "f": set()}
+
+
+@pytest.mark.parametrize("decomposition_method", ["greedy", "min_cost_flow"])
+def test_routes_never_exceed_counts(decomposition_method):
+    """Routes should run between boundary edges and never use a movement beyond its count."""
+    network_routes = _decompose_turn_movements_to_routes(
+        _movement_records(MOVEMENT_COUNTS), 50, 0.5,
+        boundary_source_edge_ids={"a"}, boundary_sink_edge_ids={"d", "f"},
+        topology_transition_graph=TOPOLOGY_GRAPH,
+        decomposition_method=decomposition_method)
+
+    assert network_routes
+    for network_route in network_routes:
+        assert network_route["main_edge_path"][0] == "a"
+        assert network_route["main_edge_path"][-1] in {"d", "f"}
+    for movement_key, volume in _movement_usage(network_routes).items():
+        assert movement_key in MOVEMENT_COUNTS or movement_key == ("c", "f")
+        assert volume <= MOVEMENT_COUNTS.get(movement_key, float("inf")) + 1e-6
+
+
+def test_min_cost_flow_covers_all_routable_counts():
+    """The flow decomposition should route all vehicles entering at the boundary."""
+    network_routes = _decompose_turn_movements_to_routes(
+        _movement_records(MOVEMENT_COUNTS), 50, 0.5,
+        boundary_source_edge_ids={"a"}, boundary_sink_edge_ids={"d", "f"},
+        topology_transition_graph=TOPOLOGY_GRAPH,
+        decomposition_method="min_cost_flow")
+
+    movement_usage = _movement_usage(network_routes)
+    assert movement_usage[("a", "b")] == pytest.approx(10.0)
+    assert sum(network_route["volume"] for network_route in network_routes) == pytest.approx(10.0)
+
+
+def test_min_cost_flow_without_topology_uses_count_endpoints():
+    """Without a topology graph, routes should run between count sources and count sinks."""
+    network_routes = _decompose_turn_movements_to_routes(
+        _movement_records({("a", "b"): 4.0, ("b", "c"): 4.0}), 50, 0.5,
+        decomposition_method="min_cost_flow")
+
+    assert network_routes == [{"main_edge_path": ["a", "b", "c"], "volume": 4.0}]
+
+
+def test_unknown_decomposition_method_raises():
+    with pytest.raises(ValueError):
+        _decompose_turn_movements_to_routes([], 50, 0.5, decomposition_method="random")
+
+
+def _rescan_physical_boundary_routes(residual_turn_volumes, boundary_source_edge_ids, boundary_sink_edge_ids,
+                                     transition_graph, max_route_edges, volume_epsilon=1e-6):
+    """Greedy decomposition that rescans every movement for each route, as before path caching."""
+    counted_transition_keys = {(source_edge_id, target_edge_id)
+                               for source_edge_id, target_volumes in residual_turn_volumes.items()
+                               for target_edge_id in target_volumes}
+    reverse_graph = gmns2sumo._reverse_transition_graph(transition_graph)
+    network_routes = []
+    while residual_turn_volumes:
+        edge_path = gmns2sumo._find_best_physical_boundary_path(
+            residual_turn_volumes, boundary_source_edge_ids, boundary_sink_edge_ids, transition_graph,
+            reverse_graph, counted_transition_keys, max_route_edges, volume_epsilon)
+        if not edge_path:
+            break
+        positive_edges = gmns2sumo._positive_residual_edges_on_path(edge_path, residual_turn_volumes, volume_epsilon)
+        route_volume = gmns2sumo._path_residual_capacity_from_edges(positive_edges, residual_turn_volumes)
+        for source_edge_id, target_edge_id in positive_edges:
+            residual_turn_volumes[source_edge_id][target_edge_id] -= route_volume
+        gmns2sumo._clean_residual_turn_volumes(residual_turn_volumes, volume_epsilon)
+        if route_volume >= 0.5:
+            network_routes.append({"main_edge_path": edge_path, "volume": route_volume})
+    return network_routes
+
+
+def test_cached_greedy_paths_match_rescanning():
+    """Caching candidate paths between routes should not change the greedy routes."""
+    rng = random.Random(7)
+    for _ in range(100):
+        edge_ids = [f"e{i:02d}" for i in range(rng.randint(4, 25))]
+        transition_graph = {edge_id: set(rng.sample(edge_ids, rng.randint(0, 3))) - {edge_id}
+                            for edge_id in edge_ids}
+        residual_turn_volumes = {}
+        for source_edge_id, target_edge_ids in transition_graph.items():
+            for target_edge_id in sorted(target_edge_ids):
+                if rng.random() < 0.7:
+                    residual_turn_volumes.setdefault(source_edge_id, {})[target_edge_id] = rng.choice(
+                        [0.5, 1.0, 1.5, 2.0, 3.0, 7.0])
+        boundary_source_edge_ids = set(rng.sample(edge_ids, rng.randint(1, 4)))
+        boundary_sink_edge_ids = set(rng.sample(edge_ids, rng.randint(1, 4)))
+        max_route_edges = rng.choice([3, 5, 50])
+
+        assert gmns2sumo._decompose_to_physical_boundary_routes(
+            copy.deepcopy(residual_turn_volumes), boundary_source_edge_ids, boundary_sink_edge_ids,
+            transition_graph, max_route_edges, 0.5, 1e-6,
+        ) == _rescan_physical_boundary_routes(
+            copy.deepcopy(residual_turn_volumes), boundary_source_edge_ids, boundary_sink_edge_ids,
+            transition_graph, max_route_edges)
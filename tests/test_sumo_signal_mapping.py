@@ -11,7 +11,9 @@ from utdf2gmns.func_lib.sumo.update_sumo_signal_from_utdf import (
     _build_inbound_direction_mapping_from_lanes,
     _build_movement_lookup_from_lanes,
     _build_signal_controller_mapping,
+    _get_timeplan_value,
     _select_movement_name_for_sumo_connection,
+    get_utdf_timeplan_lookup,
 )
 from utdf2gmns.func_lib.utdf.cvt_utdf_lane_df_to_dict import cvt_lane_df_to_dict
 
@@ -280,6 +282,30 @@ def test_timeplans_node_rows_map_child_signal_to_controller():
     }
 
 
+def test_timeplan_lookup_is_shared_and_keeps_first_value():
+    """Timeplans should be indexed once per table and return the first value of each record."""
+    timeplans = pd.DataFrame([
+        {"INTID": "100", "RECORDNAME": "Cycle Length", "DATA": "90"},
+        {"INTID": "0100", "RECORDNAME": "Cycle Length", "DATA": "120"},
+        {"INTID": "100", "RECORDNAME": "Offset", "DATA": ""},
+        {"INTID": "100", "RECORDNAME": "Node 0", "DATA": "200"},
+    ])
+    utdf_dict = {"Timeplans": timeplans}
+    timeplan_lookup = get_utdf_timeplan_lookup(utdf_dict)
+
+    assert get_utdf_timeplan_lookup(utdf_dict) is timeplan_lookup
+    assert _get_timeplan_value(timeplan_lookup, "100", "Cycle Length", "0") == "90"
+    assert _get_timeplan_value(timeplan_lookup, "100", "Offset", "0") == "0"
+    assert _get_timeplan_value(timeplan_lookup, "300", "Offset", "0") == "0"
+    assert _build_signal_controller_mapping(timeplans, timeplan_lookup=timeplan_lookup) == {
+        "100": "100",
+        "200": "100",
+    }
+
+    utdf_dict["Timeplans"] = timeplans.iloc[1:]
+    assert _get_timeplan_value(get_utdf_timeplan_lookup(utdf_dict), "100", "Cycle Length", "0") == "120"
+
+
 def test_shared_controller_uses_controller_phase_and_local_lanes():
     """Child nodes should use controller timing with their own lane phases."""
     phase_rows = [
@@ -450,3 +476,118 @@ def test_utdf_actuated_control_uses_static_sumo_program(tmp_path):
     output_text = net_file.read_text(encoding="utf-8")
     assert 'type="static"' in output_text
     assert 'duration="30.0"' in output_text
+
+
+def test_low_memory_sumo_net_keeps_same_signal_information():
+    """Streaming a net in low-memory mode should index the same signal data as a full parse."""
+    from pathlib import Path
+
+    import pytest
+
+    from utdf2gmns.func_lib.sumo.read_sumo import ReadSUMO
+
+    net_file = str(Path(__file__).resolve().parents[1] / "datasets" / "data_bullhead_seg4"
+                   / "utdf_to_sumo" / "utdf_to_sumo.net.xml")
+    sumo_net = ReadSUMO(net_file)
+    low_memory_net = ReadSUMO(net_file, low_memory=True)
+
+    assert low_memory_net.sumo_signal_info == sumo_net.sumo_signal_info
+    assert low_memory_net.inbound_edges == sumo_net.inbound_edges
+    assert low_memory_net.sumo_nbsw == sumo_net.sumo_nbsw
+    assert low_memory_net.crossing_dict == sumo_net.crossing_dict
+    assert list(low_memory_net.tl_logic_dict) == list(sumo_net.tl_logic_dict)
+    assert set(sumo_net.tl_logic_dict) == set(sumo_net.sumo_signal_info)
+    assert set(low_memory_net.connection_dict) == set(sumo_net.connection_dict)
+
+    kept_tags = {element.tag for element in low_memory_net._root}
+    assert kept_tags == {"edge", "connection", "tlLogic"}
+    assert not any(edge_id.startswith(":") for edge_id in low_memory_net.edge_dict)
+    with pytest.raises(ValueError):
+        low_memory_net.write_xml()
+
+
+def test_signal_timing_is_written_to_tls_additional_file(tmp_path):
+    """The tls additional file should carry the UTDF programs without touching the net file."""
+    import shutil
+    import xml.etree.ElementTree as ET
+    from pathlib import Path
+
+    from utdf2gmns.func_lib.sumo.update_sumo_signal_from_utdf import (TLS_ADD_PROGRAM_ID,
+                                                                      generate_sumo_tls_add_xml,
+                                                                      update_sumo_signal_from_utdf)
+    from utdf2gmns.func_lib.utdf.read_utdf import read_UTDF
+
+    dataset_dir = Path(__file__).resolve().parents[1] / "datasets" / "data_bullhead_seg4"
+    net_file = tmp_path / "network.net.xml"
+    shutil.copyfile(dataset_dir / "utdf_to_sumo" / "utdf_to_sumo.net.xml", net_file)
+
+    # a second program of the first signal, both are replaced and written once
+    net_tree = ET.parse(net_file)
+    first_program = net_tree.getroot().find("tlLogic")
+    second_program = ET.fromstring(ET.tostring(first_program))
+    second_program.set("programID", "1")
+    net_tree.getroot().insert(list(net_tree.getroot()).index(first_program) + 1, second_program)
+    net_tree.write(net_file, encoding="utf-8", xml_declaration=True)
+
+    net_text = net_file.read_bytes()
+    utdf_dict = read_UTDF(str(dataset_dir / "UTDF.csv"))
+
+    tll_file = tmp_path / "network.tll.add.xml"
+    assert generate_sumo_tls_add_xml(str(net_file), utdf_dict, str(tll_file))
+    assert net_file.read_bytes() == net_text
+
+    update_sumo_signal_from_utdf(str(net_file), utdf_dict)
+    net_programs = {tl_logic.get("id"): tl_logic for tl_logic in ET.parse(net_file).getroot().findall("tlLogic")}
+    tll_programs = ET.parse(tll_file).getroot().findall("tlLogic")
+
+    assert tll_programs
+    assert len({tl_logic.get("id") for tl_logic in tll_programs}) == len(tll_programs)
+    for tl_logic in tll_programs:
+        net_program = net_programs[tl_logic.get("id")]
+        assert tl_logic.get("programID") == TLS_ADD_PROGRAM_ID
+        assert tl_logic.get("offset") == net_program.get("offset")
+        assert [child.attrib for child in tl_logic] == [child.attrib for child in net_program]
+
+
+def test_signal_programs_from_process_pool_match_serial_run(tmp_path):
+    """Building the signal programs in worker processes should write the same net as the serial run."""
+    import shutil
+    from pathlib import Path
+
+    from utdf2gmns.func_lib.sumo.update_sumo_signal_from_utdf import update_sumo_signal_from_utdf
+    from utdf2gmns.func_lib.utdf.read_utdf import read_UTDF
+
+    dataset_dir = Path(__file__).resolve().parents[1] / "datasets" / "data_bullhead_seg4"
+    utdf_dict = read_UTDF(str(dataset_dir / "UTDF.csv"))
+
+    net_texts = []
+    for max_workers in (1, 2):
+        net_file = tmp_path / f"network_{max_workers}.net.xml"
+        shutil.copyfile(dataset_dir / "utdf_to_sumo" / "utdf_to_sumo.net.xml", net_file)
+        assert update_sumo_signal_from_utdf(str(net_file), utdf_dict, max_workers=max_workers)
+        net_texts.append(net_file.read_bytes())
+
+    assert net_texts[0] == net_texts[1]
+
+
+def test_bulk_signal_parsing_matches_per_intersection_parsing():
+    """Parsing all intersections in one pass should match parse_signal_control for each node."""
+    from pathlib import Path
+
+    from utdf2gmns.func_lib.sumo.signal_intersections import parse_all_signal_controls
+    from utdf2gmns.func_lib.utdf.read_utdf import read_UTDF
+
+    utdf_dict = read_UTDF(str(Path(__file__).resolve().parents[1] / "datasets" / "data_bullhead_seg4" / "UTDF.csv"))
+    df_phase, df_lane = utdf_dict["Phases"], utdf_dict["Lanes"]
+
+    signal_controls = parse_all_signal_controls(df_phase, df_lane)
+    assert signal_controls
+    for int_id, signal_control in signal_controls.items():
+        assert signal_control == parse_signal_control(df_phase, df_lane, int_id)
+
+    # nodes sharing one controller get equal, but separate phase dictionaries
+    controller_id, node_id = list(signal_controls)[:2]
+    shared_controls = parse_all_signal_controls(df_phase, df_lane, {node_id: controller_id, controller_id: controller_id})
+    assert list(shared_controls) == [node_id, controller_id]
+    assert shared_controls[node_id] == parse_signal_control(df_phase, df_lane, controller_id, lane_int_id=node_id)
+    assert shared_controls[node_id]["brp_info"] is not shared_controls[controller_id]["brp_info"]
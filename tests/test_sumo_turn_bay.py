@@ -1,11 +1,19 @@
 """Regression tests for SUMO turn-bay edge splitting."""
 
+import shutil
+import subprocess
 import xml.etree.ElementTree as ET
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from utdf2gmns.func_lib.gmns.geocoding_Nodes import calculate_new_coordinates_from_offsets
+from utdf2gmns.func_lib.sumo import gmns2sumo
 from utdf2gmns.func_lib.sumo.gmns2sumo import (
+    _cache_sumo_edge_profile_dict,
+    _clear_sumo_edge_profile_cache,
+    _get_sumo_edge_profile_dict,
     generate_net_link_lookup_dict,
     generate_sumo_connection_xml,
     generate_sumo_edg_xml,
@@ -1062,3 +1070,170 @@ def test_unrealistic_z_curve_falls_back_to_single_curve_point(tmp_path):
 
     assert len(forward_shape) == 3
     assert len(reverse_shape) == 3
+
+
+def test_cached_edge_profiles_are_shared_until_source_tables_change(tmp_path, monkeypatch):
+    """Writers should reuse one cached edge-profile model until its tables are replaced."""
+    utdf_dict = _build_turn_bay_utdf_dict()
+    build_count = {"count": 0}
+    build_edge_profiles = gmns2sumo._build_sumo_edge_profile_dict
+
+    def count_profile_builds(*args, **kwargs):
+        build_count["count"] += 1
+        return build_edge_profiles(*args, **kwargs)
+
+    monkeypatch.setattr(gmns2sumo, "_build_sumo_edge_profile_dict", count_profile_builds)
+
+    edge_profiles = _cache_sumo_edge_profile_dict(utdf_dict, "feet, mph")
+    generate_sumo_nod_xml(utdf_dict, str(tmp_path / "network.nod.xml"), "feet, mph")
+    generate_sumo_edg_xml(utdf_dict, "feet, mph", str(tmp_path / "network.edg.xml"))
+    generate_sumo_connection_xml(utdf_dict, str(tmp_path / "network.con.xml"), "feet, mph")
+    assert build_count["count"] == 1
+    assert _get_sumo_edge_profile_dict(utdf_dict, "feet, mph") is edge_profiles
+
+    # a different unit or a replaced source table must not reuse the cache
+    assert _get_sumo_edge_profile_dict(utdf_dict, "meters, km/h") is not edge_profiles
+    utdf_dict["network_nodes"] = dict(utdf_dict["network_nodes"])
+    assert _get_sumo_edge_profile_dict(utdf_dict, "feet, mph") is not edge_profiles
+    assert _cache_sumo_edge_profile_dict(utdf_dict, "feet, mph") is not edge_profiles
+    assert build_count["count"] == 4
+
+    _clear_sumo_edge_profile_cache(utdf_dict)
+    assert "sumo_edge_profiles" not in utdf_dict
+
+
+def test_profile_geometry_is_computed_once_for_all_writers(tmp_path, monkeypatch):
+    """SUMO and GMNS writers should share one shape and turn-bay split per profile."""
+    from utdf2gmns.func_lib.gmns.generate_lane_movement import generate_gmns_lane, generate_gmns_link
+
+    utdf_dict = _build_turn_bay_utdf_dict()
+    selected_profiles = []
+    get_profile_shape_anchors = gmns2sumo._get_profile_shape_anchors
+
+    def count_shape_selections(profile, *args, **kwargs):
+        selected_profiles.append(profile["edge_id"])
+        return get_profile_shape_anchors(profile, *args, **kwargs)
+
+    monkeypatch.setattr(gmns2sumo, "_get_profile_shape_anchors", count_shape_selections)
+
+    edge_profiles = _cache_sumo_edge_profile_dict(utdf_dict, "feet, mph")
+    generate_sumo_nod_xml(utdf_dict, str(tmp_path / "network.nod.xml"), "feet, mph")
+    generate_sumo_edg_xml(utdf_dict, "feet, mph", str(tmp_path / "network.edg.xml"))
+    generate_gmns_link(utdf_dict, str(tmp_path / "link.csv"), "feet, mph")
+    generate_gmns_lane(utdf_dict, str(tmp_path / "lane.csv"), "feet, mph")
+    assert sorted(selected_profiles) == sorted(edge_profiles)
+
+    bay_geometry = gmns2sumo._get_profile_turn_bay_geometry(
+        edge_profiles["2_1"], utdf_dict["network_nodes"], "feet, mph")
+    assert bay_geometry["main_shape_points"][-1] == bay_geometry["bay_node_coord"]
+    assert bay_geometry["stop_shape_points"][0] == bay_geometry["bay_node_coord"]
+    assert bay_geometry["main_length_m"] + bay_geometry["stop_length_m"] == pytest.approx(
+        bay_geometry["length_m"])
+
+    # a replaced network_nodes table must not reuse the attached geometry
+    gmns2sumo._get_profile_geometry(edge_profiles["2_1"], dict(utdf_dict["network_nodes"]), "feet, mph")
+    assert selected_profiles.count("2_1") == 2
+
+
+def _select_shape_one_candidate_at_a_time(start_point, end_point, current_curve_point,
+                                          reverse_curve_point, declared_length_m):
+    """Reference shape selection scoring each candidate shape on its own."""
+    candidate_shapes = []
+    if reverse_curve_point is not None and current_curve_point is not None:
+        candidate_shapes.append((0, 0, [start_point, reverse_curve_point, current_curve_point, end_point]))
+        candidate_shapes.append((0, 1, [start_point, current_curve_point, reverse_curve_point, end_point]))
+    if current_curve_point is not None:
+        candidate_shapes.append((1, 0, [start_point, current_curve_point, end_point]))
+    if reverse_curve_point is not None:
+        candidate_shapes.append((1, 1, [start_point, reverse_curve_point, end_point]))
+    candidate_shapes.append((2, 0, [start_point, end_point]))
+
+    valid_candidates = []
+    for priority_group, priority_order, shape_points in candidate_shapes:
+        cleaned_shape_points = gmns2sumo._dedupe_shape_points(shape_points)
+        if len(cleaned_shape_points) < 2:
+            continue
+        if gmns2sumo._shape_has_unrealistic_curve(cleaned_shape_points, declared_length_m):
+            continue
+        valid_candidates.append((
+            gmns2sumo._shape_candidate_score(cleaned_shape_points, declared_length_m, priority_group, priority_order),
+            cleaned_shape_points,
+        ))
+    if valid_candidates:
+        return min(valid_candidates, key=lambda candidate: candidate[0])[1]
+    return [start_point, end_point]
+
+
+@pytest.mark.parametrize("dataset_name, curved_shape_count", [
+    ("data_bullhead_seg4", 0),
+    ("data_Tempe_network", 113),
+])
+def test_batch_shape_selection_matches_one_candidate_at_a_time(dataset_name, curved_shape_count):
+    """Shapes selected for all approaches at once should match scoring each candidate on its own."""
+    from pathlib import Path
+
+    from utdf2gmns.func_lib.utdf.read_utdf import read_UTDF
+
+    dir_dataset = Path(__file__).resolve().parents[1] / "datasets" / dataset_name
+    utdf_dict = read_UTDF(str(dir_dataset / "UTDF.csv"))
+    df_node = pd.read_csv(dir_dataset / "utdf_to_gmns" / "node.csv", dtype={"node_id": str})
+    utdf_dict["network_nodes"] = {
+        node["node_id"]: {"X": str(node["X"]), "Y": str(node["Y"]),
+                          "x_coord": node["x_coord"], "y_coord": node["y_coord"]}
+        for node in df_node[~df_node["is_turn_bay_node"]].to_dict("records")
+    }
+
+    edge_profiles = gmns2sumo._build_sumo_edge_profile_dict(utdf_dict, "feet, mph")
+    curved_shapes = []
+    for profile in edge_profiles.values():
+        geometry = profile[gmns2sumo.PROFILE_GEOMETRY_KEY]
+        shape_anchors = gmns2sumo._get_profile_shape_anchors(profile, utdf_dict["network_nodes"], "feet, mph")
+        expected_shape_points = _select_shape_one_candidate_at_a_time(*shape_anchors)
+        expected_projected_data = gmns2sumo._shape_points_to_utm(expected_shape_points)
+
+        assert geometry["shape_points"] == expected_shape_points
+        assert np.array_equal(geometry["projected_data"][0], expected_projected_data[0])
+        assert geometry["projected_data"][1:] == expected_projected_data[1:]
+        if len(expected_shape_points) > 2:
+            curved_shapes.append(expected_shape_points)
+
+    assert len(curved_shapes) == curved_shape_count
+
+
+def test_connection_file_deletes_dead_end_u_turns(tmp_path):
+    """Dead-end U-turns written as <delete> entries should not be built by netconvert."""
+    utdf_dict = _build_bidirectional_curved_link_utdf_dict()
+    utdf_dict["Lanes"] = pd.DataFrame(columns=["RECORDNAME", "INTID"])
+    node_file = tmp_path / "network.nod.xml"
+    edge_file = tmp_path / "network.edg.xml"
+    connection_file = tmp_path / "network.con.xml"
+
+    generate_sumo_nod_xml(utdf_dict, str(node_file), "feet, mph")
+    generate_sumo_edg_xml(utdf_dict, "feet, mph", str(edge_file))
+    generate_sumo_connection_xml(utdf_dict, str(connection_file), "feet, mph",
+                                 delete_dead_end_u_turns=True)
+
+    deleted_pairs = {
+        (delete.get("from"), delete.get("to"))
+        for delete in ET.parse(connection_file).getroot().findall("delete")
+    }
+    assert deleted_pairs == {("1_2", "2_1"), ("2_1", "1_2")}
+
+    netconvert_executable = shutil.which("netconvert")
+    if netconvert_executable is None:
+        pytest.skip("netconvert is not installed")
+
+    net_file = tmp_path / "network.net.xml"
+    subprocess.run([netconvert_executable,
+                    f"--node-files={node_file}",
+                    f"--edge-files={edge_file}",
+                    f"--connection-files={connection_file}",
+                    f"--output-file={net_file}",
+                    "--no-warnings=true",
+                    "--proj.utm"],
+                   check=True, capture_output=True)
+    net_pairs = {
+        (connection.get("from"), connection.get("to"))
+        for connection in ET.parse(net_file).getroot().findall("connection")
+    }
+    assert not net_pairs & deleted_pairs
@@ -0,0 +1,41 @@
+"""Regression tests for the pretty-printed SUMO XML writer."""
+
+import xml.etree.ElementTree as ET
+from xml.dom import minidom
+
+import pytest
+
+from utdf2gmns.func_lib.sumo.gmns2sumo import write_pretty_xml, xml_prettify
+
+
+def _minidom_prettify(element: ET.Element) -> str:
+    return minidom.parseString(ET.tostring(element, "utf-8")).toprettyxml(indent="    ")
+
+
+def _sample_tree() -> ET.Element:
+    root = ET.Element("routes")
+    ET.SubElement(root, "vType", id="car", type="passenger")
+    route = ET.SubElement(root, "route", id='r&"0"', edges="1_2 2_3")
+    route.text = "a < b"
+    param = ET.SubElement(root, "param", key="x", value="line\nbreak\tand > °")
+    ET.SubElement(param, "empty").text = ""
+    mixed = ET.SubElement(root, "mixed")
+    mixed.text = "head"
+    ET.SubElement(mixed, "child").tail = "tail"
+    return root
+
+
+def test_output_matches_minidom_byte_for_byte(tmp_path):
+    """The streaming writer should produce the same text as minidom toprettyxml."""
+    root = _sample_tree()
+    assert xml_prettify(root) == _minidom_prettify(root)
+
+    path_xml = tmp_path / "network.rou.xml"
+    write_pretty_xml(root, str(path_xml))
+    assert path_xml.read_text() == _minidom_prettify(root)
+
+
+def test_non_string_attribute_raises():
+    """Non-string attribute values should fail as in ElementTree serialization."""
+    with pytest.raises(TypeError):
+        xml_prettify(ET.Element("edge", numLanes=2))
@@ -0,0 +1,57 @@
+"""Regression tests for the synthetic UTDF network generator."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from utdf2gmns import UTDF2GMNS
+from utdf2gmns.func_lib.utdf.read_utdf import read_UTDF
+from utdf2gmns.func_lib.utdf.synthetic_utdf import generate_synthetic_utdf
+
+PATH_BENCH_SCALING = Path(__file__).resolve().parents[1] / "benchmarks" / "bench_scaling.py"
+
+
+def _load_bench_scaling():
+    """Load the benchmark script as a module without adding the benchmarks directory to sys.path."""
+    spec = importlib.util.spec_from_file_location("bench_scaling", PATH_BENCH_SCALING)
+    bench_scaling = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(bench_scaling)
+    return bench_scaling
+
+
+@pytest.mark.parametrize("layout, num_intersections, num_externals", [("grid", 12, 14), ("arterial", 5, 12)])
+def test_synthetic_network_converts_with_valid_signals(tmp_path, layout, num_intersections, num_externals):
+    """The generated file should parse like a Synchro export and convert with a signal at every intersection."""
+    path_utdf = generate_synthetic_utdf(str(tmp_path / "UTDF.csv"), num_intersections, layout=layout, seed=3)
+    assert Path(path_utdf).read_text() == Path(generate_synthetic_utdf(
+        str(tmp_path / "again.csv"), num_intersections, layout=layout, seed=3)).read_text()
+
+    utdf_dict = read_UTDF(path_utdf)
+    assert len(utdf_dict["Nodes"]) == num_intersections + num_externals
+    assert (utdf_dict["Nodes"]["TYPE"].astype(str) == "0").sum() == num_intersections
+    assert utdf_dict["Lanes"]["INTID"].nunique() == num_intersections
+    assert utdf_dict["Phases"]["INTID"].nunique() == num_intersections
+
+    net = UTDF2GMNS(path_utdf)
+    net.geocode_utdf_intersections(single_intersection_coord={"INTID": "1", "x_coord": -111.9, "y_coord": 33.4})
+    net.create_signal_control()
+    net.utdf_to_gmns(output_dir=str(tmp_path / "gmns"), incl_utdf=False)
+    assert len(net.network_nodes) == num_intersections + num_externals
+    assert sorted(net.network_int_ids_signalized, key=int) == [str(i) for i in range(1, num_intersections + 1)]
+    assert len(net.network_signal_control) == num_intersections
+
+
+def test_scaling_exponent_and_regression_check():
+    """A quadratic stage should fit an exponent of 2 and fail against a linear baseline."""
+    bench_scaling = _load_bench_scaling()
+
+    times = {10: 0.1, 100: 10.0, 1000: 1000.0}
+    assert bench_scaling.fit_complexity_exponent(times) == pytest.approx(2.0)
+    assert bench_scaling.fit_complexity_exponent({10: 0.001, 100: 0.5}) is None
+
+    results = {"grid": {"times": {"parse": times}, "exponents": {"parse": 2.0}}}
+    baseline = {"grid": {"times": {"parse": {"10": 0.1, "100": 1.0, "1000": 10.0}}, "exponents": {"parse": 1.0}}}
+    assert len(bench_scaling.find_regressions(results, baseline, exponent_tolerance=0.3)) == 1
+    assert len(bench_scaling.find_regressions(results, baseline, exponent_tolerance=0.3, time_tolerance=0.5)) == 3
+    assert bench_scaling.find_regressions(results, results, exponent_tolerance=0.3, time_tolerance=0.5) == []
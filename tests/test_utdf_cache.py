@@ -0,0 +1,87 @@
+"""Regression tests for the on-disk cache of parsed UTDF tables."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+from utdf2gmns.func_lib.utdf import read_utdf, utdf_cache
+from utdf2gmns.func_lib.utdf.read_utdf import read_UTDF
+from utdf2gmns.func_lib.utdf.utdf_cache import (clear_utdf_cache,
+                                                evict_utdf_cache,
+                                                utdf_cache_key)
+
+
+PATH_UTDF = Path(__file__).resolve().parents[1] / "datasets" / "data_bullhead_seg4" / "UTDF.csv"
+
+
+def test_warm_start_loads_same_tables_without_parsing(tmp_path, monkeypatch):
+    """A cached UTDF file should load identical tables without scanning the csv text."""
+    cache_dir = tmp_path / "cache"
+    utdf_dict = read_UTDF(str(PATH_UTDF))
+    read_UTDF(str(PATH_UTDF), cache_dir=str(cache_dir))
+    assert [path.name for path in cache_dir.iterdir()] == [f"{utdf_cache_key(str(PATH_UTDF))}.npz"]
+
+    def fail_scan(*args, **kwargs):
+        raise AssertionError("the csv file should not be parsed on a warm start")
+
+    monkeypatch.setattr(read_utdf, "_scan_utdf_sections", fail_scan)
+    utdf_dict_cached = read_UTDF(str(PATH_UTDF), cache_dir=str(cache_dir))
+
+    assert list(utdf_dict_cached) == list(utdf_dict)
+    for table_name, df_table in utdf_dict.items():
+        pd.testing.assert_frame_equal(utdf_dict_cached[table_name], df_table, check_exact=True)
+
+
+def test_cache_key_follows_file_content(tmp_path):
+    """Editing the UTDF file should change its cache key and re-parse the file."""
+    path_utdf = tmp_path / "UTDF.csv"
+    shutil.copy(PATH_UTDF, path_utdf)
+    cache_key = utdf_cache_key(str(path_utdf))
+    assert cache_key == utdf_cache_key(str(PATH_UTDF))
+
+    with open(path_utdf, "a", encoding="utf-8") as f:
+        f.write("\n")
+    assert utdf_cache_key(str(path_utdf)) != cache_key
+
+
+def test_corrupt_cache_file_is_replaced(tmp_path):
+    """An unreadable cache file should be removed and the UTDF file parsed again."""
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    path_cache = cache_dir / f"{utdf_cache_key(str(PATH_UTDF))}.npz"
+    path_cache.write_bytes(b"not a npz file")
+
+    utdf_dict = read_UTDF(str(PATH_UTDF), cache_dir=str(cache_dir))
+
+    assert len(utdf_dict["Nodes"]) == 22
+    assert path_cache.stat().st_size > len(b"not a npz file")
+
+
+def test_failed_cache_write_still_returns_parsed_tables(tmp_path, monkeypatch):
+    """An unwritable cache directory should only skip the cache, without leaving temporary files."""
+    path_not_dir = tmp_path / "not_a_dir"
+    path_not_dir.write_text("")
+    assert len(read_UTDF(str(PATH_UTDF), cache_dir=str(path_not_dir / "cache"))["Nodes"]) == 22
+
+    def fail_replace(*args, **kwargs):
+        raise PermissionError("read-only file system")
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(utdf_cache.os, "replace", fail_replace)
+    assert len(read_UTDF(str(PATH_UTDF), cache_dir=str(cache_dir))["Nodes"]) == 22
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_eviction_removes_least_recently_used_files(tmp_path):
+    """Eviction should remove the oldest files first until the directory fits the size bound."""
+    for i, name in enumerate(["old", "middle", "new"]):
+        path = tmp_path / f"{name}.npz"
+        path.write_bytes(b"0" * 1024)
+        os.utime(path, (1_000_000 + i, 1_000_000 + i))
+
+    assert evict_utdf_cache(str(tmp_path), max_size_mb=2.5 / 1024) == ["old.npz"]
+    assert evict_utdf_cache(str(tmp_path), max_size_mb=0, keep=("new.npz",)) == ["middle.npz"]
+    assert clear_utdf_cache(str(tmp_path)) == 1
+    assert list(tmp_path.iterdir()) == []
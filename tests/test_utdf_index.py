@@ -0,0 +1,81 @@
+"""Regression tests for grouping UTDF tables by intersection id."""
+
+import pandas as pd
+
+from utdf2gmns.func_lib.utdf.utdf_index import (UTDF_INTID_INDEX_CACHE_KEY,
+                                                cvt_utdf_table_to_intid_dict,
+                                                get_utdf_intid_groups,
+                                                group_utdf_table_by_intid)
+
+
+def _lane_table() -> pd.DataFrame:
+    return pd.DataFrame({
+        "RECORDNAME": ["Up Node", "Lanes", "Up Node", None, "Lanes", "Up Node"],
+        "INTID": ["2", "2", "1", None, "01", "3"],
+        "NBT": ["5", "1", "7", "x", "2", ""],
+    })
+
+
+def test_groups_follow_first_appearance_and_row_order():
+    """Groups should match boolean filtering for each INTID, with normalized ids merged."""
+    df_lane = _lane_table()
+    lane_groups = group_utdf_table_by_intid(df_lane)
+
+    assert list(lane_groups) == ["2", "1", "3"]
+    pd.testing.assert_frame_equal(lane_groups["2"], df_lane[df_lane["INTID"] == "2"])
+    assert lane_groups["1"].index.tolist() == [2, 4]
+    assert lane_groups.get("4") is None
+    assert lane_groups["3"] is lane_groups["3"]
+
+
+def test_table_to_intid_dict_matches_pandas_conversion():
+    """The one-pass conversion should match set_index + to_dict for each intersection."""
+    df_lane = _lane_table()
+    intid_dict = cvt_utdf_table_to_intid_dict(df_lane)
+
+    assert list(intid_dict) == ["2", "1", "3"]
+    assert intid_dict["2"] == df_lane[df_lane["INTID"] == "2"].drop(
+        columns="INTID").set_index("RECORDNAME").to_dict("dict")
+    assert intid_dict["1"] == {"NBT": {"Up Node": "7", "Lanes": "2"}}
+    assert cvt_utdf_table_to_intid_dict(df_lane.iloc[0:0]) == {}
+
+    df_lane.loc[2, "INTID"] = "01"
+    assert list(cvt_utdf_table_to_intid_dict(df_lane)) == ["2", "01", "3"]
+    assert list(cvt_utdf_table_to_intid_dict(df_lane, normalize_intid=True)) == ["2", "1", "3"]
+
+
+def test_cached_groups_follow_table_replacement():
+    """Cached groups should be reused until the table is replaced in utdf_dict."""
+    utdf_dict = {"Lanes": _lane_table()}
+    lane_groups = get_utdf_intid_groups(utdf_dict, "Lanes")
+
+    assert get_utdf_intid_groups(utdf_dict, "Lanes") is lane_groups
+    assert UTDF_INTID_INDEX_CACHE_KEY in utdf_dict
+
+    utdf_dict["Lanes"] = _lane_table().iloc[:3]
+    assert list(get_utdf_intid_groups(utdf_dict, "Lanes")) == ["2", "1"]
+    assert get_utdf_intid_groups(utdf_dict, "Phases") == {}
+
+
+def test_lane_and_link_dicts_are_converted_once_per_table():
+    """Lane and link dictionaries should be cached read-only until their table is replaced."""
+    from types import MappingProxyType
+
+    import pytest
+
+    from utdf2gmns.func_lib.gmns.geocoding_Links import get_utdf_link_dict
+    from utdf2gmns.func_lib.utdf.cvt_utdf_lane_df_to_dict import (cvt_lane_df_to_dict,
+                                                                  get_utdf_lane_dict)
+
+    utdf_dict = {"Lanes": _lane_table()}
+    lane_dict = get_utdf_lane_dict(utdf_dict)
+
+    assert lane_dict == cvt_lane_df_to_dict(utdf_dict["Lanes"])
+    assert get_utdf_lane_dict(utdf_dict) is lane_dict
+    assert isinstance(lane_dict["2"]["NBT"], MappingProxyType)
+    with pytest.raises(TypeError):
+        lane_dict["2"]["NBT"]["Up Node"] = "9"
+
+    utdf_dict["Lanes"] = _lane_table().iloc[:2]
+    assert list(get_utdf_lane_dict(utdf_dict)) == ["2"]
+    assert get_utdf_link_dict(utdf_dict) == {}
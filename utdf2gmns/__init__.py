@@ -7,21 +7,28 @@
 
 # todo: https://github.com/ngctnnnn/DRL_Traffic-Signal-Control
 
-from utdf2gmns._utdf2gmns import UTDF2GMNS
-from utdf2gmns.func_lib import (read_UTDF,
-                                cvt_lane_df_to_dict,
-                                cvt_link_df_to_dict,
-                                cvt_utdf_to_signal_intersection,
-                                remove_sumo_U_turn,
-                                update_sumo_signal_from_utdf,
+from utdf2gmns.util_lib.lazy_import import lazy_import_attrs
 
-                                sumo2geojson,
-
-                                plot_net_mpl,
-                                plot_net_keplergl)
-from utdf2gmns.util_lib import (calculate_point2point_distance_in_km,
-                                time_unit_converter,
-                                time_str_to_seconds)
+# the heavy modules (pandas, pyufunc, sumolib and the GMNS/SUMO writers) are imported
+# the first time one of their functions is used, so importing utdf2gmns is fast
+__getattr__, __dir__ = lazy_import_attrs(__name__, {
+    "utdf2gmns._utdf2gmns": ("UTDF2GMNS",),
+    "utdf2gmns.func_lib.utdf.read_utdf": ("read_UTDF",),
+    "utdf2gmns.func_lib.utdf.cvt_utdf_lane_df_to_dict": ("cvt_lane_df_to_dict",),
+    "utdf2gmns.func_lib.gmns.geocoding_Links": ("cvt_link_df_to_dict",),
+    "utdf2gmns.func_lib.gmns.sigma_x_process_signal_intersection": ("cvt_utdf_to_signal_intersection",),
+    "utdf2gmns.func_lib.gmns.generate_signal_intersection": ("generate_gmns_signal_ints",),
+    "utdf2gmns.func_lib.sumo.remove_u_turn": ("remove_sumo_U_turn",),
+    "utdf2gmns.func_lib.sumo.update_sumo_signal_from_utdf": ("update_sumo_signal_from_utdf",
+                                                             "generate_sumo_tls_add_xml"),
+    "utdf2gmns.func_lib.sumo.post_process_net": ("post_process_sumo_net",),
+    "utdf2gmns.func_lib.sumo_geojson.sumo2geojson": ("sumo2geojson",),
+    "utdf2gmns.func_lib.plot_net": ("plot_net_mpl", "plot_net_keplergl"),
+    "utdf2gmns.util_lib.instrumentation": ("StageRecorder",),
+    "utdf2gmns.util_lib.pkg_utils": ("calculate_point2point_distance_in_km",
+                                     "time_unit_converter",
+                                     "time_str_to_seconds"),
+})
 
 
 __all__ = [
@@ -30,14 +37,18 @@ __all__ = [
     'cvt_lane_df_to_dict',
     'cvt_link_df_to_dict',
     'cvt_utdf_to_signal_intersection',
+    "generate_gmns_signal_ints",
     'remove_sumo_U_turn',
     "update_sumo_signal_from_utdf",
+    "generate_sumo_tls_add_xml",
+    "post_process_sumo_net",
     'sumo2geojson',
     'plot_net_mpl',
     'plot_net_keplergl',
     "calculate_point2point_distance_in_km",
     "time_unit_converter",
     "time_str_to_seconds",
+    "StageRecorder",
 ]
 
 __version__ = "1.2.4"
@@ -6,21 +6,29 @@
 ##############################################################
 
 import os
+import functools
 import json
 from pathlib import Path
 import shutil
 import subprocess
+from typing import Callable
 import pandas as pd
 
 # import utility functions from pyufunc
 import pyufunc as pf
 
 from utdf2gmns.util_lib.pkg_utils import time_unit_converter, time_str_to_seconds
+from utdf2gmns.util_lib.instrumentation import StageRecorder, count, record_stage
 
 # For deployment
 from utdf2gmns.func_lib.utdf.geocoding_intersection import generate_intersection_coordinates
+from utdf2gmns.func_lib.utdf.geocoding_cache import (DEFAULT_GEOCODING_MAX_REQUESTS_PER_SECOND,
+                                                     DEFAULT_GEOCODING_MAX_WORKERS,
+                                                     GEOCODING_CACHE_FILENAME)
 from utdf2gmns.func_lib.utdf.read_utdf import (generate_intersection_from_Links, read_UTDF)
+from utdf2gmns.func_lib.utdf.utdf_cache import DEFAULT_UTDF_CACHE_MAX_SIZE_MB
 from utdf2gmns.func_lib.utdf.cvt_utdf_lane_df_to_dict import cvt_lane_df_to_dict
+from utdf2gmns.func_lib.utdf.utdf_index import build_utdf_intid_index
 
 from utdf2gmns.func_lib.gmns.geocoding_Nodes import update_node_from_one_intersection
 from utdf2gmns.func_lib.gmns.geocoding_Links import (generate_links,
@@ -31,15 +39,15 @@ from utdf2gmns.func_lib.gmns.generate_lane_movement import (generate_gmns_lane,
                                                             generate_gmns_movement,
                                                             generate_gmns_node)
 from utdf2gmns.func_lib.gmns.sigma_x_process_signal_intersection import cvt_utdf_to_signal_intersection
+from utdf2gmns.func_lib.gmns.generate_signal_intersection import generate_gmns_signal_ints
 
-from utdf2gmns.func_lib.sumo.signal_intersections import parse_signal_control
+from utdf2gmns.func_lib.sumo.signal_intersections import parse_all_signal_controls
 from utdf2gmns.func_lib.sumo.update_sumo_signal_from_utdf import (
-    _build_signal_controller_mapping,
-    _node_sort_key,
+    _map_signal_nodes_to_controllers,
     _normalize_utdf_node_id,
-    update_sumo_signal_from_utdf,
+    generate_sumo_tls_add_xml,
 )
-from utdf2gmns.func_lib.sumo.remove_u_turn import remove_sumo_U_turn
+from utdf2gmns.func_lib.sumo.post_process_net import post_process_sumo_net
 
 
 # SUMO related functions
@@ -48,12 +56,25 @@ from utdf2gmns.func_lib.sumo.gmns2sumo import (generate_sumo_nod_xml,
                                                generate_sumo_flow_xml,
                                                generate_sumo_network_route_xml,
                                                generate_sumo_connection_xml,
-                                               generate_sumo_loop_detector_add_xml)
+                                               generate_sumo_loop_detector_add_xml,
+                                               _cache_sumo_edge_profile_dict,
+                                               _clear_sumo_edge_profile_cache)
 
 
 pd.options.mode.chained_assignment = None  # default='warn'
 
 
+def _recorded_stage(stage_name: str) -> Callable:
+    """Record a UTDF2GMNS method as a stage of the instance's stage_recorder"""
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.stage_recorder.stage(stage_name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
 class UTDF2GMNS:
     """UTDF2GMNS performs the data conversion from UTDF to different formats.
     The class includes functions such as:
@@ -63,10 +84,14 @@ class UTDF2GMNS:
 
         - create_gmns_links: create network from UTDF data by combining Nodes, Links, Lanes, and Phases
 
+        - build_network_model: build the lane/turn-bay model shared by GMNS and SUMO writers
+
         - utdf_to_gmns: convert UTDF data to GMNS data and save to the output directory
 
         - utdf_to_sumo: convert UTDF data to SUMO data and save to the output directory
 
+        - get_stage_report: wall time, CPU time, peak memory and counters of each conversion stage
+
         - and more...
     """
     def __init__(
@@ -75,6 +100,10 @@ class UTDF2GMNS:
         region_name: str = "",
         *,
         verbose: bool = False,
+        cache_dir: str | os.PathLike[str] | None = None,
+        cache_max_size_mb: float = DEFAULT_UTDF_CACHE_MAX_SIZE_MB,
+        trace_memory: bool = False,
+        on_stage_end: Callable[[dict], None] | None = None,
     ) -> None:
         """Initialize UTDF2GMNS class with UTDF file and region name
 
@@ -82,6 +111,15 @@ class UTDF2GMNS:
             utdf_filename (str): the path to the UTDF file.
             region_name (str): the metropolitan region/place the utdf file represent. Defaults to "".
             verbose (bool): whether to printout processing message. Defaults to False.
+            cache_dir (str): the directory to cache parsed UTDF tables, defaults to None (no cache).
+                The same UTDF file is loaded from the cache without parsing in later runs,
+                and geocoded intersection addresses are saved in the same directory.
+            cache_max_size_mb (float): the maximum size of the parsed UTDF tables in cache_dir in MB,
+                least recently used files are removed beyond it. Defaults to DEFAULT_UTDF_CACHE_MAX_SIZE_MB.
+            trace_memory (bool): whether to record the peak memory of each stage with tracemalloc,
+                which slows the conversion down. Defaults to False.
+            on_stage_end (Callable[[dict], None] | None): a function called with the record of each
+                finished stage, e.g. to send it to a monitoring service. Defaults to None.
         """
         print("Initializing UTDF2GMNS...")
         # Expand user-home paths such as "~/Downloads/UTDF.csv" before making
@@ -92,6 +130,12 @@ class UTDF2GMNS:
         self._utdf_filename = pf.path2linux(os.path.abspath(expanded_utdf_filename))
         self._utdf_region_name = region_name
         self._verbose = verbose
+        self._utdf_cache_dir = (pf.path2linux(os.path.abspath(os.path.expanduser(os.fspath(cache_dir))))
+                                if cache_dir else None)
+        self._utdf_cache_max_size_mb = cache_max_size_mb
+
+        # records the time, memory and counters of each conversion stage, see get_stage_report()
+        self._stage_recorder = StageRecorder(trace_memory=trace_memory, on_stage_end=on_stage_end)
 
         # check if city_name is provided
         if not region_name:
@@ -101,6 +145,7 @@ class UTDF2GMNS:
         # load UTDF data from the file in the initialization
         self.__load_utdf()
 
+    @_recorded_stage("parse")
     def __load_utdf(self) -> bool:
         """Load UTDF file and generate dataframes for Networks, Nodes, Links, Lanes, Timeplans, and Phases
         """
@@ -110,7 +155,9 @@ class UTDF2GMNS:
             raise FileNotFoundError(f"UTDF file {self._utdf_filename} not found!")
 
         # read UTDF file and create dataframes
-        utdf_dict_data = read_UTDF(self._utdf_filename)
+        utdf_dict_data = read_UTDF(self._utdf_filename,
+                                   cache_dir=self._utdf_cache_dir,
+                                   cache_max_size_mb=self._utdf_cache_max_size_mb)
 
         # Extract network settings from utdf_dict_data
         self.network_settings = {
@@ -121,8 +168,9 @@ class UTDF2GMNS:
 
         self.network_unit = "feet, mph" if str(self.network_settings.get("Metric")) == "0" else "meters, km/h"
 
-        # assign to instance variable
+        # assign to instance variable, group tables by intersection id once for per-intersection lookups
         self._utdf_dict = utdf_dict_data
+        build_utdf_intid_index(self._utdf_dict)
         self.network_int_ids = [str(int_id) for int_id in set(self._utdf_dict.get("Nodes")["INTID"].tolist())]
         self.network_int_ids_signalized = [str(int_id) for int_id in set(
             self._utdf_dict.get("Timeplans")["INTID"].tolist())]
@@ -130,13 +178,21 @@ class UTDF2GMNS:
         # initialize the instance variables
         self._is_geocoding_intersections = False
 
+        count("utdf_rows", sum(len(df) for df in utdf_dict_data.values() if isinstance(df, pd.DataFrame)))
+        count("intersections", len(self.network_int_ids))
+
         print(f"  :Total number of intersections in the UTDF file: {len(self.network_int_ids)}")
         return True
 
+    @_recorded_stage("geocode")
     def geocode_utdf_intersections(self,
                                    *,
                                    single_intersection_coord: dict = None,
-                                   dist_threshold: float = 0.01) -> bool:
+                                   dist_threshold: float = 0.01,
+                                   geocoding_provider: Callable[[str], tuple] | None = None,
+                                   max_workers: int = DEFAULT_GEOCODING_MAX_WORKERS,
+                                   max_requests_per_second: float | None = (
+                                       DEFAULT_GEOCODING_MAX_REQUESTS_PER_SECOND)) -> bool:
         """Geocode intersections
         Firstly, geocode one intersection from given single intersection coordinate.
         Then, according to the Nodes information, calculate all intersections based on relative coordinates.
@@ -147,6 +203,14 @@ class UTDF2GMNS:
                 Sample data: {"INTID": "1", "x_coord": -114.568, "y_coord": 35.155}
             dist_threshold (float): distance threshold for geocoding intersections, defaults to 0.01. Unit: km
                 only used when single_intersection_coord is not provided.
+            geocoding_provider (Callable[[str], tuple] | None): a function returning the (lng, lat)
+                of an address, defaults to None (the ArcGIS geocoder).
+                only used when single_intersection_coord is not provided.
+            max_workers (int): the number of threads sending geocoding requests, defaults to 8.
+                only used when single_intersection_coord is not provided.
+            max_requests_per_second (float | None): the maximum number of geocoding requests started
+                per second over all threads, None for no limit. Defaults to 10.0.
+                only used when single_intersection_coord is not provided.
 
         Note:
             - single_intersection_coord should follow the format:
@@ -185,7 +249,12 @@ class UTDF2GMNS:
             single_intersection = generate_intersection_coordinates(
                 df_utdf_intersection,
                 dist_threshold=dist_threshold,
-                geocode_one=True)
+                geocode_one=True,
+                provider=geocoding_provider,
+                cache_path=(os.path.join(self._utdf_cache_dir, GEOCODING_CACHE_FILENAME)
+                            if self._utdf_cache_dir else None),
+                max_workers=max_workers,
+                max_requests_per_second=max_requests_per_second)
 
             # check if the single_intersection is empty
             if single_intersection["INTID"] is None:
@@ -220,12 +289,73 @@ class UTDF2GMNS:
         self.network_nodes = node_dict
         self._utdf_dict["network_nodes"] = node_dict
         self._is_geocoding_intersections = True
+
+        # node coordinates changed, the shared network model must be rebuilt
+        self.invalidate_network_model()
         return True
 
+    @_recorded_stage("profile_build")
+    def build_network_model(self) -> dict:
+        """Build the SUMO edge-profile model shared by every GMNS and SUMO writer
+
+        The model holds lane counts, turn-bay splits, and lane slots for each
+        directed UTDF link. It is built once and reused until Lanes, Links,
+        Timeplans, or network_nodes are replaced.
+
+        Note:
+            - call invalidate_network_model() after editing the UTDF tables in place.
+
+        Returns:
+            dict: edge profiles keyed by directed link id, e.g. "1_2".
+        """
+        if hasattr(self, "network_nodes"):
+            self._utdf_dict["network_nodes"] = self.network_nodes
+
+        if self._utdf_dict.get("Links") is None:
+            return {}
+
+        edge_profiles = _cache_sumo_edge_profile_dict(self._utdf_dict, self.network_unit)
+        count("edge_profiles", len(edge_profiles))
+        return edge_profiles
+
+    def invalidate_network_model(self) -> None:
+        """Drop the cached network model so the next writer rebuilds it"""
+        _clear_sumo_edge_profile_cache(self._utdf_dict)
+
+    @property
+    def stage_recorder(self) -> StageRecorder:
+        """The recorder of conversion stages, created with default settings if __init__ was not run"""
+        if "_stage_recorder" not in self.__dict__:
+            self._stage_recorder = StageRecorder()
+        return self._stage_recorder
+
+    def get_stage_report(self, *, path: str = "") -> str:
+        """Return the wall time, CPU time, peak memory and counters of each recorded stage as JSON
+
+        Stages are recorded from initialization on: parse, geocode, profile_build, each GMNS and SUMO writer,
+        netconvert, signal_update, u_turn_removal, route_decomposition and more. Writer stages are nested
+        in the method that runs them, the "parent" of a stage record is the name of its enclosing stage.
+
+        Args:
+            path (str): the JSON file to save the report. Defaults to "" (not saved).
+
+        Example:
+            >>> import utdf2gmns as ug
+            >>> net = ug.UTDF2GMNS("UTDF.csv", "Bullhead City, AZ")
+            >>> report = json.loads(net.get_stage_report())
+            >>> report["totals"]["parse"]["wall_time_s"]
+
+        Returns:
+            str: the JSON report, {"stages": [stage records], "totals": {stage name: summed values}}
+        """
+        return self.stage_recorder.to_json(path)
+
+    @_recorded_stage("signal_control")
     def create_signal_control(self) -> bool:
         """Signalize intersections
         1. map each local signalized node to its UTDF controller
-        2. parse controller timing data with each node's own lane movements
+        2. parse controller timing data with each node's own lane movements,
+           the Phase and Lane tables are read once for all nodes
         3. assign signal control to network_signal_control, a dictionary as internal variable
         """
 
@@ -235,40 +365,15 @@ class UTDF2GMNS:
             self.network_signal_control = {}
             return True
 
-        lane_int_ids = {
-            _normalize_utdf_node_id(int_id)
-            for int_id in df_lane["INTID"].dropna().unique()
-        }
-        signal_controller_by_node = _build_signal_controller_mapping(
-            self._utdf_dict.get("Timeplans"),
+        signal_intersections = parse_all_signal_controls(
+            df_phase,
+            df_lane,
+            _map_signal_nodes_to_controllers(self._utdf_dict),
         )
-        signal_controller_by_node = {
-            node_id: controller_id
-            for node_id, controller_id in signal_controller_by_node.items()
-            if node_id in lane_int_ids
-        }
-        if not signal_controller_by_node:
-            signal_controller_by_node = {
-                _normalize_utdf_node_id(int_id): _normalize_utdf_node_id(int_id)
-                for int_id in df_phase["INTID"].unique()
-                if _normalize_utdf_node_id(int_id) in lane_int_ids
-            }
-
-        signal_intersections = {
-            node_id: parse_signal_control(
-                df_phase,
-                df_lane,
-                controller_id,
-                lane_int_id=node_id,
-            )
-            for node_id, controller_id in sorted(
-                signal_controller_by_node.items(),
-                key=lambda item: _node_sort_key(item[0]),
-            )
-        }
         self.network_signal_control = signal_intersections
         return True
 
+    @_recorded_stage("gmns.links")
     def create_gmns_links(self, *, default_width: float = 12, is_link_polygon: bool = False) -> bool:
         """Create network from UTDF data by combining Nodes, Links, Lanes, and Phases
 
@@ -294,9 +399,33 @@ class UTDF2GMNS:
 
         return True
 
-    @pf.func_running_time
-    def utdf_to_gmns_signal_ints(self, *, output_dir: str = "") -> bool:
-        """ Empower Sigma-X engine to generate each signal intersection with visualization  """
+    @_recorded_stage("gmns.signal_ints")
+    def utdf_to_gmns_signal_ints(self, *, output_dir: str = "", engine: str = "python",
+                                 max_workers: int | None = 1) -> bool:
+        """Generate the GMNS signal tables of each signal intersection
+
+        Args:
+            output_dir (str): the output directory for the "python" engine. Defaults to "",
+                the utdf_to_gmns_signal_ints folder beside the UTDF file.
+            engine (str): "python" writes the GMNS signal tables from the UTDF timings on any platform,
+                "sigma_x" runs the Sigma-X Excel engine (Windows and Excel only) and also
+                writes a Sigma-X workbook with visualization for each intersection. Defaults to "python".
+            max_workers (int | None): the number of worker processes for the "python" engine,
+                None uses one process per CPU. Defaults to 1.
+
+        Returns:
+            bool: whether the generation is successful.
+        """
+        if engine not in ("python", "sigma_x"):
+            raise ValueError("engine must be one of: 'python' or 'sigma_x'.")
+
+        if engine == "python":
+            print("\nGenerating signal intersection tables...")
+            return generate_gmns_signal_ints(self._utdf_dict,
+                                             output_dir or str(Path(self._utdf_filename).parent
+                                                               / "utdf_to_gmns_signal_ints"),
+                                             max_workers=max_workers,
+                                             verbose=self._verbose)
 
         print("\nRunning Sigma-X engine... \n")
         # print out approximate time for processing
@@ -308,6 +437,7 @@ class UTDF2GMNS:
             self._utdf_filename, verbose=self._verbose)
         return True
 
+    @_recorded_stage("utdf_to_gmns")
     def utdf_to_gmns(self, *, output_dir: str = "", incl_utdf: bool = True, is_link_polygon: bool = False) -> bool:
         """Convert UTDF data to GMNS data and save to the output directory
 
@@ -346,23 +476,24 @@ class UTDF2GMNS:
         if not hasattr(self, "network_signal_control"):
             self.create_signal_control()
 
-        self._utdf_dict["network_nodes"] = self.network_nodes
-
         # Save GMNS data with the same turn-bay profiles used by SUMO export.
-        generate_gmns_node(self._utdf_dict, os.path.join(gmns_output_dir, "node.csv"), net_unit=self.network_unit)
-        generate_gmns_link(self._utdf_dict, os.path.join(gmns_output_dir, "link.csv"), net_unit=self.network_unit)
-        generate_gmns_lane(self._utdf_dict, os.path.join(gmns_output_dir, "lane.csv"), net_unit=self.network_unit)
-        generate_gmns_movement(self._utdf_dict,
-                               os.path.join(gmns_output_dir, "movement.csv"),
-                               net_unit=self.network_unit)
-
-        signal_control_for_output = {
-            _normalize_utdf_node_id(node_id): signal_control
-            for node_id, signal_control in self.network_signal_control.items()
-            if _normalize_utdf_node_id(node_id)
-        }
-        with open(os.path.join(gmns_output_dir, "signal.json"), "w") as f:
-            json.dump(signal_control_for_output, f)
+        self.build_network_model()
+        gmns_writers = {"node.csv": generate_gmns_node,
+                        "link.csv": generate_gmns_link,
+                        "lane.csv": generate_gmns_lane,
+                        "movement.csv": generate_gmns_movement}
+        for gmns_filename, gmns_writer in gmns_writers.items():
+            with record_stage(f"gmns.{gmns_filename.replace('.', '_')}"):
+                gmns_writer(self._utdf_dict, os.path.join(gmns_output_dir, gmns_filename), net_unit=self.network_unit)
+
+        with record_stage("gmns.signal_json"):
+            signal_control_for_output = {
+                _normalize_utdf_node_id(node_id): signal_control
+                for node_id, signal_control in self.network_signal_control.items()
+                if _normalize_utdf_node_id(node_id)
+            }
+            with open(os.path.join(gmns_output_dir, "signal.json"), "w") as f:
+                json.dump(signal_control_for_output, f)
 
         # save the UTDF data to the output directory
         if incl_utdf:
@@ -387,6 +518,7 @@ class UTDF2GMNS:
         print(f"  :Successfully saved GMNS(csv) data to \n    {gmns_output_dir}.")
         return True
 
+    @_recorded_stage("utdf_to_sumo")
     def utdf_to_sumo(self, *, output_dir: str = "", sim_name: str = "",
                      show_warning_message: bool = False,
                      remove_U_turn: bool = True,
@@ -394,7 +526,11 @@ class UTDF2GMNS:
                      sim_start_time: int = 0,
                      sim_duration: int = 3600,  # 1 hour
                      flow_mode: str = "network",
-                     is_link_polygon: bool = True
+                     is_link_polygon: bool = True,
+                     route_decomposition: str = "greedy",
+                     u_turn_removal: str = "rebuild",
+                     signal_output: str = "net",
+                     signal_workers: int | None = 1,
                      ) -> bool:
         """Convert UTDF to SUMO and save networks to the output directory
 
@@ -425,6 +561,25 @@ class UTDF2GMNS:
                 decompose turning counts into full network route flows.
                 Defaults to "network".
 
+            route_decomposition (str): how network-level routes are decomposed from
+                turning counts when flow_mode is "network". Use "greedy" to build one
+                best route at a time, or "min_cost_flow" to solve all routes at once,
+                which is much faster on large networks. Defaults to "greedy".
+
+            u_turn_removal (str): how synthetic dead-end U-turns are removed when remove_U_turn is True.
+                Use "rebuild" to remove them from the compiled .net.xml and rebuild it with netconvert,
+                or "connection_file" to write them as <delete> entries into .con.xml, so the first
+                netconvert run builds the final network. Defaults to "rebuild".
+
+            signal_output (str): where the UTDF signal timings are written. Use "net" to replace the
+                tlLogic programs in .net.xml, or "additional" to write them to a separate .tll.add.xml
+                file loaded by the .sumocfg, so signal timing scenarios can reuse the compiled network.
+                Defaults to "net".
+
+            signal_workers (int | None): the number of worker processes to build the signal programs,
+                signal intersections are independent and processed in parallel when larger than 1.
+                Use None for one process per CPU. The result does not depend on it. Defaults to 1.
+
         Returns:
             bool: whether the conversion is successful.
         """
@@ -442,6 +597,15 @@ class UTDF2GMNS:
             raise ValueError(
                 "flow_mode must be one of: 'intersection' or 'network'."
             )
+        if u_turn_removal not in ("rebuild", "connection_file"):
+            raise ValueError(
+                "u_turn_removal must be one of: 'rebuild' or 'connection_file'."
+            )
+        delete_u_turns_in_con = remove_U_turn and u_turn_removal == "connection_file"
+        if signal_output not in ("net", "additional"):
+            raise ValueError(
+                "signal_output must be one of: 'net' or 'additional'."
+            )
 
         # check if the output directory exists
         utdf_dir = Path(self._utdf_filename).parent.absolute()
@@ -460,32 +624,40 @@ class UTDF2GMNS:
 
         xml_name = sim_name or "utdf_to_sumo"
 
+        # build (or reuse) the edge-profile model shared by all SUMO writers
+        self.build_network_model()
+
         # create SUMO .nod.xml file
         output_node_file = os.path.join(sumo_output_dir, f"{xml_name}.nod.xml")
         output_node_file = pf.path2linux(output_node_file)
-        generate_sumo_nod_xml(self._utdf_dict, output_node_file, self.network_unit)
+        with record_stage("sumo.nod_xml"):
+            generate_sumo_nod_xml(self._utdf_dict, output_node_file, self.network_unit)
         print(f"  :generated SUMO node xml file: {xml_name}.nod.xml")
 
         # create SUMO .edg.xml file
         output_edge_file = os.path.join(sumo_output_dir, f"{xml_name}.edg.xml")
         output_edge_file = pf.path2linux(output_edge_file)
-        generate_sumo_edg_xml(self._utdf_dict, self.network_unit, output_edge_file)
+        with record_stage("sumo.edg_xml"):
+            generate_sumo_edg_xml(self._utdf_dict, self.network_unit, output_edge_file)
         print(f"  :generated SUMO edge xml file: {xml_name}.edg.xml")
 
         # Create SUMO .con.xml file
         output_con_file = os.path.join(sumo_output_dir, f"{xml_name}.con.xml")
         output_con_file = pf.path2linux(output_con_file)
-        generate_sumo_connection_xml(self._utdf_dict, output_con_file, self.network_unit)
+        with record_stage("sumo.con_xml"):
+            generate_sumo_connection_xml(self._utdf_dict, output_con_file, self.network_unit,
+                                         delete_dead_end_u_turns=delete_u_turns_in_con)
         print(f"  :generated SUMO connection xml file: {xml_name}.con.xml")
 
         # Create SUMO loop detector in .add.xml file
         output_add_file = os.path.join(sumo_output_dir, f"{xml_name}.add.xml")
         output_add_file = pf.path2linux(output_add_file)
         if not remove_loop_detectors:
-            generate_sumo_loop_detector_add_xml(self._utdf_dict, self.network_unit,
-                                                detector_type="E1",
-                                                add_fname=output_add_file,
-                                                sim_output_fname="")
+            with record_stage("sumo.add_xml"):
+                generate_sumo_loop_detector_add_xml(self._utdf_dict, self.network_unit,
+                                                    detector_type="E1",
+                                                    add_fname=output_add_file,
+                                                    sim_output_fname="")
             print(f"  :generated SUMO loop detector xml file: {xml_name}.add.xml")
         else:
             print("  :skipped SUMO loop detector xml file generation.")
@@ -493,29 +665,10 @@ class UTDF2GMNS:
         # convert .nod.xml and .edg.xml files to .net.xml file
         output_net_file = os.path.join(sumo_output_dir, f"{xml_name}.net.xml")
         output_net_file = pf.path2linux(output_net_file)
-        try:
-            # sumo-netconvert -n network.nod.xml -e network.edg.xml -o network.net.xml
-            result = subprocess.run(["netconvert",
-                                     f"--node-files={output_node_file}",
-                                     f"--edge-files={output_edge_file}",
-                                     f"--connection-files={output_con_file}",
-                                     f"--output-file={output_net_file}",
-                                     "--no-warnings=true",
-                                     "--proj.utm"],
-                                    cwd=sumo_output_dir,
-                                    capture_output=True,
-                                    text=True)
-            if result.returncode != 0:
-                # the return code is 0, which means the command executed failed
-                # One of the reason is that the running environment is not set up correctly
-                # Such as SUMO_HOME is not set up correctly or
-                # SUMO is not installed
-
-                # We will run netconvert (nc) from the package build-in file
-                # get the path of the netconvert(nc) file under the engine directory
-                nc_filename = Path(__file__).parent / "engine" / "netconvert.exe"
-                nc_filename = pf.path2linux(nc_filename)
-                result = subprocess.run([nc_filename,
+        with record_stage("netconvert", step="build"):
+            try:
+                # sumo-netconvert -n network.nod.xml -e network.edg.xml -o network.net.xml
+                result = subprocess.run(["netconvert",
                                          f"--node-files={output_node_file}",
                                          f"--edge-files={output_edge_file}",
                                          f"--connection-files={output_con_file}",
@@ -525,23 +678,39 @@ class UTDF2GMNS:
                                         cwd=sumo_output_dir,
                                         capture_output=True,
                                         text=True)
+                if result.returncode != 0:
+                    # the return code is 0, which means the command executed failed
+                    # One of the reason is that the running environment is not set up correctly
+                    # Such as SUMO_HOME is not set up correctly or
+                    # SUMO is not installed
+
+                    # We will run netconvert (nc) from the package build-in file
+                    # get the path of the netconvert(nc) file under the engine directory
+                    nc_filename = Path(__file__).parent / "engine" / "netconvert.exe"
+                    nc_filename = pf.path2linux(nc_filename)
+                    result = subprocess.run([nc_filename,
+                                             f"--node-files={output_node_file}",
+                                             f"--edge-files={output_edge_file}",
+                                             f"--connection-files={output_con_file}",
+                                             f"--output-file={output_net_file}",
+                                             "--no-warnings=true",
+                                             "--proj.utm"],
+                                            cwd=sumo_output_dir,
+                                            capture_output=True,
+                                            text=True)
 
-            if result.returncode != 0:
-                print("  :SUMO netconvert from nod.xml, edg.xml to net.xml failed!")
-                print(f" :{result.stderr}")
-                return False
-
-            print(f"  :Successfully generated SUMO network to \n    {sumo_output_dir}.")
-            if show_warning_message:
-                print("Warning message in generating SUMO network:")
-                print(f"{result.stderr}")
-        except Exception as e:
-            print(f"  :Error in generating SUMO network: {e}")
-            return False
+                if result.returncode != 0:
+                    print("  :SUMO netconvert from nod.xml, edg.xml to net.xml failed!")
+                    print(f" :{result.stderr}")
+                    return False
 
-        # update SUMO signal in .net.xml file
-        update_sumo_signal_from_utdf(output_net_file, self._utdf_dict, verbose=self._verbose)
-        print(f"  :Successfully updated SUMO signal xml to \n    {sumo_output_dir}.")
+                print(f"  :Successfully generated SUMO network to \n    {sumo_output_dir}.")
+                if show_warning_message:
+                    print("Warning message in generating SUMO network:")
+                    print(f"{result.stderr}")
+            except Exception as e:
+                print(f"  :Error in generating SUMO network: {e}")
+                return False
 
         # create SUMO .flow.xml file
         output_flow_file = os.path.join(sumo_output_dir, f"{xml_name}.flow.xml")
@@ -559,21 +728,24 @@ class UTDF2GMNS:
         if normalized_flow_mode == "network":
             try:
                 print("\n  :Generating SUMO network-level .rou.xml file from UTDF turning counts...")
-                generate_sumo_network_route_xml(self._utdf_dict,
-                                                output_rou_file,
-                                                begin=begin_time,
-                                                end=end_time,
-                                                net_unit=self.network_unit)
+                with record_stage("route_decomposition", method=route_decomposition):
+                    generate_sumo_network_route_xml(self._utdf_dict,
+                                                    output_rou_file,
+                                                    begin=begin_time,
+                                                    end=end_time,
+                                                    net_unit=self.network_unit,
+                                                    decomposition_method=route_decomposition)
                 shutil.copyfile(output_rou_file, output_flow_file)
                 print(f"  :Successfully generated network-level route file to \n    {sumo_output_dir}.")
             except Exception as e:
                 print(f"  :Error in generating SUMO network-level route file: {e}")
                 return False
         else:
-            generate_sumo_flow_xml(self._utdf_dict, output_flow_file,
-                                   begin=begin_time,
-                                   end=end_time,
-                                   net_unit=self.network_unit)
+            with record_stage("sumo.flow_xml"):
+                generate_sumo_flow_xml(self._utdf_dict, output_flow_file,
+                                       begin=begin_time,
+                                       end=end_time,
+                                       net_unit=self.network_unit)
 
             try:
                 print("\n  :Generating SUMO .rou.xml file from UTDF lanes...")
@@ -632,18 +804,38 @@ class UTDF2GMNS:
                 print(f"  :Error in generating SUMO route file: {e}")
                 return False
 
-        # remove U-turns in the SUMO network
-        if remove_U_turn:
-            remove_sumo_U_turn(output_net_file, output_con_file)
+        # update SUMO signal and remove U-turns in the .net.xml file with one parse and one write,
+        # the routers above do not read signal programs, so routes are the same as before the update
+        with record_stage("post_process"):
+            post_process_sumo_net(output_net_file,
+                                  self._utdf_dict if signal_output == "net" else None,
+                                  output_con_file,
+                                  remove_U_turn=remove_U_turn and not delete_u_turns_in_con,
+                                  verbose=self._verbose,
+                                  max_workers=signal_workers)
+
+        # or write the signal programs of the final network to a separate additional file
+        output_tll_file = os.path.join(sumo_output_dir, f"{xml_name}.tll.add.xml")
+        output_tll_file = pf.path2linux(output_tll_file)
+        if signal_output == "additional":
+            with record_stage("signal_update", output="additional"):
+                generate_sumo_tls_add_xml(output_net_file, self._utdf_dict, output_tll_file,
+                                          verbose=self._verbose, max_workers=signal_workers)
+        print(f"  :Successfully updated SUMO signal xml to \n    {sumo_output_dir}.")
 
         # create .sumocfg file for the generated network
         # will generate default .rou.xml file for the network
         sumo_cfg_file = os.path.join(sumo_output_dir, f"{xml_name}.sumocfg")
         sumo_cfg_file = pf.path2linux(sumo_cfg_file)
+        additional_files = []
+        if signal_output == "additional":
+            additional_files.append(f"{xml_name}.tll.add.xml")
+        if not remove_loop_detectors:
+            additional_files.append(f"{xml_name}.add.xml")
         additional_files_config = (
-            ""
-            if remove_loop_detectors
-            else f'        <additional-files value="{xml_name}.add.xml"/>\n'
+            f'        <additional-files value="{",".join(additional_files)}"/>\n'
+            if additional_files
+            else ""
         )
 
         cfg_str = (
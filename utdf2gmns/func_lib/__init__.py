@@ -5,15 +5,63 @@
 # Author/Copyright: Mr. Xiangyong Luo
 ##############################################################
 
-from .utdf import __all__ as utdf_all
-from .gmns import __all__ as gmns_all
-from .sumo import __all__ as sumo_all
-from .sumo_geojson import __all__ as sumo2geojson_all
-from .utdf import *
-from .gmns import *
-from .sumo import *
-from .sumo_geojson import *
+from utdf2gmns.util_lib.lazy_import import lazy_import_attrs
 
-from .plot_net import plot_net_mpl, plot_net_keplergl
+# {subpackage: the names it exports}, each subpackage is imported the first time one of its names is used
+_SUBPACKAGE_ATTRS = {
+    ".utdf": ("cvt_lane_df_to_dict",
+              "GeocodingCache",
+              "geocode_addresses",
+              "normalize_address",
+              "generate_intersection_coordinates",
+              "geocoder_geocoding_from_address",
+              "read_UTDF",
+              "generate_intersection_from_Links",
+              "reformat_lane_dataframe",
+              "generate_synthetic_utdf",
+              "clear_utdf_cache"),
+    ".gmns": ("generate_links",
+              "generate_links_polygon",
+              "cvt_link_df_to_dict",
+              "calculate_new_coordinates_from_offsets",
+              "update_node_from_one_intersection",
+              "cvt_utdf_to_signal_intersection",
+              "generate_gmns_signal_ints",
+              "generate_gmns_lane",
+              "generate_gmns_link",
+              "generate_gmns_movement",
+              "generate_gmns_node"),
+    ".sumo": ("generate_net_link_lookup_dict",
+              "generate_net_lane_lookup_dict",
+              "generate_sumo_nod_xml",
+              "generate_sumo_edg_xml",
+              "generate_sumo_connection_xml",
+              "generate_sumo_flow_xml",
+              "generate_sumo_network_route_xml",
+              "generate_sumo_loop_detector_add_xml",
+              "post_process_sumo_net",
+              "ReadSUMO",
+              "remove_sumo_end_route_connection",
+              "mark_end_route_connections_invalid",
+              "remove_sumo_U_turn",
+              "remove_dead_end_u_turn_connections",
+              "parse_signal_control",
+              "parse_all_signal_controls",
+              "parse_lane",
+              "parse_phase",
+              "parse_timeplans",
+              "direction_mapping",
+              "build_linkDuration",
+              "extract_dir_info",
+              "create_SignalTimingPlan",
+              "process_pedestrian_crossing",
+              "update_sumo_signal_from_utdf",
+              "apply_utdf_signal_to_sumo_net",
+              "generate_sumo_tls_add_xml"),
+    ".sumo_geojson": ("sumo2geojson",),
+    ".plot_net": ("plot_net_mpl", "plot_net_keplergl"),
+}
 
-__all__ = utdf_all + gmns_all + sumo_all + sumo2geojson_all + ['plot_net_mpl', 'plot_net_keplergl',]
+__getattr__, __dir__ = lazy_import_attrs(__name__, _SUBPACKAGE_ATTRS)
+
+__all__ = [attr_name for attr_names in _SUBPACKAGE_ATTRS.values() for attr_name in attr_names]
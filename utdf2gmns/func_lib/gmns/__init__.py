@@ -6,16 +6,21 @@
 ##############################################################
 '''
 
-from .geocoding_Links import (generate_links,
-                              generate_links_polygon,
-                              cvt_link_df_to_dict)
-from .geocoding_Nodes import (calculate_new_coordinates_from_offsets,
-                              update_node_from_one_intersection)
-from .generate_lane_movement import (generate_gmns_lane,
-                                     generate_gmns_link,
-                                     generate_gmns_movement,
-                                     generate_gmns_node)
-from .sigma_x_process_signal_intersection import cvt_utdf_to_signal_intersection
+from utdf2gmns.util_lib.lazy_import import lazy_import_attrs
+
+__getattr__, __dir__ = lazy_import_attrs(__name__, {
+    ".geocoding_Links": ("generate_links",
+                         "generate_links_polygon",
+                         "cvt_link_df_to_dict"),
+    ".geocoding_Nodes": ("calculate_new_coordinates_from_offsets",
+                         "update_node_from_one_intersection"),
+    ".generate_lane_movement": ("generate_gmns_lane",
+                                "generate_gmns_link",
+                                "generate_gmns_movement",
+                                "generate_gmns_node"),
+    ".sigma_x_process_signal_intersection": ("cvt_utdf_to_signal_intersection",),
+    ".generate_signal_intersection": ("generate_gmns_signal_ints",),
+})
 
 __all__ = [
     # geocoding_Links
@@ -27,6 +32,8 @@ __all__ = [
     "update_node_from_one_intersection",
     # sigma_x_process_signal_intersection
     "cvt_utdf_to_signal_intersection",
+    # generate_signal_intersection
+    "generate_gmns_signal_ints",
 
     # generate_lane_movement
     "generate_gmns_lane",
@@ -12,20 +12,20 @@ import math
 import re
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
-from utdf2gmns.func_lib.gmns.geocoding_Links import cvt_utm_to_lonlat
+from utdf2gmns.func_lib.gmns.geocoding_Links import cvt_utm_array_to_lonlat
 from utdf2gmns.func_lib.sumo.gmns2sumo import (
     TURN_TYPE_TO_SUMO_DIR,
-    _build_sumo_edge_profile_dict,
     _calculate_turn_bay_node_coord,
     _format_xml_number,
-    _get_profile_shape_points,
+    _get_profile_geometry,
+    _get_profile_turn_bay_geometry,
+    _get_sumo_edge_profile_dict,
     _normalize_node_id,
-    _shape_length_meters,
     _shape_points_to_utm,
     _source_lane_indices_for_movement,
-    _split_shape_at_point,
     _target_lane_index_for_movement,
     generate_net_link_lookup_dict,
 )
@@ -82,128 +82,94 @@ def _get_lane_width_meters(utdf_dict: dict, net_unit: str | None) -> float:
     return lane_width_value
 
 
-def _build_polygon_geometry(shape_points: list[tuple[float, float]] | None,
-                            lane_count: int,
-                            lane_width_meters: float,
-                            lane_index: int | None = None) -> str:
-    """Return a GMNS link or lane polygon as WKT geometry.
+def _hypot_array(dx: np.ndarray, dy: np.ndarray) -> np.ndarray:
+    """Return math.hypot of each pair, the same bits as the scalar geometry code."""
+    return np.fromiter(map(math.hypot, dx.tolist(), dy.tolist()), dtype=float, count=len(dx))
 
-    When ``lane_index`` is not provided, the polygon covers the full directional
-    link width. When ``lane_index`` is provided, the polygon covers only that
-    lane. Adjacent lane polygons reuse the same offset boundary, so they touch
-    at shared edges without overlapping.
-    """
-    if not shape_points:
-        return ""
 
-    lane_count = max(lane_count, 1)
-    center_lane_index = (lane_count - 1) / 2
-    if lane_index is None:
-        right_offset_meters = (center_lane_index + 0.5) * lane_width_meters
-        left_offset_meters = -right_offset_meters
-    else:
-        lane_center_offset_meters = (center_lane_index - lane_index) * lane_width_meters
-        right_offset_meters = lane_center_offset_meters + lane_width_meters / 2
-        left_offset_meters = lane_center_offset_meters - lane_width_meters / 2
+def _clean_projected_points(projected_array: np.ndarray,
+                            minimum_segment_length_meters: float) -> np.ndarray:
+    """Drop tiny interior segments of a projected shape, keeping both endpoints."""
+    if len(projected_array) <= 2:
+        return projected_array
 
-    projected_data = _shape_points_to_utm(shape_points)
-    if projected_data is None:
-        return ""
+    projected_points = projected_array.tolist()
+    cleaned_projected_points = [projected_points[0]]
+    for projected_point in projected_points[1:-1]:
+        previous_projected_point = cleaned_projected_points[-1]
+        segment_length_meters = math.hypot(
+            projected_point[0] - previous_projected_point[0],
+            projected_point[1] - previous_projected_point[1],
+        )
+        if segment_length_meters < minimum_segment_length_meters:
+            continue
+        cleaned_projected_points.append(projected_point)
+
+    if len(cleaned_projected_points) > 1:
+        previous_projected_point = cleaned_projected_points[-1]
+        final_projected_point = projected_points[-1]
+        final_segment_length_meters = math.hypot(
+            final_projected_point[0] - previous_projected_point[0],
+            final_projected_point[1] - previous_projected_point[1],
+        )
+        if final_segment_length_meters < minimum_segment_length_meters:
+            cleaned_projected_points.pop()
 
-    projected_points, zone_number, hemisphere = projected_data
-    if len(projected_points) < 2:
-        return ""
+    cleaned_projected_points.append(projected_points[-1])
+    return np.array(cleaned_projected_points, dtype=float)
 
-    # Turn-bay splits can create a very short interior segment next to an
-    # existing UTDF curve point. Dropping only those tiny interior kinks keeps
-    # the link endpoints fixed and prevents lane-width offsets from folding.
-    polygon_width_meters = abs(right_offset_meters - left_offset_meters)
-    minimum_segment_length_meters = min(1.0, max(0.1, polygon_width_meters / 4))
-    if len(projected_points) > 2:
-        cleaned_projected_points: list[tuple[float, float]] = [projected_points[0]]
-        for projected_point in projected_points[1:-1]:
-            previous_projected_point = cleaned_projected_points[-1]
-            segment_length_meters = math.hypot(
-                projected_point[0] - previous_projected_point[0],
-                projected_point[1] - previous_projected_point[1],
-            )
-            if segment_length_meters < minimum_segment_length_meters:
-                continue
-            cleaned_projected_points.append(projected_point)
-
-        if len(cleaned_projected_points) > 1:
-            previous_projected_point = cleaned_projected_points[-1]
-            final_projected_point = projected_points[-1]
-            final_segment_length_meters = math.hypot(
-                final_projected_point[0] - previous_projected_point[0],
-                final_projected_point[1] - previous_projected_point[1],
-            )
-            if final_segment_length_meters < minimum_segment_length_meters:
-                cleaned_projected_points.pop()
-
-        cleaned_projected_points.append(projected_points[-1])
-        projected_points = cleaned_projected_points
-
-    boundaries: list[list[tuple[float, float]]] = []
-    for offset_meters in [right_offset_meters, left_offset_meters]:
-        offset_projected_points: list[tuple[float, float]] = []
-        last_normal: tuple[float, float] | None = None
-        for point_index, projected_point in enumerate(projected_points):
-            candidate_normals: list[tuple[float, float]] = []
-            if point_index > 0:
-                start_point = projected_points[point_index - 1]
-                end_point = projected_point
-                segment_dx = end_point[0] - start_point[0]
-                segment_dy = end_point[1] - start_point[1]
-                segment_length = math.hypot(segment_dx, segment_dy)
-                if segment_length > 0:
-                    candidate_normals.append((
-                        segment_dy / segment_length,
-                        -segment_dx / segment_length,
-                    ))
-            if point_index < len(projected_points) - 1:
-                start_point = projected_point
-                end_point = projected_points[point_index + 1]
-                segment_dx = end_point[0] - start_point[0]
-                segment_dy = end_point[1] - start_point[1]
-                segment_length = math.hypot(segment_dx, segment_dy)
-                if segment_length > 0:
-                    candidate_normals.append((
-                        segment_dy / segment_length,
-                        -segment_dx / segment_length,
-                    ))
-
-            if not candidate_normals:
-                normal = last_normal
-            elif len(candidate_normals) == 1:
-                normal = candidate_normals[0]
-            else:
-                normal_x = candidate_normals[0][0] + candidate_normals[1][0]
-                normal_y = candidate_normals[0][1] + candidate_normals[1][1]
-                normal_length = math.hypot(normal_x, normal_y)
-                normal = (
-                    candidate_normals[1]
-                    if normal_length <= 0
-                    else (normal_x / normal_length, normal_y / normal_length)
-                )
-
-            if normal is None:
-                offset_projected_points.append(projected_point)
-                continue
 
-            last_normal = normal
-            offset_projected_points.append((
-                projected_point[0] + normal[0] * offset_meters,
-                projected_point[1] + normal[1] * offset_meters,
-            ))
+def _offset_normals(projected_array: np.ndarray, shape_starts: np.ndarray) -> np.ndarray:
+    """Return the unit right-hand normal at each point of concatenated shapes.
 
-        boundaries.append([
-            cvt_utm_to_lonlat(point_x, point_y, zone_number, hemisphere)
-            for point_x, point_y in offset_projected_points
-        ])
+    Interior points use the normalized sum of the normals of both adjacent segments,
+    points next to zero-length segments reuse the previous normal of the same shape,
+    and points of shapes without any segment length have a NaN normal.
 
-    right_boundary_points, left_boundary_points = boundaries
-    polygon_points = [*right_boundary_points, *reversed(left_boundary_points)]
+    Args:
+        projected_array (np.ndarray): (n, 2) UTM points of all shapes, shape after shape
+        shape_starts (np.ndarray): the first point position of each shape, ascending
+    """
+    n_points = len(projected_array)
+    shape_ids = np.repeat(np.arange(len(shape_starts)), np.diff(np.append(shape_starts, n_points)))
+    point_shape_starts = shape_starts[shape_ids]
+
+    segment_deltas = projected_array[1:] - projected_array[:-1]
+    segment_lengths = _hypot_array(segment_deltas[:, 0], segment_deltas[:, 1])
+    # segments from the last point of one shape to the first point of the next are not segments
+    is_segment = (shape_ids[1:] == shape_ids[:-1]) & (segment_lengths > 0)
+
+    segment_normals = np.full(segment_deltas.shape, np.nan)
+    segment_normals[is_segment, 0] = segment_deltas[is_segment, 1] / segment_lengths[is_segment]
+    segment_normals[is_segment, 1] = -segment_deltas[is_segment, 0] / segment_lengths[is_segment]
+
+    nan_normal = np.full((1, 2), np.nan)
+    normals_before = np.vstack((nan_normal, segment_normals))
+    normals_after = np.vstack((segment_normals, nan_normal))
+    has_before = ~np.isnan(normals_before[:, 0])
+    has_after = ~np.isnan(normals_after[:, 0])
+
+    normals = np.where(has_before[:, None], normals_before, normals_after)
+    has_both = has_before & has_after
+    if has_both.any():
+        normal_sums = normals_before[has_both] + normals_after[has_both]
+        normal_lengths = _hypot_array(normal_sums[:, 0], normal_sums[:, 1])
+        joint_normals = normals_after[has_both]
+        has_joint_length = normal_lengths > 0
+        joint_normals[has_joint_length] = normal_sums[has_joint_length] / normal_lengths[has_joint_length, None]
+        normals[has_both] = joint_normals
+
+    has_normal = ~np.isnan(normals[:, 0])
+    if not has_normal.all():
+        last_normal_pos = np.maximum.accumulate(np.where(has_normal, np.arange(n_points), -1))
+        normals = np.where((last_normal_pos >= point_shape_starts)[:, None],
+                           normals[np.maximum(last_normal_pos, 0)],
+                           np.nan)
+    return normals
+
+
+def _format_wkt_polygon(polygon_points: list[list[float]]) -> str:
+    """Return closed WKT polygon text of longitude/latitude points."""
     if len(polygon_points) < 3:
         return ""
     first_point = polygon_points[0]
@@ -214,11 +180,138 @@ def _build_polygon_geometry(shape_points: list[tuple[float, float]] | None,
     ):
         polygon_points.append(first_point)
 
-    point_text = [
-        f"{_format_xml_number(point[0])} {_format_xml_number(point[1])}"
-        for point in polygon_points
-    ]
-    return f"POLYGON (({', '.join(point_text)}))"
+    point_text = ", ".join(
+        f"{_format_xml_number(point_x)} {_format_xml_number(point_y)}"
+        for point_x, point_y in polygon_points
+    )
+    return f"POLYGON (({point_text}))"
+
+
+def _get_polygon_offsets(lane_count: int, lane_width_meters: float,
+                         lane_index: int | None) -> tuple[float, float]:
+    """Return the right and left boundary offsets of a link (lane_index None) or lane polygon."""
+    lane_count = max(lane_count, 1)
+    center_lane_index = (lane_count - 1) / 2
+    if lane_index is None:
+        right_offset_meters = (center_lane_index + 0.5) * lane_width_meters
+        return right_offset_meters, -right_offset_meters
+
+    lane_center_offset_meters = (center_lane_index - lane_index) * lane_width_meters
+    return (lane_center_offset_meters + lane_width_meters / 2,
+            lane_center_offset_meters - lane_width_meters / 2)
+
+
+def _build_polygon_geometries(polygon_specs: list[tuple]) -> list[str]:
+    """Return GMNS link and lane polygons as WKT geometry, all polygons in one batch.
+
+    Each spec is ``(shape_points, lane_count, lane_width_meters, lane_index)``, where
+    a ``None`` lane index stands for the full directional link width and other indices
+    for one lane. Each shape is projected to UTM once, however many polygons use it.
+    Offset boundaries of all polygons are computed with array operations over the
+    concatenated shapes, and all boundary vertices of one UTM zone are projected back
+    with one transform. Adjacent lane polygons reuse the same offset boundary, so they
+    touch at shared edges without overlapping.
+
+    Returns:
+        list[str]: WKT polygon of each spec, "" for polygons that cannot be built
+    """
+    polygon_geometries = [""] * len(polygon_specs)
+
+    # {id(shape_points): projected data}, the same shape is shared by a link and its lanes
+    projected_shapes = {}
+    # {(id(shape_points), minimum segment length): position in cleaned_arrays}
+    cleaned_shape_pos = {}
+    cleaned_arrays = []
+    cleaned_zones = []
+    # (spec position, cleaned shape position, right offset, left offset)
+    polygon_boundaries = []
+
+    for spec_pos, (shape_points, lane_count, lane_width_meters, lane_index) in enumerate(polygon_specs):
+        if not shape_points:
+            continue
+        shape_key = id(shape_points)
+        if shape_key not in projected_shapes:
+            projected_shapes[shape_key] = _shape_points_to_utm(shape_points)
+        projected_data = projected_shapes[shape_key]
+        if projected_data is None or len(projected_data[0]) < 2:
+            continue
+        projected_array, zone_number, hemisphere = projected_data
+
+        right_offset_meters, left_offset_meters = _get_polygon_offsets(
+            lane_count, lane_width_meters, lane_index)
+
+        # Turn-bay splits can create a very short interior segment next to an
+        # existing UTDF curve point. Dropping only those tiny interior kinks keeps
+        # the link endpoints fixed and prevents lane-width offsets from folding.
+        polygon_width_meters = abs(right_offset_meters - left_offset_meters)
+        minimum_segment_length_meters = min(1.0, max(0.1, polygon_width_meters / 4))
+        cleaned_key = (shape_key, minimum_segment_length_meters)
+        if cleaned_key not in cleaned_shape_pos:
+            cleaned_shape_pos[cleaned_key] = len(cleaned_arrays)
+            cleaned_arrays.append(_clean_projected_points(projected_array, minimum_segment_length_meters))
+            cleaned_zones.append((zone_number, hemisphere))
+
+        polygon_boundaries.append(
+            (spec_pos, cleaned_shape_pos[cleaned_key], right_offset_meters, left_offset_meters))
+
+    if not polygon_boundaries:
+        return polygon_geometries
+
+    shape_lengths = np.array([len(cleaned_array) for cleaned_array in cleaned_arrays])
+    shape_starts = np.concatenate(([0], np.cumsum(shape_lengths)[:-1]))
+    projected_points = np.concatenate(cleaned_arrays)
+    normals = _offset_normals(projected_points, shape_starts)
+
+    # every polygon has a right boundary and a left boundary along its cleaned shape
+    boundary_shape_pos = np.repeat([shape_pos for _, shape_pos, _, _ in polygon_boundaries], 2)
+    boundary_offsets = np.array([offset_meters
+                                 for _, _, right_offset_meters, left_offset_meters in polygon_boundaries
+                                 for offset_meters in (right_offset_meters, left_offset_meters)])
+    boundary_lengths = shape_lengths[boundary_shape_pos]
+    boundary_ends = np.cumsum(boundary_lengths)
+    point_positions = (np.arange(boundary_ends[-1])
+                       + np.repeat(shape_starts[boundary_shape_pos] - (boundary_ends - boundary_lengths),
+                                   boundary_lengths))
+    point_offsets = np.repeat(boundary_offsets, boundary_lengths)
+
+    boundary_points = projected_points[point_positions]
+    boundary_normals = normals[point_positions]
+    boundary_points = np.where(np.isnan(boundary_normals),
+                               boundary_points,
+                               boundary_points + boundary_normals * point_offsets[:, None])
+
+    lonlat_points = np.empty_like(boundary_points)
+    zone_codes = {}
+    shape_zone_codes = np.array([zone_codes.setdefault(zone, len(zone_codes)) for zone in cleaned_zones])
+    point_zone_codes = np.repeat(shape_zone_codes[boundary_shape_pos], boundary_lengths)
+    for (zone_number, hemisphere), zone_code in zone_codes.items():
+        in_zone = point_zone_codes == zone_code
+        lons, lats = cvt_utm_array_to_lonlat(boundary_points[in_zone, 0], boundary_points[in_zone, 1],
+                                             zone_number, hemisphere)
+        lonlat_points[in_zone, 0] = lons
+        lonlat_points[in_zone, 1] = lats
+    lonlat_points = lonlat_points.tolist()
+
+    for boundary_pos, (spec_pos, _, _, _) in enumerate(polygon_boundaries):
+        right_end = boundary_ends[2 * boundary_pos].item()
+        left_end = boundary_ends[2 * boundary_pos + 1].item()
+        right_start = right_end - boundary_lengths[2 * boundary_pos].item()
+        polygon_geometries[spec_pos] = _format_wkt_polygon(
+            [*lonlat_points[right_start:right_end], *reversed(lonlat_points[right_end:left_end])])
+    return polygon_geometries
+
+
+def _build_polygon_geometry(shape_points: list[tuple[float, float]] | None,
+                            lane_count: int,
+                            lane_width_meters: float,
+                            lane_index: int | None = None) -> str:
+    """Return a GMNS link or lane polygon as WKT geometry.
+
+    When ``lane_index`` is not provided, the polygon covers the full directional
+    link width. When ``lane_index`` is provided, the polygon covers only that
+    lane. Use _build_polygon_geometries to build many polygons together.
+    """
+    return _build_polygon_geometries([(shape_points, lane_count, lane_width_meters, lane_index)])[0]
 
 
 def _get_network_nodes(utdf_dict: dict) -> dict:
@@ -230,76 +323,40 @@ def _get_network_nodes(utdf_dict: dict) -> dict:
 
 
 def _get_profile_segment_records(profile: dict, network_nodes: dict,
-                                 net_unit: str | None,
-                                 lane_width_meters: float) -> list[dict[str, Any]]:
-    """Return the GMNS link segment rows represented by one SUMO edge profile."""
-    shape_points = _get_profile_shape_points(profile, network_nodes, net_unit)
+                                 net_unit: str | None) -> list[dict[str, Any]]:
+    """Return the GMNS link segment rows represented by one SUMO edge profile.
 
-    if not profile["has_turn_bay"]:
-        return [{
-            "link_id": profile["main_edge_id"],
-            "from_node_id": profile["from_node"],
-            "to_node_id": profile["to_node"],
-            "lanes": profile["stop_lane_count"],
-            "length_m": _shape_length_meters(shape_points) or profile["length_m"],
-            "free_speed_mps": profile["speed_mps"],
-            "geometry": _build_polygon_geometry(
-                shape_points,
-                profile["stop_lane_count"],
-                lane_width_meters,
-            ),
-            "_shape_points": shape_points,
-            "main_link_id": profile["main_edge_id"],
-            "is_turn_bay_link": False,
-        }]
+    The polygon geometry is left empty, see _add_segment_polygon_geometries.
+    """
+    if profile["has_turn_bay"]:
+        geometry = _get_profile_turn_bay_geometry(profile, network_nodes, net_unit)
+    else:
+        geometry = _get_profile_geometry(profile, network_nodes, net_unit)
 
-    bay_node_coord = _calculate_turn_bay_node_coord(profile, network_nodes, net_unit)
-    if bay_node_coord is None:
+    if not profile["has_turn_bay"] or geometry["bay_node_coord"] is None:
         return [{
             "link_id": profile["main_edge_id"],
             "from_node_id": profile["from_node"],
             "to_node_id": profile["to_node"],
             "lanes": profile["stop_lane_count"],
-            "length_m": _shape_length_meters(shape_points) or profile["length_m"],
+            "length_m": geometry["length_m"] or profile["length_m"],
             "free_speed_mps": profile["speed_mps"],
-            "geometry": _build_polygon_geometry(
-                shape_points,
-                profile["stop_lane_count"],
-                lane_width_meters,
-            ),
-            "_shape_points": shape_points,
+            "geometry": "",
+            "_shape_points": geometry["shape_points"],
             "main_link_id": profile["main_edge_id"],
             "is_turn_bay_link": False,
         }]
 
-    main_shape_points, stop_shape_points = _split_shape_at_point(
-        shape_points,
-        bay_node_coord,
-    )
-    main_length_m = _shape_length_meters(main_shape_points)
-    stop_length_m = _shape_length_meters(stop_shape_points)
-    if main_length_m is None and stop_length_m is None:
-        if profile["length_m"] is None:
-            main_length_m = None
-            stop_length_m = profile["turn_bay_length_m"]
-        else:
-            stop_length_m = min(profile["turn_bay_length_m"], profile["length_m"])
-            main_length_m = max(profile["length_m"] - stop_length_m, 0.1)
-
     return [
         {
             "link_id": profile["main_edge_id"],
             "from_node_id": profile["from_node"],
             "to_node_id": profile["bay_node_id"],
             "lanes": profile["main_lane_count"],
-            "length_m": main_length_m,
+            "length_m": geometry["main_length_m"],
             "free_speed_mps": profile["speed_mps"],
-            "geometry": _build_polygon_geometry(
-                main_shape_points,
-                profile["main_lane_count"],
-                lane_width_meters,
-            ),
-            "_shape_points": main_shape_points,
+            "geometry": "",
+            "_shape_points": geometry["main_shape_points"],
             "main_link_id": profile["main_edge_id"],
             "is_turn_bay_link": False,
         },
@@ -308,44 +365,57 @@ def _get_profile_segment_records(profile: dict, network_nodes: dict,
             "from_node_id": profile["bay_node_id"],
             "to_node_id": profile["to_node"],
             "lanes": profile["stop_lane_count"],
-            "length_m": stop_length_m,
+            "length_m": geometry["stop_length_m"],
             "free_speed_mps": profile["speed_mps"],
-            "geometry": _build_polygon_geometry(
-                stop_shape_points,
-                profile["stop_lane_count"],
-                lane_width_meters,
-            ),
-            "_shape_points": stop_shape_points,
+            "geometry": "",
+            "_shape_points": geometry["stop_shape_points"],
             "main_link_id": profile["main_edge_id"],
             "is_turn_bay_link": True,
         },
     ]
 
 
+def _add_segment_polygon_geometries(segments: list[dict[str, Any]],
+                                    lane_width_meters: float) -> None:
+    """Fill the link polygon geometry of link segment records in one batch."""
+    polygon_geometries = _build_polygon_geometries([
+        (segment["_shape_points"], segment["lanes"], lane_width_meters, None)
+        for segment in segments
+    ])
+    for segment, geometry in zip(segments, polygon_geometries):
+        segment["geometry"] = geometry
+
+
 def _get_profile_segments_by_link_id(utdf_dict: dict,
-                                     net_unit: str | None) -> dict[str, dict[str, Any]]:
-    """Build link segment records keyed by generated GMNS link id."""
+                                     net_unit: str | None,
+                                     include_geometry: bool = False) -> dict[str, dict[str, Any]]:
+    """Build link segment records keyed by generated GMNS link id.
+
+    Link polygons are only built when include_geometry is True.
+    """
     network_nodes = _get_network_nodes(utdf_dict)
-    edge_profiles = _build_sumo_edge_profile_dict(utdf_dict, net_unit)
-    lane_width_meters = _get_lane_width_meters(utdf_dict, net_unit)
+    edge_profiles = _get_sumo_edge_profile_dict(utdf_dict, net_unit)
     segments_by_link_id = {}
     for edge_id in sorted(edge_profiles):
         profile = edge_profiles[edge_id]
         for segment in _get_profile_segment_records(
                 profile,
                 network_nodes,
-                net_unit,
-                lane_width_meters):
+                net_unit):
             segments_by_link_id[segment["link_id"]] = segment
+
+    if include_geometry:
+        _add_segment_polygon_geometries(
+            list(segments_by_link_id.values()),
+            _get_lane_width_meters(utdf_dict, net_unit),
+        )
     return segments_by_link_id
 
 
 def _build_lane_record(profile: dict, lane_index: int, link_id: str,
                        lane_length_m: float | None, lane_speed_mps: float | None,
-                       lane_count: int, shape_points: list[tuple[float, float]] | None,
-                       lane_width_meters: float,
                        lane_slot: dict | None = None) -> dict[str, Any]:
-    """Create one GMNS lane row from a profile lane slot."""
+    """Create one GMNS lane row from a profile lane slot, without the lane polygon."""
     movement = lane_slot.get("movement") if lane_slot else None
     turn_type = lane_slot.get("turn_type", "T") if lane_slot else "T"
     lane_type = TURN_TYPE_TO_GMNS_TYPE.get(turn_type, "thru")
@@ -367,12 +437,7 @@ def _build_lane_record(profile: dict, lane_index: int, link_id: str,
         "lane_num": lane_index,
         "length_m": _format_number(lane_length_m),
         "speed_mps": _format_number(lane_speed_mps),
-        "geometry": _build_polygon_geometry(
-            shape_points,
-            lane_count,
-            lane_width_meters,
-            lane_index=lane_index,
-        ),
+        "geometry": "",
         "type": lane_type,
         "movement_name": movement_name,
         "mvmt_id": movement_id,
@@ -389,7 +454,7 @@ def generate_gmns_node(utdf_dict: dict, filename: str = "node.csv",
                        net_unit: str | None = None) -> bool:
     """Generate ``node.csv`` with original intersections and turn-bay nodes."""
     network_nodes = _get_network_nodes(utdf_dict)
-    edge_profiles = _build_sumo_edge_profile_dict(utdf_dict, net_unit)
+    edge_profiles = _get_sumo_edge_profile_dict(utdf_dict, net_unit)
 
     node_rows = []
     existing_node_ids = set()
@@ -440,7 +505,7 @@ def generate_gmns_node(utdf_dict: dict, filename: str = "node.csv",
 def generate_gmns_link(utdf_dict: dict, filename: str = "link.csv",
                        net_unit: str | None = None) -> bool:
     """Generate ``link.csv`` using the same turn-bay split as SUMO export."""
-    segments_by_link_id = _get_profile_segments_by_link_id(utdf_dict, net_unit)
+    segments_by_link_id = _get_profile_segments_by_link_id(utdf_dict, net_unit, include_geometry=True)
     df_link = pd.DataFrame(segments_by_link_id.values())
     if df_link.empty:
         df_link.to_csv(filename, index=False)
@@ -470,9 +535,12 @@ def generate_gmns_link(utdf_dict: dict, filename: str = "link.csv",
 def generate_lane_lookup_dict(utdf_dict: dict, net_unit: str | None = None) -> dict:
     """Return GMNS lane rows built from the shared SUMO edge profile model."""
     network_nodes = _get_network_nodes(utdf_dict)
-    edge_profiles = _build_sumo_edge_profile_dict(utdf_dict, net_unit)
+    edge_profiles = _get_sumo_edge_profile_dict(utdf_dict, net_unit)
     lane_width_meters = _get_lane_width_meters(utdf_dict, net_unit)
-    lane_lookup_dict = {}
+
+    # lane rows without geometry and their polygon specs, polygons are built in one batch
+    lane_records = []
+    polygon_specs = []
 
     for edge_id in sorted(edge_profiles):
         profile = edge_profiles[edge_id]
@@ -482,7 +550,6 @@ def generate_lane_lookup_dict(utdf_dict: dict, net_unit: str | None = None) -> d
                 profile,
                 network_nodes,
                 net_unit,
-                lane_width_meters,
             )
         }
 
@@ -494,49 +561,39 @@ def generate_lane_lookup_dict(utdf_dict: dict, net_unit: str | None = None) -> d
         if has_written_turn_bay:
             main_segment = segments[profile["main_edge_id"]]
             for lane_index in range(profile["main_lane_count"]):
-                lane_record = _build_lane_record(
+                lane_records.append(_build_lane_record(
                     profile,
                     lane_index,
                     profile["main_edge_id"],
                     main_segment["length_m"],
                     profile["speed_mps"],
-                    profile["main_lane_count"],
-                    main_segment.get("_shape_points"),
-                    lane_width_meters,
-                )
-                lane_lookup_dict[lane_record["lane_id"]] = lane_record
-
-            stop_segment = segments[profile["stop_edge_id"]]
-            for lane_slot in profile["stop_lane_slots"]:
-                lane_record = _build_lane_record(
-                    profile,
-                    lane_slot["index"],
-                    profile["stop_edge_id"],
-                    stop_segment["length_m"],
-                    profile["speed_mps"],
-                    profile["stop_lane_count"],
-                    stop_segment.get("_shape_points"),
-                    lane_width_meters,
-                    lane_slot,
-                )
-                lane_lookup_dict[lane_record["lane_id"]] = lane_record
-            continue
+                ))
+                polygon_specs.append((main_segment.get("_shape_points"),
+                                      profile["main_lane_count"],
+                                      lane_width_meters,
+                                      lane_index))
+            segment = segments[profile["stop_edge_id"]]
+        else:
+            segment = segments[profile["main_edge_id"]]
 
-        segment = segments[profile["main_edge_id"]]
         for lane_slot in profile["stop_lane_slots"]:
-            lane_record = _build_lane_record(
+            lane_records.append(_build_lane_record(
                 profile,
                 lane_slot["index"],
-                profile["main_edge_id"],
+                segment["link_id"],
                 segment["length_m"],
                 profile["speed_mps"],
-                profile["stop_lane_count"],
-                segment.get("_shape_points"),
-                lane_width_meters,
                 lane_slot,
-            )
-            lane_lookup_dict[lane_record["lane_id"]] = lane_record
+            ))
+            polygon_specs.append((segment.get("_shape_points"),
+                                  profile["stop_lane_count"],
+                                  lane_width_meters,
+                                  lane_slot["index"]))
 
+    lane_lookup_dict = {}
+    for lane_record, geometry in zip(lane_records, _build_polygon_geometries(polygon_specs)):
+        lane_record["geometry"] = geometry
+        lane_lookup_dict[lane_record["lane_id"]] = lane_record
     return lane_lookup_dict
 
 
@@ -649,7 +706,7 @@ def generate_gmns_movement(utdf_dict: dict, filename: str = "movement.csv",
     if utdf_dict.get("Lanes") is None:
         raise ValueError("Could not get Lane data from utdf_dict.")
 
-    edge_profiles = _build_sumo_edge_profile_dict(utdf_dict, net_unit)
+    edge_profiles = _get_sumo_edge_profile_dict(utdf_dict, net_unit)
     segments_by_link_id = _get_profile_segments_by_link_id(utdf_dict, net_unit)
     movement_rows = []
 
@@ -0,0 +1,287 @@
+'''
+##############################################################
+# Created Date: Sunday, October 18th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+'''
+
+import os
+import re
+from pathlib import Path
+
+import pandas as pd
+import pyufunc as pf
+
+from utdf2gmns.func_lib.gmns.geocoding_Links import get_utdf_link_dict
+from utdf2gmns.func_lib.sumo.signal_intersections import parse_all_signal_controls
+from utdf2gmns.func_lib.sumo.update_sumo_signal_from_utdf import (_extract_float,
+                                                                  _get_timeplan_value,
+                                                                  _is_blank,
+                                                                  _load_utdf_dict,
+                                                                  _map_signal_nodes_to_controllers,
+                                                                  _map_signal_tasks,
+                                                                  _normalize_utdf_node_id,
+                                                                  get_utdf_timeplan_lookup)
+from utdf2gmns.func_lib.utdf.cvt_utdf_lane_df_to_dict import get_utdf_lane_dict
+
+# GMNS signal tables written by the Sigma-X engine, {file name: columns}
+SIGNAL_INT_TABLE_COLUMNS = {
+    "signal_phase": ["node_id", "mvmt_id", "offroad_link_id", "phase_num", "protection", "mvmt_text_id"],
+    "signal_phase_concurrency": ["node_id", "signal_phase_id", "ring", "barrier"],
+    "signal_timing": ["timing_phase_id", "node_id", "signal_phase_num", "min_green", "max_green", "extension",
+                      "clearance", "walk_time", "ped_clearance", "mvmt_text_id", "geometry"],
+    "signal_timing_plan": ["node_id", "timing_plan_id", "time_day", "cycle_length", "coord_node_id",
+                           "coord_phase", "offset"],
+    "sim_timing": ["osm_node_id", "time_window", "time_interval", "travel_time_delta", "capacity", "v_over_c",
+                   "cycle_no", "cycle_length", "green_time", "red_time", "stage_no", "mvmt_text_id",
+                   "start_green_time", "end_green_time", "geometry"],
+}
+
+# UTDF timing plans have no time of day, the plan is used all day
+SIGNAL_TIMING_PLAN_TIME_DAY = "00:00_23:59"
+
+# approach names used in the node name, north-south street first, as in the Sigma-X engine
+NODE_NAME_BOUNDS = (("NB", "SB", "NE", "SW"), ("EB", "WB", "NW", "SE"))
+
+
+def _to_number(value: object) -> int | float | str:
+    """Return a UTDF cell as int or float for the output tables, blank cells stay empty."""
+    if _is_blank(value):
+        return ""
+    try:
+        number = float(str(value).strip())
+    except ValueError:
+        return str(value).strip()
+    return int(number) if number.is_integer() else round(number, 2)
+
+
+def _seconds_to_hhmmss(seconds: float) -> str:
+    """Format seconds in the cycle as hhmmss, e.g. 80 -> 000120."""
+    minutes, second = divmod(int(round(seconds)), 60)
+    hour, minute = divmod(minutes, 60)
+    return f"{hour:02d}{minute:02d}{second:02d}"
+
+
+def _signal_node_name(node_id: str, node_links: dict) -> str:
+    """Return the file name of a signal node, e.g. Node_39_SR 95_Camp Mohave South."""
+    name_parts = [f"Node_{node_id}"]
+    for bounds in NODE_NAME_BOUNDS:
+        for bound in bounds:
+            street_name = node_links.get(bound, {}).get("Name")
+            if not _is_blank(street_name):
+                name_parts.append(str(street_name).strip())
+                break
+    return re.sub(r'[\\/:*?"<>|]', "-", "_".join(name_parts))
+
+
+def _get_phase_number(phase_name: str) -> int | str:
+    """Return the number of a UTDF phase key, e.g. D2 -> 2."""
+    return _to_number(phase_name[1:])
+
+
+def _get_phase_barrier_ring(phase_info: dict) -> tuple[int | str, int | str]:
+    """Return the (barrier, ring) of a phase from its BRP value, e.g. 112 -> (1, 1)."""
+    brp = str(phase_info.get("BRP", "")).strip()
+    if len(brp) < 2:
+        return "", ""
+    return _to_number(brp[0]), _to_number(brp[1])
+
+
+def _get_phase_green_window(phase_info: dict, cycle_length: float) -> tuple[float, float]:
+    """Return the local green start and green duration of a phase in the cycle."""
+    green_start = _extract_float(phase_info.get("LocalStart", phase_info.get("Start")))
+    green_end = _extract_float(phase_info.get("LocalYield", phase_info.get("Yield")))
+    green_time = green_end - green_start
+    if cycle_length > 0:
+        green_time %= cycle_length
+    return green_start, round(green_time, 2)
+
+
+def _get_phase_movement(phase_info: dict) -> str:
+    """Return the movement a phase is named by, the protected through movement when there is one."""
+    movements = phase_info.get("protected") or phase_info.get("permitted") or []
+    through_movements = [movement for movement in movements if movement[2:3] == "T"]
+    return (through_movements or movements or [""])[0]
+
+
+def _build_signal_intersection_tables(task: dict) -> dict:
+    """Build the GMNS signal tables of one signal intersection and write its per-node files.
+
+    The task holds all data of the intersection, so intersections can be processed in worker processes.
+
+    Returns:
+        dict: {table name: list of rows}
+    """
+    node_id = task["node_id"]
+    signal_control = task["signal_control"]
+    node_lanes = task["node_lanes"]
+    cycle_length = task["cycle_length"]
+
+    phases = {phase_name: phase_info for phase_name, phase_info in signal_control.items()
+              if phase_name != "brp_info"}
+    tables = {table_name: [] for table_name in SIGNAL_INT_TABLE_COLUMNS}
+
+    tables["signal_timing_plan"].append({
+        "node_id": node_id,
+        "timing_plan_id": 1,
+        "time_day": SIGNAL_TIMING_PLAN_TIME_DAY,
+        "cycle_length": _to_number(cycle_length),
+        "coord_node_id": task["coord_node_id"],
+        "coord_phase": task["coord_phase"],
+        "offset": task["offset"],
+    })
+
+    for phase_name, phase_info in phases.items():
+        barrier, ring = _get_phase_barrier_ring(phase_info)
+        tables["signal_phase_concurrency"].append({
+            "node_id": node_id,
+            "signal_phase_id": _get_phase_number(phase_name),
+            "ring": ring,
+            "barrier": barrier,
+        })
+        tables["signal_timing"].append({
+            "timing_phase_id": 1,
+            "node_id": node_id,
+            "signal_phase_num": _get_phase_number(phase_name),
+            "min_green": _to_number(phase_info.get("MinGreen")),
+            "max_green": _to_number(phase_info.get("MaxGreen")),
+            "extension": _to_number(phase_info.get("VehExt")),
+            "clearance": _to_number(_extract_float(phase_info.get("Yellow")) + _extract_float(phase_info.get("AllRed"))),
+            "walk_time": _to_number(phase_info.get("Walk")),
+            "ped_clearance": _to_number(phase_info.get("DontWalk")),
+            "mvmt_text_id": _get_phase_movement(phase_info),
+            "geometry": 0,
+        })
+
+    # movements in UTDF lane order, a protected-permitted movement has one row for each phase
+    for movement_name, movement_info in node_lanes.items():
+        for phase_name, phase_info in phases.items():
+            if movement_name in phase_info.get("protected", []):
+                protection = "Protected"
+            elif movement_name in phase_info.get("permitted", []):
+                is_rtor = movement_name[2:3] == "R" and _extract_float(movement_info.get("Allow RTOR")) > 0
+                protection = "RTOR" if is_rtor else "Permissive"
+            else:
+                continue
+
+            phase_num = _get_phase_number(phase_name)
+            if protection == "Protected":
+                mvmt_id = phase_num
+                sat_flow = _extract_float(movement_info.get("SatFlow"))
+            else:
+                # Sigma-X numbering, 1 for right turns on red and 2 for other permitted movements
+                mvmt_id = f"{phase_num}{1 if protection == 'RTOR' else 2}"
+                sat_flow = _extract_float(movement_info.get("SatFlowRTOR" if protection == "RTOR" else "SatFlowPerm"))
+            tables["signal_phase"].append({
+                "node_id": node_id,
+                "mvmt_id": mvmt_id,
+                "offroad_link_id": "",
+                "phase_num": phase_num,
+                "protection": protection,
+                "mvmt_text_id": movement_name,
+            })
+
+            green_start, green_time = _get_phase_green_window(phase_info, cycle_length)
+            capacity = round(sat_flow * green_time / cycle_length) if cycle_length > 0 else 0
+            lane_group_flow = _extract_float(movement_info.get("Lane Group Flow"))
+            start_green_time = _seconds_to_hhmmss(green_start)
+            end_green_time = _seconds_to_hhmmss(green_start + green_time)
+            tables["sim_timing"].append({
+                "osm_node_id": node_id,
+                "time_window": f"{start_green_time}_{end_green_time}",
+                "time_interval": "",
+                "travel_time_delta": "",
+                "capacity": capacity,
+                "v_over_c": round(lane_group_flow / capacity, 3) if capacity > 0 else "",
+                "cycle_no": 0,
+                "cycle_length": _to_number(cycle_length),
+                "green_time": _to_number(green_time),
+                "red_time": _to_number(round(cycle_length - green_time, 2)),
+                "stage_no": _get_phase_barrier_ring(phase_info)[0],
+                "mvmt_text_id": movement_name,
+                "start_green_time": start_green_time,
+                "end_green_time": end_green_time,
+                "geometry": 0,
+            })
+
+    # per-node tables, in place of the Sigma-X workbook of the node
+    node_dir = Path(task["output_dir"]) / task["node_name"]
+    os.makedirs(node_dir, exist_ok=True)
+    for table_name, columns in SIGNAL_INT_TABLE_COLUMNS.items():
+        # object columns keep whole numbers as integers
+        pd.DataFrame(tables[table_name], columns=columns, dtype=object).to_csv(
+            node_dir / f"{table_name}.csv", index=False)
+
+    return tables
+
+
+def generate_gmns_signal_ints(utdf_dict_or_fname: dict | str, output_dir: str = "",
+                              *, max_workers: int | None = 1, verbose: bool = False) -> bool:
+    """Generate the GMNS signal tables of each signal intersection from UTDF, without Excel
+
+    A native replacement of the Sigma-X engine (cvt_utdf_to_signal_intersection).
+    The same GMNS tables are written, signal_phase, signal_phase_concurrency, signal_timing,
+    signal_timing_plan and sim_timing, for all intersections and in a Node_<id>_<street names>
+    folder for each intersection. Timings are taken from the UTDF Phases, Lanes and Timeplans data
+    (the Synchro timing plan) instead of being re-optimized by the Sigma-X workbook.
+
+    Args:
+        utdf_dict_or_fname (dict | str): the UTDF dictionary or the path of UTDF csv file
+        output_dir (str): the output directory. Defaults to "", the utdf_to_gmns_signal_ints folder
+            beside the UTDF file, or the current directory when a UTDF dictionary is given.
+        max_workers (int | None): the number of worker processes for the signal intersections,
+            1 processes them in this process and None uses one process per CPU. Defaults to 1.
+        verbose (bool): whether to print the process. Defaults to False.
+
+    Example:
+        >>> import utdf2gmns as ug
+        >>> ug.generate_gmns_signal_ints("UTDF.csv", max_workers=None)
+
+    Returns:
+        bool: True if success
+    """
+
+    utdf_dict = _load_utdf_dict(utdf_dict_or_fname)
+    if not output_dir:
+        utdf_dir = Path(utdf_dict_or_fname).parent if isinstance(utdf_dict_or_fname, str) else Path()
+        output_dir = utdf_dir / "utdf_to_gmns_signal_ints"
+    output_dir = pf.path2linux(Path(output_dir).absolute())
+    os.makedirs(output_dir, exist_ok=True)
+
+    controller_by_node = _map_signal_nodes_to_controllers(utdf_dict)
+    signal_controls = parse_all_signal_controls(utdf_dict.get("Phases"), utdf_dict.get("Lanes"), controller_by_node)
+    timeplan_lookup = get_utdf_timeplan_lookup(utdf_dict)
+    lane_dict = get_utdf_lane_dict(utdf_dict)
+    link_dict = {_normalize_utdf_node_id(int_id): node_links for int_id, node_links in get_utdf_link_dict(utdf_dict).items()}
+    lane_dict = {_normalize_utdf_node_id(int_id): node_lanes for int_id, node_lanes in lane_dict.items()}
+
+    tasks = []
+    for node_id, controller_id in controller_by_node.items():
+        node_lanes = lane_dict.get(node_id, {})
+        tasks.append({
+            "node_id": node_id,
+            "node_name": _signal_node_name(node_id, link_dict.get(node_id, {})),
+            "signal_control": signal_controls[node_id],
+            "node_lanes": {movement_name: dict(movement_info) for movement_name, movement_info in node_lanes.items()
+                           if movement_name not in ("PED", "HOLD")},
+            "cycle_length": _extract_float(_get_timeplan_value(timeplan_lookup, controller_id, "Cycle Length", "0")),
+            "offset": _to_number(_get_timeplan_value(timeplan_lookup, controller_id, "Offset", "0")),
+            "coord_phase": _to_number(_get_timeplan_value(timeplan_lookup, controller_id, "Reference Phase", "")),
+            # nodes sharing a controller are coordinated by the controller node
+            "coord_node_id": controller_id if controller_id != node_id else 0,
+            "output_dir": output_dir,
+        })
+
+    tables = {table_name: [] for table_name in SIGNAL_INT_TABLE_COLUMNS}
+    for node_tables in _map_signal_tasks(_build_signal_intersection_tables, tasks, max_workers):
+        for table_name, rows in node_tables.items():
+            tables[table_name].extend(rows)
+
+    for table_name, columns in SIGNAL_INT_TABLE_COLUMNS.items():
+        pd.DataFrame(tables[table_name], columns=columns, dtype=object).to_csv(
+            os.path.join(output_dir, f"{table_name}.csv"), index=False)
+
+    if verbose:
+        print(f"  :Signal tables of {len(tasks)} intersections saved to {output_dir}")
+    return True
@@ -6,73 +6,145 @@
 ##############################################################
 '''
 
+import functools
 import math
 from typing import TYPE_CHECKING
+import numpy as np
 import pandas as pd
 import pyufunc as pf
 
+from utdf2gmns.func_lib.utdf.utdf_index import cvt_utdf_table_to_intid_dict, get_utdf_lookup
+from utdf2gmns.util_lib.instrumentation import count
+
 if TYPE_CHECKING:
     from shapely.geometry import Polygon, LineString, Point
     from pyproj import Transformer
 
 
-@pf.requires("pyproj", verbose=False)
-def cvt_lonlat_to_utm(lon: float, lat: float) -> tuple:
-    """Convert latitude and longitude to UTM coordinates."""
-    pf.import_package("pyproj", verbose=False)  # ensure pyproj is imported
-    from pyproj import Transformer  # ensure Transformer is imported
+WGS84_CRS = "EPSG:4326"  # WGS84 Latitude/Longitude
 
-    # Calculate UTM zone number
-    zone_number = int((math.floor((lon + 180) / 6) % 60) + 1)
 
-    # Determine hemisphere
+def _get_utm_zone(lon: float, lat: float) -> tuple[int, str]:
+    """Return the UTM zone number and hemisphere of a longitude/latitude point."""
+    zone_number = int((math.floor((lon + 180) / 6) % 60) + 1)
     hemisphere = 'north' if lat >= 0 else 'south'
+    return zone_number, hemisphere
 
-    # Determine EPSG code based on hemisphere and zone
-    if hemisphere == 'north':
-        epsg_code = 32600 + zone_number  # Northern hemisphere
-    else:
-        epsg_code = 32700 + zone_number  # Southern hemisphere
 
-    # Define the coordinate reference systems
-    wgs84_crs = "EPSG:4326"  # WGS84 Latitude/Longitude
-    utm_crs = f"EPSG:{epsg_code}"  # UTM zone
+def _get_utm_epsg_code(zone_number: int, hemisphere: str) -> int:
+    """Return the EPSG code of a UTM zone."""
+    if hemisphere.lower() == 'north':
+        return 32600 + zone_number  # Northern hemisphere
+    if hemisphere.lower() == 'south':
+        return 32700 + zone_number  # Southern hemisphere
+    raise ValueError("Hemisphere must be 'north' or 'south'")
+
 
-    # Create a transformer object for forward transformation
-    transformer = Transformer.from_crs(wgs84_crs, utm_crs, always_xy=True)
+@functools.lru_cache(maxsize=None)
+@pf.requires("pyproj", verbose=False)
+def _get_utm_transformer(zone_number: int, hemisphere: str, inverse: bool = False) -> "Transformer":
+    """Return a cached WGS84 -> UTM transformer (UTM -> WGS84 when inverse is True).
 
-    # Perform the transformation
+    Building a pyproj Transformer is far more expensive than using it, so one
+    transformer per zone and direction is created and reused for the session.
+    """
+    from pyproj import Transformer
+
+    utm_crs = f"EPSG:{_get_utm_epsg_code(zone_number, hemisphere)}"
+    if inverse:
+        return Transformer.from_crs(utm_crs, WGS84_CRS, always_xy=True)
+    return Transformer.from_crs(WGS84_CRS, utm_crs, always_xy=True)
+
+
+def cvt_lonlat_to_utm(lon: float, lat: float) -> tuple:
+    """Convert latitude and longitude to UTM coordinates."""
+    zone_number, hemisphere = _get_utm_zone(lon, lat)
+
+    # Perform the transformation with the cached zone transformer
+    transformer = _get_utm_transformer(zone_number, hemisphere.lower())
     easting, northing = transformer.transform(lon, lat)
+    count("projections")
 
     return (easting, northing, zone_number, hemisphere)
 
 
-@pf.requires("pyproj", verbose=False)
 def cvt_utm_to_lonlat(easting: float, northing: float, zone_number: int, hemisphere: str) -> tuple:
     """Convert UTM coordinates back to latitude and longitude."""
+    # validate hemisphere before looking up the cached transformer
+    _get_utm_epsg_code(zone_number, hemisphere)
 
-    pf.import_package("pyproj", verbose=False)  # ensure pyproj is imported
-    from pyproj import Transformer  # ensure Transformer is imported
+    transformer = _get_utm_transformer(zone_number, hemisphere.lower(), inverse=True)
+    lon, lat = transformer.transform(easting, northing)
+    count("projections")
 
-    # Determine EPSG code based on hemisphere and zone
-    if hemisphere.lower() == 'north':
-        epsg_code = 32600 + zone_number  # Northern hemisphere
-    elif hemisphere.lower() == 'south':
-        epsg_code = 32700 + zone_number  # Southern hemisphere
-    else:
-        raise ValueError("Hemisphere must be 'north' or 'south'")
+    return (lon, lat)
 
-    # Define the coordinate reference systems
-    utm_crs = f"EPSG:{epsg_code}"  # UTM zone
-    wgs84_crs = "EPSG:4326"  # WGS84 Latitude/Longitude
 
-    # Create a transformer object for inverse transformation
-    transformer = Transformer.from_crs(utm_crs, wgs84_crs, always_xy=True)
+def cvt_lonlat_array_to_utm(lons: "np.ndarray", lats: "np.ndarray",
+                            zone_number: int | None = None,
+                            hemisphere: str | None = None) -> tuple:
+    """Project longitude/latitude arrays into one UTM zone with a single transform call.
 
-    # Perform the transformation
-    lon, lat = transformer.transform(easting, northing)
+    Args:
+        lons (np.ndarray): longitudes of the points.
+        lats (np.ndarray): latitudes of the points, same length as lons.
+        zone_number (int): the UTM zone to project into. Defaults to the zone of the first point.
+        hemisphere (str): "north" or "south". Defaults to the hemisphere of the first point.
+
+    Example:
+        >>> from utdf2gmns.func_lib.gmns.geocoding_Links import cvt_lonlat_array_to_utm
+        >>> eastings, northings, zone_number, hemisphere = cvt_lonlat_array_to_utm(
+        ...     [-111.94, -111.93], [33.42, 33.43])
+        >>> zone_number, hemisphere
+        (12, 'north')
 
-    return (lon, lat)
+    Returns:
+        tuple: (eastings, northings, zone_number, hemisphere), eastings and northings are np.ndarray.
+    """
+    lons = np.asarray(lons, dtype=float)
+    lats = np.asarray(lats, dtype=float)
+    if lons.size == 0:
+        return np.empty(0), np.empty(0), zone_number or 0, hemisphere or "north"
+
+    # all points share one zone so the projected coordinates are comparable
+    if zone_number is None or hemisphere is None:
+        first_zone_number, first_hemisphere = _get_utm_zone(float(lons.flat[0]), float(lats.flat[0]))
+        zone_number = first_zone_number if zone_number is None else zone_number
+        hemisphere = first_hemisphere if hemisphere is None else hemisphere
+
+    _get_utm_epsg_code(zone_number, hemisphere)
+    transformer = _get_utm_transformer(zone_number, hemisphere.lower())
+    eastings, northings = transformer.transform(lons, lats)
+    count("projections", lons.size)
+    return np.asarray(eastings, dtype=float), np.asarray(northings, dtype=float), zone_number, hemisphere
+
+
+def cvt_utm_array_to_lonlat(eastings: "np.ndarray", northings: "np.ndarray",
+                            zone_number: int, hemisphere: str) -> tuple:
+    """Convert UTM coordinate arrays of one zone back to longitude/latitude arrays.
+
+    Args:
+        eastings (np.ndarray): UTM eastings in meters.
+        northings (np.ndarray): UTM northings in meters, same length as eastings.
+        zone_number (int): the UTM zone of the coordinates.
+        hemisphere (str): "north" or "south".
+
+    Raises:
+        ValueError: Hemisphere must be 'north' or 'south'
+
+    Returns:
+        tuple: (lons, lats) as np.ndarray.
+    """
+    _get_utm_epsg_code(zone_number, hemisphere)
+    eastings = np.asarray(eastings, dtype=float)
+    northings = np.asarray(northings, dtype=float)
+    if eastings.size == 0:
+        return np.empty(0), np.empty(0)
+
+    transformer = _get_utm_transformer(zone_number, hemisphere.lower(), inverse=True)
+    lons, lats = transformer.transform(eastings, northings)
+    count("projections", eastings.size)
+    return np.asarray(lons, dtype=float), np.asarray(lats, dtype=float)
 
 
 def create_line_polygon_points(lon1: float, lat1: float, lon2: float, lat2: float,
@@ -193,24 +265,33 @@ def cvt_link_df_to_dict(df_link: pd.DataFrame) -> dict:
         dict: a dictionary of links with keys are intersection ids and values are link data
     """
 
-    # get unique intersection id
-    intersection_id_list = list(df_link["INTID"].unique())
+    # convert utdf_link dataframe to dictionary in one pass
+    link_dict = cvt_utdf_table_to_intid_dict(df_link)
+
+    # select columns with Up ID not empty
+    return {intersection_id: {direction: link_info
+                              for direction, link_info in int_links.items()
+                              if link_info["Up ID"] != ''}
+            for intersection_id, int_links in link_dict.items()}
 
-    # convert utdf_link dataframe to dictionary
-    link_dict = {}
-    for intersection_id in intersection_id_list:
-        df_link_int_id = df_link[df_link["INTID"] == intersection_id]
 
-        df_link_int_id.set_index("RECORDNAME", inplace=True)
-        del df_link_int_id["INTID"]
+def get_utdf_link_dict(utdf_dict: dict) -> dict:
+    """Return the read-only link dictionary of the UTDF data, converting the Links table only once.
 
-        # select columns with Up ID not empty
-        col_selection = df_link_int_id.columns[df_link_int_id.loc["Up ID"] != '']
-        df_link_int_id = df_link_int_id[col_selection]
+    The result is cached in utdf_dict and rebuilt when utdf_dict["Links"] is replaced.
+    Use cvt_link_df_to_dict for a dictionary that can be modified.
 
-        link_dict[intersection_id] = df_link_int_id.to_dict("dict")
+    Args:
+        utdf_dict (dict): the UTDF dictionary returned by read_UTDF
+
+    Returns:
+        dict: a dictionary of links with keys are intersection ids and values are link data
+    """
+    def build_link_dict() -> dict:
+        df_link = utdf_dict.get("Links")
+        return {} if df_link is None else cvt_link_df_to_dict(df_link)
 
-    return link_dict
+    return get_utdf_lookup(utdf_dict, "links", ("Links",), build_link_dict)
 
 
 def generate_links_polygon(df_link: pd.DataFrame,
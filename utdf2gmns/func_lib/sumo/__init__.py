@@ -6,28 +6,41 @@
 ##############################################################
 '''
 
-from .gmns2sumo import (generate_net_link_lookup_dict,
-                        generate_net_lane_lookup_dict,
-                        generate_sumo_nod_xml,
-                        generate_sumo_edg_xml,
-                        generate_sumo_connection_xml,
-                        generate_sumo_flow_xml,
-                        generate_sumo_network_route_xml,
-                        generate_sumo_loop_detector_add_xml)
-from .read_sumo import ReadSUMO
-from .remove_end_route_connection import remove_sumo_end_route_connection
-from .remove_u_turn import remove_sumo_U_turn
-from .signal_intersections import (parse_signal_control,
-                                   parse_lane,
-                                   parse_phase,
-                                   parse_timeplans)
-from .signal_mapping import (direction_mapping,
-                             build_linkDuration,
-                             extract_dir_info,
-                             create_SignalTimingPlan,
-                             process_pedestrian_crossing)
+from utdf2gmns.util_lib.lazy_import import lazy_import_attrs
+
+# update_sumo_signal_from_utdf shares its name with its module. Python sets the module as an attribute
+# of this package when it is imported, which would hide a lazy attribute, so it is imported here.
 from .update_sumo_signal_from_utdf import update_sumo_signal_from_utdf
 
+__getattr__, __dir__ = lazy_import_attrs(__name__, {
+    ".gmns2sumo": ("generate_net_link_lookup_dict",
+                   "generate_net_lane_lookup_dict",
+                   "generate_sumo_nod_xml",
+                   "generate_sumo_edg_xml",
+                   "generate_sumo_connection_xml",
+                   "generate_sumo_flow_xml",
+                   "generate_sumo_network_route_xml",
+                   "generate_sumo_loop_detector_add_xml"),
+    ".post_process_net": ("post_process_sumo_net",),
+    ".read_sumo": ("ReadSUMO",),
+    ".remove_end_route_connection": ("remove_sumo_end_route_connection",
+                                     "mark_end_route_connections_invalid"),
+    ".remove_u_turn": ("remove_sumo_U_turn",
+                       "remove_dead_end_u_turn_connections"),
+    ".signal_intersections": ("parse_signal_control",
+                              "parse_all_signal_controls",
+                              "parse_lane",
+                              "parse_phase",
+                              "parse_timeplans"),
+    ".signal_mapping": ("direction_mapping",
+                        "build_linkDuration",
+                        "extract_dir_info",
+                        "create_SignalTimingPlan",
+                        "process_pedestrian_crossing"),
+    ".update_sumo_signal_from_utdf": ("apply_utdf_signal_to_sumo_net",
+                                      "generate_sumo_tls_add_xml"),
+})
+
 __all__ = [
     # gmns2sumo.py
     'generate_net_link_lookup_dict',
@@ -39,17 +52,23 @@ __all__ = [
     "generate_sumo_network_route_xml",
     "generate_sumo_loop_detector_add_xml",
 
+    # post_process_net.py
+    'post_process_sumo_net',
+
     # read_sumo.py
     'ReadSUMO',
 
     # remove_end_route_connection.py
     'remove_sumo_end_route_connection',
+    'mark_end_route_connections_invalid',
 
     # remove_u_turn.py
     'remove_sumo_U_turn',
+    'remove_dead_end_u_turn_connections',
 
     # signal_intersections.py
     'parse_signal_control',
+    'parse_all_signal_controls',
     "parse_lane",
     'parse_phase',
     'parse_timeplans',
@@ -62,5 +81,7 @@ __all__ = [
     'process_pedestrian_crossing',
 
     # update_sumo_signal_from_utdf.py
-    'update_sumo_signal_from_utdf'
+    'update_sumo_signal_from_utdf',
+    'apply_utdf_signal_to_sumo_net',
+    'generate_sumo_tls_add_xml',
 ]
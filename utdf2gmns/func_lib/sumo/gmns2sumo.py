@@ -13,26 +13,101 @@
 # SUMO netedit specification: https://sumo.dlr.de/docs/Netedit/index.html#processing_menu_options
 
 
-from xml.dom import minidom
+import heapq
+import io
 import xml.etree.ElementTree as ET  # Use ElementTree for XML generation
 import re
 import copy
-import math
 from collections import deque
 from datetime import datetime
 from typing import Any
 
-from utdf2gmns.func_lib.gmns.geocoding_Links import cvt_lonlat_to_utm, cvt_utm_to_lonlat
+import numpy as np
+
+from utdf2gmns.func_lib.gmns.geocoding_Links import _get_utm_zone, cvt_lonlat_array_to_utm, cvt_utm_to_lonlat
 from utdf2gmns.func_lib.gmns.geocoding_Nodes import calculate_new_coordinates_from_offsets
-from utdf2gmns.func_lib.utdf.cvt_utdf_lane_df_to_dict import cvt_lane_df_to_dict
-from utdf2gmns.func_lib.gmns.geocoding_Links import cvt_link_df_to_dict
+from utdf2gmns.func_lib.utdf.cvt_utdf_lane_df_to_dict import get_utdf_lane_dict
+from utdf2gmns.func_lib.gmns.geocoding_Links import get_utdf_link_dict
+from utdf2gmns.func_lib.utdf.utdf_index import get_utdf_lookup
+from utdf2gmns.func_lib.sumo.route_flow_decomposition import decompose_routes_with_min_cost_flow
+from utdf2gmns.util_lib.instrumentation import count, is_recording
+
+
+# methods to decompose UTDF turning counts into network-level routes
+ROUTE_DECOMPOSITION_METHODS = ("greedy", "min_cost_flow")
+
+XML_DECLARATION = '<?xml version="1.0" ?>\n'
+XML_INDENT = "    "
+
+
+def _escape_xml_data(data: str) -> str:
+    """Escape XML text and attribute values the same way as minidom."""
+    if not isinstance(data, str):
+        raise TypeError(f"cannot serialize {data!r} (type {type(data).__name__})")
+    return data.replace("&", "&amp;").replace("<", "&lt;").replace("\"", "&quot;").replace(">", "&gt;")
+
+
+def write_xml_element(f, element: ET.Element, level: int = 0) -> None:
+    """Write an Element and its children to an open text file, indented as minidom toprettyxml.
+
+    Elements are written one by one to the file handle, no intermediate string of the whole
+    tree is created. Write detached elements one at a time to stream a large file.
+
+    Args:
+        f: a writable text file handle
+        element (ET.Element): the element to write
+        level (int): the indentation level of the element. Defaults to 0.
+    """
+    indent = XML_INDENT * level
+
+    if element.tag is ET.Comment:
+        f.write(f"{indent}<!--{element.text or ''}-->\n")
+        return
+
+    attrs = "".join(f' {name}="{_escape_xml_data(value)}"' for name, value in element.items())
+
+    # text, child elements and their tails in document order, as parsed by minidom
+    child_nodes = [element.text] if element.text else []
+    for child in element:
+        child_nodes.append(child)
+        if child.tail:
+            child_nodes.append(child.tail)
+
+    if not child_nodes:
+        f.write(f"{indent}<{element.tag}{attrs}/>\n")
+    elif len(child_nodes) == 1 and isinstance(child_nodes[0], str):
+        f.write(f"{indent}<{element.tag}{attrs}>{_escape_xml_data(child_nodes[0])}</{element.tag}>\n")
+    else:
+        f.write(f"{indent}<{element.tag}{attrs}>\n")
+        for child_node in child_nodes:
+            if isinstance(child_node, str):
+                f.write(f"{indent}{XML_INDENT}{_escape_xml_data(child_node)}\n")
+            else:
+                write_xml_element(f, child_node, level + 1)
+        f.write(f"{indent}</{element.tag}>\n")
 
 
-def xml_prettify(element: str) -> str:
+def write_pretty_xml(element: ET.Element, filename: str) -> None:
+    """Write an Element to a pretty-printed XML file, the same as writing xml_prettify(element).
+
+    Args:
+        element (ET.Element): the root element
+        filename (str): the output XML file
+    """
+    with open(filename, "w") as f:
+        f.write(XML_DECLARATION)
+        write_xml_element(f, element)
+
+    if is_recording():
+        count("xml_elements_written", sum(1 for _ in element.iter()))
+
+
+def xml_prettify(element: ET.Element) -> str:
     """Return a pretty-printed XML string for the Element."""
-    rough_string = ET.tostring(element, 'utf-8')
-    re_parsed = minidom.parseString(rough_string)
-    return re_parsed.toprettyxml(indent="    ")
+    with io.StringIO() as f:
+        f.write(XML_DECLARATION)
+        write_xml_element(f, element)
+        return f.getvalue()
 
 
 def cvt_feet_to_meters(feet: float) -> float:
@@ -64,6 +139,24 @@ MAX_REALISTIC_CURVE_TURN_DEGREES = 80.0
 MAX_REALISTIC_Z_CURVE_TOTAL_DEGREES = 90.0
 MAX_REALISTIC_SHAPE_LENGTH_RATIO = 1.35
 
+# Edge profiles depend only on these UTDF tables (plus the network unit).
+SUMO_EDGE_PROFILE_CACHE_KEY = "sumo_edge_profiles"
+SUMO_EDGE_PROFILE_SOURCE_KEYS = ("Links", "Lanes", "Timeplans", "network_nodes")
+
+# Profile key of the shape and turn-bay split geometry shared by all writers.
+PROFILE_GEOMETRY_KEY = "_geometry"
+
+# Candidate shapes of a directed approach in selection order, as (priority group,
+# priority order, anchor positions). The anchors of an approach are its start point,
+# end point, current curve point and reverse curve point, at positions 0 to 3.
+SHAPE_CANDIDATE_ANCHORS = (
+    (0, 0, (0, 3, 2, 1)),
+    (0, 1, (0, 2, 3, 1)),
+    (1, 0, (0, 2, 1)),
+    (1, 1, (0, 3, 1)),
+    (2, 0, (0, 1)),
+)
+
 
 def _is_blank(value: Any) -> bool:
     """Return True when a UTDF cell does not contain useful data."""
@@ -207,7 +300,7 @@ def _collect_active_lane_approach_ids(utdf_dict: dict) -> set[str]:
         return set()
 
     active_approach_ids: set[str] = set()
-    network_lanes = cvt_lane_df_to_dict(lanes_df)
+    network_lanes = get_utdf_lane_dict(utdf_dict)
     for intersection_id, movement_lanes in network_lanes.items():
         intersection_node = _normalize_node_id(intersection_id)
         for movement_name, movement_info in movement_lanes.items():
@@ -427,9 +520,7 @@ def _profile_has_enough_turn_bay_geometry(profile: dict, network_nodes: dict | N
     if network_nodes is None:
         return True
 
-    shape_length = _shape_length_meters(
-        _get_profile_shape_points(profile, network_nodes, net_unit),
-    )
+    shape_length = _get_profile_geometry(profile, network_nodes, net_unit)["length_m"]
     if shape_length is None:
         return True
 
@@ -443,7 +534,7 @@ def _profile_has_enough_turn_bay_geometry(profile: dict, network_nodes: dict | N
 
 def _build_sumo_edge_profile_dict(utdf_dict: dict, net_unit: str | None) -> dict:
     """Build lane profiles shared by SUMO node, edge, connection, flow, and detector writers."""
-    link_lookup_dict = generate_net_link_lookup_dict(utdf_dict)
+    link_lookup_dict = _get_net_link_lookup_dict(utdf_dict)
     edge_profiles = {
         edge_id: _create_empty_edge_profile(edge_id, link_info, net_unit)
         for edge_id, link_info in link_lookup_dict.items()
@@ -452,7 +543,7 @@ def _build_sumo_edge_profile_dict(utdf_dict: dict, net_unit: str | None) -> dict
 
     lanes_df = utdf_dict.get("Lanes")
     if lanes_df is not None:
-        network_lanes = cvt_lane_df_to_dict(lanes_df)
+        network_lanes = get_utdf_lane_dict(utdf_dict)
         for intersection_id, movement_lanes in network_lanes.items():
             intersection_node = _normalize_node_id(intersection_id)
             for movement_name, movement_info in movement_lanes.items():
@@ -570,6 +661,10 @@ def _build_sumo_edge_profile_dict(utdf_dict: dict, net_unit: str | None) -> dict
         profile["reverse_curve_pt_x"] = reverse_profile.get("curve_pt_x")
         profile["reverse_curve_pt_y"] = reverse_profile.get("curve_pt_y")
 
+    # select the shapes of all approaches in one batch, once the reverse curve points are known
+    if utdf_dict.get("network_nodes") is not None:
+        _build_profile_geometries(list(edge_profiles.values()), utdf_dict["network_nodes"], net_unit)
+
     for profile in edge_profiles.values():
         _finalize_edge_profile(profile)
         if profile["has_turn_bay"] and not _profile_has_enough_turn_bay_geometry(
@@ -581,6 +676,54 @@ def _build_sumo_edge_profile_dict(utdf_dict: dict, net_unit: str | None) -> dict
     return edge_profiles
 
 
+def _is_sumo_edge_profile_cache_valid(utdf_dict: dict, net_unit: str | None) -> bool:
+    """Return True when the cached edge profiles still match the UTDF tables they came from."""
+    cached_model = utdf_dict.get(SUMO_EDGE_PROFILE_CACHE_KEY)
+    if not isinstance(cached_model, dict) or cached_model.get("net_unit") != net_unit:
+        return False
+
+    # Tables are compared by identity: replacing Lanes, Links, Timeplans, or
+    # network_nodes in the dictionary makes the cached model stale.
+    cached_sources = cached_model.get("sources", {})
+    return all(
+        cached_sources.get(source_key) is utdf_dict.get(source_key)
+        for source_key in SUMO_EDGE_PROFILE_SOURCE_KEYS
+    )
+
+
+def _cache_sumo_edge_profile_dict(utdf_dict: dict, net_unit: str | None) -> dict:
+    """Build the edge profiles once and store them in ``utdf_dict`` for later writers."""
+    if _is_sumo_edge_profile_cache_valid(utdf_dict, net_unit):
+        return utdf_dict[SUMO_EDGE_PROFILE_CACHE_KEY]["edge_profiles"]
+
+    edge_profiles = _build_sumo_edge_profile_dict(utdf_dict, net_unit)
+    utdf_dict[SUMO_EDGE_PROFILE_CACHE_KEY] = {
+        "net_unit": net_unit,
+        "sources": {
+            source_key: utdf_dict.get(source_key)
+            for source_key in SUMO_EDGE_PROFILE_SOURCE_KEYS
+        },
+        "edge_profiles": edge_profiles,
+    }
+    return edge_profiles
+
+
+def _clear_sumo_edge_profile_cache(utdf_dict: dict) -> None:
+    """Drop cached edge profiles so the next writer rebuilds them."""
+    utdf_dict.pop(SUMO_EDGE_PROFILE_CACHE_KEY, None)
+
+
+def _get_sumo_edge_profile_dict(utdf_dict: dict, net_unit: str | None) -> dict:
+    """Return cached edge profiles when they are still valid, otherwise build new ones.
+
+    Writers treat the returned profiles as read-only, so one cached model can be
+    shared by every SUMO and GMNS writer of a ``UTDF2GMNS`` instance.
+    """
+    if _is_sumo_edge_profile_cache_valid(utdf_dict, net_unit):
+        return utdf_dict[SUMO_EDGE_PROFILE_CACHE_KEY]["edge_profiles"]
+    return _build_sumo_edge_profile_dict(utdf_dict, net_unit)
+
+
 def _get_network_node(network_nodes: dict, node_id: str) -> dict | None:
     """Find a node record regardless of whether its key is stored as text or a number."""
     if node_id in network_nodes:
@@ -604,14 +747,16 @@ def _append_distinct_shape_point(shape_points: list[tuple[float, float]],
     """Append a shape point unless it duplicates the previous coordinate."""
     if point is None:
         return
-    if shape_points and (
-        abs(shape_points[-1][0] - point[0]) < 1e-10
-        and abs(shape_points[-1][1] - point[1]) < 1e-10
-    ):
+    if shape_points and _is_same_shape_point(shape_points[-1], point):
         return
     shape_points.append(point)
 
 
+def _is_same_shape_point(point: tuple[float, float], other_point: tuple[float, float]) -> bool:
+    """Return True when two longitude/latitude points are the same shape coordinate."""
+    return abs(point[0] - other_point[0]) < 1e-10 and abs(point[1] - other_point[1]) < 1e-10
+
+
 def _dedupe_shape_points(shape_points: list[tuple[float, float]]
                          ) -> list[tuple[float, float]]:
     """Return shape points without consecutive duplicate coordinates."""
@@ -621,69 +766,84 @@ def _dedupe_shape_points(shape_points: list[tuple[float, float]]
     return cleaned_shape_points
 
 
-def _project_shape_points_only(shape_points: list[tuple[float, float]]
-                               ) -> list[tuple[float, float]]:
-    """Project a longitude/latitude shape into UTM points for geometry checks."""
+def _project_shape_points_only(shape_points: list[tuple[float, float]]) -> np.ndarray:
+    """Project a longitude/latitude shape into an ``(n, 2)`` UTM array for geometry checks."""
     projected_data = _shape_points_to_utm(shape_points)
     if projected_data is None:
-        return []
+        return np.empty((0, 2))
     projected_points, _, _ = projected_data
     return projected_points
 
 
-def _shape_direct_length_meters(shape_points: list[tuple[float, float]]) -> float | None:
-    """Return the straight-line length between a shape's endpoints."""
-    projected_points = _project_shape_points_only(shape_points)
+def _projected_segment_lengths(projected_points: np.ndarray) -> np.ndarray:
+    """Return the length of each segment of a projected shape."""
+    segment_deltas = np.diff(projected_points, axis=0)
+    return (segment_deltas[:, 0] ** 2 + segment_deltas[:, 1] ** 2) ** 0.5
+
+
+def _projected_shape_length(projected_points: np.ndarray) -> float | None:
+    """Return the polyline length of a projected shape."""
     if len(projected_points) < 2:
         return None
+    # Python's sequential sum keeps lengths identical to the per-point loop
+    return sum(_projected_segment_lengths(projected_points).tolist())
+
 
-    start_x, start_y = projected_points[0]
-    end_x, end_y = projected_points[-1]
+def _projected_direct_length(projected_points: np.ndarray) -> float | None:
+    """Return the straight-line length between the endpoints of a projected shape."""
+    if len(projected_points) < 2:
+        return None
+
+    start_x, start_y = projected_points[0].tolist()
+    end_x, end_y = projected_points[-1].tolist()
     return ((end_x - start_x) ** 2 + (end_y - start_y) ** 2) ** 0.5
 
 
+def _projected_signed_turn_angles(projected_points: np.ndarray) -> list[float]:
+    """Return signed turn angles between consecutive segments of a projected shape."""
+    if len(projected_points) < 3:
+        return []
+
+    segment_vectors = np.diff(projected_points, axis=0)
+    segment_lengths = (segment_vectors[:, 0] ** 2 + segment_vectors[:, 1] ** 2) ** 0.5
+    previous_vectors, next_vectors = segment_vectors[:-1], segment_vectors[1:]
+    previous_lengths, next_lengths = segment_lengths[:-1], segment_lengths[1:]
+    is_valid_turn = (previous_lengths > 0) & (next_lengths > 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dot_products = (
+            previous_vectors[:, 0] * next_vectors[:, 0]
+            + previous_vectors[:, 1] * next_vectors[:, 1]
+        ) / (previous_lengths * next_lengths)
+    dot_products = np.clip(dot_products[is_valid_turn], -1.0, 1.0)
+    turn_angles = np.degrees(np.arccos(dot_products))
+    cross_products = (
+        previous_vectors[:, 0] * next_vectors[:, 1]
+        - previous_vectors[:, 1] * next_vectors[:, 0]
+    )[is_valid_turn]
+    return np.where(cross_products >= 0, turn_angles, -turn_angles).tolist()
+
+
+def _shape_direct_length_meters(shape_points: list[tuple[float, float]]) -> float | None:
+    """Return the straight-line length between a shape's endpoints."""
+    return _projected_direct_length(_project_shape_points_only(shape_points))
+
+
 def _shape_signed_turn_angles(shape_points: list[tuple[float, float]]) -> list[float]:
     """Return signed turn angles between consecutive projected shape segments."""
-    projected_points = _project_shape_points_only(shape_points)
-    signed_turn_angles: list[float] = []
-    for previous_point, current_point, next_point in zip(
-            projected_points,
-            projected_points[1:],
-            projected_points[2:]):
-        previous_vector = (
-            current_point[0] - previous_point[0],
-            current_point[1] - previous_point[1],
-        )
-        next_vector = (
-            next_point[0] - current_point[0],
-            next_point[1] - current_point[1],
-        )
-        previous_length = (previous_vector[0] ** 2 + previous_vector[1] ** 2) ** 0.5
-        next_length = (next_vector[0] ** 2 + next_vector[1] ** 2) ** 0.5
-        if previous_length <= 0 or next_length <= 0:
-            continue
-
-        dot_product = (
-            previous_vector[0] * next_vector[0]
-            + previous_vector[1] * next_vector[1]
-        ) / (previous_length * next_length)
-        dot_product = min(max(dot_product, -1.0), 1.0)
-        turn_angle = math.degrees(math.acos(dot_product))
-        cross_product = (
-            previous_vector[0] * next_vector[1]
-            - previous_vector[1] * next_vector[0]
-        )
-        signed_turn_angles.append(turn_angle if cross_product >= 0 else -turn_angle)
-    return signed_turn_angles
+    return _projected_signed_turn_angles(_project_shape_points_only(shape_points))
 
 
 def _shape_has_unrealistic_curve(shape_points: list[tuple[float, float]],
-                                 declared_length_m: float | None) -> bool:
+                                 declared_length_m: float | None,
+                                 projected_points: np.ndarray | None = None) -> bool:
     """Return True when a UTDF curve would create a sharp or Z-shaped link."""
     if len(shape_points) <= 2:
         return False
 
-    signed_turn_angles = _shape_signed_turn_angles(shape_points)
+    if projected_points is None:
+        projected_points = _project_shape_points_only(shape_points)
+    signed_turn_angles = _projected_signed_turn_angles(projected_points)
     if not signed_turn_angles:
         return False
 
@@ -699,8 +859,8 @@ def _shape_has_unrealistic_curve(shape_points: list[tuple[float, float]],
     if has_opposite_turns and total_turn_angle >= MAX_REALISTIC_Z_CURVE_TOTAL_DEGREES:
         return True
 
-    shape_length_m = _shape_length_meters(shape_points)
-    direct_length_m = _shape_direct_length_meters(shape_points)
+    shape_length_m = _projected_shape_length(projected_points)
+    direct_length_m = _projected_direct_length(projected_points)
     if shape_length_m is None or direct_length_m is None:
         return False
 
@@ -715,13 +875,16 @@ def _shape_has_unrealistic_curve(shape_points: list[tuple[float, float]],
 def _shape_candidate_score(shape_points: list[tuple[float, float]],
                            declared_length_m: float | None,
                            priority_group: int,
-                           priority_order: int) -> tuple[float, float, float, int]:
+                           priority_order: int,
+                           projected_points: np.ndarray | None = None) -> tuple[float, float, float, int]:
     """Return a deterministic score for selecting the most realistic UTDF shape."""
-    shape_length_m = _shape_length_meters(shape_points) or 0.0
-    direct_length_m = _shape_direct_length_meters(shape_points) or shape_length_m
+    if projected_points is None:
+        projected_points = _project_shape_points_only(shape_points)
+    shape_length_m = _projected_shape_length(projected_points) or 0.0
+    direct_length_m = _projected_direct_length(projected_points) or shape_length_m
     reference_length_m = declared_length_m or direct_length_m
     length_error_m = abs(shape_length_m - reference_length_m)
-    signed_turn_angles = _shape_signed_turn_angles(shape_points)
+    signed_turn_angles = _projected_signed_turn_angles(projected_points)
     max_turn_angle = (
         max(abs(turn_angle) for turn_angle in signed_turn_angles)
         if signed_turn_angles
@@ -737,47 +900,168 @@ def _select_realistic_shape_points(
         reverse_curve_point: tuple[float, float] | None,
         declared_length_m: float | None) -> list[tuple[float, float]]:
     """Choose the UTDF shape that avoids unrealistic 90-degree and Z links."""
-    candidate_shapes = []
-    if reverse_curve_point is not None and current_curve_point is not None:
-        candidate_shapes.extend([
-            (
-                0,
-                0,
-                [start_point, reverse_curve_point, current_curve_point, end_point],
-            ),
-            (
-                0,
-                1,
-                [start_point, current_curve_point, reverse_curve_point, end_point],
-            ),
-        ])
-    if current_curve_point is not None:
-        candidate_shapes.append((1, 0, [start_point, current_curve_point, end_point]))
-    if reverse_curve_point is not None:
-        candidate_shapes.append((1, 1, [start_point, reverse_curve_point, end_point]))
-    candidate_shapes.append((2, 0, [start_point, end_point]))
-
-    valid_candidates = []
-    for priority_group, priority_order, shape_points in candidate_shapes:
-        cleaned_shape_points = _dedupe_shape_points(shape_points)
-        if len(cleaned_shape_points) < 2:
-            continue
-        if _shape_has_unrealistic_curve(cleaned_shape_points, declared_length_m):
-            continue
+    return _select_realistic_shapes([
+        (start_point, end_point, current_curve_point, reverse_curve_point, declared_length_m),
+    ])[0][0]
 
-        valid_candidates.append((
-            _shape_candidate_score(
-                cleaned_shape_points,
-                declared_length_m,
-                priority_group,
-                priority_order,
-            ),
-            cleaned_shape_points,
-        ))
 
-    if valid_candidates:
-        return min(valid_candidates, key=lambda candidate: candidate[0])[1]
-    return [start_point, end_point]
+def _project_shape_anchors(shape_anchors: list[tuple]) -> tuple[np.ndarray, list[tuple[int, str]]]:
+    """Project the anchor points of many approaches, each into the UTM zone of its start point.
+
+    Returns:
+        tuple: (an (n, 4, 2) array of projected anchors, NaN for missing curve points;
+            the (zone number, hemisphere) of each approach)
+    """
+    anchor_lonlats = np.full((len(shape_anchors), 4, 2), np.nan)
+    for approach_pos, approach_anchors in enumerate(shape_anchors):
+        for anchor_pos, point in enumerate(approach_anchors[:4]):
+            if point is not None:
+                anchor_lonlats[approach_pos, anchor_pos] = point
+
+    approach_zones = [_get_utm_zone(*approach_anchors[0]) for approach_anchors in shape_anchors]
+    zone_codes = {}
+    approach_zone_codes = np.array([zone_codes.setdefault(zone, len(zone_codes)) for zone in approach_zones])
+
+    # one transform call for all anchors of each zone
+    projected_anchors = np.full_like(anchor_lonlats, np.nan)
+    has_anchor = ~np.isnan(anchor_lonlats[:, :, 0])
+    for (zone_number, hemisphere), zone_code in zone_codes.items():
+        in_zone = has_anchor & (approach_zone_codes == zone_code)[:, None]
+        eastings, northings, _, _ = cvt_lonlat_array_to_utm(
+            anchor_lonlats[in_zone, 0],
+            anchor_lonlats[in_zone, 1],
+            zone_number,
+            hemisphere,
+        )
+        projected_anchors[in_zone, 0] = eastings
+        projected_anchors[in_zone, 1] = northings
+    return projected_anchors, approach_zones
+
+
+def _select_realistic_shapes(shape_anchors: list[tuple]) -> list[tuple[list[tuple[float, float]], tuple]]:
+    """Choose the UTDF shape of many directed approaches at once, avoiding 90-degree and Z links.
+
+    Each approach is ``(start point, end point, current curve point, reverse curve point,
+    declared length)``, curve points can be None. The candidate shapes of all approaches
+    are checked and scored together on projected arrays, with the same rules and the
+    same arithmetic as _shape_has_unrealistic_curve and _shape_candidate_score, so each
+    result is the shape _select_realistic_shape_points chooses for the approach.
+
+    Returns:
+        list: (shape points, (projected shape points, zone number, hemisphere)) of each approach
+    """
+    if not shape_anchors:
+        return []
+
+    projected_anchors, approach_zones = _project_shape_anchors(shape_anchors)
+
+    candidate_approach_pos = []
+    candidate_priorities = []
+    candidate_anchor_positions = []
+    for approach_pos, approach_anchors in enumerate(shape_anchors):
+        anchor_points = approach_anchors[:4]
+        for priority_group, priority_order, anchor_positions in SHAPE_CANDIDATE_ANCHORS:
+            if any(anchor_points[anchor_pos] is None for anchor_pos in anchor_positions):
+                continue
+
+            # drop consecutive duplicate points, the same as _dedupe_shape_points
+            cleaned_anchor_positions = [anchor_positions[0]]
+            for anchor_pos in anchor_positions[1:]:
+                if not _is_same_shape_point(anchor_points[cleaned_anchor_positions[-1]], anchor_points[anchor_pos]):
+                    cleaned_anchor_positions.append(anchor_pos)
+            if len(cleaned_anchor_positions) < 2:
+                continue
+
+            candidate_approach_pos.append(approach_pos)
+            candidate_priorities.append((priority_group, priority_order))
+            candidate_anchor_positions.append(cleaned_anchor_positions)
+
+    candidate_point_counts = np.array([len(anchor_positions) for anchor_positions in candidate_anchor_positions])
+    candidate_approach_pos = np.array(candidate_approach_pos, dtype=np.int64)
+
+    # candidates are padded to four points by repeating the end point, the padded
+    # segments have zero length and so never form a turn
+    padded_anchor_positions = np.array([
+        anchor_positions + anchor_positions[-1:] * (4 - len(anchor_positions))
+        for anchor_positions in candidate_anchor_positions
+    ])
+    candidate_points = projected_anchors[candidate_approach_pos[:, None], padded_anchor_positions]
+
+    segment_vectors = np.diff(candidate_points, axis=1)
+    segment_lengths = (segment_vectors[:, :, 0] ** 2 + segment_vectors[:, :, 1] ** 2) ** 0.5
+    previous_vectors, next_vectors = segment_vectors[:, :-1], segment_vectors[:, 1:]
+    previous_lengths, next_lengths = segment_lengths[:, :-1], segment_lengths[:, 1:]
+    is_turn = (previous_lengths > 0) & (next_lengths > 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dot_products = (
+            previous_vectors[:, :, 0] * next_vectors[:, :, 0]
+            + previous_vectors[:, :, 1] * next_vectors[:, :, 1]
+        ) / (previous_lengths * next_lengths)
+    turn_angles = np.degrees(np.arccos(np.clip(np.where(is_turn, dot_products, 1.0), -1.0, 1.0)))
+    cross_products = (
+        previous_vectors[:, :, 0] * next_vectors[:, :, 1]
+        - previous_vectors[:, :, 1] * next_vectors[:, :, 0]
+    )
+    signed_turn_angles = np.where(cross_products >= 0, turn_angles, -turn_angles)
+    abs_turn_angles = np.where(is_turn, np.abs(signed_turn_angles), 0.0)
+    max_turn_angles = abs_turn_angles.max(axis=1)
+    has_opposite_turns = is_turn[:, 0] & is_turn[:, 1] & (signed_turn_angles[:, 0] * signed_turn_angles[:, 1] < 0)
+    total_turn_angles = abs_turn_angles[:, 0] + abs_turn_angles[:, 1]
+
+    # shape and direct lengths use Python arithmetic, the same as _projected_shape_length
+    # and _projected_direct_length, so ties between candidates break the same way
+    shape_lengths = np.array([
+        sum(candidate_segment_lengths[:point_count - 1])
+        for candidate_segment_lengths, point_count in zip(segment_lengths.tolist(), candidate_point_counts.tolist())
+    ])
+    direct_lengths = np.array([
+        ((end_x - start_x) ** 2 + (end_y - start_y) ** 2) ** 0.5
+        for (start_x, start_y), (end_x, end_y) in zip(
+            candidate_points[:, 0].tolist(),
+            candidate_points[np.arange(len(candidate_points)), candidate_point_counts - 1].tolist(),
+        )
+    ])
+    declared_lengths = np.array([
+        float(shape_anchors[approach_pos][4] or 0.0) for approach_pos in candidate_approach_pos.tolist()
+    ])
+
+    reference_lengths = np.where(declared_lengths != 0, declared_lengths, direct_lengths)
+    max_reasonable_lengths = np.maximum(
+        reference_lengths * MAX_REALISTIC_SHAPE_LENGTH_RATIO,
+        direct_lengths * MAX_REALISTIC_SHAPE_LENGTH_RATIO,
+    )
+    is_unrealistic = (
+        (candidate_point_counts > 2)
+        & is_turn.any(axis=1)
+        & (
+            (max_turn_angles >= MAX_REALISTIC_CURVE_TURN_DEGREES)
+            | (has_opposite_turns & (total_turn_angles >= MAX_REALISTIC_Z_CURVE_TOTAL_DEGREES))
+            | (shape_lengths > max_reasonable_lengths)
+        )
+    )
+
+    score_direct_lengths = np.where(direct_lengths != 0, direct_lengths, shape_lengths)
+    length_errors = np.abs(shape_lengths - np.where(declared_lengths != 0, declared_lengths, score_direct_lengths))
+
+    # the first valid candidate of each approach sorted by its score is the selected shape
+    priority_groups, priority_orders = np.array(candidate_priorities, dtype=np.int64).reshape(-1, 2).T
+    candidate_order = np.lexsort((priority_orders, max_turn_angles, length_errors, priority_groups,
+                                  candidate_approach_pos))
+    candidate_order = candidate_order[~is_unrealistic[candidate_order]]
+    selected_candidates = dict(zip(candidate_approach_pos[candidate_order[::-1]].tolist(),
+                                   candidate_order[::-1].tolist()))
+
+    selected_shapes = []
+    for approach_pos, approach_anchors in enumerate(shape_anchors):
+        candidate_pos = selected_candidates.get(approach_pos)
+        anchor_positions = candidate_anchor_positions[candidate_pos] if candidate_pos is not None else [0, 1]
+        zone_number, hemisphere = approach_zones[approach_pos]
+        selected_shapes.append((
+            [approach_anchors[anchor_pos] for anchor_pos in anchor_positions],
+            (projected_anchors[approach_pos, anchor_positions], zone_number, hemisphere),
+        ))
+    return selected_shapes
 
 
 def _convert_utdf_xy_to_lonlat(value_x: Any, value_y: Any, reference_node: dict,
@@ -801,16 +1085,21 @@ def _convert_utdf_xy_to_lonlat(value_x: Any, value_y: Any, reference_node: dict,
     )
 
 
-def _get_profile_shape_points(profile: dict, network_nodes: dict | None,
-                              net_unit: str | None) -> list[tuple[float, float]]:
-    """Return the UTDF-defined centerline points for one directed approach."""
+def _get_profile_shape_anchors(profile: dict, network_nodes: dict | None,
+                               net_unit: str | None) -> tuple | None:
+    """Return the anchor points of the UTDF-defined centerline of one directed approach.
+
+    Returns:
+        tuple | None: (start point, end point, curve point, reverse curve point, declared length),
+            None when the approach nodes are not geocoded
+    """
     if not network_nodes:
-        return []
+        return None
 
     up_node = _get_network_node(network_nodes, profile["from_node"])
     intersection_node = _get_network_node(network_nodes, profile["to_node"])
     if up_node is None or intersection_node is None:
-        return []
+        return None
 
     start_point = (float(up_node["x_coord"]), float(up_node["y_coord"]))
     end_point = (
@@ -829,31 +1118,126 @@ def _get_profile_shape_points(profile: dict, network_nodes: dict | None,
         intersection_node,
         net_unit,
     )
+    return start_point, end_point, curve_point, reverse_curve_point, profile.get("length_m")
+
+
+def _build_profile_geometries(profiles: list[dict], network_nodes: dict | None,
+                              net_unit: str | None) -> list[dict[str, Any]]:
+    """Select the shapes of many directed approaches in one batch and attach their geometry records.
+
+    See _get_profile_geometry for the geometry record.
+    """
+    shape_anchors = [_get_profile_shape_anchors(profile, network_nodes, net_unit) for profile in profiles]
+
     # UTDF may store a two-point curve across the current and reverse links.
     # Keep that detail when it creates a realistic road centerline, but reject
     # sharp or Z-shaped candidates that would not represent a real street.
-    return _select_realistic_shape_points(
-        start_point,
-        end_point,
-        curve_point,
-        reverse_curve_point,
-        profile.get("length_m"),
+    selected_shapes = iter(_select_realistic_shapes(
+        [approach_anchors for approach_anchors in shape_anchors if approach_anchors is not None]))
+
+    geometries = []
+    for profile, approach_anchors in zip(profiles, shape_anchors):
+        shape_points, projected_data = next(selected_shapes) if approach_anchors is not None else ([], None)
+        geometry = {
+            "network_nodes": network_nodes,
+            "net_unit": net_unit,
+            "shape_points": shape_points,
+            "projected_data": projected_data,
+            "length_m": _projected_shape_length(projected_data[0]) if projected_data is not None else None,
+        }
+        profile[PROFILE_GEOMETRY_KEY] = geometry
+        geometries.append(geometry)
+    return geometries
+
+
+def _get_profile_geometry(profile: dict, network_nodes: dict | None,
+                          net_unit: str | None) -> dict[str, Any]:
+    """Return the shape geometry of one directed approach, computed once per profile.
+
+    The record holds the selected centerline, its UTM projection and the shape
+    length. It is attached to the profile, so the edge profile model, the SUMO
+    writers and the GMNS writers share it. It is recomputed when ``network_nodes``
+    is replaced or another ``net_unit`` is used.
+    Turn-bay split geometry is added by _get_profile_turn_bay_geometry on first use.
+
+    Returns:
+        dict: the geometry record, treat it as read-only
+    """
+    geometry = profile.get(PROFILE_GEOMETRY_KEY)
+    if (
+        geometry is not None
+        and geometry["network_nodes"] is network_nodes
+        and geometry["net_unit"] == net_unit
+    ):
+        return geometry
+    return _build_profile_geometries([profile], network_nodes, net_unit)[0]
+
+
+def _get_profile_turn_bay_geometry(profile: dict, network_nodes: dict | None,
+                                   net_unit: str | None) -> dict[str, Any]:
+    """Return the geometry record of one directed approach with its turn-bay split.
+
+    Adds the turn-bay node coordinate, the upstream (main) and stop-line shape
+    pieces and their lengths to the record of _get_profile_geometry. When neither
+    piece has a measurable length, the UTDF link and turn-bay lengths are used.
+    """
+    geometry = _get_profile_geometry(profile, network_nodes, net_unit)
+    if "bay_node_coord" in geometry:
+        return geometry
+
+    bay_node_coord = _calculate_turn_bay_node_coord_from_geometry(profile, geometry)
+    main_shape_points, stop_shape_points = _split_shape_at_point(
+        geometry["shape_points"],
+        bay_node_coord,
+        geometry["projected_data"],
     )
+    main_length_m = _shape_length_meters(main_shape_points)
+    stop_length_m = _shape_length_meters(stop_shape_points)
+    if main_length_m is None and stop_length_m is None:
+        if profile["length_m"] is None:
+            main_length_m = None
+            stop_length_m = profile["turn_bay_length_m"]
+        else:
+            stop_length_m = min(profile["turn_bay_length_m"], profile["length_m"])
+            main_length_m = max(profile["length_m"] - stop_length_m, 0.1)
+
+    geometry.update({
+        "bay_node_coord": bay_node_coord,
+        "main_shape_points": main_shape_points,
+        "stop_shape_points": stop_shape_points,
+        "main_length_m": main_length_m,
+        "stop_length_m": stop_length_m,
+    })
+    return geometry
 
 
-def _shape_points_to_utm(shape_points: list[tuple[float, float]]
-                         ) -> tuple[list[tuple[float, float]], int, str] | None:
-    """Project longitude/latitude shape points into UTM for distance operations."""
-    if not shape_points:
+def _get_profile_shape_points(profile: dict, network_nodes: dict | None,
+                              net_unit: str | None) -> list[tuple[float, float]]:
+    """Return the UTDF-defined centerline points for one directed approach."""
+    return _get_profile_geometry(profile, network_nodes, net_unit)["shape_points"]
+
+
+def _shape_points_to_utm(shape_points: list[tuple[float, float]],
+                         zone_number: int | None = None,
+                         hemisphere: str | None = None
+                         ) -> tuple[np.ndarray, int, str] | None:
+    """Project longitude/latitude shape points into UTM for distance operations.
+
+    The whole shape is projected with one batched transform into a single zone
+    (the zone of the first point unless given) and returned as an ``(n, 2)``
+    array of eastings and northings.
+    """
+    if shape_points is None or len(shape_points) == 0:
         return None
 
-    projected_points: list[tuple[float, float]] = []
-    zone_number = 0
-    hemisphere = "north"
-    for lon, lat in shape_points:
-        point_x, point_y, zone_number, hemisphere = cvt_lonlat_to_utm(lon, lat)
-        projected_points.append((point_x, point_y))
-    return projected_points, zone_number, hemisphere
+    lonlat_points = np.asarray(shape_points, dtype=float).reshape(-1, 2)
+    eastings, northings, zone_number, hemisphere = cvt_lonlat_array_to_utm(
+        lonlat_points[:, 0],
+        lonlat_points[:, 1],
+        zone_number,
+        hemisphere,
+    )
+    return np.column_stack((eastings, northings)), zone_number, hemisphere
 
 
 def _shape_length_meters(shape_points: list[tuple[float, float]] | None) -> float | None:
@@ -866,22 +1250,24 @@ def _shape_length_meters(shape_points: list[tuple[float, float]] | None) -> floa
         return None
 
     projected_points, _, _ = projected_data
-    return sum(
-        ((end_x - start_x) ** 2 + (end_y - start_y) ** 2) ** 0.5
-        for (start_x, start_y), (end_x, end_y)
-        in zip(projected_points, projected_points[1:])
-    )
+    return _projected_shape_length(projected_points)
 
 
 def _interpolate_point_from_downstream(shape_points: list[tuple[float, float]],
-                                       distance_from_downstream_m: float
+                                       distance_from_downstream_m: float,
+                                       projected_data: tuple | None = None
                                        ) -> tuple[float, float] | None:
-    """Return a point located upstream from the intersection along a UTDF shape."""
-    projected_data = _shape_points_to_utm(shape_points)
+    """Return a point located upstream from the intersection along a UTDF shape.
+
+    ``projected_data`` is the _shape_points_to_utm result of the shape if already known.
+    """
+    if projected_data is None:
+        projected_data = _shape_points_to_utm(shape_points)
     if projected_data is None:
         return None
 
-    projected_points, zone_number, hemisphere = projected_data
+    projected_array, zone_number, hemisphere = projected_data
+    projected_points = projected_array.tolist()
     remaining_distance = max(distance_from_downstream_m, 0.0)
     for downstream_index in range(len(projected_points) - 1, 0, -1):
         down_x, down_y = projected_points[downstream_index]
@@ -903,19 +1289,28 @@ def _interpolate_point_from_downstream(shape_points: list[tuple[float, float]],
 
 
 def _split_shape_at_point(shape_points: list[tuple[float, float]],
-                          split_point: tuple[float, float] | None
+                          split_point: tuple[float, float] | None,
+                          projected_data: tuple | None = None
                           ) -> tuple[list[tuple[float, float]], list[tuple[float, float]]]:
-    """Split a profile centerline into upstream and stop-line shape pieces."""
+    """Split a profile centerline into upstream and stop-line shape pieces.
+
+    ``projected_data`` is the _shape_points_to_utm result of the shape if already known.
+    """
     if not shape_points or split_point is None:
         return shape_points, []
 
-    projected_data = _shape_points_to_utm(shape_points)
-    split_projected_data = _shape_points_to_utm([split_point])
-    if projected_data is None or split_projected_data is None:
+    if projected_data is None:
+        projected_data = _shape_points_to_utm(shape_points)
+    if projected_data is None:
         return shape_points, []
 
-    projected_points, _, _ = projected_data
-    split_projected = split_projected_data[0][0]
+    projected_array, zone_number, hemisphere = projected_data
+    split_projected_data = _shape_points_to_utm([split_point], zone_number, hemisphere)
+    if split_projected_data is None:
+        return shape_points, []
+
+    projected_points = projected_array.tolist()
+    split_projected = split_projected_data[0][0].tolist()
     best_segment_index = 0
     best_distance = float("inf")
     for index in range(len(projected_points) - 1):
@@ -948,15 +1343,18 @@ def _split_shape_at_point(shape_points: list[tuple[float, float]],
 def _calculate_turn_bay_node_coord(profile: dict, network_nodes: dict,
                                    net_unit: str | None = None) -> tuple[float, float] | None:
     """Calculate the connector node coordinate at the upstream start of a turn-bay section."""
-    shape_points = _get_profile_shape_points(profile, network_nodes, net_unit)
-    if not shape_points:
-        return None
+    return _get_profile_turn_bay_geometry(profile, network_nodes, net_unit)["bay_node_coord"]
 
-    projected_data = _shape_points_to_utm(shape_points)
-    if projected_data is None:
+
+def _calculate_turn_bay_node_coord_from_geometry(profile: dict,
+                                                 geometry: dict[str, Any]) -> tuple[float, float] | None:
+    """Calculate the turn-bay node coordinate from the geometry record of a profile."""
+    shape_points = geometry["shape_points"]
+    projected_data = geometry["projected_data"]
+    if not shape_points or projected_data is None:
         return None
 
-    shape_length = _shape_length_meters(shape_points) or 0.0
+    shape_length = geometry["length_m"] or 0.0
     if shape_length <= 0:
         return shape_points[-1]
 
@@ -966,7 +1364,7 @@ def _calculate_turn_bay_node_coord(profile: dict, network_nodes: dict,
     minimum_main_segment_length = min(MIN_TURN_BAY_SPLIT_EDGE_LENGTH_M, shape_length / 2)
     maximum_bay_length = max(shape_length - minimum_main_segment_length, shape_length / 2)
     bay_length = min(profile["turn_bay_length_m"], maximum_bay_length)
-    return _interpolate_point_from_downstream(shape_points, bay_length)
+    return _interpolate_point_from_downstream(shape_points, bay_length, projected_data)
 
 
 def _source_lane_indices_for_movement(profile: dict, movement: dict) -> list[int]:
@@ -1075,7 +1473,7 @@ def generate_sumo_nod_xml(utdf_dict: dict, filename: str = "network.nod.xml",
             node_elem.set("type", "traffic_light")  # Default type
 
     try:
-        edge_profiles = _build_sumo_edge_profile_dict(utdf_dict, net_unit)
+        edge_profiles = _get_sumo_edge_profile_dict(utdf_dict, net_unit)
     except ValueError:
         edge_profiles = {}
     for profile in edge_profiles.values():
@@ -1093,9 +1491,7 @@ def generate_sumo_nod_xml(utdf_dict: dict, filename: str = "network.nod.xml",
         bay_node_elem.set("type", "unregulated")
         existing_node_ids.add(profile["bay_node_id"])
 
-    xml_str = xml_prettify(root)
-    with open(filename, "w") as f:
-        f.write(xml_str)
+    write_pretty_xml(root, filename)
 
     return True
 
@@ -1156,7 +1552,7 @@ def generate_net_lane_lookup_dict(utdf_dict: dict, net_unit: str) -> dict:
     if lanes_df is None:
         raise ValueError("Could not get Lane data from utdf_dict.")
 
-    network_lanes = cvt_lane_df_to_dict(lanes_df)  # Convert lanes DataFrame to dictionary
+    network_lanes = get_utdf_lane_dict(utdf_dict)
 
     mvt_group_base = {
         "NB": {},  # {"NBL": {},"NBT": {}, "NBR": {},"NBU": {}, ...},
@@ -1180,7 +1576,7 @@ def generate_net_lane_lookup_dict(utdf_dict: dict, net_unit: str) -> dict:
     lane_lookup_dict = {}
 
     # create link lookup dictionary: f{"{from_node}_{to_node}": "num_lanes"}
-    link_lookup_dict = generate_net_link_lookup_dict(utdf_dict)
+    link_lookup_dict = _get_net_link_lookup_dict(utdf_dict)
 
     # Loop through each intersection, mvt group, lane and connection
     for int_id, mvt_lanes in network_lanes.items():
@@ -1467,8 +1863,37 @@ def generate_net_lane_lookup_dict(utdf_dict: dict, net_unit: str) -> dict:
     return lane_lookup_dict
 
 
+def _find_dead_end_u_turn_edge_pairs(edge_profiles: dict,
+                                     explicit_connection_pairs: set[tuple[str, str]]
+                                     ) -> list[tuple[str, str]]:
+    """Return the dead-end U-turns netconvert would add, as (from edge, to edge) pairs.
+
+    netconvert adds a turnaround from each approach to its reverse edge. At a dead end,
+    where the reverse edge is the only edge leaving the end node, this U-turn is synthetic
+    unless UTDF lane movements wrote it to .con.xml explicitly.
+    """
+    outgoing_profiles_by_node: dict[str, list[dict]] = {}
+    for profile in edge_profiles.values():
+        outgoing_profiles_by_node.setdefault(profile["from_node"], []).append(profile)
+
+    dead_end_pairs = []
+    for profile in edge_profiles.values():
+        outgoing_profiles = outgoing_profiles_by_node.get(profile["to_node"], [])
+        if not outgoing_profiles:
+            continue
+        if any(outgoing_profile["to_node"] != profile["from_node"] for outgoing_profile in outgoing_profiles):
+            continue
+
+        for reverse_profile in outgoing_profiles:
+            edge_pair = (profile["stop_edge_id"], reverse_profile["main_edge_id"])
+            if edge_pair not in explicit_connection_pairs:
+                dead_end_pairs.append(edge_pair)
+    return dead_end_pairs
+
+
 def generate_sumo_connection_xml(utdf_dict: dict, filename: str = "network.con.xml",
-                                 net_unit: str | None = None) -> bool:
+                                 net_unit: str | None = None,
+                                 delete_dead_end_u_turns: bool = False) -> bool:
     """Generate the .con.xml file.
                      int_id
                     ____|____ _____  __ ...
@@ -1483,6 +1908,9 @@ def generate_sumo_connection_xml(utdf_dict: dict, filename: str = "network.con.x
         utdf_dict (dict): A dictionary containing UTDF data.
         filename (str): The name of the output connection XML file (.con.xml).
         net_unit (str | None): The distance/speed unit used by the UTDF network.
+        delete_dead_end_u_turns (bool): whether to write ``<delete>`` entries for the synthetic
+            dead-end U-turns netconvert would add, so netconvert builds the final network without
+            removing U-turns and rebuilding afterwards. Defaults to False.
 
     Raises:
         ValueError: Could not get Lane data from utdf_dict.
@@ -1502,7 +1930,7 @@ def generate_sumo_connection_xml(utdf_dict: dict, filename: str = "network.con.x
 
     root_con = ET.Element("connections")
 
-    edge_profiles = _build_sumo_edge_profile_dict(utdf_dict, net_unit)
+    edge_profiles = _get_sumo_edge_profile_dict(utdf_dict, net_unit)
 
     # Lane-add/drop connections let vehicles leave the real through-lane section
     # and enter the short stop-line segment that contains turn pockets.
@@ -1551,9 +1979,14 @@ def generate_sumo_connection_xml(utdf_dict: dict, filename: str = "network.con.x
                 connection.set("dir", sumo_direction)
                 _set_float_attr(connection, "speed", movement.get("turning_speed_mps"))
 
-    xml_str = xml_prettify(root_con)
-    with open(filename, "w") as f:
-        f.write(xml_str)
+    if delete_dead_end_u_turns:
+        explicit_connection_pairs = {(connection.get("from"), connection.get("to"))
+                                     for connection in root_con}
+        for from_edge_id, to_edge_id in _find_dead_end_u_turn_edge_pairs(edge_profiles,
+                                                                         explicit_connection_pairs):
+            ET.SubElement(root_con, "delete", {"from": from_edge_id, "to": to_edge_id})
+
+    write_pretty_xml(root_con, filename)
 
     return True
 
@@ -1585,8 +2018,8 @@ def generate_sumo_edg_xml(utdf_dict: dict, net_unit: str, filename: str = "netwo
         raise ValueError("UTDF Links and Lanes data are required. ")
 
     network_nodes = utdf_dict.get("network_nodes")
-    network_links = cvt_link_df_to_dict(links_df)
-    edge_profiles = _build_sumo_edge_profile_dict(utdf_dict, net_unit)
+    network_links = get_utdf_link_dict(utdf_dict)
+    edge_profiles = _get_sumo_edge_profile_dict(utdf_dict, net_unit)
 
     def add_edge(edge_id: str, from_node: str, to_node: str, lane_count: int,
                  speed_mps: float | None,
@@ -1627,62 +2060,44 @@ def generate_sumo_edg_xml(utdf_dict: dict, net_unit: str, filename: str = "netwo
 
     def add_profile_edges(profile: dict) -> None:
         """Write the main edge and optional turn-bay edge for one approach profile."""
-        shape_points = _get_profile_shape_points(profile, network_nodes, net_unit)
         if profile["has_turn_bay"]:
-            bay_node_coord = _calculate_turn_bay_node_coord(
-                profile,
-                network_nodes,
-                net_unit,
-            )
-            main_shape_points, stop_shape_points = _split_shape_at_point(
-                shape_points,
-                bay_node_coord,
-            )
-            main_lane_length_m = _shape_length_meters(main_shape_points)
-            stop_lane_length_m = _shape_length_meters(stop_shape_points)
-            if main_lane_length_m is None and stop_lane_length_m is None:
-                if profile["length_m"] is None:
-                    main_lane_length_m = None
-                    stop_lane_length_m = profile["turn_bay_length_m"]
-                else:
-                    stop_lane_length_m = min(profile["turn_bay_length_m"], profile["length_m"])
-                    main_lane_length_m = max(profile["length_m"] - stop_lane_length_m, 0.1)
-
+            geometry = _get_profile_turn_bay_geometry(profile, network_nodes, net_unit)
             main_edge_element = add_edge(
                 profile["main_edge_id"],
                 profile["from_node"],
                 profile["bay_node_id"],
                 profile["main_lane_count"],
                 profile["speed_mps"],
-                main_shape_points,
+                geometry["main_shape_points"],
             )
-            add_main_lane_elements(main_edge_element, profile, main_lane_length_m)
+            add_main_lane_elements(main_edge_element, profile, geometry["main_length_m"])
             stop_edge_element = add_edge(
                 profile["stop_edge_id"],
                 profile["bay_node_id"],
                 profile["to_node"],
                 profile["stop_lane_count"],
                 profile["speed_mps"],
-                stop_shape_points,
+                geometry["stop_shape_points"],
             )
             add_stop_lane_elements(
                 stop_edge_element,
                 profile,
-                stop_lane_length_m,
+                geometry["stop_length_m"],
             )
         else:
+            geometry = _get_profile_geometry(profile, network_nodes, net_unit)
             edge_element = add_edge(
                 profile["main_edge_id"],
                 profile["from_node"],
                 profile["to_node"],
                 profile["stop_lane_count"],
                 profile["speed_mps"],
-                shape_points,
+                geometry["shape_points"],
             )
             add_stop_lane_elements(
                 edge_element,
                 profile,
-                _shape_length_meters(shape_points) or profile["length_m"],
+                geometry["length_m"] or profile["length_m"],
             )
 
     root = ET.Element("edges")
@@ -1706,9 +2121,7 @@ def generate_sumo_edg_xml(utdf_dict: dict, net_unit: str, filename: str = "netwo
         add_profile_edges(profile)
         written_profile_edge_ids.add(edge_id)
 
-    xml_str = xml_prettify(root)
-    with open(filename, "w") as f:
-        f.write(xml_str)
+    write_pretty_xml(root, filename)
     return True
 
 
@@ -1736,7 +2149,7 @@ def generate_net_link_lookup_dict(utdf_dict: dict) -> dict:
     if link_df is None:
         raise ValueError("UTDF Links data are required in utdf_dict.")
 
-    network_links = cvt_link_df_to_dict(link_df)  # Convert links DataFrame to dictionary
+    network_links = get_utdf_link_dict(utdf_dict)
     active_lane_approach_ids = _collect_active_lane_approach_ids(utdf_dict)
 
     # Create a lookup dictionary for edges
@@ -1767,6 +2180,15 @@ def generate_net_link_lookup_dict(utdf_dict: dict) -> dict:
     return edge_lookup_dict
 
 
+def _get_net_link_lookup_dict(utdf_dict: dict) -> dict:
+    """Return the read-only edge lookup of generate_net_link_lookup_dict, built once per UTDF load."""
+    if utdf_dict.get("Links") is None:
+        raise ValueError("UTDF Links data are required in utdf_dict.")
+
+    return get_utdf_lookup(utdf_dict, "net_links", ("Links", "Lanes"),
+                           lambda: generate_net_link_lookup_dict(utdf_dict))
+
+
 def generate_sumo_flow_xml(utdf_dict: dict, fname: str = "network.flow.xml", **kwargs) -> bool:
     """Generate the .flow.xml file.
 
@@ -1794,7 +2216,7 @@ def generate_sumo_flow_xml(utdf_dict: dict, fname: str = "network.flow.xml", **k
     if lane_df is None:
         raise ValueError("UTDF Lanes data are required. ")
 
-    network_lanes = cvt_lane_df_to_dict(lane_df)  # Convert lanes DataFrame to dictionary
+    network_lanes = get_utdf_lane_dict(utdf_dict)
 
     root = ET.Element("routes")
     ET.SubElement(root, "vType", id="car", type="passenger")
@@ -1803,7 +2225,7 @@ def generate_sumo_flow_xml(utdf_dict: dict, fname: str = "network.flow.xml", **k
     begin_time = kwargs.get("begin")
     end_time = kwargs.get("end")
     net_unit = kwargs.get("net_unit")
-    edge_profiles = _build_sumo_edge_profile_dict(utdf_dict, net_unit)
+    edge_profiles = _get_sumo_edge_profile_dict(utdf_dict, net_unit)
 
     flow_id_lst = []
     for int_id, direction_lanes in network_lanes.items():
@@ -1841,15 +2263,13 @@ def generate_sumo_flow_xml(utdf_dict: dict, fname: str = "network.flow.xml", **k
                     if end_time is not None:
                         flow_elem.set("end", f"{int(end_time)}")
 
-    xml_str = xml_prettify(root)
-    with open(fname, "w") as f:
-        f.write(xml_str)
+    write_pretty_xml(root, fname)
     return True
 
 
 def _build_turn_movement_records(utdf_dict: dict, net_unit: str | None) -> list[dict[str, Any]]:
     """Return valid UTDF turning movements as SUMO main-edge transitions."""
-    edge_profiles = _build_sumo_edge_profile_dict(utdf_dict, net_unit)
+    edge_profiles = _get_sumo_edge_profile_dict(utdf_dict, net_unit)
     movement_records = []
 
     for source_profile in edge_profiles.values():
@@ -2202,8 +2622,10 @@ def _find_shortest_topology_path(start_edge_id: str,
     blocked_edge_ids = blocked_edge_ids or set()
     visited = {start_edge_id}
     pending_paths: deque[list[str]] = deque([[start_edge_id]])
+    num_expansions = 0
     while pending_paths:
         path = pending_paths.popleft()
+        num_expansions += 1
         if len(path) >= max_route_edges:
             continue
 
@@ -2229,10 +2651,12 @@ def _find_shortest_topology_path(start_edge_id: str,
 
             next_path = [*path, next_edge_id]
             if next_edge_id in target_edge_ids:
+                count("bfs_expansions", num_expansions)
                 return next_path
             visited.add(next_edge_id)
             pending_paths.append(next_path)
 
+    count("bfs_expansions", num_expansions)
     return []
 
 
@@ -2272,6 +2696,36 @@ def _build_boundary_to_boundary_path_for_movement(
         max_route_edges: int,
         volume_epsilon: float) -> list[str]:
     """Extend one residual movement to physical network entry and exit edges."""
+    return _build_boundary_path_and_prefix_for_movement(
+        source_edge_id,
+        target_edge_id,
+        boundary_source_edge_ids,
+        boundary_sink_edge_ids,
+        transition_graph,
+        reverse_transition_graph,
+        residual_turn_volumes,
+        counted_transition_keys,
+        max_route_edges,
+        volume_epsilon,
+    )[0]
+
+
+def _build_boundary_path_and_prefix_for_movement(
+        source_edge_id: str,
+        target_edge_id: str,
+        boundary_source_edge_ids: set[str],
+        boundary_sink_edge_ids: set[str],
+        transition_graph: dict[str, set[str]],
+        reverse_transition_graph: dict[str, set[str]],
+        residual_turn_volumes: dict[str, dict[str, float]],
+        counted_transition_keys: set[tuple[str, str]],
+        max_route_edges: int,
+        volume_epsilon: float) -> tuple[list[str], list[str]]:
+    """Return the boundary-to-boundary path of one residual movement and its entry prefix path.
+
+    The exit suffix is searched from the entry prefix, so a failed movement keeps
+    failing until a transition on its entry prefix is exhausted.
+    """
     reverse_prefix_path = _find_shortest_topology_path(
         source_edge_id,
         boundary_source_edge_ids,
@@ -2283,16 +2737,16 @@ def _build_boundary_to_boundary_path_for_movement(
         graph_is_reversed=True,
     )
     if not reverse_prefix_path:
-        return []
+        return [], []
 
     prefix_path = list(reversed(reverse_prefix_path))
     if target_edge_id in prefix_path:
-        return []
+        return [], prefix_path
 
     route_path = [*prefix_path, target_edge_id]
     remaining_edge_limit = max_route_edges - len(prefix_path)
     if remaining_edge_limit <= 0:
-        return []
+        return [], prefix_path
 
     suffix_path = _find_shortest_topology_path(
         target_edge_id,
@@ -2305,9 +2759,30 @@ def _build_boundary_to_boundary_path_for_movement(
         blocked_edge_ids=set(route_path[:-1]),
     )
     if not suffix_path:
-        return []
+        return [], prefix_path
+
+    return [*route_path, *suffix_path[1:]], prefix_path
+
 
-    return [*route_path, *suffix_path[1:]]
+def _is_better_boundary_path(candidate_path: list[str],
+                             candidate_positive_count: int,
+                             candidate_capacity: float,
+                             best_path: list[str],
+                             best_positive_count: int,
+                             best_capacity: float,
+                             volume_epsilon: float) -> bool:
+    """Return True when a candidate path replaces the best path found so far.
+
+    Paths covering more residual movements win, then paths with a larger capacity,
+    and capacities within volume_epsilon are broken by the smaller path.
+    """
+    if candidate_positive_count != best_positive_count:
+        return candidate_positive_count > best_positive_count
+    if candidate_capacity > best_capacity + volume_epsilon:
+        return True
+    if abs(candidate_capacity - best_capacity) <= volume_epsilon:
+        return not best_path or tuple(candidate_path) < tuple(best_path)
+    return False
 
 
 def _find_best_physical_boundary_path(
@@ -2356,23 +2831,166 @@ def _find_best_physical_boundary_path(
                 positive_edges,
                 residual_turn_volumes,
             )
-            candidate_positive_count = len(positive_edges)
-            if candidate_positive_count > best_positive_count:
+            if _is_better_boundary_path(candidate_path, len(positive_edges), candidate_capacity,
+                                        best_path, best_positive_count, best_capacity,
+                                        volume_epsilon):
                 best_path = candidate_path
-                best_positive_count = candidate_positive_count
+                best_positive_count = len(positive_edges)
                 best_capacity = candidate_capacity
-            elif candidate_positive_count == best_positive_count:
-                if candidate_capacity > best_capacity + volume_epsilon:
-                    best_path = candidate_path
-                    best_capacity = candidate_capacity
-                elif abs(candidate_capacity - best_capacity) <= volume_epsilon:
-                    if not best_path or tuple(candidate_path) < tuple(best_path):
-                        best_path = candidate_path
-                        best_capacity = candidate_capacity
 
     return best_path
 
 
+class _BoundaryPathCandidates:
+    """Candidate boundary paths of all residual movements, cached between greedy route steps.
+
+    The candidate path of a movement only depends on which counted transitions are
+    exhausted, and a breadth-first search returns the same path when a transition
+    off that path is removed. A movement is therefore searched again only when a
+    transition on its path (or on the entry prefix of a failed search) becomes
+    exhausted. Other candidates sharing a decremented transition are only re-scored.
+    Scored candidates are kept in a priority queue, so the best path is popped
+    instead of found by rescanning every movement, and the result is the same as
+    _find_best_physical_boundary_path.
+    """
+
+    def __init__(self,
+                 residual_turn_volumes: dict[str, dict[str, float]],
+                 boundary_source_edge_ids: set[str],
+                 boundary_sink_edge_ids: set[str],
+                 transition_graph: dict[str, set[str]],
+                 reverse_transition_graph: dict[str, set[str]],
+                 counted_transition_keys: set[tuple[str, str]],
+                 max_route_edges: int,
+                 volume_epsilon: float) -> None:
+        self._residual_turn_volumes = residual_turn_volumes
+        self._search_args = (
+            boundary_source_edge_ids,
+            boundary_sink_edge_ids,
+            transition_graph,
+            reverse_transition_graph,
+            residual_turn_volumes,
+            counted_transition_keys,
+            max_route_edges,
+            volume_epsilon,
+        )
+        self._volume_epsilon = volume_epsilon
+
+        # {movement: candidate path}, an empty path if the movement has no boundary path
+        self._paths: dict[tuple[str, str], list[str]] = {}
+        # {movement: transitions the candidate path depends on} and the reverse lookup
+        self._dependencies: dict[tuple[str, str], list[tuple[str, str]]] = {}
+        self._movements_by_transition: dict[tuple[str, str], set[tuple[str, str]]] = {}
+        # {movement: (positive count, capacity)} of candidates that can be selected
+        self._scores: dict[tuple[str, str], tuple[int, float]] = {}
+        # (-positive count, -capacity, movement, version), outdated versions are skipped
+        self._queue: list[tuple[int, float, tuple[str, str], int]] = []
+        self._versions: dict[tuple[str, str], int] = {}
+
+        for source_edge_id in sorted(residual_turn_volumes):
+            for target_edge_id in sorted(residual_turn_volumes[source_edge_id]):
+                if residual_turn_volumes[source_edge_id][target_edge_id] > volume_epsilon:
+                    self._search_path((source_edge_id, target_edge_id))
+
+    def _search_path(self, movement: tuple[str, str]) -> None:
+        """Search the boundary path of a movement and record the transitions it depends on."""
+        self._remove_dependencies(movement)
+        path, prefix_path = _build_boundary_path_and_prefix_for_movement(*movement, *self._search_args)
+
+        dependency_path = path or prefix_path
+        dependencies = list(zip(dependency_path, dependency_path[1:]))
+        self._dependencies[movement] = dependencies
+        for transition in dependencies:
+            self._movements_by_transition.setdefault(transition, set()).add(movement)
+
+        self._paths[movement] = path
+        self._score_path(movement)
+
+    def _score_path(self, movement: tuple[str, str]) -> None:
+        """Score the candidate path of a movement with the current residual volumes."""
+        self._versions[movement] = self._versions.get(movement, 0) + 1
+        self._scores.pop(movement, None)
+
+        path = self._paths[movement]
+        if not path:
+            return
+        positive_edges = _positive_residual_edges_on_path(
+            path,
+            self._residual_turn_volumes,
+            self._volume_epsilon,
+        )
+        if not positive_edges:
+            return
+
+        capacity = _path_residual_capacity_from_edges(positive_edges, self._residual_turn_volumes)
+        self._scores[movement] = (len(positive_edges), capacity)
+        heapq.heappush(self._queue, (-len(positive_edges), -capacity, movement, self._versions[movement]))
+
+    def _remove_dependencies(self, movement: tuple[str, str]) -> None:
+        for transition in self._dependencies.pop(movement, []):
+            self._movements_by_transition[transition].discard(movement)
+
+    def _remove_movement(self, movement: tuple[str, str]) -> None:
+        self._remove_dependencies(movement)
+        self._paths.pop(movement, None)
+        self._scores.pop(movement, None)
+        self._versions[movement] = self._versions.get(movement, 0) + 1
+
+    def best_path(self) -> list[str]:
+        """Return the best residual boundary path, the same as _find_best_physical_boundary_path."""
+        # pop the candidates with the largest positive count whose capacities are chained
+        # within volume_epsilon from the largest capacity, only they can win the comparison
+        top_entries = []
+        while self._queue:
+            neg_count, neg_capacity, movement, version = self._queue[0]
+            if version != self._versions.get(movement):
+                heapq.heappop(self._queue)
+                continue
+            if top_entries and (
+                    neg_count != top_entries[0][0]
+                    or neg_capacity - top_entries[-1][1] > self._volume_epsilon):
+                break
+            top_entries.append(heapq.heappop(self._queue))
+
+        # compare them in the same order as the scan over all movements
+        best_path: list[str] = []
+        best_positive_count = 0
+        best_capacity = 0.0
+        for _, _, movement, _ in sorted(top_entries, key=lambda entry: entry[2]):
+            positive_count, capacity = self._scores[movement]
+            if _is_better_boundary_path(self._paths[movement], positive_count, capacity,
+                                        best_path, best_positive_count, best_capacity,
+                                        self._volume_epsilon):
+                best_path = self._paths[movement]
+                best_positive_count = positive_count
+                best_capacity = capacity
+
+        for entry in top_entries:
+            heapq.heappush(self._queue, entry)
+        return best_path
+
+    def update_after_route(self, positive_edges: list[tuple[str, str]]) -> None:
+        """Update candidates after a route volume is subtracted from the positive edges of its path."""
+        movements_to_search = set()
+        movements_to_score = set()
+        for transition in positive_edges:
+            source_edge_id, target_edge_id = transition
+            affected_movements = self._movements_by_transition.get(transition, set())
+            if self._residual_turn_volumes.get(source_edge_id, {}).get(target_edge_id, 0.0) > self._volume_epsilon:
+                movements_to_score.update(affected_movements)
+                continue
+
+            movements_to_search.update(affected_movements)
+            self._remove_movement(transition)
+            movements_to_search.discard(transition)
+
+        for movement in sorted(movements_to_search):
+            self._search_path(movement)
+        for movement in sorted(movements_to_score - movements_to_search):
+            if movement in self._paths:
+                self._score_path(movement)
+
+
 def _decompose_to_physical_boundary_routes(
         residual_turn_volumes: dict[str, dict[str, float]],
         boundary_source_edge_ids: set[str],
@@ -2388,19 +3006,20 @@ def _decompose_to_physical_boundary_routes(
         for target_edge_id in target_volumes
     }
     reverse_graph = _reverse_transition_graph(topology_transition_graph)
+    path_candidates = _BoundaryPathCandidates(
+        residual_turn_volumes,
+        boundary_source_edge_ids,
+        boundary_sink_edge_ids,
+        topology_transition_graph,
+        reverse_graph,
+        counted_transition_keys,
+        max_route_edges,
+        volume_epsilon,
+    )
     network_routes = []
 
     while residual_turn_volumes:
-        edge_path = _find_best_physical_boundary_path(
-            residual_turn_volumes,
-            boundary_source_edge_ids,
-            boundary_sink_edge_ids,
-            topology_transition_graph,
-            reverse_graph,
-            counted_transition_keys,
-            max_route_edges,
-            volume_epsilon,
-        )
+        edge_path = path_candidates.best_path()
         if not edge_path:
             break
 
@@ -2422,6 +3041,7 @@ def _decompose_to_physical_boundary_routes(
         for source_edge_id, target_edge_id in positive_edges:
             residual_turn_volumes[source_edge_id][target_edge_id] -= route_volume
         _clean_residual_turn_volumes(residual_turn_volumes, volume_epsilon)
+        path_candidates.update_after_route(positive_edges)
 
         if route_volume >= min_route_volume:
             network_routes.append({
@@ -2438,6 +3058,7 @@ def _decompose_turn_movements_to_routes(movement_records: list[dict[str, Any]],
                                         boundary_source_edge_ids: set[str] | None = None,
                                         boundary_sink_edge_ids: set[str] | None = None,
                                         topology_transition_graph: dict[str, set[str]] | None = None,
+                                        decomposition_method: str = "greedy",
                                         ) -> list[dict[str, Any]]:
     """Convert intersection turning counts into longer network-level route flows.
 
@@ -2448,7 +3069,16 @@ def _decompose_turn_movements_to_routes(movement_records: list[dict[str, Any]],
     the UTDF counts. When adjacent intersection counts are inconsistent, the
     generator leaves the unmatched residual demand out of the network-level
     routes instead of creating or removing vehicles on ordinary internal links.
+
+    The "greedy" method subtracts the best residual path one route at a time.
+    The "min_cost_flow" method solves all routes at once as a min-cost flow on
+    a boundary-to-boundary network with the counts as capacities, which is much
+    faster on large networks and usually covers more of the counts.
     """
+    if decomposition_method not in ROUTE_DECOMPOSITION_METHODS:
+        raise ValueError(f"decomposition_method must be one of {ROUTE_DECOMPOSITION_METHODS}, "
+                         f"got {decomposition_method!r}")
+
     volume_epsilon = 1e-6
     (
         outgoing_records_by_source,
@@ -2466,11 +3096,31 @@ def _decompose_turn_movements_to_routes(movement_records: list[dict[str, Any]],
         boundary_sink_edge_ids,
     )
     residual_turn_volumes = _build_residual_turn_volume_graph(outgoing_records_by_source)
-    if (
+    use_physical_boundary = (
         topology_transition_graph is not None
         and boundary_source_edge_ids
         and boundary_sink_edge_ids
-    ):
+    )
+    if decomposition_method == "min_cost_flow":
+        if not use_physical_boundary:
+            # routes follow counted movements only, from count sources to count sinks
+            boundary_source_edge_ids = set(source_volume_by_edge)
+            boundary_sink_edge_ids = set(sink_volume_by_edge)
+            topology_transition_graph = {
+                source_edge_id: set(target_volumes)
+                for source_edge_id, target_volumes in residual_turn_volumes.items()
+            }
+        return decompose_routes_with_min_cost_flow(
+            residual_turn_volumes,
+            boundary_source_edge_ids,
+            boundary_sink_edge_ids,
+            topology_transition_graph,
+            max_route_edges,
+            min_route_volume,
+            volume_epsilon,
+        )
+
+    if use_physical_boundary:
         return _decompose_to_physical_boundary_routes(
             residual_turn_volumes,
             boundary_source_edge_ids,
@@ -2564,6 +3214,7 @@ def generate_sumo_network_route_xml(utdf_dict: dict, fname: str = "network.rou.x
             net_unit (str): The distance/speed unit used by the UTDF network.
             max_route_edges (int): Maximum number of main edges in one route.
             min_route_volume (float): Smallest route volume to keep.
+            decomposition_method (str): "greedy" or "min_cost_flow". Defaults to "greedy".
 
     Raises:
         ValueError: UTDF Lanes data are required.
@@ -2579,8 +3230,9 @@ def generate_sumo_network_route_xml(utdf_dict: dict, fname: str = "network.rou.x
     net_unit = kwargs.get("net_unit")
     max_route_edges = int(kwargs.get("max_route_edges", 50))
     min_route_volume = float(kwargs.get("min_route_volume", 0.5))
+    decomposition_method = kwargs.get("decomposition_method", "greedy")
 
-    edge_profiles = _build_sumo_edge_profile_dict(utdf_dict, net_unit)
+    edge_profiles = _get_sumo_edge_profile_dict(utdf_dict, net_unit)
     edge_profiles_by_main_edge = {
         profile["main_edge_id"]: profile
         for profile in edge_profiles.values()
@@ -2601,6 +3253,7 @@ def generate_sumo_network_route_xml(utdf_dict: dict, fname: str = "network.rou.x
         boundary_source_edge_ids=boundary_source_edge_ids,
         boundary_sink_edge_ids=boundary_sink_edge_ids,
         topology_transition_graph=topology_transition_graph,
+        decomposition_method=decomposition_method,
     )
 
     route_volume_by_edges: dict[tuple[str, ...], float] = {}
@@ -2617,42 +3270,46 @@ def generate_sumo_network_route_xml(utdf_dict: dict, fname: str = "network.rou.x
             route_volume_by_edges.get(route_key, 0.0) + network_route["volume"]
         )
 
-    root = ET.Element("routes")
-    ET.SubElement(root, "vType", id="car", type="passenger")
-
-    route_index = 0
-    for route_edges, route_volume in sorted(route_volume_by_edges.items()):
-        flow_number = _format_route_flow_number(route_volume)
-        if int(flow_number) <= 0:
-            continue
-
-        route_id = f"network_route_{route_index}"
-        route_element = ET.SubElement(root, "route")
-        route_element.set("id", route_id)
-        route_element.set("edges", " ".join(route_edges))
-
-        flow_element = ET.SubElement(root, "flow")
-        flow_element.set("id", f"network_flow_{route_index}")
-        flow_element.set("route", route_id)
-        flow_element.set("number", flow_number)
-        flow_element.set("type", "car")
-        flow_element.set("departLane", "best")
-        # Network-level flows enter from physical boundary links. Vehicles are
-        # already traveling before they reach the modeled network, so placing
-        # them on a free boundary position at speed prevents artificial cold-
-        # start queues from overpowering the UTDF turning counts.
-        flow_element.set("departSpeed", "max")
-        flow_element.set("departPos", "random_free")
-        if begin_time is not None:
-            flow_element.set("begin", f"{int(begin_time)}")
-        if end_time is not None:
-            flow_element.set("end", f"{int(end_time)}")
-
-        route_index += 1
-
-    xml_str = xml_prettify(root)
     with open(fname, "w") as f:
-        f.write(xml_str)
+        f.write(XML_DECLARATION)
+        f.write("<routes>\n")
+        write_xml_element(f, ET.Element("vType", id="car", type="passenger"), level=1)
+
+        route_index = 0
+        for route_edges, route_volume in sorted(route_volume_by_edges.items()):
+            flow_number = _format_route_flow_number(route_volume)
+            if int(flow_number) <= 0:
+                continue
+
+            route_id = f"network_route_{route_index}"
+            route_element = ET.Element("route")
+            route_element.set("id", route_id)
+            route_element.set("edges", " ".join(route_edges))
+
+            flow_element = ET.Element("flow")
+            flow_element.set("id", f"network_flow_{route_index}")
+            flow_element.set("route", route_id)
+            flow_element.set("number", flow_number)
+            flow_element.set("type", "car")
+            flow_element.set("departLane", "best")
+            # Network-level flows enter from physical boundary links. Vehicles are
+            # already traveling before they reach the modeled network, so placing
+            # them on a free boundary position at speed prevents artificial cold-
+            # start queues from overpowering the UTDF turning counts.
+            flow_element.set("departSpeed", "max")
+            flow_element.set("departPos", "random_free")
+            if begin_time is not None:
+                flow_element.set("begin", f"{int(begin_time)}")
+            if end_time is not None:
+                flow_element.set("end", f"{int(end_time)}")
+
+            # write each route and flow as they are created, the file may hold tens of thousands of flows
+            write_xml_element(f, route_element, level=1)
+            write_xml_element(f, flow_element, level=1)
+            route_index += 1
+
+        f.write("</routes>\n")
+    count("xml_elements_written", 2 + 2 * route_index)
     return True
 
 
@@ -2684,7 +3341,7 @@ def generate_sumo_loop_detector_add_xml(utdf_dict: dict, net_unit: str, detector
             https://sumo.dlr.de/docs/Simulation/Output/Instantaneous_Induction_Loops_Detectors.html
     """
 
-    edge_profiles = _build_sumo_edge_profile_dict(utdf_dict, net_unit)
+    edge_profiles = _get_sumo_edge_profile_dict(utdf_dict, net_unit)
 
     # get detector tag
     if detector_type == "E1":
@@ -2721,7 +3378,5 @@ def generate_sumo_loop_detector_add_xml(utdf_dict: dict, net_unit: str, detector
             detector.set("friendlyPos", "true")
             detector.set("file", f"{sim_output_fname}")  # output file name
 
-    xml_str = xml_prettify(add_elem)
-    with open(add_fname, "w") as f:
-        f.write(xml_str)
+    write_pretty_xml(add_elem, add_fname)
     return True
@@ -0,0 +1,113 @@
+'''
+##############################################################
+# Created Date: Sunday, October 18th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+'''
+
+import xml.etree.ElementTree as ET
+
+from utdf2gmns.func_lib.sumo.read_sumo import ReadSUMO
+from utdf2gmns.func_lib.sumo.remove_end_route_connection import mark_end_route_connections_invalid
+from utdf2gmns.func_lib.sumo.remove_u_turn import (_get_default_connection_file,
+                                                   _read_explicit_connection_pairs,
+                                                   _rebuild_sumo_net_file,
+                                                   remove_dead_end_u_turn_connections)
+from utdf2gmns.func_lib.sumo.update_sumo_signal_from_utdf import apply_utdf_signal_to_sumo_net
+from utdf2gmns.func_lib.utdf.read_utdf import read_UTDF
+from utdf2gmns.util_lib.instrumentation import count, record_stage
+
+
+def post_process_sumo_net(path_net: str,
+                          utdf_dict_or_fname: dict | str | None = None,
+                          path_con: str | None = None,
+                          *,
+                          remove_U_turn: bool = True,
+                          remove_end_route_connection: bool = False,
+                          rebuild_net: bool = True,
+                          verbose: bool = False,
+                          max_workers: int | None = 1) -> bool:
+    """Apply all post-processing steps to a compiled SUMO network with one parse and one write.
+
+    The steps below are applied in memory, in order, to the same parsed ``.net.xml`` tree:
+        1. replace signal programs with UTDF signal timings (when UTDF data is given)
+        2. remove non-explicit dead-end U-turns (``remove_U_turn``)
+        3. mark remaining U-turn connections as invalid (``remove_end_route_connection``)
+
+    The network is then written once, and rebuilt by ``netconvert`` at most once
+    (only when connections may have been removed).
+
+    Args:
+        path_net (str): Path to the SUMO ``.net.xml`` file, updated in place.
+        utdf_dict_or_fname (dict | str | None): the UTDF dictionary or the path of UTDF csv file.
+            Defaults to None, which keeps the signal programs of the network.
+        path_con (str | None): Optional path to the generated plain ``.con.xml`` file, U-turns
+            in it are preserved. If omitted, a file with the same prefix beside ``path_net`` is used.
+        remove_U_turn (bool): whether to remove dead-end U-turns. Defaults to True.
+        remove_end_route_connection (bool): whether to mark U-turn connections as invalid.
+            Defaults to False.
+        rebuild_net (bool): whether to rewrite the net with ``netconvert`` after deleting
+            connections, which keeps SUMO's internal via-connection tables consistent. Defaults to True.
+        verbose (bool): whether to print the process. Defaults to False.
+        max_workers (int | None): the number of worker processes to build the signal programs,
+            1 builds them in this process and None uses one process per CPU. Defaults to 1.
+
+    Example:
+        >>> import utdf2gmns as ug
+        >>> ug.post_process_sumo_net("utdf_to_sumo.net.xml", "UTDF.csv", remove_U_turn=True)
+
+    Returns:
+        bool: True when the SUMO network file was updated successfully.
+    """
+
+    # check if path is a string and ends with .net.xml
+    if not isinstance(path_net, str):
+        raise ValueError("path_net must be a string")
+    if not path_net.endswith(".net.xml"):
+        raise ValueError("path_net must end with .net.xml")
+
+    # Check if utdf_dict_or_fname is a dictionary or a file name
+    if utdf_dict_or_fname is None or isinstance(utdf_dict_or_fname, dict):
+        utdf_dict = utdf_dict_or_fname
+    elif isinstance(utdf_dict_or_fname, str):
+        utdf_dict = read_UTDF(utdf_dict_or_fname)
+    else:
+        raise TypeError("utdf_dict_or_fname must be a dictionary, a file name or None")
+
+    if utdf_dict is None and not remove_U_turn and not remove_end_route_connection:
+        return True
+
+    # parse the network once, all steps below share the same tree
+    tree = ET.parse(path_net)
+    root = tree.getroot()
+
+    if utdf_dict is not None:
+        with record_stage("signal_update"):
+            apply_utdf_signal_to_sumo_net(ReadSUMO(path_net, tree=tree), utdf_dict,
+                                          verbose=verbose, max_workers=max_workers)
+
+    num_u_turns_removed = 0
+    if remove_U_turn:
+        with record_stage("u_turn_removal"):
+            path_con = path_con or str(_get_default_connection_file(path_net))
+            num_u_turns_removed = remove_dead_end_u_turn_connections(root, _read_explicit_connection_pairs(path_con))
+            count("u_turns_removed", num_u_turns_removed)
+
+    if remove_end_route_connection:
+        mark_end_route_connections_invalid(root)
+
+    # write the modified xml to the file once
+    with record_stage("net_xml_write"):
+        tree.write(path_net, encoding='utf-8', xml_declaration=True)
+
+    if remove_U_turn and rebuild_net:
+        with record_stage("netconvert", step="rebuild"):
+            if not _rebuild_sumo_net_file(path_net):
+                return False
+
+    if remove_U_turn:
+        print(f"  :{num_u_turns_removed} dead-end U-turn connections removed from the SUMO network")
+    if remove_end_route_connection:
+        print("  :End route connections removed from the SUMO network")
+    return True
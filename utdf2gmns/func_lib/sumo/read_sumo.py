@@ -11,70 +11,137 @@ import xml.etree.ElementTree as ET
 import numpy as np
 import io
 
+# edge functions the signal mapper does not read, dropped in low-memory mode
+SIGNAL_UNUSED_EDGE_FUNCTIONS = {"internal", "walkingarea"}
+
 
 class ReadSUMO:
     """load sumo network xml file and parse the information
+
+    tlLogic, edge and signal connection elements are indexed in one pass over the network,
+    so looking up or replacing one signal does not scan the whole network.
+
+    Args:
+        net_filename (str): the path of sumo network xml file
+        tree (ET.ElementTree | None): an already parsed network of net_filename.
+            Defaults to None, which parses net_filename.
+        low_memory (bool): whether to stream the network with iterparse and only keep the
+            element kinds the signal mapper needs (non-internal edges, signal connections and tlLogic).
+            The reduced network can not be written back. Defaults to False.
     """
-    def __init__(self, net_filename: str):
+    def __init__(self, net_filename: str, tree: ET.ElementTree | None = None, low_memory: bool = False):
         self._net_filename = net_filename
-        self._tree = ET.parse(net_filename)
+        self._low_memory = low_memory
+
+        # {tl id: [tlLogic element of each program]}
+        self.tl_logic_dict = {}
+        # {edge id: edge element}
+        self.edge_dict = {}
+        # {(tl id, link index): connection element}
+        self.connection_dict = {}
+
+        # initialize signal info, inbound edges and pedestrian crossings
+        self.sumo_signal_info = {}
+        self.inbound_edges = {}
+        self.crossing_dict = {}
+
+        if low_memory and tree is None:
+            self._tree = self.__iterparse_signal_elements()
+        else:
+            self._tree = ET.parse(net_filename) if tree is None else tree
+            for element in self._tree.getroot():
+                self.__index_element(element)
         self._root = self._tree.getroot()
 
-        # parse the xml file
-        self.__parse_sumo_xml()
+        # parse the inbound edge slopes
         self.__parse_edges()
 
-    def __parse_sumo_xml(self, sumo_ids_filter=None):
-        """parse the sumo network xml file"""
-
-        # initialize signal info and inbound edges
-        sumo_signal_info = {}
-        inbound_edges = {}
-
-        for connection in self._root.findall("connection"):
-            # get the tlLogic_ids
-            tlLogic_ids = connection.get("tl")
-
-            if tlLogic_ids is None:
+    def __iterparse_signal_elements(self) -> ET.ElementTree:
+        """stream the sumo network xml file and keep only the elements the signal mapper needs"""
+
+        root = None
+        depth = 0
+        kept_elements = []
+        for event, element in ET.iterparse(self._net_filename, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = element
+                depth += 1
                 continue
 
-            if sumo_ids_filter is None or tlLogic_ids in sumo_ids_filter:
-                if tlLogic_ids not in sumo_signal_info:
-                    sumo_signal_info[tlLogic_ids] = {}
-                connection_index = connection.get('linkIndex')
-                if connection_index is None:
-                    continue
-
-                inbound_edge_id = connection.get('from')
-                if inbound_edge_id is not None and (inbound_edge_id not in inbound_edges) and ':' not in inbound_edge_id:
-                    inbound_edges[inbound_edge_id] = tlLogic_ids
-
-                sumo_signal_info[tlLogic_ids][connection_index] = {
-                    'dir': connection.get('dir'),
-                    'fromEdge': connection.get('from'),
-                    'fromLane': connection.get('fromLane'),
-                    'toEdge': connection.get('to'),
-                    'toLane': connection.get('toLane'),
-                }
-        self.sumo_signal_info = sumo_signal_info
-        self.inbound_edges = inbound_edges
+            depth -= 1
+            if depth != 1:
+                continue
+            if self.__index_element(element):
+                kept_elements.append(element)
+            else:
+                # free the unused element while streaming, its empty shell is detached below
+                element.clear()
+
+        root[:] = kept_elements
+        return ET.ElementTree(root)
+
+    def __index_element(self, element: ET.Element) -> bool:
+        """index one child of <net>, return whether the signal mapper needs it"""
+
+        if element.tag == "connection":
+            return self.__index_connection(element)
+
+        if element.tag == "edge":
+            edge_function = element.get("function")
+            if edge_function == "crossing":
+                self.crossing_dict[element.get("id")] = element.get("crossingEdges").split(" ")
+            is_needed = edge_function not in SIGNAL_UNUSED_EDGE_FUNCTIONS
+            if is_needed or not self._low_memory:
+                self.edge_dict[element.get("id")] = element
+            return is_needed
+
+        if element.tag == "tlLogic":
+            self.tl_logic_dict.setdefault(element.get("id"), []).append(element)
+            return True
+
+        return False
+
+    def __index_connection(self, connection: ET.Element) -> bool:
+        """index one connection and collect its signal information"""
+
+        # get the tlLogic_ids
+        tlLogic_ids = connection.get("tl")
+        if tlLogic_ids is None:
+            return False
+
+        if tlLogic_ids not in self.sumo_signal_info:
+            self.sumo_signal_info[tlLogic_ids] = {}
+        connection_index = connection.get('linkIndex')
+        if connection_index is None:
+            return True
+
+        inbound_edge_id = connection.get('from')
+        if inbound_edge_id is not None and (inbound_edge_id not in self.inbound_edges) and ':' not in inbound_edge_id:
+            self.inbound_edges[inbound_edge_id] = tlLogic_ids
+
+        self.sumo_signal_info[tlLogic_ids][connection_index] = {
+            'dir': connection.get('dir'),
+            'fromEdge': connection.get('from'),
+            'fromLane': connection.get('fromLane'),
+            'toEdge': connection.get('to'),
+            'toLane': connection.get('toLane'),
+        }
+        self.connection_dict[(tlLogic_ids, connection_index)] = connection
+        return True
 
     def __parse_edges(self):
-        """parse the edges in the sumo network xml file"""
+        """parse the slopes of inbound edges in the sumo network xml file"""
 
         self.sumo_nbsw = {}
-        self.crossing_dict = {}
-        for edge in self._root.findall('edge'):
-            edge_ids = edge.get('id')
-            if edge_ids in self.inbound_edges.keys():
+        for edge_ids, edge in self.edge_dict.items():
+            if edge_ids in self.inbound_edges:
                 for lane in edge.findall('lane'):
                     # selected the last two points
                     shape_info = lane.get('shape').split(' ')[-2:]
                     shape_slope = self.get_slope(shape_info)
                     self.sumo_nbsw[edge_ids] = shape_slope
                     break
-            if edge.get('function') == 'crossing':
-                self.crossing_dict[edge_ids] = edge.get('crossingEdges').split(' ')
 
     def get_slope(self, shape_info):
         """calculate the slope of the edge"""
@@ -146,16 +213,19 @@ class ReadSUMO:
 
         new_tlLogic_element = ET.fromstring(f.getvalue())
 
-        for tlLogic in self._root.findall('tlLogic'):
-            if tlLogic.get('id') == new_tlLogic_element.get('id'):
-                tlLogic.clear()
-                tlLogic.attrib.update(new_tlLogic_element.attrib)
-                for phase in new_tlLogic_element:
-                    tlLogic.append(phase)
+        # tlLogic elements are indexed by id, so only the programs of this signal are visited
+        for tlLogic in self.tl_logic_dict.get(new_tlLogic_element.get('id'), []):
+            tlLogic.clear()
+            tlLogic.attrib.update(new_tlLogic_element.attrib)
+            for phase in new_tlLogic_element:
+                tlLogic.append(phase)
 
         f.close()
 
     def write_xml(self):
         """write the xml file"""
 
+        if self._low_memory:
+            raise ValueError("a network loaded with low_memory=True only keeps part of the elements "
+                             "and can not be written")
         self._tree.write(self._net_filename, encoding='utf-8', xml_declaration=True)
@@ -10,6 +10,29 @@
 import xml.etree.ElementTree as ET
 
 
+def mark_end_route_connections_invalid(root: ET.Element) -> int:
+    """Mark U-turn connections of a parsed SUMO network as invalid, in memory.
+
+    Args:
+        root (ET.Element): the root <net> element of a parsed .net.xml file
+
+    Returns:
+        int: the number of connections marked as invalid
+    """
+    num_marked = 0
+
+    # loop through all connections
+    for connection in root.findall("connection"):
+        from_edge = connection.get('from')
+        to_edge = connection.get('to')
+
+        # change the dir attribute to "invalid" if the connection is a U-turn
+        if from_edge == to_edge or from_edge == "_".join(to_edge.split("_")[::-1]):
+            connection.attrib["dir"] = "invalid"
+            num_marked += 1
+    return num_marked
+
+
 def remove_sumo_end_route_connection(path_net: str) -> bool:
     """ Remove end route connection in the SUMO network."""
 
@@ -23,20 +46,7 @@ def remove_sumo_end_route_connection(path_net: str) -> bool:
     with open(path_net, 'r') as f:
         tree = ET.parse(f)
 
-    root = tree.getroot()
-    connections = root.findall("connection")
-
-    # loop through all connections
-    for connection in connections:
-        from_edge = connection.get('from')
-        to_edge = connection.get('to')
-
-        if from_edge == to_edge:
-            # change the dir attribute to "invalid" if the connection is a U-turn'
-            connection.attrib['dir'] = "invalid"
-
-        if from_edge == "_".join(to_edge.split("_")[::-1]):
-            connection.attrib["dir"] = "invalid"
+    mark_end_route_connections_invalid(tree.getroot())
 
     # write the modified xml to the file
     tree.write(path_net, encoding='utf-8', xml_declaration=True)
@@ -215,6 +215,35 @@ def _find_dead_end_u_turn_connections_to_remove(connections: list[ET.Element],
     return connections_to_remove
 
 
+def remove_dead_end_u_turn_connections(root: ET.Element,
+                                       explicit_connection_pairs: set[tuple[str, str]]) -> int:
+    """Remove non-explicit dead-end U-turns from a parsed SUMO network, in memory.
+
+    Args:
+        root (ET.Element): The root ``<net>`` element of a parsed ``.net.xml`` file.
+        explicit_connection_pairs (set[tuple[str, str]]): ``(from, to)`` edge
+            pairs written to ``.con.xml``, their U-turns are preserved.
+
+    Returns:
+        int: The number of connections removed, including their internal via chain.
+    """
+    connections = root.findall("connection")
+    edge_nodes, outgoing_edges_by_node = _build_edge_node_lookup(root)
+
+    connections_to_remove = _find_dead_end_u_turn_connections_to_remove(
+        connections,
+        explicit_connection_pairs,
+        edge_nodes,
+        outgoing_edges_by_node,
+    )
+
+    # rebuild the children once instead of searching the whole net for every removed connection
+    removed_connection_ids = {id(connection) for connection in connections_to_remove}
+    if removed_connection_ids:
+        root[:] = [child for child in root if id(child) not in removed_connection_ids]
+    return len(connections_to_remove)
+
+
 def remove_sumo_U_turn(path_net: str, path_con: str | None = None,
                        rebuild_net: bool = True) -> bool:
     """Remove only non-explicit dead-end U-turns in the SUMO network.
@@ -250,18 +279,7 @@ def remove_sumo_U_turn(path_net: str, path_con: str | None = None,
     with open(path_net, 'r') as f:
         tree = ET.parse(f)
 
-    root = tree.getroot()
-    connections = root.findall("connection")
-    edge_nodes, outgoing_edges_by_node = _build_edge_node_lookup(root)
-
-    connections_to_remove = _find_dead_end_u_turn_connections_to_remove(
-        connections,
-        explicit_connection_pairs,
-        edge_nodes,
-        outgoing_edges_by_node,
-    )
-    for connection in connections_to_remove:
-        root.remove(connection)
+    num_removed = remove_dead_end_u_turn_connections(tree.getroot(), explicit_connection_pairs)
 
     # write the modified xml to the file
     tree.write(path_net, encoding='utf-8', xml_declaration=True)
@@ -270,5 +288,5 @@ def remove_sumo_U_turn(path_net: str, path_con: str | None = None,
         if not _rebuild_sumo_net_file(path_net):
             return False
 
-    print(f"  :{len(connections_to_remove)} dead-end U-turn connections removed from the SUMO network")
+    print(f"  :{num_removed} dead-end U-turn connections removed from the SUMO network")
     return True
@@ -0,0 +1,291 @@
+'''
+##############################################################
+# Created Date: Sunday, October 18th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+'''
+
+import heapq
+import math
+from typing import Any
+
+from utdf2gmns.util_lib.instrumentation import count
+
+# the virtual node connecting all boundary edges, routes enter and leave the network through it
+BOUNDARY_NODE = 0
+
+
+def _push_flow(path_arcs: list[int], source_node: int, sink_node: int,
+               arc_cap: list[float], excess: list[float]) -> None:
+    """Push the largest possible flow from an excess node to a deficit node along residual arcs."""
+    push_volume = min(excess[source_node], -excess[sink_node], *(arc_cap[arc] for arc in path_arcs))
+    for arc in path_arcs:
+        arc_cap[arc] -= push_volume
+        arc_cap[arc ^ 1] += push_volume
+    excess[source_node] -= push_volume
+    excess[sink_node] += push_volume
+
+
+def _solve_min_cost_circulation(num_nodes: int,
+                                arcs: list[tuple[int, int, float, int]],
+                                volume_epsilon: float) -> list[float]:
+    """Solve a min-cost circulation with successive shortest paths.
+
+    Negative-cost arcs are saturated first, which leaves a residual graph with non-negative
+    costs and node imbalances. The imbalances are then routed from excess to deficit nodes
+    along shortest paths found by Dijkstra with node potentials, pushing a blocking flow on
+    all zero reduced-cost arcs after each search.
+
+    Args:
+        num_nodes (int): the number of nodes, nodes are 0 ... num_nodes - 1
+        arcs (list): (from node, to node, capacity, integer cost) of each arc, capacity can be math.inf
+        volume_epsilon (float): flows not larger than volume_epsilon are treated as zero
+
+    Returns:
+        list[float]: the flow on each arc
+    """
+    # residual graph, arc 2i is the i-th input arc and arc 2i + 1 is its reverse arc
+    arc_head = []
+    arc_cap = []
+    arc_cost = []
+    out_arcs = [[] for _ in range(num_nodes)]
+    excess = [0.0] * num_nodes
+
+    for from_node, to_node, capacity, cost in arcs:
+        out_arcs[from_node].append(len(arc_head))
+        out_arcs[to_node].append(len(arc_head) + 1)
+        arc_head.extend((to_node, from_node))
+        arc_cost.extend((cost, -cost))
+        if cost < 0:
+            arc_cap.extend((0.0, capacity))
+            excess[to_node] += capacity
+            excess[from_node] -= capacity
+        else:
+            arc_cap.extend((capacity, 0.0))
+
+    potential = [0] * num_nodes
+    num_settled = 0
+    while True:
+        excess_nodes = [node for node in range(num_nodes) if excess[node] > volume_epsilon]
+        if not excess_nodes:
+            break
+
+        # Dijkstra from all excess nodes until the nearest deficit node is settled
+        dist = [math.inf] * num_nodes
+        heap = []
+        for node in excess_nodes:
+            dist[node] = 0
+            heap.append((0, node))
+        heapq.heapify(heap)
+
+        pred_arc = [-1] * num_nodes
+        settled = [False] * num_nodes
+        deficit_node = -1
+        deficit_dist = math.inf
+        while heap:
+            node_dist, node = heapq.heappop(heap)
+            if settled[node]:
+                continue
+            settled[node] = True
+            num_settled += 1
+            if excess[node] < -volume_epsilon:
+                deficit_node = node
+                deficit_dist = node_dist
+                break
+
+            for arc in out_arcs[node]:
+                if arc_cap[arc] <= volume_epsilon:
+                    continue
+                next_node = arc_head[arc]
+                next_dist = node_dist + arc_cost[arc] + potential[node] - potential[next_node]
+                if next_dist < dist[next_node]:
+                    dist[next_node] = next_dist
+                    pred_arc[next_node] = arc
+                    heapq.heappush(heap, (next_dist, next_node))
+
+        if math.isinf(deficit_dist):
+            break
+
+        for node in range(num_nodes):
+            potential[node] += min(dist[node], deficit_dist)
+
+        # push along the shortest path first, so every search makes progress
+        path_arcs = []
+        node = deficit_node
+        while pred_arc[node] >= 0:
+            path_arcs.append(pred_arc[node])
+            node = arc_head[pred_arc[node] ^ 1]
+        _push_flow(path_arcs, node, deficit_node, arc_cap, excess)
+
+        # then push a blocking flow from excess to deficit nodes on zero reduced-cost arcs
+        next_arc_pos = [0] * num_nodes
+        for source_node in excess_nodes:
+            while excess[source_node] > volume_epsilon:
+                path_arcs = []
+                on_path = {source_node}
+                node = source_node
+                while excess[node] >= -volume_epsilon:
+                    node_arcs = out_arcs[node]
+                    while next_arc_pos[node] < len(node_arcs):
+                        arc = node_arcs[next_arc_pos[node]]
+                        next_node = arc_head[arc]
+                        if (arc_cap[arc] > volume_epsilon
+                                and next_node not in on_path
+                                and arc_cost[arc] + potential[node] == potential[next_node]):
+                            break
+                        next_arc_pos[node] += 1
+                    else:
+                        # dead end, retreat to the previous node
+                        if not path_arcs:
+                            break
+                        on_path.discard(node)
+                        node = arc_head[path_arcs.pop() ^ 1]
+                        next_arc_pos[node] += 1
+                        continue
+
+                    path_arcs.append(node_arcs[next_arc_pos[node]])
+                    node = arc_head[path_arcs[-1]]
+                    on_path.add(node)
+
+                if excess[node] >= -volume_epsilon:
+                    break
+
+                _push_flow(path_arcs, source_node, node, arc_cap, excess)
+
+    # the flow on an input arc is the residual capacity of its reverse arc
+    count("dijkstra_expansions", num_settled)
+    return [arc_cap[2 * i + 1] for i in range(len(arcs))]
+
+
+def _extract_boundary_routes(arc_flows: dict[tuple[int, int], float],
+                             volume_epsilon: float) -> list[tuple[list[int], float]]:
+    """Decompose a circulation into routes passing through the boundary node.
+
+    Cycles that do not pass through the boundary node have no entry or exit edge
+    and are left out.
+
+    Returns:
+        list: (nodes of the route without the boundary node, route volume)
+    """
+    flow_out: dict[int, dict[int, float]] = {}
+    for (from_node, to_node), flow in arc_flows.items():
+        if flow > volume_epsilon:
+            flow_out.setdefault(from_node, {})[to_node] = flow
+
+    def next_node_of(node: int) -> int | None:
+        # follow the largest remaining flow first, so routes are few and large
+        node_flows = flow_out.get(node)
+        if not node_flows:
+            return None
+        return max(node_flows, key=lambda to_node: (node_flows[to_node], -to_node))
+
+    def remove_flow(path: list[int], volume: float) -> None:
+        for from_node, to_node in zip(path, path[1:]):
+            flow_out[from_node][to_node] -= volume
+            if flow_out[from_node][to_node] <= volume_epsilon:
+                del flow_out[from_node][to_node]
+
+    routes = []
+    while (next_node := next_node_of(BOUNDARY_NODE)) is not None:
+        path = [BOUNDARY_NODE]
+        path_pos = {BOUNDARY_NODE: 0}
+        while next_node is not None and next_node != BOUNDARY_NODE:
+            if next_node in path_pos:
+                # an internal cycle, remove it and continue from the node where it starts
+                cycle = path[path_pos[next_node]:] + [next_node]
+                remove_flow(cycle, min(flow_out[u][v] for u, v in zip(cycle, cycle[1:])))
+                for node in path[path_pos[next_node] + 1:]:
+                    del path_pos[node]
+                del path[path_pos[next_node] + 1:]
+            else:
+                path_pos[next_node] = len(path)
+                path.append(next_node)
+            next_node = next_node_of(path[-1])
+
+        if next_node is None:
+            # flow conservation is broken by rounding, drop the remaining flow out of the boundary
+            remove_flow(path[:2], flow_out[path[0]][path[1]])
+            continue
+
+        path.append(BOUNDARY_NODE)
+        route_volume = min(flow_out[u][v] for u, v in zip(path, path[1:]))
+        remove_flow(path, route_volume)
+        routes.append((path[1:-1], route_volume))
+
+    return routes
+
+
+def decompose_routes_with_min_cost_flow(residual_turn_volumes: dict[str, dict[str, float]],
+                                        boundary_source_edge_ids: set[str],
+                                        boundary_sink_edge_ids: set[str],
+                                        transition_graph: dict[str, set[str]],
+                                        max_route_edges: int,
+                                        min_route_volume: float,
+                                        volume_epsilon: float) -> list[dict[str, Any]]:
+    """Decompose UTDF turning counts into boundary-to-boundary routes with a min-cost flow.
+
+    Each counted movement is an arc with its UTDF count as capacity and a reward for every
+    vehicle using it. Uncounted topology transitions are connector arcs without capacity limit
+    and a small cost, and boundary source/sink edges are connected to a virtual boundary node.
+    The min-cost circulation on this network covers as much of the UTDF counts as possible
+    with routes that enter and leave at the network boundary, and it is decomposed into routes.
+    Since every route volume is part of the arc flows, no movement can exceed its UTDF count.
+
+    Args:
+        residual_turn_volumes (dict): {source edge id: {target edge id: UTDF count}}
+        boundary_source_edge_ids (set[str]): edges where routes can enter the network
+        boundary_sink_edge_ids (set[str]): edges where routes can leave the network
+        transition_graph (dict): {edge id: set of next edge ids} of all physical transitions
+        max_route_edges (int): maximum number of main edges in one route, longer routes are left out
+        min_route_volume (float): smallest route volume to keep
+        volume_epsilon (float): volumes not larger than volume_epsilon are treated as zero
+
+    Returns:
+        list[dict]: [{"main_edge_path": [edge ids], "volume": route volume}, ...]
+    """
+    edge_ids = sorted(
+        set(transition_graph)
+        | {target_edge_id for target_edge_ids in transition_graph.values() for target_edge_id in target_edge_ids}
+        | set(residual_turn_volumes)
+        | {target_edge_id for target_volumes in residual_turn_volumes.values() for target_edge_id in target_volumes}
+        | boundary_source_edge_ids
+        | boundary_sink_edge_ids
+    )
+    node_by_edge_id = {edge_id: node for node, edge_id in enumerate(edge_ids, start=1)}
+
+    # every arc costs 1, a counted movement earns max_route_edges, so a route using
+    # a counted movement is worth keeping unless it needs about max_route_edges connectors
+    counted_arc_cost = 1 - max(int(max_route_edges), 2)
+    arcs = []
+    for source_edge_id, target_volumes in sorted(residual_turn_volumes.items()):
+        for target_edge_id, volume in sorted(target_volumes.items()):
+            if volume > volume_epsilon:
+                arcs.append((node_by_edge_id[source_edge_id], node_by_edge_id[target_edge_id],
+                             volume, counted_arc_cost))
+    for source_edge_id, target_edge_ids in sorted(transition_graph.items()):
+        for target_edge_id in sorted(target_edge_ids):
+            if target_edge_id not in residual_turn_volumes.get(source_edge_id, {}):
+                arcs.append((node_by_edge_id[source_edge_id], node_by_edge_id[target_edge_id], math.inf, 1))
+    for edge_id in sorted(boundary_source_edge_ids):
+        arcs.append((BOUNDARY_NODE, node_by_edge_id[edge_id], math.inf, 0))
+    for edge_id in sorted(boundary_sink_edge_ids):
+        arcs.append((node_by_edge_id[edge_id], BOUNDARY_NODE, math.inf, 0))
+
+    flows = _solve_min_cost_circulation(len(edge_ids) + 1, arcs, volume_epsilon)
+    arc_flows = {(from_node, to_node): flow for (from_node, to_node, _, _), flow in zip(arcs, flows)}
+
+    network_routes = []
+    for route_nodes, route_volume in _extract_boundary_routes(arc_flows, volume_epsilon):
+        if len(route_nodes) < 2 or len(route_nodes) > max_route_edges:
+            continue
+        if route_volume < min_route_volume:
+            continue
+        network_routes.append({
+            "main_edge_path": [edge_ids[node - 1] for node in route_nodes],
+            "volume": route_volume,
+        })
+
+    network_routes.sort(key=lambda network_route: (-len(network_route["main_edge_path"]),
+                                                   network_route["main_edge_path"]))
+    return network_routes
@@ -9,6 +9,8 @@
 import pandas as pd
 from collections import OrderedDict
 
+from utdf2gmns.func_lib.utdf.utdf_index import _normalize_intid, cvt_utdf_table_to_intid_dict
+
 
 BLANK_TEXT_VALUES = {"", "nan", "none", "null"}
 
@@ -50,35 +52,21 @@ def _normalize_phase_name(value: object) -> str:
     return f"D{phase_value}"
 
 
-def parse_phase(df_phase: pd.DataFrame, int_id: int) -> dict:
-    """Extract signal Phase data by intersection ID
-
-    Args:
-        df_Phase (pd.DataFrame): UTDF Phase data
-        int_id (int): Intersection ID
-
-    Returns:
-        dict: {"D1"" {}, "D2": {}, "D3": {}}
-
-    """
-    # get dataframe of the intersection
-    df_phase_id = df_phase[df_phase['INTID'] == str(int_id)]
-    col_names = list(df_phase["RECORDNAME"].unique())
+def _get_intid_rows(df_table: pd.DataFrame, int_id: int, intid_groups: dict = None) -> pd.DataFrame:
+    """Return the rows of one intersection from pre-grouped data, or by filtering the table"""
+    if intid_groups is not None:
+        return intid_groups.get(_normalize_intid(int_id), df_table.iloc[0:0])
+    return df_table[df_table['INTID'] == str(int_id)]
 
-    if 'RECORDNAME' in df_phase_id:
-        del df_phase_id['RECORDNAME']
-    if 'INTID' in df_phase_id:
-        del df_phase_id['INTID']
 
-    phase_info = list(df_phase_id)
+def _build_phase_control(phase_columns: dict) -> dict:
+    """Build the phase data and ring-barrier info of a controller from {phase: {RECORDNAME: value}}"""
     result = {}
-    for phs in phase_info:
-        signal_data = list(df_phase[phs][(df_phase['RECORDNAME'].isin(col_names)) & (df_phase['INTID'] == str(int_id))])
-        res = dict(zip(col_names, signal_data))
+    for phs, res in phase_columns.items():
 
         # save the signal data
         if res["MinGreen"]:
-            result[phs] = res
+            result[phs] = dict(res)
 
     # prepare brp info
     phs = result.keys()
@@ -106,41 +94,45 @@ def parse_phase(df_phase: pd.DataFrame, int_id: int) -> dict:
     return result
 
 
-def parse_lane(df_lane: pd.DataFrame, int_id: int, verbose: bool = False) -> dict:
-    """Extract single lane data by intersection ID
+def parse_phase(df_phase: pd.DataFrame, int_id: int, *, intid_groups: dict = None) -> dict:
+    """Extract signal Phase data by intersection ID
 
     Args:
-        df_lane (pd.DataFrame): UTDF Lane data
+        df_Phase (pd.DataFrame): UTDF Phase data
         int_id (int): Intersection ID
+        intid_groups (dict): pre-grouped Phase data by intersection id, from group_utdf_table_by_intid.
+            Defaults to None, filter df_phase by int_id.
 
     Returns:
-        dict: {'D5': {'protected': ['NBL']}, 'D2': {'protected': ['NBT'], 'permitted': ['NBR']},
-        'D1': {'protected': ['SBL']}, 'D6': {'protected': ['SBT'], 'permitted': ['SBR']},
-        'D3': {'protected': ['EBL']}, 'D8': {'protected': ['EBT'], 'permitted': ['EBR']},
-        'D7': {'protected': ['WBL']}, 'D4': {'protected': ['WBT'], 'permitted': ['WBR']}}
+        dict: {"D1"" {}, "D2": {}, "D3": {}}
 
     """
+    # get dataframe of the intersection
+    df_phase_id = _get_intid_rows(df_phase, int_id, intid_groups)
+    col_names = list(df_phase_id["RECORDNAME"])
 
-    # prepare single lane dataframe for the intersection
-    df_lane = df_lane[~df_lane['INTID'].isnull()]
-    df_lane_id = df_lane[df_lane['INTID'] == str(int_id)]
-    df_lane_id.index = df_lane_id['RECORDNAME']
+    phase_info = [col for col in df_phase_id.columns if col not in ('RECORDNAME', 'INTID')]
+    return _build_phase_control({phs: dict(zip(col_names, list(df_phase_id[phs]))) for phs in phase_info})
+
+
+def _build_lane_control(lane_columns: dict, int_id: int, verbose: bool = False) -> dict:
+    """Build the movement data and phase movements of an intersection from {movement: {RECORDNAME: value}}"""
 
     traffic_movement_data = {}
     inbound_nodes = {}
     need_lookup = []
-    for traffic_movement in df_lane_id.columns:
+    for traffic_movement, movement_records in lane_columns.items():
 
         # skip the columns that are not traffic movements
         if traffic_movement in ['RECORDNAME', 'INTID', 'PED', 'HOLD']:
             continue
 
         # skip the traffic movements that do not have an up node
-        if not df_lane_id[traffic_movement].loc['Up Node']:
+        if not movement_records['Up Node']:
             continue
 
         # collect the traffic movement data for the intersection
-        traffic_movement_data[traffic_movement] = df_lane_id[traffic_movement].to_dict()
+        traffic_movement_data[traffic_movement] = dict(movement_records)
         traffic_movement_data[traffic_movement]["Protected"] = []
         traffic_movement_data[traffic_movement]["Permitted"] = []
 
@@ -148,19 +140,15 @@ def parse_lane(df_lane: pd.DataFrame, int_id: int, verbose: bool = False) -> dic
         for i in range(1, 5):
 
             key = f'Phase{i}'
-            if key in df_lane_id.index:
-                phase_name = _normalize_phase_name(
-                    df_lane_id[traffic_movement].loc[key],
-                )
+            if key in movement_records:
+                phase_name = _normalize_phase_name(movement_records[key])
                 if phase_name:
                     traffic_movement_data[traffic_movement]["Protected"].append(
                         phase_name)
 
             key = f'PermPhase{i}'
-            if key in df_lane_id.index:
-                phase_name = _normalize_phase_name(
-                    df_lane_id[traffic_movement].loc[key],
-                )
+            if key in movement_records:
+                phase_name = _normalize_phase_name(movement_records[key])
                 if phase_name:
                     traffic_movement_data[traffic_movement]["Permitted"].append(
                         phase_name)
@@ -248,33 +236,73 @@ def parse_lane(df_lane: pd.DataFrame, int_id: int, verbose: bool = False) -> dic
     return traffic_movement_data
 
 
-def parse_timeplans(df_timeplans: pd.DataFrame, int_id: int) -> dict:
+def parse_lane(df_lane: pd.DataFrame, int_id: int, verbose: bool = False, *, intid_groups: dict = None) -> dict:
+    """Extract single lane data by intersection ID
+
+    Args:
+        df_lane (pd.DataFrame): UTDF Lane data
+        int_id (int): Intersection ID
+        intid_groups (dict): pre-grouped Lane data by intersection id, from group_utdf_table_by_intid.
+            Defaults to None, filter df_lane by int_id.
+
+    Returns:
+        dict: {'D5': {'protected': ['NBL']}, 'D2': {'protected': ['NBT'], 'permitted': ['NBR']},
+        'D1': {'protected': ['SBL']}, 'D6': {'protected': ['SBT'], 'permitted': ['SBR']},
+        'D3': {'protected': ['EBL']}, 'D8': {'protected': ['EBT'], 'permitted': ['EBR']},
+        'D7': {'protected': ['WBL']}, 'D4': {'protected': ['WBT'], 'permitted': ['WBR']}}
+
+    """
+
+    # prepare single lane dataframe for the intersection
+    df_lane_id = _get_intid_rows(df_lane, int_id, intid_groups).set_index("RECORDNAME", drop=False)
+    lane_columns = {traffic_movement: df_lane_id[traffic_movement].to_dict()
+                    for traffic_movement in df_lane_id.columns
+                    if traffic_movement not in ('RECORDNAME', 'INTID')}
+    return _build_lane_control(lane_columns, int_id, verbose)
+
+
+def parse_timeplans(df_timeplans: pd.DataFrame, int_id: int, *, intid_groups: dict = None) -> dict:
     """Extract signal Time plan data by intersection ID
 
     Args:
         df_timeplans (pd.DataFrame): UTDF Time plan data
         int_id (int): Intersection ID
+        intid_groups (dict): pre-grouped Time plan data by intersection id, from group_utdf_table_by_intid.
+            Defaults to None, filter df_timeplans by int_id.
 
     Returns:
         dict: the time plan data for the intersection
     """
 
     # prepare single dataframe for the intersection
-    df_timeplans = df_timeplans[~df_timeplans['INTID'].isnull()]
-    df_timeplans_id = df_timeplans[df_timeplans['INTID'] == str(int_id)]
+    df_timeplans_id = _get_intid_rows(df_timeplans, int_id, intid_groups)
 
     # prepare single timeplans for the intersection
-    int_timeplans = {}
-    for i in range(len(df_timeplans_id)):
-        int_timeplans[df_timeplans_id.loc[i, "RECORDNAME"]] = df_timeplans_id.loc[i, "DATA"]
-    return int_timeplans
+    return dict(zip(df_timeplans_id["RECORDNAME"], df_timeplans_id["DATA"]))
+
+
+def _merge_lane_phases(int_phase: dict, int_lane_phase: dict, int_id: int) -> dict:
+    """Add the protected and permitted movements of each lane phase to the controller phases"""
+    phase_key = list(int_lane_phase.keys())
+    for phs in phase_key:
+        for pro_per in list(int_lane_phase[phs].keys()):
+            try:
+                int_phase[phs][pro_per] = int_lane_phase[phs][pro_per]
+            except KeyError as e:
+                print("  :Error: Intersection ID: ", int_id)
+                print(e)
+
+    return int_phase
 
 
 def parse_signal_control(
         df_phase: pd.DataFrame,
         df_lane: pd.DataFrame,
         int_id: int,
-        lane_int_id: int | str | None = None) -> dict:
+        lane_int_id: int | str | None = None,
+        *,
+        phase_groups: dict = None,
+        lane_groups: dict = None) -> dict:
     """Extract signalized intersection data from the UTDF Phase and Lane data by intersection ID
 
     Args:
@@ -284,6 +312,8 @@ def parse_signal_control(
         lane_int_id (int | str | None): Intersection ID that owns the lane
             movement-to-phase records. Timeplans can assign multiple nodes to
             one controller, so this can differ from ``int_id``.
+        phase_groups (dict): pre-grouped Phase data by intersection id. Defaults to None.
+        lane_groups (dict): pre-grouped Lane data by intersection id. Defaults to None.
 
     Returns:
         dict: {'D1': {'protected': ['SBL']},
@@ -299,17 +329,45 @@ def parse_signal_control(
     if lane_int_id is None:
         lane_int_id = int_id
 
-    int_phase = parse_phase(df_phase, int_id)
-    int_lane = parse_lane(df_lane, lane_int_id)
-    int_lane_phase = int_lane['phases']
+    int_phase = parse_phase(df_phase, int_id, intid_groups=phase_groups)
+    int_lane = parse_lane(df_lane, lane_int_id, intid_groups=lane_groups)
+    return _merge_lane_phases(int_phase, int_lane['phases'], int_id)
 
-    phase_key = list(int_lane_phase.keys())
-    for phs in phase_key:
-        for pro_per in list(int_lane_phase[phs].keys()):
-            try:
-                int_phase[phs][pro_per] = int_lane_phase[phs][pro_per]
-            except KeyError as e:
-                print("  :Error: Intersection ID: ", int_id)
-                print(e)
 
-    return int_phase
+def parse_all_signal_controls(df_phase: pd.DataFrame,
+                              df_lane: pd.DataFrame,
+                              controller_by_node: dict | None = None) -> dict:
+    """Extract the signal control data of all intersections, reading the Phase and Lane tables once
+
+    Both tables are converted to {INTID: {column: {RECORDNAME: value}}} in one pass, the result of
+    each intersection is the same as parse_signal_control(df_phase, df_lane, controller_id, node_id).
+    Intersections without Phase or Lane rows get no phases or no movements.
+
+    Args:
+        df_phase (pd.DataFrame): UTDF Phase data
+        df_lane (pd.DataFrame): UTDF Lane data
+        controller_by_node (dict | None): {node id: id of the intersection that owns the controller timings},
+            the result follows its order. Defaults to None, every intersection with Phase and Lane data
+            uses its own timings.
+
+    Example:
+        >>> from utdf2gmns.func_lib.sumo.signal_intersections import parse_all_signal_controls
+        >>> signal_controls = parse_all_signal_controls(utdf_dict["Phases"], utdf_dict["Lanes"])
+        >>> signal_controls["1"]  # {'D1': {...}, ..., 'brp_info': {...}}
+
+    Returns:
+        dict: {node id: signal control data}
+    """
+    phase_tables = cvt_utdf_table_to_intid_dict(df_phase, normalize_intid=True)
+    lane_tables = cvt_utdf_table_to_intid_dict(df_lane, normalize_intid=True)
+
+    if controller_by_node is None:
+        controller_by_node = {int_id: int_id for int_id in phase_tables if int_id in lane_tables}
+
+    signal_controls = {}
+    for node_id, controller_id in controller_by_node.items():
+        # phase dictionaries are built for each node, nodes sharing a controller do not share them
+        int_phase = _build_phase_control(phase_tables.get(_normalize_intid(controller_id), {}))
+        int_lane = _build_lane_control(lane_tables.get(_normalize_intid(node_id), {}), node_id)
+        signal_controls[node_id] = _merge_lane_phases(int_phase, int_lane['phases'], controller_id)
+    return signal_controls
@@ -7,19 +7,34 @@
 ##############################################################
 '''
 
+import contextlib
+import io
+import os
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+from typing import Callable
+
+from utdf2gmns.func_lib.sumo.gmns2sumo import write_pretty_xml
 from utdf2gmns.func_lib.sumo.read_sumo import ReadSUMO
-from utdf2gmns.func_lib.sumo.signal_intersections import parse_signal_control
+from utdf2gmns.func_lib.sumo.signal_intersections import parse_all_signal_controls
 from utdf2gmns.func_lib.sumo.signal_mapping import (direction_mapping,
                                                     build_linkDuration,
                                                     extract_dir_info,
                                                     create_SignalTimingPlan,
                                                     process_pedestrian_crossing)
 from utdf2gmns.func_lib.utdf.read_utdf import read_UTDF
-from utdf2gmns.func_lib.utdf.cvt_utdf_lane_df_to_dict import cvt_lane_df_to_dict
+from utdf2gmns.func_lib.utdf.cvt_utdf_lane_df_to_dict import get_utdf_lane_dict
+from utdf2gmns.func_lib.utdf.utdf_index import get_utdf_lookup
+from utdf2gmns.util_lib.instrumentation import count
 
 
 BLANK_TEXT_VALUES = {"", "nan", "none", "null"}
 
+# programID of the signal programs written to a .tll.add.xml file. SUMO does not allow
+# loading a program with the id and programID of a network program, the last loaded one is active
+TLS_ADD_PROGRAM_ID = "utdf"
+
 
 def _is_blank(value: object) -> bool:
     """Return True when a UTDF cell does not contain useful data."""
@@ -100,18 +115,65 @@ def _sumo_dir_to_utdf_turn(sumo_dir: str | None) -> str:
     return "R" if sumo_dir in {"r", "R"} else str(sumo_dir or "").upper()
 
 
+def _build_timeplan_lookup(timeplans_df) -> dict:
+    """Index the UTDF Timeplans table by controller and record name in one pass.
+
+    Returns:
+        dict: {normalized controller INTID: {RECORDNAME: (DATA values in row order)}}
+    """
+    if timeplans_df is None or "INTID" not in timeplans_df or "RECORDNAME" not in timeplans_df:
+        return {}
+
+    data_values = timeplans_df["DATA"].tolist() if "DATA" in timeplans_df else [None] * len(timeplans_df)
+    timeplan_lookup: dict[str, dict] = {}
+    for controller_id, record_name, value in zip(timeplans_df["INTID"].map(_normalize_utdf_node_id).tolist(),
+                                                 timeplans_df["RECORDNAME"].tolist(),
+                                                 data_values):
+        timeplan_lookup.setdefault(controller_id, {}).setdefault(record_name, []).append(value)
+
+    return {controller_id: {record_name: tuple(values) for record_name, values in records.items()}
+            for controller_id, records in timeplan_lookup.items()}
+
+
+def get_utdf_timeplan_lookup(utdf_dict: dict) -> dict:
+    """Return the read-only Timeplans lookup of the UTDF data, indexing the table only once.
+
+    The result is cached in utdf_dict and rebuilt when utdf_dict["Timeplans"] is replaced.
+
+    Args:
+        utdf_dict (dict): the UTDF dictionary returned by read_UTDF
+
+    Returns:
+        dict: {normalized controller INTID: {RECORDNAME: (DATA values in row order)}}
+    """
+    return get_utdf_lookup(utdf_dict, "timeplans", ("Timeplans",),
+                           lambda: _build_timeplan_lookup(utdf_dict.get("Timeplans")))
+
+
+def _get_timeplan_value(timeplan_lookup: dict, controller_id: str, record_name: str,
+                        default: str) -> str:
+    """Read the first Timeplans value of a controller record, with a safe default."""
+    values = timeplan_lookup.get(controller_id, {}).get(record_name)
+    if not values:
+        return default
+    return default if _is_blank(values[0]) else str(values[0])
+
+
 def _build_signal_controller_mapping(
         timeplans_df,
-        sumo_signal_ids: set[str] | None = None) -> dict[str, str]:
+        sumo_signal_ids: set[str] | None = None,
+        timeplan_lookup: dict | None = None) -> dict[str, str]:
     """Map each signalized node to the UTDF controller that owns its timings.
 
     UTDF Timeplans support ``Node 0`` through ``Node 7`` records so one
     controller can operate multiple intersections. In that case Synchro writes
     the timing and phase records only for the controller INTID, while the local
     intersection still has its own lane movement records.
+
+    Pass the cached ``timeplan_lookup`` of timeplans_df to avoid indexing the table again.
     """
-    if timeplans_df is None or "INTID" not in timeplans_df or "RECORDNAME" not in timeplans_df:
-        return {}
+    if timeplan_lookup is None:
+        timeplan_lookup = _build_timeplan_lookup(timeplans_df)
 
     allowed_signal_ids = None
     if sumo_signal_ids is not None:
@@ -121,29 +183,64 @@ def _build_signal_controller_mapping(
         }
 
     controller_mapping: dict[str, str] = {}
-    normalized_intids = timeplans_df["INTID"].map(_normalize_utdf_node_id)
-    for controller_id in sorted(set(normalized_intids), key=_node_sort_key):
+    for controller_id in sorted(timeplan_lookup, key=_node_sort_key):
         if not controller_id:
             continue
 
         if allowed_signal_ids is None or controller_id in allowed_signal_ids:
             controller_mapping[controller_id] = controller_id
 
-        controller_rows = timeplans_df[normalized_intids == controller_id]
-        node_rows = controller_rows[
-            controller_rows["RECORDNAME"].astype(str).str.strip().str.lower().str.startswith("node")
-        ]
-        for node_id in node_rows.get("DATA", []):
-            normalized_node_id = _normalize_utdf_node_id(node_id)
-            if not normalized_node_id or normalized_node_id == "0":
-                continue
-            if allowed_signal_ids is not None and normalized_node_id not in allowed_signal_ids:
+        for record_name, values in timeplan_lookup[controller_id].items():
+            if not str(record_name).strip().lower().startswith("node"):
                 continue
-            controller_mapping.setdefault(normalized_node_id, controller_id)
+            for node_id in values:
+                normalized_node_id = _normalize_utdf_node_id(node_id)
+                if not normalized_node_id or normalized_node_id == "0":
+                    continue
+                if allowed_signal_ids is not None and normalized_node_id not in allowed_signal_ids:
+                    continue
+                controller_mapping.setdefault(normalized_node_id, controller_id)
 
     return controller_mapping
 
 
+def _map_signal_nodes_to_controllers(utdf_dict: dict) -> dict[str, str]:
+    """Map each signalized node with UTDF lane data to the controller that owns its timings.
+
+    Nodes come from the Timeplans node records. When none of them has lane data,
+    every Phases intersection with lane data uses its own timings.
+
+    Returns:
+        dict: {node id: controller id}, in node order
+    """
+    df_phase = utdf_dict.get("Phases")
+    df_lane = utdf_dict.get("Lanes")
+    if df_phase is None or df_lane is None:
+        return {}
+
+    lane_int_ids = {
+        _normalize_utdf_node_id(int_id)
+        for int_id in df_lane["INTID"].dropna().unique()
+    }
+    signal_controller_by_node = _build_signal_controller_mapping(
+        utdf_dict.get("Timeplans"),
+        timeplan_lookup=get_utdf_timeplan_lookup(utdf_dict),
+    )
+    signal_controller_by_node = {
+        node_id: controller_id
+        for node_id, controller_id in signal_controller_by_node.items()
+        if node_id in lane_int_ids
+    }
+    if not signal_controller_by_node:
+        signal_controller_by_node = {
+            _normalize_utdf_node_id(int_id): _normalize_utdf_node_id(int_id)
+            for int_id in df_phase["INTID"].unique()
+            if _normalize_utdf_node_id(int_id) in lane_int_ids
+        }
+
+    return dict(sorted(signal_controller_by_node.items(), key=lambda item: _node_sort_key(item[0])))
+
+
 def _build_inbound_direction_mapping_from_lanes(
         network_lanes: dict,
         intersection_id: str,
@@ -306,70 +403,87 @@ def _build_inbound_direction_mapping_from_utdf(
     if lane_df is None:
         return {}, set()
     return _build_inbound_direction_mapping_from_lanes(
-        cvt_lane_df_to_dict(lane_df),
+        get_utdf_lane_dict(utdf_dict),
         intersection_id,
         inbound_edges,
     )
 
 
-def update_sumo_signal_from_utdf(sumo_net_xml: str, utdf_dict_or_fname: dict | str, verbose: bool = False) -> bool:
-    """update sumo signal (.net.xml) from UTDF signal information
+def _load_utdf_dict(utdf_dict_or_fname: dict | str) -> dict:
+    """Return the UTDF dictionary, reading the UTDF csv file when a file name is given."""
 
-    Args:
-        sumo_net_xml (str): the path of sumo network xml file
-        utdf_dict_or_fname (dict | str): the UTDF dictionary or the path of UTDF csv file
-        verbose (bool): whether to print the process. Defaults to False.
+    # Check if utdf_dict_or_fname is a dictionary or a file name
+    if isinstance(utdf_dict_or_fname, dict):
+        return utdf_dict_or_fname
+    if isinstance(utdf_dict_or_fname, str):
+        return read_UTDF(utdf_dict_or_fname)
+    raise TypeError("utdf_dict_or_fname must be a dictionary or a file name")
+
+
+def _get_intersection_network_lanes(network_lanes: dict, intersection_id: str) -> dict:
+    """Return a plain-dict copy of the UTDF lane entry of one intersection, keyed as in network_lanes."""
+    movement_lanes_key = str(intersection_id)
+    if movement_lanes_key not in network_lanes and movement_lanes_key.isdigit():
+        movement_lanes_key = int(intersection_id)
+    if movement_lanes_key not in network_lanes:
+        return {}
+    return {
+        movement_lanes_key: {
+            movement_name: dict(movement_info)
+            for movement_name, movement_info in network_lanes[movement_lanes_key].items()
+        }
+    }
 
-    Example:
-        >>> import utdf2gmns as ug
-        >>> sumo_net_xml = "your sumo network xml file"
-        >>> utdf_dict_or_fname = "your utdf file, in csv format"
-        >>> ug.update_sumo_signal_from_utdf(sumo_net_xml, utdf_dict_or_fname, verbose=True)
 
-    Returns:
-        bool: whether the generation is successful
-    """
+def _build_signal_program_task(sumo_net: ReadSUMO, utdf_signal: dict, network_lanes: dict,
+                               int_id: str, controller_id: str, cycle_length: float,
+                               verbose: bool) -> dict:
+    """Collect the UTDF and SUMO data of one signal intersection, the task is picklable."""
 
-    # Check if utdf_dict_or_fname is a dictionary or a file name
-    if isinstance(utdf_dict_or_fname, dict):
-        utdf_dict = utdf_dict_or_fname
-    elif isinstance(utdf_dict_or_fname, str):
-        utdf_dict = read_UTDF(utdf_dict_or_fname)
-    else:
-        raise TypeError("utdf_dict_or_fname must be a dictionary or a file name")
+    sumo_signal = sumo_net.sumo_signal_info[int_id]
+    inbound_edge_ids = {movement["fromEdge"] for movement in sumo_signal.values() if ":" not in movement["fromEdge"]}
+    crossing_edge_ids = {movement["toEdge"] for movement in sumo_signal.values() if ":" in movement["fromEdge"]}
 
-    # check if sumo_net_xml ends with .net.xml
-    if not sumo_net_xml.endswith(".net.xml"):
-        raise ValueError("sumo_net_xml must end with .net.xml")
+    # only the signal control and lane movements of this intersection, with its SUMO connections
+    return {
+        "int_id": int_id,
+        "controller_id": controller_id,
+        "utdf_signal": utdf_signal,
+        "cycle_length": cycle_length,
+        "verbose": verbose,
+        "network_lanes": _get_intersection_network_lanes(network_lanes, int_id),
+        "sumo_signal": sumo_signal,
+        "sumo_nbsw": {edge_id: slope for edge_id, slope in sumo_net.sumo_nbsw.items()
+                      if edge_id in inbound_edge_ids},
+        "crossing_dict": {edge_id: crossed_edges for edge_id, crossed_edges in sumo_net.crossing_dict.items()
+                          if edge_id in crossing_edge_ids},
+    }
 
-    # read sumo network
-    sumo_net = ReadSUMO(sumo_net_xml)
 
-    timeplans = utdf_dict.get("Timeplans")
-    signal_controller_by_node = _build_signal_controller_mapping(
-        timeplans,
-        set(sumo_net.sumo_signal_info.keys()),
-    )
-    signalized_int_ids = [
-        node_id for node_id in sorted(signal_controller_by_node, key=_node_sort_key)
-        if node_id in sumo_net.sumo_signal_info
-    ]
+def _build_intersection_signal_program(task: dict) -> dict:
+    """Map the SUMO connections of one signal intersection to UTDF movements and build its timing plan.
 
-    # parse signal intersection information
-    utdf_signal = {}
-    network_lanes = cvt_lane_df_to_dict(utdf_dict.get("Lanes"))
+    The task holds all data of the intersection, so intersections can be processed in worker processes.
+    Printed messages are returned instead, the caller prints them in intersection order.
 
-    for int_id in signalized_int_ids:
+    Returns:
+        dict: {"int_id", "sumo_signal": connections with UTDF directions, "ret": signal phases,
+        "linkDur": link durations, "log": printed messages}
+    """
+    int_id = task["int_id"]
+    controller_id = task["controller_id"]
+    verbose = task["verbose"]
+    network_lanes = task["network_lanes"]
 
-        # in this case sumo id equal to UTDF signal intersection id
-        int_id = str(int_id)
-        controller_id = signal_controller_by_node[int_id]
+    # the same interface as ReadSUMO for direction_mapping and process_pedestrian_crossing
+    sumo_net = SimpleNamespace(sumo_signal_info={int_id: task["sumo_signal"]},
+                               sumo_nbsw=task["sumo_nbsw"],
+                               crossing_dict=task["crossing_dict"])
 
-        utdf_signal[int_id] = parse_signal_control(df_phase=utdf_dict.get("Phases"),
-                                                   df_lane=utdf_dict.get("Lanes"),
-                                                   int_id=controller_id,
-                                                   lane_int_id=int_id)
-        phase_directions = set(extract_dir_info(utdf_signal[int_id]))
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        utdf_signal = task["utdf_signal"]
+        phase_directions = set(extract_dir_info(utdf_signal))
 
         if verbose:
             print(f"\nIntersection id: {int_id} "
@@ -457,6 +571,85 @@ def update_sumo_signal_from_utdf(sumo_net_xml: str, utdf_dict_or_fname: dict | s
             else:
                 process_pedestrian_crossing(int_id, sumo_net, sumo_movement, UTDF_DIRS)
 
+        if verbose:
+            print(f"  :processing signal @ id: {int_id}")
+
+        ret = create_SignalTimingPlan(
+            utdf_signal,
+            sumo_net.sumo_signal_info[int_id],
+            verbose=verbose,
+            cycle_length=task["cycle_length"])
+        linkDur = build_linkDuration(
+            utdf_signal,
+            sumo_net.sumo_signal_info[int_id])
+
+        if ret and verbose:
+            for i in sumo_net.sumo_signal_info[int_id]:
+                print(f"  :{i} {sumo_net.sumo_signal_info[int_id][i]}")
+
+    return {"int_id": int_id,
+            "sumo_signal": sumo_net.sumo_signal_info[int_id],
+            "ret": ret,
+            "linkDur": linkDur,
+            "log": log.getvalue()}
+
+
+def _map_signal_tasks(worker: Callable[[dict], dict], tasks: list[dict], max_workers: int | None = 1) -> list[dict]:
+    """Run worker on each task, in a process pool when more than one worker is requested.
+
+    Args:
+        worker (Callable): a module-level function, so it can be sent to worker processes
+        tasks (list[dict]): the picklable tasks
+        max_workers (int | None): the number of worker processes, 1 runs the tasks in this process
+            and None uses one process per CPU. Defaults to 1.
+
+    Returns:
+        list[dict]: the results in the order of tasks
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers <= 1 or len(tasks) <= 1:
+        return [worker(task) for task in tasks]
+
+    max_workers = min(max_workers, len(tasks))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # map keeps the task order, chunks reduce the inter-process round trips
+        return list(executor.map(worker, tasks, chunksize=max(1, len(tasks) // (max_workers * 4))))
+
+
+def apply_utdf_signal_to_sumo_net(sumo_net: ReadSUMO, utdf_dict: dict, verbose: bool = False,
+                                  max_workers: int | None = 1) -> list[str]:
+    """replace the signal programs of a loaded sumo network with UTDF signal timings, in memory
+
+    The network is not written, so several post-processing steps can share one parse and one write.
+    The Phase and Lane tables are parsed once for all intersections. Signal intersections are then
+    independent: each one is mapped and timed from its own signal control, lane movements
+    and SUMO connections, so they can be processed in parallel. The programs are replaced
+    in intersection order, the result does not depend on max_workers.
+
+    Args:
+        sumo_net (ReadSUMO): the loaded sumo network
+        utdf_dict (dict): the UTDF dictionary
+        verbose (bool): whether to print the process. Defaults to False.
+        max_workers (int | None): the number of worker processes for the signal intersections,
+            1 processes them in this process and None uses one process per CPU. Defaults to 1.
+
+    Returns:
+        list[str]: the ids of the signal intersections updated from UTDF
+    """
+
+    timeplans = utdf_dict.get("Timeplans")
+    timeplan_lookup = get_utdf_timeplan_lookup(utdf_dict)
+    signal_controller_by_node = _build_signal_controller_mapping(
+        timeplans,
+        set(sumo_net.sumo_signal_info.keys()),
+        timeplan_lookup=timeplan_lookup,
+    )
+    signalized_int_ids = [
+        node_id for node_id in sorted(signal_controller_by_node, key=_node_sort_key)
+        if node_id in sumo_net.sumo_signal_info
+    ]
+
     # UTDF coordinated/actuated control types include timing splits, but this
     # exporter does not build SUMO traffic-light detector calls for actuated
     # phase extension. Writing SUMO ``actuated`` programs would therefore run
@@ -471,18 +664,7 @@ def update_sumo_signal_from_utdf(sumo_net_xml: str, utdf_dict_or_fname: dict | s
     def get_timeplan_value(controller_id: str, record_name: str,
                            default: str) -> str:
         """Read one Timeplans value for a controller, with a safe default."""
-        if timeplans is None:
-            return default
-
-        matching_values = timeplans["DATA"][
-            (timeplans["INTID"].map(_normalize_utdf_node_id) == controller_id)
-            & (timeplans["RECORDNAME"] == record_name)
-        ].tolist()
-        if not matching_values:
-            return default
-
-        value = matching_values[0]
-        return default if _is_blank(value) else str(value)
+        return _get_timeplan_value(timeplan_lookup, controller_id, record_name, default)
 
     def get_signal_type(controller_id: str) -> str:
         """Convert a UTDF Control Type value into a SUMO tlLogic type."""
@@ -493,10 +675,18 @@ def update_sumo_signal_from_utdf(sumo_net_xml: str, utdf_dict_or_fname: dict | s
             control_type_id = "0"
         return control_type.get(control_type_id, "static")
 
+    # parse the signal control of all intersections at once, then collect the data of each intersection
+    signal_controls = parse_all_signal_controls(
+        utdf_dict.get("Phases"),
+        utdf_dict.get("Lanes"),
+        {int_id: signal_controller_by_node[int_id] for int_id in signalized_int_ids},
+    )
+    network_lanes = get_utdf_lane_dict(utdf_dict)
+    tasks = []
     for int_id in signalized_int_ids:
-        if verbose:
-            print(f"  :processing signal @ id: {int_id}")
 
+        # in this case sumo id equal to UTDF signal intersection id
+        int_id = str(int_id)
         controller_id = signal_controller_by_node[int_id]
         cycle_length_text = get_timeplan_value(controller_id, "Cycle Length", "0")
         try:
@@ -504,20 +694,17 @@ def update_sumo_signal_from_utdf(sumo_net_xml: str, utdf_dict_or_fname: dict | s
         except ValueError:
             cycle_length = 0.0
 
-        ret = create_SignalTimingPlan(
-            utdf_signal[int_id],
-            sumo_net.sumo_signal_info[int_id],
-            verbose=verbose,
-            cycle_length=cycle_length)
-        linkDur = build_linkDuration(
-            utdf_signal[int_id],
-            sumo_net.sumo_signal_info[int_id])
+        tasks.append(_build_signal_program_task(sumo_net, signal_controls[int_id], network_lanes,
+                                                int_id, controller_id, cycle_length, verbose))
 
-        if ret:
-            for i in sumo_net.sumo_signal_info[int_id]:
-                if verbose:
-                    print(f"  :{i} {sumo_net.sumo_signal_info[int_id][i]}")
+    # build the timing plans, then replace the programs in intersection order
+    for result in _map_signal_tasks(_build_intersection_signal_program, tasks, max_workers):
+        int_id = result["int_id"]
+        controller_id = signal_controller_by_node[int_id]
+        print(result["log"], end="")
+        sumo_net.sumo_signal_info[int_id] = result["sumo_signal"]
 
+        if result["ret"]:
             types = get_signal_type(controller_id)
             offsets = get_timeplan_value(controller_id, "Offset", "0")
             try:
@@ -525,13 +712,99 @@ def update_sumo_signal_from_utdf(sumo_net_xml: str, utdf_dict_or_fname: dict | s
             except ValueError:
                 offset_seconds = 0.0
 
-            sumo_net.replace_tl_logic_xml(int_id, ret, linkDur, types, offset_seconds)
+            sumo_net.replace_tl_logic_xml(int_id, result["ret"], result["linkDur"], types, offset_seconds)
             valid_ids[int_id] = int_id
             valid += 1
     print(f"  :Total signal intersections: {len(signalized_int_ids)}"
           f", valid intersections: {valid}\n")
+    count("signal_programs_replaced", valid)
+    return list(valid_ids)
+
+
+def update_sumo_signal_from_utdf(sumo_net_xml: str, utdf_dict_or_fname: dict | str, verbose: bool = False,
+                                 max_workers: int | None = 1) -> bool:
+    """update sumo signal (.net.xml) from UTDF signal information
+
+    Args:
+        sumo_net_xml (str): the path of sumo network xml file
+        utdf_dict_or_fname (dict | str): the UTDF dictionary or the path of UTDF csv file
+        verbose (bool): whether to print the process. Defaults to False.
+        max_workers (int | None): the number of worker processes for the signal intersections,
+            1 processes them in this process and None uses one process per CPU. Defaults to 1.
+
+    Example:
+        >>> import utdf2gmns as ug
+        >>> sumo_net_xml = "your sumo network xml file"
+        >>> utdf_dict_or_fname = "your utdf file, in csv format"
+        >>> ug.update_sumo_signal_from_utdf(sumo_net_xml, utdf_dict_or_fname, verbose=True)
+
+    Returns:
+        bool: whether the generation is successful
+    """
+
+    utdf_dict = _load_utdf_dict(utdf_dict_or_fname)
+
+    # check if sumo_net_xml ends with .net.xml
+    if not sumo_net_xml.endswith(".net.xml"):
+        raise ValueError("sumo_net_xml must end with .net.xml")
+
+    # read sumo network
+    sumo_net = ReadSUMO(sumo_net_xml)
+    apply_utdf_signal_to_sumo_net(sumo_net, utdf_dict, verbose=verbose, max_workers=max_workers)
 
     # update sumo.net.xml
     sumo_net.write_xml()
 
     return True
+
+
+def generate_sumo_tls_add_xml(sumo_net_xml: str, utdf_dict_or_fname: dict | str,
+                              filename: str = "network.tll.add.xml", verbose: bool = False,
+                              max_workers: int | None = 1) -> bool:
+    """write UTDF signal timings to a SUMO additional file (.tll.add.xml), the .net.xml file is not changed
+
+    The programs are written with programID "utdf", SUMO runs them instead of the network
+    programs when the file is loaded, so one compiled network can be reused
+    for several signal timing scenarios, each with its own small additional file.
+
+    Args:
+        sumo_net_xml (str): the path of sumo network xml file
+        utdf_dict_or_fname (dict | str): the UTDF dictionary or the path of UTDF csv file
+        filename (str): the path of the output additional file. Defaults to "network.tll.add.xml".
+        verbose (bool): whether to print the process. Defaults to False.
+        max_workers (int | None): the number of worker processes for the signal intersections,
+            1 processes them in this process and None uses one process per CPU. Defaults to 1.
+
+    Example:
+        >>> import utdf2gmns as ug
+        >>> ug.generate_sumo_tls_add_xml("network.net.xml", "UTDF.csv", "network.tll.add.xml")
+        >>> # load it in .sumocfg: <additional-files value="network.tll.add.xml"/>
+
+    Returns:
+        bool: whether the generation is successful
+    """
+
+    utdf_dict = _load_utdf_dict(utdf_dict_or_fname)
+
+    # check if sumo_net_xml ends with .net.xml
+    if not sumo_net_xml.endswith(".net.xml"):
+        raise ValueError("sumo_net_xml must end with .net.xml")
+
+    # the network is only read, keep the elements the signal mapper needs
+    sumo_net = ReadSUMO(sumo_net_xml, low_memory=True)
+    updated_signal_ids = apply_utdf_signal_to_sumo_net(sumo_net, utdf_dict, verbose=verbose, max_workers=max_workers)
+
+    root_add = ET.Element("additional")
+    for signal_id in updated_signal_ids:
+        # every program of the signal is replaced with the same UTDF program, write it once,
+        # SUMO does not load two programs with the same id and programID
+        tl_logic = sumo_net.tl_logic_dict[signal_id][0]
+
+        # copy without the whitespace of the network file, the writer indents the elements
+        tl_logic_element = ET.SubElement(root_add, "tlLogic", tl_logic.attrib)
+        tl_logic_element.set("programID", TLS_ADD_PROGRAM_ID)
+        for child in tl_logic:
+            ET.SubElement(tl_logic_element, child.tag, child.attrib)
+
+    write_pretty_xml(root_add, filename)
+    return True
@@ -6,17 +6,31 @@
 ##############################################################
 '''
 
-from .cvt_utdf_lane_df_to_dict import cvt_lane_df_to_dict
-from .geocoding_intersection import (generate_intersection_coordinates,
-                                     geocoder_geocoding_from_address)
-from .read_utdf import (read_UTDF,
-                        generate_intersection_from_Links,
-                        reformat_lane_dataframe)
+from utdf2gmns.util_lib.lazy_import import lazy_import_attrs
+
+__getattr__, __dir__ = lazy_import_attrs(__name__, {
+    ".cvt_utdf_lane_df_to_dict": ("cvt_lane_df_to_dict",),
+    ".geocoding_cache": ("GeocodingCache",
+                         "geocode_addresses",
+                         "normalize_address"),
+    ".geocoding_intersection": ("generate_intersection_coordinates",
+                                "geocoder_geocoding_from_address"),
+    ".read_utdf": ("read_UTDF",
+                   "generate_intersection_from_Links",
+                   "reformat_lane_dataframe"),
+    ".synthetic_utdf": ("generate_synthetic_utdf",),
+    ".utdf_cache": ("clear_utdf_cache",),
+})
 
 __all__ = [
     # cvt utdf_lane_df_to_dict.py
     "cvt_lane_df_to_dict",
 
+    # geocoding_cache.py
+    "GeocodingCache",
+    "geocode_addresses",
+    "normalize_address",
+
     # geocoding_intersection.py
     "generate_intersection_coordinates",
     "geocoder_geocoding_from_address",
@@ -25,4 +39,10 @@ __all__ = [
     "read_UTDF",
     "generate_intersection_from_Links",
     "reformat_lane_dataframe",
+
+    # synthetic_utdf.py
+    "generate_synthetic_utdf",
+
+    # utdf_cache.py
+    "clear_utdf_cache",
 ]
@@ -7,23 +7,23 @@
 '''
 import pandas as pd
 
+from utdf2gmns.func_lib.utdf.utdf_index import cvt_utdf_table_to_intid_dict, get_utdf_lookup
+
 
 def cvt_lane_df_to_dict(df_lane: pd.DataFrame) -> dict:
     """Convert UTDF lane DataFrame to dictionary.
-    """
 
-    # get unique intersection id
-    int_id_lst = list(df_lane['INTID'].unique())
+    Args:
+        df_lane (pd.DataFrame): UTDF lane data
 
-    # convert utdf_lane dataframe to dictionary
-    lane_dict = {}
-    for int_id in int_id_lst:
-        df_lane_int = df_lane[df_lane['INTID'] == int_id]
-        df_lane_int.set_index("RECORDNAME", inplace=True)
-        del df_lane_int['INTID']
+    Returns:
+        dict: {INTID: {movement: {RECORDNAME: value}}}
+    """
 
-        lane_dict[int_id] = df_lane_int.to_dict('dict')
+    # convert utdf_lane dataframe to dictionary in one pass
+    lane_dict = cvt_utdf_table_to_intid_dict(df_lane)
 
+    for int_id in lane_dict:
         empty_key = []
         # Remove invalid turning movement
         for key in lane_dict[int_id].keys():
@@ -33,3 +33,22 @@ def cvt_lane_df_to_dict(df_lane: pd.DataFrame) -> dict:
             del lane_dict[int_id][key]
 
     return lane_dict
+
+
+def get_utdf_lane_dict(utdf_dict: dict) -> dict:
+    """Return the read-only lane dictionary of the UTDF data, converting the Lanes table only once.
+
+    The result is cached in utdf_dict and rebuilt when utdf_dict["Lanes"] is replaced.
+    Use cvt_lane_df_to_dict for a dictionary that can be modified.
+
+    Args:
+        utdf_dict (dict): the UTDF dictionary returned by read_UTDF
+
+    Returns:
+        dict: {INTID: {movement: {RECORDNAME: value}}}, empty if no Lanes data
+    """
+    def build_lane_dict() -> dict:
+        df_lane = utdf_dict.get("Lanes")
+        return {} if df_lane is None else cvt_lane_df_to_dict(df_lane)
+
+    return get_utdf_lookup(utdf_dict, "lanes", ("Lanes",), build_lane_dict)
@@ -0,0 +1,193 @@
+'''
+##############################################################
+# Created Date: Sunday, October 18th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+'''
+
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+from utdf2gmns.util_lib.instrumentation import count
+
+# file name of the geocoding cache inside a cache directory
+GEOCODING_CACHE_FILENAME = "geocoding.sqlite"
+
+# default number of threads sending geocoding requests
+DEFAULT_GEOCODING_MAX_WORKERS = 8
+
+# default upper bound of geocoding requests started per second over all threads, it suits the ArcGIS
+# geocoder used by default and still lets requests overlap. Set 1 for providers such as Nominatim
+DEFAULT_GEOCODING_MAX_REQUESTS_PER_SECOND = 10.0
+
+# the coordinates returned by a provider when an address could not be geocoded
+GEOCODING_FAILED_LNG_LAT = (0, 0)
+
+
+def normalize_address(address: str) -> str:
+    """Normalize an address so spelling variants of the same address share one cache entry.
+
+    Letters are lower-cased, repeated whitespace is collapsed and whitespace around
+    "&" and "," is removed, e.g. " Main St &  1st Ave,Tempe " -> "main st&1st ave,tempe".
+
+    Args:
+        address (str): the address to be normalized
+
+    Returns:
+        str: the normalized address
+    """
+    address = re.sub(r"\s+", " ", str(address)).strip().lower()
+    return re.sub(r"\s*([&,])\s*", r"\1", address)
+
+
+class GeocodingCache:
+    """A SQLite table of geocoded addresses, keyed by provider name and normalized address.
+
+    Only successfully geocoded addresses are saved, so an address that failed for a network
+    or service error is requested again on the next run.
+
+    Args:
+        cache_path (str): path to the SQLite file. Defaults to ":memory:", which keeps
+            the cache for the lifetime of this object only.
+    """
+
+    def __init__(self, cache_path: str = ":memory:"):
+        if cache_path != ":memory:":
+            Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+        self._cache_path = cache_path
+        self._conn = sqlite3.connect(cache_path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS geocoding ("
+            "provider TEXT NOT NULL, address TEXT NOT NULL, lng REAL NOT NULL, lat REAL NOT NULL, "
+            "PRIMARY KEY (provider, address))")
+        self._conn.commit()
+
+    def get_many(self, provider_name: str, addresses: list) -> dict:
+        """Look up normalized addresses, return {address: (lng, lat)} of the cached ones."""
+
+        lng_lat_dict = {}
+        # stay below the SQLite limit of host parameters in one statement
+        for start in range(0, len(addresses), 500):
+            chunk = addresses[start:start + 500]
+            rows = self._conn.execute(
+                f"SELECT address, lng, lat FROM geocoding WHERE provider = ? "
+                f"AND address IN ({', '.join('?' * len(chunk))})",
+                [provider_name, *chunk])
+            lng_lat_dict.update({address: (lng, lat) for address, lng, lat in rows})
+        return lng_lat_dict
+
+    def set_many(self, provider_name: str, lng_lat_dict: dict) -> None:
+        """Save {normalized address: (lng, lat)} in one transaction."""
+
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO geocoding (provider, address, lng, lat) VALUES (?, ?, ?, ?)",
+                [(provider_name, address, float(lng), float(lat))
+                 for address, (lng, lat) in lng_lat_dict.items()])
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _RateLimiter:
+    """Space out the start of calls shared by several threads to at most max_calls_per_second."""
+
+    def __init__(self, max_calls_per_second: float | None):
+        self._interval = 1 / max_calls_per_second if max_calls_per_second else 0
+        self._lock = threading.Lock()
+        self._next_time = time.monotonic()
+
+    def wait(self) -> None:
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_time - now
+            self._next_time = max(now, self._next_time) + self._interval
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+def _get_provider_name(provider: Callable) -> str:
+    """the cache namespace of a provider, the module and qualified name of the function or callable class"""
+    provider_name = getattr(provider, "__qualname__", None) or type(provider).__qualname__
+    return f"{getattr(provider, '__module__', None) or type(provider).__module__}.{provider_name}"
+
+
+def geocode_addresses(addresses: list,
+                      provider: Callable[[str], tuple] | None = None,
+                      *,
+                      cache: GeocodingCache | None = None,
+                      max_workers: int = DEFAULT_GEOCODING_MAX_WORKERS,
+                      max_requests_per_second: float | None = None,
+                      verbose: bool = False) -> dict:
+    """Geocode addresses once each, reading the cache first and requesting the misses concurrently.
+
+    Args:
+        addresses (list): addresses to be geocoded, duplicates are requested once
+        provider (Callable[[str], tuple] | None): a function returning the (lng, lat) of an address
+            and (0, 0) if the address could not be geocoded.
+            Defaults to None, which uses geocoder_geocoding_from_address.
+        cache (GeocodingCache | None): the cache of geocoded addresses. Defaults to None (no cache).
+        max_workers (int): the number of threads sending requests. Defaults to 8.
+        max_requests_per_second (float | None): the maximum number of requests started per second
+            over all threads. Defaults to None (no limit).
+        verbose (bool): whether to print the process. Defaults to False.
+
+    Returns:
+        dict: {address: (lng, lat)} of every input address, (0, 0) if it could not be geocoded
+    """
+    if provider is None:
+        from utdf2gmns.func_lib.utdf.geocoding_intersection import geocoder_geocoding_from_address
+        provider = geocoder_geocoding_from_address
+    provider_name = _get_provider_name(provider)
+
+    # {normalized address: the first spelling of it}, requests are sent with the original spelling
+    address_dict = {}
+    for address in addresses:
+        address_dict.setdefault(normalize_address(address), address)
+
+    lng_lat_dict = cache.get_many(provider_name, list(address_dict)) if cache is not None else {}
+    missed_addresses = [address for address in address_dict if address not in lng_lat_dict]
+    count("geocoding_cache_hits", len(address_dict) - len(missed_addresses))
+    count("geocoding_requests", len(missed_addresses))
+
+    if verbose:
+        print(f"  :{len(address_dict) - len(missed_addresses)} / {len(address_dict)} addresses "
+              f"loaded from geocoding cache, {len(missed_addresses)} to request")
+
+    rate_limiter = _RateLimiter(max_requests_per_second)
+
+    def _request(address: str) -> tuple:
+        rate_limiter.wait()
+        try:
+            return tuple(provider(address_dict[address]))
+        except Exception as e:
+            print(f"  :Could not geocode {address_dict[address]} with {e}")
+            return GEOCODING_FAILED_LNG_LAT
+
+    if max_workers > 1 and len(missed_addresses) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(missed_addresses))) as executor:
+            requested = dict(zip(missed_addresses, executor.map(_request, missed_addresses)))
+    else:
+        requested = {address: _request(address) for address in missed_addresses}
+    lng_lat_dict.update(requested)
+
+    if cache is not None:
+        cache.set_many(provider_name, {address: lng_lat for address, lng_lat in requested.items()
+                                       if tuple(lng_lat) != GEOCODING_FAILED_LNG_LAT})
+
+    return {address: lng_lat_dict[normalize_address(address)] for address in addresses}
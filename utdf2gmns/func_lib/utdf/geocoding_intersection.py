@@ -7,13 +7,18 @@
 
 # from geopy.geocoders import Nominatim
 # import googlemaps
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, TYPE_CHECKING
 
 # from pathlib import Path
 # import geocoder
+import numpy as np
 import pandas as pd
 import pyufunc as pf
 # from pyufunc import func_running_time
+from utdf2gmns.func_lib.utdf.geocoding_cache import (DEFAULT_GEOCODING_MAX_REQUESTS_PER_SECOND,
+                                                     DEFAULT_GEOCODING_MAX_WORKERS,
+                                                     GeocodingCache,
+                                                     geocode_addresses)
 from utdf2gmns.util_lib.pkg_utils import calculate_point2point_distance_in_km
 
 if TYPE_CHECKING:
@@ -45,21 +50,34 @@ def geocoder_geocoding_from_address(address: str) -> tuple:
     return location_lng_lat
 
 
-@pf.func_running_time
 def generate_intersection_coordinates(df_intersection: pd.DataFrame,
                                       dist_threshold: float = 0.01,
-                                      geocode_one: bool = False) -> Any:
+                                      geocode_one: bool = False,
+                                      *,
+                                      provider: Callable[[str], tuple] | None = None,
+                                      cache_path: str | None = None,
+                                      max_workers: int = DEFAULT_GEOCODING_MAX_WORKERS,
+                                      max_requests_per_second: float | None = (
+                                          DEFAULT_GEOCODING_MAX_REQUESTS_PER_SECOND)) -> Any:
     """generate_coordinates_from_intersection: geocoding intersections
 
+    Each intersection is geocoded with both orders of its street names. Addresses are looked up
+    in the geocoding cache first and the missed ones are requested concurrently.
+
     Args:
         df_intersection (pd.DataFrame): the dataframe of intersections
         dist_threshold (float): maximum distance threshold to compare two nodes,
             defaults to 0.01 (10 meters), unit: km
         geocode_one: geocoding one valid intersection, defaults to False.
+        provider (Callable[[str], tuple] | None): a function returning the (lng, lat) of an address.
+            Defaults to None, which uses geocoder_geocoding_from_address.
+        cache_path (str | None): path to the SQLite geocoding cache. Defaults to None (no cache).
+        max_workers (int): the number of threads sending geocoding requests. Defaults to 8.
+        max_requests_per_second (float | None): the maximum number of geocoding requests
+            started per second, None for no limit. Defaults to 10.0.
 
     Raises:
         Exception: intersection_name and city_name must included in the dataframe
-        Exception: geocoding intersections failed
 
     Returns:
         pd.DataFrame or dict: a dataframe of intersections with coordinates or a dictionary of one intersection
@@ -74,15 +92,7 @@ def generate_intersection_coordinates(df_intersection: pd.DataFrame,
                         " please check the input file.")
 
     # Create one column named "reversed_int_name"
-    for i in range(len(df)):
-        intersection_name_value = df.loc[i, "intersection_name"]
-        intersection_name_str = intersection_name_value if isinstance(intersection_name_value, str) else str(intersection_name_value)
-
-        if "&" in intersection_name_str:
-            int_name_lst = intersection_name_str.split("&")
-            df.loc[i, "reversed_int_name"] = int_name_lst[1] + " & " + int_name_lst[0]
-        else:
-            df.loc[i, "reversed_int_name"] = intersection_name_str
+    df["reversed_int_name"] = [_reverse_intersection_name(name) for name in df["intersection_name"]]
 
     # create two columns named "full_name_int" and "full_name_int_r" as reverse of "full_name_int"
     df["full_name_int"] = df["intersection_name"] + ", " + df["city_name"]
@@ -90,53 +100,47 @@ def generate_intersection_coordinates(df_intersection: pd.DataFrame,
 
     # Step 4: geocoding
     print("  :geocoding intersections...")
+    int_id_list = df["synchro_INTID"].tolist()
     int_full_name_list = df["full_name_int"].tolist()
     int_full_name_r_list = df["full_name_int_r"].tolist()
 
-    # the number of intersections to be geocode
-    num_intersection = len(int_full_name_list)
-    distance = []
-
-    lng_lat_full_name = []
-    lng_lat_full_name_reversed = []
-
-    for i in range(num_intersection):
-        int_id = df.loc[i, "synchro_INTID"]
-        try:
-            lng_lat = geocoder_geocoding_from_address(int_full_name_list[i])
-            lng_lat_reverse = geocoder_geocoding_from_address(int_full_name_r_list[i])
-
-            dist = calculate_point2point_distance_in_km(lng_lat, lng_lat_reverse)
-
-            if geocode_one and lng_lat != (0, 0) and lng_lat_reverse != (0, 0) and dist <= dist_threshold:
-                x_coord = lng_lat[0]
-                y_coord = lng_lat[1]
-                print(f"   :Geocode ID: {int_id}, coords: {x_coord}, {y_coord}.")
-                return {"INTID": int_id, "x_coord": x_coord, "y_coord": y_coord}
-
-            lng_lat_full_name.append(lng_lat)
-            lng_lat_full_name_reversed.append(lng_lat_reverse)
-            distance.append(dist)
-
-        except Exception as e:
-            print(f"  :Could not geocode intersection id: {int_id} with {e}")
-
-    # if not return value in the loop, which means no valid intersection is geo-coded
-    if geocode_one:
-        return {"INTID": None, "x_coord": None, "y_coord": None}
-
-    # create new column named distance_from_full_name
-    for i in range(len(df)):
-        df["distance_to_full_name"] = distance
-
-        if distance[i] <= dist_threshold:
-            df.loc[i, "x_coord"] = lng_lat_full_name[i][0]
-            df.loc[i, "y_coord"] = lng_lat_full_name_reversed[i][1]
-
-        else:
-            # use None to indicate the intersection is not able to geocode
-            df.loc[i, "x_coord"] = None
-            df.loc[i, "y_coord"] = None
+    geocode_kwargs = {"provider": provider, "max_workers": max_workers,
+                      "max_requests_per_second": max_requests_per_second}
+    with GeocodingCache(cache_path or ":memory:") as cache:
+        if geocode_one:
+            # geocode the first intersection alone, as most are valid, then a batch of intersections at a time,
+            # stop at the first valid one
+            batch_size = max(max_workers, 1)
+            batch_starts = [0, *range(1, len(int_id_list), batch_size)]
+            for start, end in zip(batch_starts, [*batch_starts[1:], len(int_id_list)]):
+                lng_lat_dict = geocode_addresses(int_full_name_list[start:end] + int_full_name_r_list[start:end],
+                                                 cache=cache, **geocode_kwargs)
+                for i in range(start, end):
+                    lng_lat = lng_lat_dict[int_full_name_list[i]]
+                    lng_lat_reverse = lng_lat_dict[int_full_name_r_list[i]]
+                    dist = calculate_point2point_distance_in_km(lng_lat, lng_lat_reverse)
+
+                    if lng_lat != (0, 0) and lng_lat_reverse != (0, 0) and dist <= dist_threshold:
+                        x_coord = lng_lat[0]
+                        y_coord = lng_lat[1]
+                        print(f"   :Geocode ID: {int_id_list[i]}, coords: {x_coord}, {y_coord}.")
+                        return {"INTID": int_id_list[i], "x_coord": x_coord, "y_coord": y_coord}
+
+            # if not return value in the loop, which means no valid intersection is geo-coded
+            return {"INTID": None, "x_coord": None, "y_coord": None}
+
+        lng_lat_dict = geocode_addresses(int_full_name_list + int_full_name_r_list, cache=cache, **geocode_kwargs)
+
+    lng_lat_full_name = np.array([lng_lat_dict[name] for name in int_full_name_list], dtype=float).reshape(-1, 2)
+    lng_lat_full_name_reversed = np.array([lng_lat_dict[name] for name in int_full_name_r_list],
+                                          dtype=float).reshape(-1, 2)
+    distance = np.array([calculate_point2point_distance_in_km(lng_lat, lng_lat_reverse)
+                         for lng_lat, lng_lat_reverse in zip(lng_lat_full_name, lng_lat_full_name_reversed)])
+
+    # use NaN to indicate the intersection is not able to geocode
+    is_geocoded = distance <= dist_threshold
+    df["x_coord"] = np.where(is_geocoded, lng_lat_full_name[:, 0], np.nan)
+    df["y_coord"] = np.where(is_geocoded, lng_lat_full_name_reversed[:, 1], np.nan)
 
     created_column_names = ["reversed_int_name", "full_name_int",
                             "full_name_intersection_reversed", "distance_to_full_name"]
@@ -150,6 +154,16 @@ def generate_intersection_coordinates(df_intersection: pd.DataFrame,
 
     return df_final
 
+
+def _reverse_intersection_name(intersection_name: Any) -> str:
+    """swap the first two street names of an intersection name, e.g. "A & B" -> "B & A" """
+
+    intersection_name_str = intersection_name if isinstance(intersection_name, str) else str(intersection_name)
+    if "&" in intersection_name_str:
+        int_name_lst = intersection_name_str.split("&")
+        return int_name_lst[1] + " & " + int_name_lst[0]
+    return intersection_name_str
+
 # def googlemaps_geocoding_from_address(address, api_key) -> tuple:
 #
 #     # initialize googlemaps client
@@ -5,22 +5,38 @@
 # Author/Copyright: Mr. Xiangyong Luo
 ##############################################################
 
+import csv
+import io
 import os
+import numpy as np
 import pandas as pd
-from pyufunc import func_running_time
 
 from utdf2gmns.util_lib.pkg_settings import utdf_categories, utdf_link_col_names
+from utdf2gmns.func_lib.utdf.utdf_cache import (DEFAULT_UTDF_CACHE_MAX_SIZE_MB,
+                                                load_utdf_cache,
+                                                save_utdf_cache,
+                                                utdf_cache_key)
+from utdf2gmns.func_lib.utdf.utdf_index import (_group_intid_row_positions,
+                                                cvt_utdf_table_to_intid_dict,
+                                                group_utdf_table_by_intid)
 
 # avoid the warning of "A value is trying to be set on a copy of a slice from a DataFrame"
 pd.options.mode.chained_assignment = None  # default='warn'
 
 
-@func_running_time
-def read_UTDF(path_utdf: str) -> dict:
+def read_UTDF(path_utdf: str,
+              *,
+              cache_dir: str = None,
+              cache_max_size_mb: float = DEFAULT_UTDF_CACHE_MAX_SIZE_MB) -> dict:
     """read the utdf.csv file and return a dictionary of dataframes
 
     Args:
         path_utdf (str): path to the utdf.csv file
+        cache_dir (str): the directory to cache the parsed tables, defaults to None (no cache).
+            The cache is keyed by the file content and package version,
+            a cached file is loaded without parsing the csv file again.
+        cache_max_size_mb (float): the maximum size of the cache directory in MB,
+            least recently used files are removed first. Defaults to 512.
 
     Example:
         >>> import utdf2gmns as ug
@@ -45,82 +61,25 @@ def read_UTDF(path_utdf: str) -> dict:
         raise ValueError(
             f"The file {path_utdf} is not a CSV file. Please provide a valid CSV file for the UTDF data.")
 
-    # read the utdf.csv file
-    with open(path_utdf, "r", encoding='utf-8') as f:
-        lines = f.readlines()
-
-    # find the start index of each category, the index is the row contain column names
-    categorical_data_beginning_index_dict = {}
-    for i in range(len(lines)):
-        if "Network" in lines[i] and utdf_categories["Network"] in lines[i + 1]:
-            categorical_data_beginning_index_dict[i + 2] = "Network"
-        elif "Nodes" in lines[i] and utdf_categories["Nodes"] in lines[i + 1]:
-            categorical_data_beginning_index_dict[i + 2] = "Nodes"
-        elif "Links" in lines[i] and utdf_categories["Links"] in lines[i + 1]:
-            categorical_data_beginning_index_dict[i + 2] = "Links"
-        elif "Lanes" in lines[i] and utdf_categories["Lanes"] in lines[i + 1]:
-            categorical_data_beginning_index_dict[i + 2] = "Lanes"
-        elif "Timeplans" in lines[i] and utdf_categories["Timeplans"] in lines[i + 1]:
-            categorical_data_beginning_index_dict[i + 2] = "Timeplans"
-        elif "Phases" in lines[i] and utdf_categories["Phases"] in lines[i + 1]:
-            categorical_data_beginning_index_dict[i + 2] = "Phases"
-        else:
-            continue
+    # load parsed tables from the cache if available
+    cache_key = None
+    if cache_dir:
+        cache_key = utdf_cache_key(path_utdf)
+        utdf_dict_data = load_utdf_cache(path_utdf, cache_dir, cache_key=cache_key)
+        if utdf_dict_data is not None:
+            return utdf_dict_data
 
-    categorical_index_ordered = sorted(
-        list(categorical_data_beginning_index_dict.keys()))  # ascending order
+    # read the utdf.csv file once and locate each category section in the raw text
+    with open(path_utdf, "r", encoding='utf-8') as f:
+        utdf_text = f.read()
 
-    # prepare dataframe for each category
+    # parse each section directly from its slice of the text
     utdf_dict_data = {}
-
-    for j in range(len(categorical_index_ordered)):
-        # get the category name from start_index_dict
-        category_name = categorical_data_beginning_index_dict[categorical_index_ordered[j]]
-
-        # if it's the last value in the list, then the end index is the end of the file
-        if j == len(categorical_index_ordered) - 1:
-            category_value = [k.split(",")
-                              for k in lines[categorical_index_ordered[j]:]]
-
-        # if it's not the last value in the list, then the end index is the start index of the next category - 2
-        else:
-            category_value = [
-                k.split(",") for k in lines[categorical_index_ordered[j]:categorical_index_ordered[j + 1] - 2]]
-
-        # save data to dictionary
-        utdf_dict_data[category_name] = pd.DataFrame(
-            category_value[1:], columns=category_value[0])
-
-    # format utdf_lane data : remove unnecessary rows with None and column with '\n'
-    # format each table in utdf_dict_data
-    for table_name, df_table_name in utdf_dict_data.items():
+    for category_name, column_line, section_text in _scan_utdf_sections(utdf_text):
         try:
-            # get the last column name from utdf_setting
-            last_col_name = list(df_table_name.columns)[-1]
-
-            # remove unnecessary rows / invalid rows with NaN
-            if table_name != "Network":
-                df_table_name = df_table_name[df_table_name["INTID"].notna()]
-                df_table_name = df_table_name[df_table_name['INTID'].astype(
-                    str).str.isdigit()]
-            else:
-                df_table_name = df_table_name[df_table_name[last_col_name].notna(
-                )]
-
-            # clean the data / remove '\n' in the end of column SW
-            df_table_name.loc[:, last_col_name] = df_table_name[last_col_name].map(
-                lambda x: x.replace("\n", ""))
-
-            df_table_name = df_table_name.rename(
-                columns={last_col_name: last_col_name.replace("\n", "")})
-
-            # drop the column with empty string
-            df_table_name = df_table_name.drop(
-                columns=[""], axis=1) if "" in df_table_name.columns else df_table_name
-
-            utdf_dict_data[table_name] = df_table_name
+            utdf_dict_data[category_name] = _read_utdf_section(category_name, column_line, section_text)
         except Exception as e:
-            print(f"Could not format table: {table_name} for {e}")
+            print(f"Could not format table: {category_name} for {e}")
             continue
 
     # update Timeplans table with three columns needed
@@ -128,10 +87,114 @@ def read_UTDF(path_utdf: str) -> dict:
     utdf_dict_data["phase_timeplans"] = spanning_phase_timeplans_data(
         utdf_dict_data)
 
+    if cache_dir:
+        save_utdf_cache(utdf_dict_data, path_utdf, cache_dir,
+                        cache_key=cache_key, max_size_mb=cache_max_size_mb)
+
     return utdf_dict_data
 
 
-@func_running_time
+def _scan_utdf_sections(utdf_text: str) -> list:
+    """Locate the Network, Nodes, Links, Lanes, Timeplans and Phases sections in UTDF text.
+
+    A section starts with a title line containing the category name (e.g. "[Lanes]"),
+    followed by the category description line (e.g. "Lane Group Data") and the
+    column name line. The section data ends right before the next section's title line.
+
+    Args:
+        utdf_text (str): the whole content of a utdf.csv file
+
+    Returns:
+        list: a list of (category_name, column_line, section_text) in file order
+    """
+
+    # {column line start: (category name, title line start)}
+    section_start_dict = {}
+    for category_name, category_desc in utdf_categories.items():
+        desc_pos = utdf_text.find(category_desc)
+        while desc_pos != -1:
+            desc_line_start = utdf_text.rfind("\n", 0, desc_pos) + 1
+            column_line_start = utdf_text.find("\n", desc_pos) + 1
+
+            # the description line must follow a title line containing the category name
+            if desc_line_start > 0 and column_line_start > 0:
+                title_line_start = utdf_text.rfind("\n", 0, desc_line_start - 1) + 1
+                if category_name in utdf_text[title_line_start:desc_line_start]:
+                    section_start_dict.setdefault(column_line_start, (category_name, title_line_start))
+
+            desc_pos = utdf_text.find(category_desc, desc_pos + len(category_desc))
+
+    column_line_start_ordered = sorted(section_start_dict)  # ascending order
+
+    section_list = []
+    for j, column_line_start in enumerate(column_line_start_ordered):
+        category_name = section_start_dict[column_line_start][0]
+
+        # the section ends at the title line of the next section or at the end of the file
+        if j == len(column_line_start_ordered) - 1:
+            section_end = len(utdf_text)
+        else:
+            section_end = section_start_dict[column_line_start_ordered[j + 1]][1]
+
+        column_line_end = utdf_text.find("\n", column_line_start, section_end)
+        if column_line_end == -1:
+            column_line_end = section_end
+
+        section_list.append((category_name,
+                             utdf_text[column_line_start:column_line_end],
+                             utdf_text[column_line_end + 1:section_end]))
+    return section_list
+
+
+def _read_utdf_section(category_name: str, column_line: str, section_text: str) -> pd.DataFrame:
+    """Parse one UTDF section into a dataframe of strings and remove invalid rows and empty columns.
+
+    Args:
+        category_name (str): the category name of the section, e.g. "Lanes"
+        column_line (str): the column name line of the section
+        section_text (str): the data rows of the section
+
+    Returns:
+        pd.DataFrame: a dataframe of the section data
+    """
+
+    col_names = column_line.split(",")
+
+    # only parse named columns, the trailing columns with empty names are padding
+    col_index_used = [i for i, col_name in enumerate(col_names) if col_name != ""]
+    df_table = pd.DataFrame(columns=[col_names[i] for i in col_index_used], dtype=str)
+    is_last_col_missing = np.zeros(0, dtype=bool)
+
+    if section_text:
+        df_table = pd.read_csv(io.StringIO(section_text),
+                               sep=",",
+                               header=None,
+                               names=range(len(col_names)),
+                               usecols=col_index_used,
+                               index_col=False,
+                               dtype=str,
+                               na_filter=False,
+                               skip_blank_lines=False,
+                               quoting=csv.QUOTE_NONE)
+        df_table.columns = [col_names[i] for i in col_index_used]
+        is_last_col_missing = np.zeros(len(df_table), dtype=bool)
+
+        # rows shorter than the column line have missing values at the end, not empty strings
+        if section_text.count(",") != (len(col_names) - 1) * len(df_table):
+            row_lines = section_text.split("\n")
+            if row_lines[-1] == "":
+                row_lines.pop()
+            field_counts = np.array([row.count(",") + 1 for row in row_lines])
+            if len(field_counts) == len(df_table):
+                df_table = df_table.mask(np.array(col_index_used) >= field_counts[:, None])
+                is_last_col_missing = field_counts < len(col_names)
+
+    # remove unnecessary rows / invalid rows with NaN
+    if category_name != "Network":
+        return df_table[df_table["INTID"].fillna("").astype(str).str.isdigit()]
+    return df_table[~is_last_col_missing]
+
+
 def generate_intersection_from_Links(df_link: pd.DataFrame, city_name: str) -> pd.DataFrame:
     """generate_intersection_data_from_utdf: convert utdf links to intersection
 
@@ -155,21 +218,21 @@ def generate_intersection_from_Links(df_link: pd.DataFrame, city_name: str) -> p
     # df_link = df_link.rename(columns={"SW\n": "SW"})
     # df_link["SW"] = df_link["SW"].map(lambda x: x.replace("\n", ""))
 
-    # get the unique link id
-    link_id = df_link["INTID"].unique().tolist()
-
     # generate link dictionary in format of: {link_id: {RECORDNAME:{columns:values}}}
+    link_col_names = df_link.columns.tolist()
+    link_values = df_link.to_numpy(dtype=object)
+    record_name_pos = link_col_names.index("RECORDNAME")
+    int_id_pos = link_col_names.index("INTID")
+
     df_link_dict = {}
-    for single_id in link_id:
-        df_single_id = df_link[df_link["INTID"] == single_id]
-        record_name = df_single_id["RECORDNAME"].unique().tolist()
+    for positions in _group_intid_row_positions(df_link).values():
         df_single_id_dict = {}
-        for name in record_name:
-            # convert one row of dataframe to dictionary
-            df_single_id_name = df_single_id[df_single_id["RECORDNAME"] == name].to_dict("records")[
-                0]
-            df_single_id_dict[name] = df_single_id_name
-        df_link_dict[single_id] = df_single_id_dict
+        single_id_rows = link_values[positions].tolist()
+        for row in single_id_rows:
+            # convert one row of dataframe to dictionary, keep the first row of each record name
+            if row[record_name_pos] not in df_single_id_dict:
+                df_single_id_dict[row[record_name_pos]] = dict(zip(link_col_names, row))
+        df_link_dict[single_id_rows[0][int_id_pos]] = df_single_id_dict
 
     # prepare intersection dataframe
     sequenced_intersection_id = 0
@@ -238,17 +301,17 @@ def spanning_phase_timeplans_data(utdf_dict_data: dict, isSimpleCol: bool = True
     if "INTID" not in df_phase.columns or "INTID" not in df_timeplans.columns:
         return pd.DataFrame()
 
-    # get unique intersection id
-    intersection_id = df_phase["INTID"].unique().tolist()
+    # group both tables by intersection id once
+    timeplans_groups = group_utdf_table_by_intid(df_timeplans)
 
     final_spanned_list = []
 
-    for INTID in intersection_id:
+    for int_id, df_phase_single_id in group_utdf_table_by_intid(df_phase).items():
+        INTID = df_phase_single_id["INTID"].iloc[0]
 
         # get utdf_phase dataframe by id
-        df_phase_single_id = df_phase[df_phase["INTID"]
-                                      == INTID].reset_index(drop=True)
-        df_timeplans_single_id = df_timeplans[df_timeplans["INTID"] == INTID].reset_index(
+        df_phase_single_id = df_phase_single_id.reset_index(drop=True)
+        df_timeplans_single_id = timeplans_groups.get(int_id, df_timeplans.iloc[0:0]).reset_index(
             drop=True)
 
         df_phase_single_id_dict = df_phase_single_id.to_dict("list")
@@ -310,15 +373,10 @@ def reformat_lane_dataframe(utdf_dict_data: dict) -> pd.DataFrame:
     # get utdf_lane data
     df_lane = utdf_dict_data["Lanes"]
 
-    # get unique intersection id
-    intersection_id_list = list(df_lane["INTID"].unique())
-
-    # convert utdf_lane dataframe to dictionary
-    lane_dict = []
-    for intersection_id in intersection_id_list:
-        df_lane_intersection_id = df_lane[df_lane["INTID"] == intersection_id]
-        df_lane_intersection_id.set_index("RECORDNAME", inplace=True)
-        lane_dict.append(df_lane_intersection_id.to_dict("dict"))
+    # convert utdf_lane dataframe to dictionary in one pass
+    lane_dict_by_intid = cvt_utdf_table_to_intid_dict(df_lane, drop_cols=())
+    intersection_id_list = list(lane_dict_by_intid.keys())
+    lane_dict = list(lane_dict_by_intid.values())
 
     # reformat lane_dict to dataframe
     df_lane_formatted = pd.DataFrame(lane_dict)
@@ -0,0 +1,281 @@
+'''
+##############################################################
+# Created Date: Sunday, October 18th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+'''
+
+import math
+import os
+import random
+
+SYNTHETIC_LAYOUTS = ("grid", "arterial")
+
+# approach direction: (x step, y step) from the intersection to the upstream node, Y increases to the north
+APPROACH_UPSTREAM_STEPS = {"NB": (0, -1), "SB": (0, 1), "EB": (-1, 0), "WB": (1, 0)}
+
+# approach direction: {turn: the direction of the downstream node from the intersection}
+APPROACH_TURN_STEPS = {
+    "NB": {"L": (-1, 0), "T": (0, 1), "R": (1, 0)},
+    "SB": {"L": (1, 0), "T": (0, -1), "R": (-1, 0)},
+    "EB": {"L": (0, 1), "T": (1, 0), "R": (0, -1)},
+    "WB": {"L": (0, -1), "T": (-1, 0), "R": (0, 1)},
+}
+
+# NEMA phase of the left turn and through movement of each approach
+APPROACH_PHASES = {"NB": (5, 2), "SB": (1, 6), "EB": (3, 8), "WB": (7, 4)}
+
+LANE_COLUMNS = [f"{approach}{turn}" for approach in APPROACH_TURN_STEPS for turn in ("L", "T", "R")]
+
+NETWORK_SETTINGS = [
+    ("UTDFVERSION", "8"), ("Metric", "0"), ("yellowTime", "3.5"), ("allRedTime", "1.0"), ("Walk", "7.0"),
+    ("DontWalk", "11.0"), ("HV", "0.02"), ("PHF", "0.92"), ("DefWidth", "12"), ("DefFlow", "1900"),
+    ("vehLength", "25"), ("heavyvehlength", "45"), ("criticalgap", "4.5"), ("followuptime", "2.5"),
+    ("stopthresholdspeed", "5.0"), ("criticalmergegap", "3.7"), ("growth", "1.00"), ("PedSpeed", "3.5"),
+    ("LostTimeAdjust", "0.0"), ("ScenarioDate", "01/01/2026"), ("ScenarioTime", "9:00 am"),
+]
+
+# Lane Group records written with the same (left, through, right) values for every approach
+LANE_RECORD_TEMPLATE = {
+    "Width": ("12", "12", "12"), "Storage": ("", "", ""), "Taper": ("", "", ""), "StLanes": ("", "", ""),
+    "Grade": ("", "", ""), "LostTime": ("6", "5.3", "4"), "Lost Time Adjust": ("0", "0", "0"),
+    "IdealFlow": ("1900", "1900", "1900"), "Allow RTOR": ("1", "1", "1"), "SatFlowRTOR": ("0", "5", "0"),
+    "Peds": ("0", "0", "0"), "Bicycles": ("0", "0", "0"), "PHF": ("0.92", "0.92", "0.92"),
+    "Growth": ("100", "100", "100"), "HeavyVehicles": ("2", "2", "2"), "BusStops": ("0", "0", "0"),
+    "Midblock": ("", "0", ""), "Right Channeled": ("", "", "0"), "Alignment": ("0", "0", "1"),
+    "Enter Blocked": ("0", "0", "0"), "HeadwayFact": ("1.00", "1.00", "1.00"), "Turning Speed": ("15", "60", "9"),
+    "FirstDetect": ("20", "100", ""), "LastDetect": ("0", "0", ""), "DetectPhase2": ("0", "0", ""),
+    "DetectPhase3": ("0", "0", ""), "DetectPhase4": ("0", "0", ""), "SwitchPhase": ("0", "0", ""),
+    "numDetects": ("1", "2", ""), "DetectPos1": ("0", "0", ""), "DetectSize1": ("20", "6", ""),
+    "DetectType1": ("3", "3", ""), "DetectExtend1": ("0", "0", ""), "DetectQueue1": ("0", "0", ""),
+    "DetectDelay1": ("0", "0", ""), "DetectPos2": ("", "94", ""), "DetectSize2": ("", "6", ""),
+    "DetectType2": ("", "3", ""), "DetectExtend2": ("", "0", ""), "Exit Lanes": ("", "0", ""),
+    "CBD": ("", "0", ""),
+}
+
+LANE_RECORD_ORDER = [
+    "Up Node", "Dest Node", "Lanes", "Shared", "Width", "Storage", "Taper", "StLanes", "Grade", "Speed",
+    "Phase1", "LostTime", "Lost Time Adjust", "IdealFlow", "SatFlow", "SatFlowPerm", "Allow RTOR",
+    "SatFlowRTOR", "Volume", "Peds", "Bicycles", "PHF", "Growth", "HeavyVehicles", "BusStops", "Midblock",
+    "Distance", "TravelTime", "Right Channeled", "Alignment", "Enter Blocked", "HeadwayFact", "Turning Speed",
+    "FirstDetect", "LastDetect", "DetectPhase1", "DetectPhase2", "DetectPhase3", "DetectPhase4", "SwitchPhase",
+    "numDetects", "DetectPos1", "DetectSize1", "DetectType1", "DetectExtend1", "DetectQueue1", "DetectDelay1",
+    "DetectPos2", "DetectSize2", "DetectType2", "DetectExtend2", "Exit Lanes", "CBD", "Lane Group Flow",
+]
+
+# eight phase dual ring timing, phases D1 to D8, of a 73.2 seconds cycle with zero offset
+SIGNAL_CYCLE_LENGTH = 73.2
+PHASE_RECORD_TEMPLATE = {
+    "BRP": ("111", "112", "211", "212", "121", "122", "221", "222"),
+    "MinGreen": ("6", "20", "6", "6", "6", "20", "6", "6"),
+    "MaxGreen": ("6", "20", "6", "18", "6", "20", "6", "18"),
+    "VehExt": ("3",) * 8,
+    "TimeBeforeReduce": ("0",) * 8,
+    "TimeToReduce": ("0",) * 8,
+    "MinGap": ("3",) * 8,
+    "Yellow": ("3", "4.3", "3", "3.6", "3", "4.3", "3", "3.6"),
+    "AllRed": ("3", "1", "3", "2.3", "3", "1", "2.9", "1.5"),
+    "Recall": ("3",) * 8,
+    "Walk": ("", "7", "", "7", "", "7", "", "7"),
+    "DontWalk": ("", "11", "", "11", "", "11", "", "11"),
+    "PedCalls": ("", "0", "", "0", "", "0", "", "0"),
+    "MinSplit": ("12", "25.3", "12", "23.9", "12", "25.3", "11.9", "23.1"),
+    "DualEntry": ("0", "1", "0", "1", "0", "1", "0", "1"),
+    "InhibitMax": ("1",) * 8,
+}
+PHASE_LOCAL_START = (61.2, 0, 25.3, 37.3, 61.2, 0, 25.3, 37.2)
+PHASE_LOCAL_YIELD = (67.2, 20, 31.3, 55.3, 67.2, 20, 31.3, 56.1)
+PHASE_LOCAL_YIELD170 = (67.2, 9, 31.3, 44.3, 67.2, 9, 31.3, 45.1)
+PHASE_ACT_GREEN = ("6", "20", "6", "18", "6", "20", "6", "18.9")
+
+# link records after Up ID, Lanes, Name, Distance, Speed and Time, with their default values
+LINK_DEFAULT_RECORDS = [
+    ("Grade", "0"), ("Median", "12"), ("Offset", "0"), ("TWLTL", "0"), ("Crosswalk Width", "16"),
+    ("Mandatory Distance", "200"), ("Mandatory Distance2", "1980"), ("Positioning Distance", "1320"),
+    ("Positioning Distance2", "2640"), ("Curve Pt X", ""), ("Curve Pt Y", ""), ("Curve Pt Z", ""),
+    ("Link Is Hidden", "false"), ("Street Name Is Hidden", "false"),
+]
+
+
+def generate_synthetic_utdf(path_utdf: str,
+                            num_intersections: int,
+                            *,
+                            layout: str = "grid",
+                            spacing_ft: float = 1320,
+                            seed: int = 0) -> str:
+    """Write a synthetic UTDF file of a grid or arterial network of signalized intersections.
+
+    Every intersection has four approaches with a left-turn lane and through lanes shared with the right turn,
+    and runs an eight phase dual ring plan. Boundary approaches start at unsignalized external nodes.
+    Offsets and turning volumes are drawn from a random generator, so the same seed writes the same file.
+
+    Args:
+        path_utdf (str): path of the UTDF csv file to write
+        num_intersections (int): the number of signalized intersections
+        layout (str): "grid" places the intersections in a near-square grid of two-lane streets,
+            "arterial" places them along one north-south arterial with short cross streets. Defaults to "grid".
+        spacing_ft (float): the distance between adjacent intersections in feet. Defaults to 1320.
+        seed (int): the seed of the random volumes and offsets. Defaults to 0.
+
+    Raises:
+        ValueError: layout must be one of SYNTHETIC_LAYOUTS
+        ValueError: num_intersections must be a positive integer
+
+    Example:
+        >>> from utdf2gmns.func_lib.utdf.synthetic_utdf import generate_synthetic_utdf
+        >>> generate_synthetic_utdf("grid_100.csv", 100, layout="grid")
+        >>> utdf_dict = read_UTDF("grid_100.csv")
+
+    Returns:
+        str: path_utdf
+    """
+    if layout not in SYNTHETIC_LAYOUTS:
+        raise ValueError(f"layout must be one of {SYNTHETIC_LAYOUTS}")
+    if not isinstance(num_intersections, int) or num_intersections < 1:
+        raise ValueError("num_intersections must be a positive integer")
+
+    rng = random.Random(seed)
+
+    # {(column, row): intersection id}, intersections are numbered row by row from the south-west
+    num_cols = 1 if layout == "arterial" else math.ceil(math.sqrt(num_intersections))
+    int_ids = {(i % num_cols, i // num_cols): i + 1 for i in range(num_intersections)}
+
+    # {node id: (column, row, node type)} in grid units, external nodes sit outside the boundary intersections
+    nodes = {int_id: (col, row, 0) for (col, row), int_id in int_ids.items()}
+    external_ids = {}
+    # {external node id: (approach direction of its inbound link, intersection id upstream)}
+    external_inbound = {}
+    upstream_approaches = {step: approach for approach, step in APPROACH_UPSTREAM_STEPS.items()}
+    for (col, row), int_id in int_ids.items():
+        for step_x, step_y in APPROACH_UPSTREAM_STEPS.values():
+            neighbor_cell = (col + step_x, row + step_y)
+            if neighbor_cell in int_ids or (int_id, neighbor_cell) in external_ids:
+                continue
+            node_id = num_intersections + len(external_ids) + 1
+            external_ids[(int_id, neighbor_cell)] = node_id
+            external_inbound[node_id] = (upstream_approaches[(-step_x, -step_y)], int_id)
+            # cross streets of an arterial end a short distance from the arterial
+            distance_scale = 0.25 if layout == "arterial" and step_x else 0.5
+            nodes[node_id] = (col + step_x * distance_scale, row + step_y * distance_scale, 1)
+
+    def neighbor_id(int_id: int, col: int, row: int, step: tuple) -> int:
+        neighbor_cell = (col + step[0], row + step[1])
+        return int_ids.get(neighbor_cell) or external_ids[(int_id, neighbor_cell)]
+
+    def street_name(col: float, row: float, is_north_south: bool) -> str:
+        if layout == "arterial":
+            return "Main St" if is_north_south else f"Cross St {round(row) + 1}"
+        return f"Street {round(col) + 1}" if is_north_south else f"Avenue {round(row) + 1}"
+
+    def num_through_lanes(is_north_south: bool) -> int:
+        return 2 if layout == "grid" or is_north_south else 1
+
+    def link_distance(node_a: int, node_b: int) -> int:
+        return round(math.dist(nodes[node_a][:2], nodes[node_b][:2]) * spacing_ft)
+
+    lines = ["[Network]", "Network Settings", "RECORDNAME,DATA"]
+    lines.extend(f"{name},{value}" for name, value in NETWORK_SETTINGS)
+
+    lines.extend(["", "[Nodes]", "Node Data",
+                  "INTID,TYPE,X,Y,Z,DESCRIPTION,CBD,Inside Radius,Outside Radius,Roundabout Lanes,Circle Speed"])
+    for node_id, (col, row, node_type) in nodes.items():
+        lines.append(f"{node_id},{node_type},{round(col * spacing_ft)},{round(row * spacing_ft)},0,,,,,,")
+
+    # links are listed at their downstream node, by the direction they travel
+    lines.extend(["", "[Links]", "Link Data", "RECORDNAME,INTID,NB,SB,EB,WB"])
+    for node_id, (col, row, node_type) in nodes.items():
+        link_columns = {}
+        for approach, (step_x, step_y) in APPROACH_UPSTREAM_STEPS.items():
+            if node_type == 0:
+                up_id = neighbor_id(node_id, col, row, (step_x, step_y))
+            elif external_inbound[node_id][0] == approach:
+                # the only link into an external node comes from its intersection
+                up_id = external_inbound[node_id][1]
+            else:
+                continue
+            is_north_south = approach in ("NB", "SB")
+            through_lanes = num_through_lanes(is_north_south)
+            speed = 45 if is_north_south or layout == "grid" else 35
+            distance = link_distance(up_id, node_id)
+            link_columns[approach] = {
+                "Up ID": up_id,
+                "Lanes": through_lanes + 1 if node_type == 0 else through_lanes,
+                "Name": street_name(col, row, is_north_south),
+                "Distance": distance,
+                "Speed": speed,
+                "Time": f"{distance / (speed * 5280 / 3600):.1f}",
+            }
+        record_values = [(name, {approach: values[name] for approach, values in link_columns.items()})
+                         for name in ("Up ID", "Lanes", "Name", "Distance", "Speed", "Time")]
+        record_values.extend((name, dict.fromkeys(link_columns, value)) for name, value in LINK_DEFAULT_RECORDS)
+        for name, values in record_values:
+            lines.append(",".join([name, str(node_id)] + [str(values.get(approach, ""))
+                                                           for approach in APPROACH_UPSTREAM_STEPS]))
+
+    lines.extend(["", "[Lanes]", "Lane Group Data", "RECORDNAME,INTID," + ",".join(LANE_COLUMNS) + ",PED,HOLD"])
+    for (col, row), int_id in int_ids.items():
+        lane_values = {name: [] for name in LANE_RECORD_ORDER}
+        for approach, turn_steps in APPROACH_TURN_STEPS.items():
+            is_north_south = approach in ("NB", "SB")
+            through_lanes = num_through_lanes(is_north_south)
+            up_id = neighbor_id(int_id, col, row, APPROACH_UPSTREAM_STEPS[approach])
+            left_phase, through_phase = APPROACH_PHASES[approach]
+            volumes = (rng.randint(50, 250), rng.randint(200, 500) * through_lanes, rng.randint(50, 300))
+            for turn_pos, (turn, step) in enumerate(turn_steps.items()):
+                is_through = turn == "T"
+                lane_values["Up Node"].append(up_id)
+                lane_values["Dest Node"].append(neighbor_id(int_id, col, row, step))
+                lane_values["Lanes"].append({"L": 1, "T": through_lanes, "R": 0}[turn])
+                lane_values["Shared"].append({"L": "0", "T": "2", "R": ""}[turn])
+                lane_values["Speed"].append(45 if is_through else "")
+                lane_values["Phase1"].append({"L": left_phase, "T": through_phase, "R": ""}[turn])
+                lane_values["SatFlow"].append({"L": 1770, "T": 1760 * through_lanes, "R": 0}[turn])
+                lane_values["SatFlowPerm"].append({"L": 1770, "T": 1760 * through_lanes, "R": 0}[turn])
+                lane_values["Volume"].append(volumes[turn_pos])
+                lane_values["Distance"].append(link_distance(up_id, int_id) if is_through else "")
+                lane_values["TravelTime"].append(
+                    f"{link_distance(up_id, int_id) / (45 * 5280 / 3600):.1f}" if is_through else "")
+                lane_values["DetectPhase1"].append({"L": left_phase, "T": through_phase, "R": ""}[turn])
+                lane_values["Lane Group Flow"].append(
+                    {"L": round(volumes[0] / 0.92), "T": round((volumes[1] + volumes[2]) / 0.92), "R": 0}[turn])
+                for name, template_values in LANE_RECORD_TEMPLATE.items():
+                    lane_values[name].append(template_values[turn_pos])
+        for name in LANE_RECORD_ORDER:
+            lines.append(",".join([name, str(int_id)] + [str(value) for value in lane_values[name]] + ["", ""]))
+
+    offsets = {int_id: round(rng.uniform(0, SIGNAL_CYCLE_LENGTH), 1) for int_id in int_ids.values()}
+
+    lines.extend(["", "[Timeplans]", "Timing Plan Settings", "RECORDNAME,INTID,DATA"])
+    for int_id in int_ids.values():
+        for name, value in (("Control Type", 0), ("Cycle Length", SIGNAL_CYCLE_LENGTH), ("Lock Timings", 0),
+                            ("Referenced To", 0), ("Reference Phase", 206), ("Offset", offsets[int_id]),
+                            ("Master", 0), ("Yield", 0), ("Node 0", int_id), ("Node 1", 0)):
+            lines.append(f"{name},{int_id},{value}")
+
+    lines.extend(["", "[Phases]", "Phasing Data", "RECORDNAME,INTID,D1,D2,D3,D4,D5,D6,D7,D8"])
+    for int_id in int_ids.values():
+        offset = offsets[int_id]
+
+        def shift(local_times: tuple) -> list:
+            return [f"{(local_time + offset) % SIGNAL_CYCLE_LENGTH:.1f}" for local_time in local_times]
+
+        clearance = [float(yellow) + float(all_red) for yellow, all_red in
+                     zip(PHASE_RECORD_TEMPLATE["Yellow"], PHASE_RECORD_TEMPLATE["AllRed"])]
+        phase_records = dict(PHASE_RECORD_TEMPLATE)
+        phase_records["Start"] = shift(PHASE_LOCAL_START)
+        phase_records["End"] = shift([local_yield + clearance[i] for i, local_yield in enumerate(PHASE_LOCAL_YIELD)])
+        phase_records["Yield"] = shift(PHASE_LOCAL_YIELD)
+        phase_records["Yield170"] = shift(PHASE_LOCAL_YIELD170)
+        phase_records["LocalStart"] = [f"{local_time:g}" for local_time in PHASE_LOCAL_START]
+        phase_records["LocalYield"] = [f"{local_time:g}" for local_time in PHASE_LOCAL_YIELD]
+        phase_records["LocalYield170"] = [f"{local_time:g}" for local_time in PHASE_LOCAL_YIELD170]
+        phase_records["ActGreen"] = PHASE_ACT_GREEN
+        for name, values in phase_records.items():
+            lines.append(",".join([name, str(int_id), *values]))
+    lines.append("")
+
+    os.makedirs(os.path.dirname(os.path.abspath(path_utdf)), exist_ok=True)
+    with open(path_utdf, "w", encoding="utf-8", newline="\n") as f:
+        f.write("\n".join(lines) + "\n")
+    return path_utdf
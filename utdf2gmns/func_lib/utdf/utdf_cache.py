@@ -0,0 +1,242 @@
+'''
+##############################################################
+# Created Date: Sunday, October 18th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+'''
+
+import hashlib
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# tables saved in the cache, the same keys as returned by read_UTDF
+UTDF_CACHE_TABLES = ("Network", "Nodes", "Links", "Lanes", "Timeplans", "Phases", "phase_timeplans")
+
+# default upper bound of the cache directory size, in MB
+DEFAULT_UTDF_CACHE_MAX_SIZE_MB = 512
+
+# bump when the layout of the cache file changes
+UTDF_CACHE_FORMAT_VERSION = "1"
+
+
+def utdf_cache_key(path_utdf: str) -> str:
+    """Generate the cache key of a utdf.csv file from its content, the package version and pandas version.
+
+    Args:
+        path_utdf (str): path to the utdf.csv file
+
+    Returns:
+        str: a sha256 hex digest
+    """
+    from utdf2gmns import __version__
+
+    sha = hashlib.sha256()
+    with open(path_utdf, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha.update(chunk)
+    sha.update(f"|utdf2gmns={__version__}|pandas={pd.__version__}|format={UTDF_CACHE_FORMAT_VERSION}".encode())
+    return sha.hexdigest()
+
+
+def load_utdf_cache(path_utdf: str, cache_dir: str, *, cache_key: str = None) -> dict | None:
+    """Load the parsed UTDF tables of a utdf.csv file from the cache directory.
+
+    Args:
+        path_utdf (str): path to the utdf.csv file
+        cache_dir (str): the cache directory
+        cache_key (str): the cache key if already calculated. Defaults to None.
+
+    Returns:
+        dict | None: a dictionary of dataframes, None if the file is not cached
+    """
+    path_cache = Path(cache_dir) / f"{cache_key or utdf_cache_key(path_utdf)}.npz"
+    if not path_cache.is_file():
+        return None
+
+    try:
+        with np.load(path_cache, allow_pickle=False) as npz_data:
+            utdf_dict_data = _npz_to_tables(npz_data)
+    except Exception as e:
+        print(f"  :Could not load UTDF cache {path_cache.name} for {e}, re-parse the UTDF file.")
+        path_cache.unlink(missing_ok=True)
+        return None
+
+    # mark as recently used for LRU eviction
+    os.utime(path_cache)
+    return utdf_dict_data
+
+
+def save_utdf_cache(utdf_dict_data: dict,
+                    path_utdf: str,
+                    cache_dir: str,
+                    *,
+                    cache_key: str = None,
+                    max_size_mb: float = DEFAULT_UTDF_CACHE_MAX_SIZE_MB) -> bool:
+    """Save the parsed UTDF tables to the cache directory and evict least recently used files.
+
+    Args:
+        utdf_dict_data (dict): a dictionary of dataframes returned by read_UTDF
+        path_utdf (str): path to the utdf.csv file
+        cache_dir (str): the cache directory
+        cache_key (str): the cache key if already calculated. Defaults to None.
+        max_size_mb (float): the maximum size of the cache directory in MB.
+            Defaults to DEFAULT_UTDF_CACHE_MAX_SIZE_MB.
+
+    Returns:
+        bool: True if the tables are saved
+    """
+    table_names = [table_name for table_name in UTDF_CACHE_TABLES if table_name in utdf_dict_data]
+
+    try:
+        npz_data = _tables_to_npz(utdf_dict_data, table_names)
+    except ValueError as e:
+        print(f"  :Could not cache UTDF tables for {e}")
+        return False
+
+    path_cache = Path(cache_dir) / f"{cache_key or utdf_cache_key(path_utdf)}.npz"
+
+    # write to a temporary file first so a partially written cache is never loaded
+    path_tmp = path_cache.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        with open(path_tmp, "wb") as f:
+            np.savez_compressed(f, **npz_data)
+        os.replace(path_tmp, path_cache)
+    except OSError as e:
+        # the cache is optional, a failed write should not fail reading the UTDF file
+        print(f"  :Could not save UTDF cache to {cache_dir} for {e}")
+        try:
+            path_tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return False
+
+    evict_utdf_cache(cache_dir, max_size_mb=max_size_mb, keep=(path_cache.name,))
+    return True
+
+
+def evict_utdf_cache(cache_dir: str,
+                     *,
+                     max_size_mb: float = DEFAULT_UTDF_CACHE_MAX_SIZE_MB,
+                     keep: tuple = ()) -> list:
+    """Remove least recently used cache files until the cache directory fits in max_size_mb.
+
+    Args:
+        cache_dir (str): the cache directory
+        max_size_mb (float): the maximum size of the cache directory in MB.
+            Defaults to DEFAULT_UTDF_CACHE_MAX_SIZE_MB.
+        keep (tuple): file names that should not be removed. Defaults to ().
+
+    Returns:
+        list: the removed file names
+    """
+    cache_files = sorted(Path(cache_dir).glob("*.npz"), key=lambda path: path.stat().st_mtime)
+    total_size = sum(path.stat().st_size for path in cache_files)
+    max_size = max_size_mb * 1024 * 1024
+
+    removed = []
+    for path in cache_files:
+        if total_size <= max_size:
+            break
+        if path.name in keep:
+            continue
+        total_size -= path.stat().st_size
+        path.unlink(missing_ok=True)
+        removed.append(path.name)
+    return removed
+
+
+def clear_utdf_cache(cache_dir: str) -> int:
+    """Remove all cached UTDF tables in the cache directory.
+
+    Args:
+        cache_dir (str): the cache directory
+
+    Returns:
+        int: the number of removed files
+    """
+    return len(evict_utdf_cache(cache_dir, max_size_mb=0))
+
+
+def _tables_to_npz(utdf_dict_data: dict, table_names: list) -> dict:
+    """Convert dataframes to arrays without Python objects, so they can be loaded with allow_pickle=False.
+
+    String columns of all tables share one vocabulary of unique values. Each table saves its
+    string columns as one 2D array of integer codes (-1 for missing values), so loading is
+    a take on the vocabulary instead of creating every string again.
+    """
+    npz_data = {"tables": np.array(table_names, dtype=str)}
+
+    # {table name: object array of string columns, shape (n_rows, n_str_cols)}
+    str_table_values = {}
+    for table_name in table_names:
+        df = utdf_dict_data[table_name]
+        if not df.columns.is_unique:
+            raise ValueError(f"duplicate column names in table {table_name}")
+
+        npz_data[f"{table_name}.columns"] = np.array(df.columns.tolist(), dtype=str)
+        npz_data[f"{table_name}.dtypes"] = np.array([str(dtype) for dtype in df.dtypes], dtype=str)
+
+        if isinstance(df.index, pd.RangeIndex):
+            npz_data[f"{table_name}.range_index"] = np.array([df.index.start, df.index.stop, df.index.step])
+        elif pd.api.types.is_integer_dtype(df.index.dtype):
+            npz_data[f"{table_name}.index"] = df.index.to_numpy(dtype=np.int64)
+        else:
+            raise ValueError(f"non-integer index in table {table_name}")
+
+        str_col_pos = []
+        for i, col_name in enumerate(df.columns):
+            if pd.api.types.is_numeric_dtype(df[col_name].dtype):
+                npz_data[f"{table_name}.{i}"] = df[col_name].to_numpy()
+            else:
+                str_col_pos.append(i)
+        npz_data[f"{table_name}.str_cols"] = np.array(str_col_pos, dtype=np.int64)
+        str_table_values[table_name] = df.iloc[:, str_col_pos].to_numpy(dtype=object)
+
+    codes, vocab = pd.factorize(np.concatenate([values.ravel() for values in str_table_values.values()]))
+    if not all(isinstance(value, str) for value in vocab):
+        raise ValueError("non-string values in string columns")
+
+    codes = codes.astype(np.int32 if len(vocab) >= np.iinfo(np.int16).max else np.int16)
+    npz_data["vocab"] = np.array(vocab.tolist(), dtype=str)
+
+    code_start = 0
+    for table_name, values in str_table_values.items():
+        npz_data[f"{table_name}.codes"] = codes[code_start:code_start + values.size].reshape(values.shape)
+        code_start += values.size
+    return npz_data
+
+
+def _npz_to_tables(npz_data) -> dict:
+    """Convert the arrays saved by _tables_to_npz back to dataframes."""
+
+    # the last entry is used for missing values, code -1
+    vocab = np.append(npz_data["vocab"].astype(object), np.nan)
+
+    utdf_dict_data = {}
+    for table_name in npz_data["tables"].tolist():
+        col_names = npz_data[f"{table_name}.columns"].tolist()
+        dtypes = npz_data[f"{table_name}.dtypes"].tolist()
+
+        if f"{table_name}.range_index" in npz_data:
+            index = pd.RangeIndex(*npz_data[f"{table_name}.range_index"].tolist())
+        else:
+            index = pd.Index(npz_data[f"{table_name}.index"])
+
+        str_values = vocab[npz_data[f"{table_name}.codes"]]
+        str_col_pos = {i: j for j, i in enumerate(npz_data[f"{table_name}.str_cols"].tolist())}
+
+        col_values = {}
+        for i, dtype in enumerate(dtypes):
+            values = str_values[:, str_col_pos[i]] if i in str_col_pos else npz_data[f"{table_name}.{i}"]
+            col_values[i] = pd.Series(values, index=index, dtype=dtype)
+
+        df = pd.DataFrame(col_values, index=index)
+        if col_names:
+            df.columns = col_names
+        utdf_dict_data[table_name] = df
+    return utdf_dict_data
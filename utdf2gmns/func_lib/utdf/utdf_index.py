@@ -0,0 +1,231 @@
+'''
+##############################################################
+# Created Date: Sunday, October 18th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+'''
+
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+BLANK_TEXT_VALUES = {"", "nan", "none", "null"}
+
+# per-intersection row groups of UTDF tables, cached in utdf_dict
+UTDF_INTID_INDEX_CACHE_KEY = "utdf_intid_index"
+UTDF_INTID_INDEX_TABLES = ("Links", "Lanes", "Timeplans", "Phases")
+
+# read-only nested lookups converted from UTDF tables, cached in utdf_dict
+UTDF_LOOKUP_CACHE_KEY = "utdf_lookups"
+
+
+def _normalize_intid(value: object) -> str:
+    """Return a stable UTDF intersection id string, e.g. "012" and 12.0 -> "12"."""
+    if value is None or str(value).strip().lower() in BLANK_TEXT_VALUES:
+        return ""
+
+    int_id = str(value).strip()
+    try:
+        numeric_int_id = float(int_id)
+    except ValueError:
+        return int_id
+
+    return str(int(numeric_int_id)) if numeric_int_id.is_integer() else int_id
+
+
+def _group_intid_row_positions(df_table: pd.DataFrame) -> dict:
+    """Locate the row positions of each intersection of a UTDF table in one pass.
+
+    Intersections are ordered by first appearance and positions are in the original row order.
+    Rows without INTID are skipped.
+
+    Returns:
+        dict: {normalized INTID: np.ndarray of row positions}
+    """
+    if df_table is None or "INTID" not in df_table.columns or df_table.empty:
+        return {}
+
+    row_codes, int_ids = pd.factorize(df_table["INTID"])
+
+    # INTID values normalized to the same id (e.g. "01" and "1") belong to one group
+    group_code_dict = {}
+    int_id_group_codes = np.array([group_code_dict.setdefault(_normalize_intid(int_id), len(group_code_dict))
+                                   for int_id in int_ids] + [-1], dtype=np.int64)
+    row_group_codes = int_id_group_codes[row_codes]
+
+    # stable sort rows by group (rows without INTID first), then each group is a contiguous slice
+    row_order = np.argsort(row_group_codes, kind="stable")
+    group_ends = np.cumsum(np.bincount(row_group_codes[row_group_codes >= 0], minlength=len(group_code_dict)))
+    group_offset = int((row_group_codes < 0).sum())
+
+    row_positions = {}
+    group_start = 0
+    for int_id, group_end in zip(group_code_dict, group_ends.tolist()):
+        row_positions[int_id] = row_order[group_offset + group_start:group_offset + group_end]
+        group_start = group_end
+    return row_positions
+
+
+class UTDFIntidGroups(Mapping):
+    """Read-only {normalized INTID: dataframe} view of a UTDF table grouped by intersection id.
+
+    Rows of all intersections are located in one pass, the dataframe of an intersection
+    is created on first access and then reused. Do not modify the returned dataframes in place.
+    """
+
+    def __init__(self, df_table: pd.DataFrame) -> None:
+        self._df_table = df_table
+        self._row_positions = _group_intid_row_positions(df_table)
+        self._groups = {}
+
+    def __getitem__(self, int_id: str) -> pd.DataFrame:
+        if int_id not in self._groups:
+            self._groups[int_id] = self._df_table.iloc[self._row_positions[int_id]]
+        return self._groups[int_id]
+
+    def __iter__(self):
+        return iter(self._row_positions)
+
+    def __len__(self) -> int:
+        return len(self._row_positions)
+
+
+def group_utdf_table_by_intid(df_table: pd.DataFrame) -> UTDFIntidGroups:
+    """Group a UTDF table by intersection id in one pass.
+
+    Intersections are ordered by first appearance and rows keep their original order,
+    the same as filtering df_table[df_table["INTID"] == int_id] for each unique INTID.
+
+    Args:
+        df_table (pd.DataFrame): UTDF table with INTID column, e.g. Links, Lanes, Timeplans, Phases
+
+    Example:
+        >>> from utdf2gmns.func_lib.utdf.utdf_index import group_utdf_table_by_intid
+        >>> lane_groups = group_utdf_table_by_intid(utdf_dict["Lanes"])
+        >>> lane_groups["1"]  # lane data of intersection 1
+
+    Returns:
+        UTDFIntidGroups: {normalized INTID: dataframe of the intersection}
+    """
+    return UTDFIntidGroups(df_table)
+
+
+def cvt_utdf_table_to_intid_dict(df_table: pd.DataFrame,
+                                 index_col: str = "RECORDNAME",
+                                 drop_cols: tuple = ("INTID",),
+                                 normalize_intid: bool = False) -> dict:
+    """Convert a UTDF table to {INTID: {column: {RECORDNAME: value}}} in one pass.
+
+    For each intersection, the same as
+    df_table[df_table["INTID"] == int_id].drop(columns=drop_cols).set_index(index_col).to_dict("dict"),
+    keyed by the INTID value of the first row of the intersection.
+
+    Args:
+        df_table (pd.DataFrame): UTDF table with INTID column
+        index_col (str): the column used as keys of the inner dictionary. Defaults to "RECORDNAME".
+        drop_cols (tuple): columns excluded from the dictionary. Defaults to ("INTID",).
+        normalize_intid (bool): whether to key by the normalized INTID, the same keys as
+            group_utdf_table_by_intid. Defaults to False.
+
+    Returns:
+        dict: {INTID: {column: {RECORDNAME: value}}}
+    """
+    row_positions = _group_intid_row_positions(df_table)
+    if not row_positions:
+        return {}
+
+    col_names = df_table.columns.tolist()
+    intid_pos = col_names.index("INTID")
+    index_pos = col_names.index(index_col)
+    value_cols = [(j, col_name) for j, col_name in enumerate(col_names)
+                  if col_name != index_col and col_name not in drop_cols]
+
+    # convert the table to Python objects once, then slice rows of each intersection
+    table_values = df_table.to_numpy(dtype=object)
+
+    intid_dict = {}
+    for int_id, positions in row_positions.items():
+        col_values = table_values[positions].T.tolist()
+        index_values = col_values[index_pos]
+        intid_key = int_id if normalize_intid else col_values[intid_pos][0]
+        intid_dict[intid_key] = {col_name: dict(zip(index_values, col_values[j])) for j, col_name in value_cols}
+    return intid_dict
+
+
+def get_utdf_intid_groups(utdf_dict: dict, table_name: str) -> dict:
+    """Return the per-intersection groups of a UTDF table, grouping the table only once.
+
+    The groups are cached in utdf_dict and rebuilt when the table is replaced
+    (e.g. utdf_dict["Lanes"] = new_df). The returned dataframes are shared, do not modify them in place.
+
+    Args:
+        utdf_dict (dict): the UTDF dictionary returned by read_UTDF
+        table_name (str): the table name, e.g. "Lanes"
+
+    Returns:
+        dict: {normalized INTID: dataframe of the intersection}
+    """
+    df_table = utdf_dict.get(table_name)
+    intid_index = utdf_dict.setdefault(UTDF_INTID_INDEX_CACHE_KEY, {})
+
+    cached_table, intid_groups = intid_index.get(table_name, (None, None))
+    if df_table is None or cached_table is not df_table:
+        intid_groups = group_utdf_table_by_intid(df_table)
+        intid_index[table_name] = (df_table, intid_groups)
+    return intid_groups
+
+
+def build_utdf_intid_index(utdf_dict: dict) -> dict:
+    """Group Links, Lanes, Timeplans and Phases by intersection id and cache the groups in utdf_dict.
+
+    Args:
+        utdf_dict (dict): the UTDF dictionary returned by read_UTDF
+
+    Returns:
+        dict: {table name: {normalized INTID: dataframe of the intersection}}
+    """
+    return {table_name: get_utdf_intid_groups(utdf_dict, table_name)
+            for table_name in UTDF_INTID_INDEX_TABLES}
+
+
+def freeze_nested_dict(nested_dict: dict) -> MappingProxyType:
+    """Wrap a nested dictionary and all of its inner dictionaries in read-only mapping proxies."""
+    return MappingProxyType({key: freeze_nested_dict(value) if isinstance(value, dict) else value
+                             for key, value in nested_dict.items()})
+
+
+def get_utdf_lookup(utdf_dict: dict,
+                    lookup_name: str,
+                    table_names: tuple,
+                    build_lookup: Callable[[], dict]) -> MappingProxyType:
+    """Return a lookup converted from UTDF tables, converting the tables only once per load.
+
+    The lookup is frozen with read-only mapping proxies and cached in utdf_dict.
+    It is rebuilt when any of its source tables is replaced (e.g. utdf_dict["Lanes"] = new_df).
+
+    Args:
+        utdf_dict (dict): the UTDF dictionary returned by read_UTDF
+        lookup_name (str): the name of the lookup, e.g. "lanes"
+        table_names (tuple): the source tables of the lookup, e.g. ("Lanes",)
+        build_lookup (Callable[[], dict]): build the lookup from utdf_dict
+
+    Example:
+        >>> from utdf2gmns.func_lib.utdf.utdf_index import get_utdf_lookup
+        >>> lane_dict = get_utdf_lookup(utdf_dict, "lanes", ("Lanes",),
+        ...                             lambda: cvt_lane_df_to_dict(utdf_dict["Lanes"]))
+
+    Returns:
+        MappingProxyType: the read-only lookup
+    """
+    source_tables = tuple(utdf_dict.get(table_name) for table_name in table_names)
+    lookup_cache = utdf_dict.setdefault(UTDF_LOOKUP_CACHE_KEY, {})
+
+    cached_tables, lookup = lookup_cache.get(lookup_name, ((), None))
+    if len(cached_tables) != len(source_tables) or any(
+            cached_table is not df_table for cached_table, df_table in zip(cached_tables, source_tables)):
+        lookup = freeze_nested_dict(build_lookup())
+        lookup_cache[lookup_name] = (source_tables, lookup)
+    return lookup
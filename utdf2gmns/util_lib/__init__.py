@@ -6,15 +6,27 @@
 ##############################################################
 '''
 
-from .pkg_utils import (calculate_point2point_distance_in_km,
-                        time_unit_converter,
-                        time_str_to_seconds)
-from .pkg_settings import (utdf_categories,
-                           utdf_metadata,
-                           utdf_link_col_names,
-                           utdf_lane_col_names,)
+from .lazy_import import lazy_import_attrs
+
+__getattr__, __dir__ = lazy_import_attrs(__name__, {
+    ".instrumentation": ("StageRecorder",
+                         "record_stage",
+                         "count"),
+    ".pkg_utils": ("calculate_point2point_distance_in_km",
+                   "time_unit_converter",
+                   "time_str_to_seconds"),
+    ".pkg_settings": ("utdf_categories",
+                      "utdf_metadata",
+                      "utdf_link_col_names",
+                      "utdf_lane_col_names"),
+})
 
 __all__ = [
+    # instrumentation.py
+    "StageRecorder",
+    "record_stage",
+    "count",
+
     "calculate_point2point_distance_in_km",
     "time_unit_converter",
     "time_str_to_seconds",
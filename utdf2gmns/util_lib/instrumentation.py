@@ -0,0 +1,206 @@
+'''
+##############################################################
+# Created Date: Sunday, October 18th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+'''
+
+import contextlib
+import contextvars
+import json
+import time
+import tracemalloc
+from typing import Callable, Iterator
+
+# the open stages of all recorders, innermost last: ((recorder, stage frame), ...)
+# functions record into the innermost stage, so library code does not need a recorder argument.
+# each thread and asyncio task has its own stack, so conversions running side by side do not
+# record into each other's stages
+_ACTIVE_STAGES = contextvars.ContextVar("utdf2gmns_active_stages", default=())
+
+
+class StageRecorder:
+    """Record the wall time, CPU time, peak memory and counters of conversion stages.
+
+    Stages are recorded with the stage() context manager and may be nested. While a stage is open,
+    record_stage() and count() calls in any function of the same thread or asyncio task record into it,
+    they do nothing otherwise.
+
+    Args:
+        trace_memory (bool): whether to record the peak memory of each stage with tracemalloc.
+            tracemalloc slows Python code down, so it is off by default. Defaults to False.
+        on_stage_end (Callable[[dict], None] | None): a function called with the record of each
+            finished stage, e.g. to send it to a monitoring service. Defaults to None.
+
+    Example:
+        >>> from utdf2gmns.util_lib.instrumentation import StageRecorder, count
+        >>> recorder = StageRecorder()
+        >>> with recorder.stage("parse"):
+        ...     count("rows", 10)
+        >>> recorder.records[0]["counters"]
+        {'rows': 10}
+    """
+
+    def __init__(self, trace_memory: bool = False, on_stage_end: Callable[[dict], None] | None = None):
+        self.trace_memory = trace_memory
+        self.on_stage_end = on_stage_end
+        self.records = []
+        self._start_time = time.perf_counter()
+        self._is_tracing_owner = False
+
+    @contextlib.contextmanager
+    def stage(self, name: str, **info) -> Iterator[dict]:
+        """Record one stage, the yielded dictionary holds its counters.
+
+        Args:
+            name (str): the stage name, e.g. "parse" or "sumo.edg_xml"
+            **info: extra JSON serializable values saved in the stage record
+
+        Yields:
+            dict: the counters of the stage, {counter name: value}
+        """
+        parent_frame = next((frame for recorder, frame in reversed(_ACTIVE_STAGES.get()) if recorder is self), None)
+        frame = {"name": name,
+                 "parent": parent_frame["name"] if parent_frame else None,
+                 "info": info,
+                 "counters": {}}
+
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._is_tracing_owner = True
+            # keep the peak of the open stages before resetting it for this stage
+            _update_traced_peaks()
+            tracemalloc.reset_peak()
+            frame["memory_start"] = frame["memory_peak"] = tracemalloc.get_traced_memory()[0]
+
+        _ACTIVE_STAGES.set((*_ACTIVE_STAGES.get(), (self, frame)))
+        status = "ok"
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield frame["counters"]
+        except BaseException as e:
+            status = type(e).__name__
+            raise
+        finally:
+            wall_time = time.perf_counter() - wall_start
+            cpu_time = time.process_time() - cpu_start
+
+            peak_memory = None
+            if self.trace_memory and tracemalloc.is_tracing():
+                _update_traced_peaks()
+                tracemalloc.reset_peak()
+                peak_memory = frame["memory_peak"] - frame["memory_start"]
+
+            # remove by identity, nested stages may have equal frames
+            active_stages = _ACTIVE_STAGES.get()
+            frame_index = next(i for i in range(len(active_stages) - 1, -1, -1) if active_stages[i][1] is frame)
+            active_stages = active_stages[:frame_index] + active_stages[frame_index + 1:]
+            _ACTIVE_STAGES.set(active_stages)
+            if self._is_tracing_owner and not any(recorder is self for recorder, _ in active_stages):
+                tracemalloc.stop()
+                self._is_tracing_owner = False
+
+            record = {
+                "name": name,
+                "parent": frame["parent"],
+                "status": status,
+                "start_s": round(wall_start - self._start_time, 6),
+                "wall_time_s": round(wall_time, 6),
+                "cpu_time_s": round(cpu_time, 6),
+                "peak_memory_bytes": peak_memory,
+                "counters": frame["counters"],
+                **({"info": info} if info else {}),
+            }
+            self.records.append(record)
+            if self.on_stage_end is not None:
+                try:
+                    self.on_stage_end(record)
+                except Exception as e:
+                    print(f"  :stage callback failed for stage {name} with {e}")
+
+    def to_dict(self) -> dict:
+        """Return the report of all recorded stages.
+
+        Returns:
+            dict: {"stages": stage records in the order they finished,
+                "totals": {stage name: summed wall time, CPU time and counters}}
+        """
+        totals = {}
+        for record in self.records:
+            total = totals.setdefault(record["name"], {"calls": 0, "wall_time_s": 0.0,
+                                                       "cpu_time_s": 0.0, "counters": {}})
+            total["calls"] += 1
+            total["wall_time_s"] = round(total["wall_time_s"] + record["wall_time_s"], 6)
+            total["cpu_time_s"] = round(total["cpu_time_s"] + record["cpu_time_s"], 6)
+            for counter_name, value in record["counters"].items():
+                total["counters"][counter_name] = total["counters"].get(counter_name, 0) + value
+        return {"stages": list(self.records), "totals": totals}
+
+    def to_json(self, path: str = "", indent: int | None = 2) -> str:
+        """Return the report of all recorded stages as JSON, and save it if path is given.
+
+        Args:
+            path (str): the JSON file to save the report. Defaults to "" (not saved).
+            indent (int | None): the JSON indentation. Defaults to 2.
+
+        Returns:
+            str: the JSON report
+        """
+        report_json = json.dumps(self.to_dict(), indent=indent)
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(report_json)
+        return report_json
+
+    def clear(self) -> None:
+        """Remove all recorded stages."""
+        self.records.clear()
+
+
+def _update_traced_peaks() -> None:
+    """fold the current tracemalloc peak into every open stage that traces memory"""
+    peak = tracemalloc.get_traced_memory()[1]
+    for recorder, frame in _ACTIVE_STAGES.get():
+        if recorder.trace_memory:
+            frame["memory_peak"] = max(frame["memory_peak"], peak)
+
+
+def is_recording() -> bool:
+    """Return whether a stage is open, so callers can skip preparing counter values."""
+    return bool(_ACTIVE_STAGES.get())
+
+
+@contextlib.contextmanager
+def record_stage(name: str, **info) -> Iterator[dict | None]:
+    """Record a nested stage in the recorder of the innermost open stage, do nothing if no stage is open.
+
+    Args:
+        name (str): the stage name
+        **info: extra JSON serializable values saved in the stage record
+
+    Yields:
+        dict | None: the counters of the stage, None if no stage is open
+    """
+    active_stages = _ACTIVE_STAGES.get()
+    if not active_stages:
+        yield None
+        return
+
+    with active_stages[-1][0].stage(name, **info) as counters:
+        yield counters
+
+
+def count(name: str, value: int | float = 1) -> None:
+    """Add value to a counter of the innermost open stage, do nothing if no stage is open.
+
+    Args:
+        name (str): the counter name, e.g. "projections"
+        value (int | float): the value to add. Defaults to 1.
+    """
+    active_stages = _ACTIVE_STAGES.get()
+    if active_stages:
+        counters = active_stages[-1][1]["counters"]
+        counters[name] = counters.get(name, 0) + value
@@ -0,0 +1,53 @@
+'''
+##############################################################
+# Created Date: Sunday, October 18th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+'''
+
+import importlib
+import importlib.util
+import sys
+from typing import Callable
+
+
+def lazy_import_attrs(package_name: str, module_attrs: dict) -> tuple[Callable, Callable]:
+    """Create the module level __getattr__ and __dir__ (PEP 562) of a package that imports its attributes lazily.
+
+    An attribute is imported from its module the first time it is accessed, then saved in the package,
+    so later accesses do not go through __getattr__ again. Submodules of the package are imported
+    the same way when accessed as attributes.
+
+    Args:
+        package_name (str): the name of the package, i.e. __name__ of its __init__.py
+        module_attrs (dict): {module name: attribute names}, the module name is absolute
+            or relative to the package, e.g. {".read_utdf": ("read_UTDF",)}
+
+    Example:
+        >>> __getattr__, __dir__ = lazy_import_attrs(__name__, {".read_utdf": ("read_UTDF",)})
+
+    Returns:
+        tuple[Callable, Callable]: the __getattr__ and __dir__ functions of the package
+    """
+    attr_modules = {attr_name: module_name
+                    for module_name, attr_names in module_attrs.items()
+                    for attr_name in attr_names}
+
+    def __getattr__(name: str):
+        module_name = attr_modules.get(name)
+        if module_name is not None:
+            value = getattr(importlib.import_module(module_name, package_name), name)
+        elif importlib.util.find_spec(f"{package_name}.{name}") is not None:
+            # subpackages and modules are attributes of the package, as with eager imports
+            value = importlib.import_module(f"{package_name}.{name}")
+        else:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> list:
+        return sorted(set(vars(sys.modules[package_name])) | set(attr_modules))
+
+    return __getattr__, __dir__